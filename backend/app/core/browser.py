@@ -2,13 +2,18 @@
 Playwright 브라우저 매니저
 네이버 보안 우회를 위한 스텔스 브라우저 설정
 """
-from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from __future__ import annotations
+
 import os
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from dotenv import load_dotenv
 
 load_dotenv()
 
+if TYPE_CHECKING:
+    # playwright는 브라우저를 처음 시작할 때 import (API 워커 시작 시간 / 메모리 절감)
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
 
 class BrowserManager:
     """브라우저 인스턴스 관리 클래스"""
@@ -20,6 +25,7 @@ class BrowserManager:
     async def start(self):
         """Playwright 및 브라우저 시작"""
         if self.playwright is None:
+            from playwright.async_api import async_playwright
             self.playwright = await async_playwright().start()
         
         if self.browser is None:
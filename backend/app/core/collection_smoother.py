@@ -0,0 +1,228 @@
+"""
+주요지표 자동수집 부하 분산 (시간 내 지터 스케줄링)
+
+매 시간 정각에 그 시간의 수집 대상 tracker를 한꺼번에 처리하면
+네이버 API / 프록시 / 알림(NHN) 호출이 정각에 몰립니다.
+이 모듈은 각 tracker를 시간 내 고정 오프셋 슬롯에 배치하여 부하를 분산합니다.
+
+설계 원칙:
+- 오프셋은 (키워드, 매장 좌표) 해시로 결정 → 매 시간 같은 슬롯 (안정적)
+  같은 검색을 공유하는 tracker는 같은 슬롯에 모여 배치 수집의 검색 공유가 유지됨
+- 분산 구간은 시간 종료 전 여유(DEADLINE_MARGIN_SECONDS)를 남기도록 제한 → "H시 안에 수집" 보장
+- 예정 시각이 이미 지난 슬롯(재시작 등)은 즉시 디스패치 (백필)
+- 시간별 예정/실제 디스패치 타임라인을 메모리에 보관 (/api/v1/system/metric-collection-timeline)
+"""
+import asyncio
+import hashlib
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 시간 종료 전 남겨둘 여유 (마지막 슬롯의 수집이 H시 안에 끝나도록)
+DEADLINE_MARGIN_SECONDS = 600
+
+# 타임라인 보관 시간 수
+TIMELINE_HISTORY_HOURS = 24
+
+# 슬롯 디스패치 함수: tracker 목록 → (성공 수, 실패 수)
+SlotDispatcher = Callable[[List[dict]], Awaitable[Tuple[int, int]]]
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class CollectionSmoother:
+    """
+    시간 단위 수집 계획 + 슬롯별 디스패치
+    
+    - build_plan(): tracker → 오프셋 슬롯 배치
+    - run_hour(): 슬롯 예정 시각마다 디스패치 (이전 슬롯 완료를 기다리지 않음)
+    - get_timeline(): 예정 vs 실제 디스패치 시각, 슬롯별 결과
+    """
+    
+    def __init__(self, window_minutes: int = 45, slot_seconds: int = 60):
+        self.slot_seconds = max(1, slot_seconds)
+        # 분산 구간은 시간 종료 전 여유를 남기도록 제한 (0이면 정각 일괄 수집)
+        self.window_seconds = max(0, min(window_minutes * 60, 3600 - DEADLINE_MARGIN_SECONDS))
+        self._timeline: deque = deque(maxlen=TIMELINE_HISTORY_HOURS)
+        self._running_hours = set()
+    
+    @property
+    def slot_count(self) -> int:
+        return max(1, self.window_seconds // self.slot_seconds)
+    
+    @staticmethod
+    def spread_key(tracker: dict) -> str:
+        """오프셋 / 샤드 해시 키 (같은 검색을 공유하는 tracker는 같은 키)"""
+        keyword_info = tracker.get("keywords") or {}
+        store_info = tracker.get("stores") or {}
+        keyword = keyword_info.get("keyword")
+        if not keyword:
+            return str(tracker.get("id", ""))
+        return f"{keyword}|{store_info.get('place_x') or ''}|{store_info.get('place_y') or ''}"
+    
+    def tracker_offset(self, tracker: dict) -> int:
+        """tracker의 시간 내 디스패치 오프셋 (초, 슬롯 단위로 정렬)"""
+        if self.window_seconds <= 0:
+            return 0
+        digest = hashlib.md5(self.spread_key(tracker).encode("utf-8")).hexdigest()
+        return (int(digest[:8], 16) % self.slot_count) * self.slot_seconds
+    
+    def build_plan(self, trackers: List[dict], hour_start: datetime) -> List[dict]:
+        """tracker 목록을 오프셋 슬롯으로 묶은 수집 계획 (예정 시각 순)"""
+        slots: Dict[int, List[dict]] = {}
+        for tracker in trackers:
+            slots.setdefault(self.tracker_offset(tracker), []).append(tracker)
+        
+        plan = []
+        for offset in sorted(slots):
+            plan.append({
+                "offset_seconds": offset,
+                "planned_at": hour_start + timedelta(seconds=offset),
+                "trackers": slots[offset],
+            })
+        return plan
+    
+    async def run_hour(
+        self,
+        trackers: List[dict],
+        hour_start: datetime,
+        dispatch: SlotDispatcher,
+        mode: str = "scheduled",
+        plan_id: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        한 시간 분량의 수집 계획 실행
+        
+        Args:
+            trackers: 수집 대상 tracker 목록 (stores, keywords 포함)
+            hour_start: 수집 시간대 시작 시각 (KST, 정각)
+            dispatch: 슬롯 디스패치 함수
+            mode: "scheduled" (정각 cron) / "backfill" (재시작 후 보충) / "sweep" / "recovery" (다른 워커 몫 인수)
+            plan_id: 같은 시간대를 나눠 실행할 때의 계획 구분 (스케줄러 샤드, None이면 시간대 전체)
+        
+        Returns:
+            해당 시간의 타임라인 레코드 (이미 같은 시간대/계획을 실행 중이면 None)
+        """
+        hour_key = hour_start.isoformat()
+        running_key = hour_key if plan_id is None else f"{hour_key}#{plan_id}"
+        if running_key in self._running_hours:
+            logger.info(f"[Smoother] {running_key} 수집 계획이 이미 실행 중 - 건너뜀 ({mode})")
+            return None
+        
+        self._running_hours.add(running_key)
+        try:
+            plan = self.build_plan(trackers, hour_start)
+            record = {
+                "hour": hour_key,
+                "mode": mode,
+                "plan": plan_id,
+                "window_seconds": self.window_seconds,
+                "tracker_count": len(trackers),
+                "started_at": _iso(datetime.now(KST)),
+                "completed_at": None,
+                "slots": [],
+            }
+            self._timeline.append(record)
+            
+            logger.info(
+                f"[Smoother] {hour_key} 수집 계획 ({mode}): "
+                f"{len(trackers)}개 tracker → {len(plan)}개 슬롯 / {self.window_seconds}초 구간"
+            )
+            
+            tasks = []
+            for slot in plan:
+                delay = (slot["planned_at"] - datetime.now(KST)).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                
+                dispatched_at = datetime.now(KST)
+                slot_record = {
+                    "offset_seconds": slot["offset_seconds"],
+                    "planned_at": _iso(slot["planned_at"]),
+                    "dispatched_at": _iso(dispatched_at),
+                    "completed_at": None,
+                    "lag_seconds": round((dispatched_at - slot["planned_at"]).total_seconds(), 3),
+                    "tracker_ids": [t.get("id") for t in slot["trackers"]],
+                    "success": 0,
+                    "failed": 0,
+                    "status": "running",
+                }
+                record["slots"].append(slot_record)
+                tasks.append(asyncio.create_task(
+                    self._run_slot(slot["trackers"], slot_record, dispatch)
+                ))
+            
+            if tasks:
+                await asyncio.gather(*tasks)
+            
+            record["completed_at"] = _iso(datetime.now(KST))
+            return record
+        finally:
+            self._running_hours.discard(running_key)
+    
+    async def _run_slot(self, trackers: List[dict], slot_record: dict, dispatch: SlotDispatcher):
+        try:
+            success, failed = await dispatch(trackers)
+            slot_record["success"] = success
+            slot_record["failed"] = failed
+            slot_record["status"] = "done"
+        except Exception as e:
+            slot_record["failed"] = len(trackers)
+            slot_record["status"] = "error"
+            logger.error(f"[Smoother] 슬롯 디스패치 실패 (+{slot_record['offset_seconds']}초): {str(e)}", exc_info=True)
+        finally:
+            slot_record["completed_at"] = _iso(datetime.now(KST))
+    
+    def get_timeline(self) -> dict:
+        """시간별 예정/실제 디스패치 타임라인 (최근 순)"""
+        return {
+            "config": {
+                "window_seconds": self.window_seconds,
+                "slot_seconds": self.slot_seconds,
+                "slot_count": self.slot_count,
+                "deadline_margin_seconds": DEADLINE_MARGIN_SECONDS,
+            },
+            "running_hours": sorted(self._running_hours),
+            "hours": list(reversed(self._timeline)),
+        }
+
+
+def get_hour_start(now: Optional[datetime] = None) -> datetime:
+    """KST 기준 현재 시간대 시작 시각 (정각)"""
+    now = now or datetime.now(KST)
+    return now.astimezone(KST).replace(minute=0, second=0, microsecond=0)
+
+
+def filter_uncollected(trackers: List[dict], hour_start: datetime) -> List[dict]:
+    """해당 시간대에 아직 수집되지 않은 tracker만 반환 (백필용)"""
+    pending = []
+    for tracker in trackers:
+        last_collected_at = tracker.get("last_collected_at")
+        if last_collected_at:
+            try:
+                collected = datetime.fromisoformat(str(last_collected_at).replace("Z", "+00:00"))
+                if collected.tzinfo is None:
+                    collected = collected.replace(tzinfo=KST)
+                if collected >= hour_start:
+                    continue
+            except ValueError:
+                pass
+        pending.append(tracker)
+    return pending
+
+
+# 싱글톤 인스턴스
+metric_collection_smoother = CollectionSmoother(
+    window_minutes=settings.METRIC_SMOOTHING_WINDOW_MINUTES,
+    slot_seconds=settings.METRIC_SMOOTHING_SLOT_SECONDS,
+)
@@ -0,0 +1,163 @@
+"""
+응답 압축 미들웨어 (Accept-Encoding: br / gzip)
+
+- brotli 패키지가 있으면 br 우선, 없으면 gzip (Accept-Encoding의 q 값 반영)
+- RESPONSE_COMPRESSION_MIN_BYTES 미만 본문, 이미 인코딩된 응답, 304 / 204는 그대로 전달
+- 본문을 한 번에 보내는 응답만 압축 (SSE 등 스트리밍 응답은 버퍼링하지 않고 그대로 전달)
+- 큰 본문(OFFLOAD_BYTES 이상)은 스레드에서 압축 (이벤트 루프 점유 방지)
+
+순수 ASGI 미들웨어라서 BaseHTTPMiddleware보다 안쪽(먼저 add_middleware)에 등록해야
+본문이 한 번에 전달됩니다 (main.py 참고).
+"""
+import asyncio
+import gzip
+from typing import Dict, List, Optional, Tuple
+
+# 압축 대상 Content-Type
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# 이 크기 이상이면 스레드에서 압축
+OFFLOAD_BYTES = 256 * 1024
+
+
+def _load_brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+_brotli = _load_brotli()
+
+
+def available_encodings() -> List[str]:
+    """서버가 지원하는 인코딩 (선호 순)"""
+    return ["br", "gzip"] if _brotli else ["gzip"]
+
+
+def choose_encoding(accept_encoding: str, encodings: Optional[List[str]] = None) -> Optional[str]:
+    """Accept-Encoding에서 q 값이 가장 높은 인코딩 (같으면 서버 선호 순, 없으면 None)"""
+    encodings = encodings or available_encodings()
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip()] = weight
+    
+    best, best_weight = None, 0.0
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    if encoding == "br":
+        return _brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """응답 압축 (순수 ASGI)"""
+    
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        accept_encoding = ""
+        for key, value in scope.get("headers") or []:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message = None
+        
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+            
+            start, start_message = start_message, None
+            body = message.get("body", b"")
+            if message.get("more_body") or not self._should_compress(start, body):
+                await send(start)
+                await send(message)
+                return
+            
+            if len(body) >= OFFLOAD_BYTES:
+                compressed = await asyncio.to_thread(
+                    compress_body, body, encoding, self.gzip_level, self.brotli_quality
+                )
+            else:
+                compressed = compress_body(body, encoding, self.gzip_level, self.brotli_quality)
+            if len(compressed) >= len(body):
+                await send(start)
+                await send(message)
+                return
+            
+            headers = [(key, value) for key, value in start.get("headers", []) if key != b"content-length"]
+            headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers = _add_vary(headers)
+            await send({**start, "headers": headers})
+            await send({**message, "body": compressed})
+        
+        await self.app(scope, receive, send_wrapper)
+    
+    def _should_compress(self, start: dict, body: bytes) -> bool:
+        if start.get("status") in (204, 304) or len(body) < self.minimum_size:
+            return False
+        content_type = b""
+        for key, value in start.get("headers", []):
+            if key == b"content-encoding":
+                return False
+            if key == b"content-type":
+                content_type = value
+        content_type_str = content_type.decode("latin-1").lower()
+        if content_type_str.startswith("text/event-stream"):
+            return False
+        return content_type_str.startswith(COMPRESSIBLE_TYPES)
+
+
+def _add_vary(headers: List[Tuple[bytes, bytes]]) -> List[Tuple[bytes, bytes]]:
+    for index, (key, value) in enumerate(headers):
+        if key == b"vary":
+            if b"accept-encoding" not in value.lower():
+                headers[index] = (key, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
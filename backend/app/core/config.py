@@ -56,6 +56,13 @@ class Settings:
     # false: 차감 안 함 (테스트 모드)
     CREDIT_AUTO_DEDUCT: bool = os.getenv("CREDIT_AUTO_DEDUCT", "false").lower() == "true"
     
+    # 크레딧 예약 유지 시간 (초, 확정 / 해제되지 않은 예약은 이후 잔액 계산에서 제외)
+    CREDIT_RESERVATION_TTL_SECONDS: int = int(os.getenv("CREDIT_RESERVATION_TTL_SECONDS", "600"))
+    
+    # 사용자별 크레딧 잔액 캐시 유지 시간 (초, 0이면 캐시 안 함)
+    # 확정 / 충전 / 리셋 / 관리자 지급 시 즉시 갱신, 다른 워커의 변경은 TTL 안에 반영
+    CREDIT_BALANCE_CACHE_TTL_SECONDS: float = float(os.getenv("CREDIT_BALANCE_CACHE_TTL_SECONDS", "10"))
+    
     # ============================================
     # Payment Configuration
     # ============================================
@@ -103,6 +110,175 @@ class Settings:
     # OTP 설정
     OTP_EXPIRE_MINUTES: int = 3  # OTP 유효 시간 (분)
     OTP_LENGTH: int = 6  # OTP 자릿수
+    
+    # ============================================
+    # Metric Tracker Collection
+    # ============================================
+    
+    # 시간별 자동수집 배치 모드 (같은 검색을 공유하는 tracker 그룹 단위 동시 수집 + 일괄 저장)
+    # false: tracker마다 collect_metrics()를 순차 실행 (기존 방식)
+    METRIC_BATCH_COLLECTION_ENABLED: bool = os.getenv("METRIC_BATCH_COLLECTION_ENABLED", "true").lower() == "true"
+    
+    # 배치 모드에서 동시에 진행할 검색 그룹 수 (네이버 API 글로벌 세마포어와 별개)
+    METRIC_BATCH_CONCURRENCY: int = int(os.getenv("METRIC_BATCH_CONCURRENCY", "10"))
+    
+    # 시간 내 부하 분산: 수집 대상 tracker를 정각부터 N분 구간에 고정 오프셋으로 분산
+    # 0: 정각 일괄 수집 (기존 방식), 최대 50분 (시간 종료 전 10분 여유)
+    METRIC_SMOOTHING_WINDOW_MINUTES: int = int(os.getenv("METRIC_SMOOTHING_WINDOW_MINUTES", "45"))
+    
+    # 분산 슬롯 간격 (초) - 같은 슬롯의 tracker는 한 번에 디스패치
+    METRIC_SMOOTHING_SLOT_SECONDS: int = int(os.getenv("METRIC_SMOOTHING_SLOT_SECONDS", "60"))
+    
+    # 서버 재시작 시 현재 시간대에 아직 수집되지 않은 tracker 보충 수집
+    METRIC_BACKFILL_ON_STARTUP: bool = os.getenv("METRIC_BACKFILL_ON_STARTUP", "true").lower() == "true"
+    
+    # ============================================
+    # Request Tracing (Server-Timing)
+    # ============================================
+    
+    # 요청별 구간(span) 측정 + Server-Timing 응답 헤더
+    # false: 미들웨어 자체를 등록하지 않음 (span 호출은 ContextVar 조회 1회로 즉시 반환)
+    REQUEST_TRACING_ENABLED: bool = os.getenv("REQUEST_TRACING_ENABLED", "false").lower() == "true"
+    
+    # 이 시간(ms) 이상 걸린 요청은 span 내역과 함께 경고 로그 (0: 로그 안 함)
+    SLOW_REQUEST_THRESHOLD_MS: int = int(os.getenv("SLOW_REQUEST_THRESHOLD_MS", "0"))
+    
+    # ============================================
+    # Logging
+    # ============================================
+    
+    # 루트 로그 레벨
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    
+    # 출력 형식: text (기존 형식) / json (구조화 로그, 한 줄에 JSON 1개)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()
+    
+    # 로그 큐 크기 (요청 처리 스레드/이벤트 루프는 큐에 넣기만 하고 출력은 별도 스레드)
+    # 큐가 가득 차면 대기하지 않고 버림 (버린 수는 /api/v1/admin/logging에서 확인)
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    
+    # 시작 시 DEBUG 레벨로 둘 로거 (쉼표 구분, 예: app.services.naver_review_service,app.routers.auth)
+    LOG_DEBUG_LOGGERS: str = os.getenv("LOG_DEBUG_LOGGERS", "")
+    
+    # 요청 단위 상세 덤프(리뷰 ID 목록 등) 샘플링 비율 (0~1, 해당 로거가 DEBUG일 때만 적용)
+    LOG_DEBUG_SAMPLE_RATE: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.05"))
+    
+    # ============================================
+    # Worker Role
+    # ============================================
+    
+    # 프로세스 역할 (역할에 필요 없는 라우터 / 스케줄러는 import하지 않음)
+    # all: API + 스케줄러 (단일 워커 배포, 기본값)
+    # api: API 라우터만 (스케줄러 미시작)
+    # scheduler: 스케줄러 + 헬스체크 / 시스템 엔드포인트만
+    # scraper: 답글 게시 / 네이버 세션 등 브라우저 자동화 라우터만
+    # worker: 백그라운드 작업(?async=true로 등록된 분석) 워커 + 헬스체크 / 시스템 엔드포인트만
+    WORKER_ROLE: str = os.getenv("WORKER_ROLE", "all").strip().lower()
+    
+    # ============================================
+    # Scheduler Coordination (다중 워커)
+    # ============================================
+    
+    # 워커 간 스케줄러 조정 백엔드
+    # local: 프로세스 내 메모리 (단일 워커 배포, 항상 리더)
+    # supabase: Postgres 리스 / 실행 기록 RPC (스케줄러를 실행하는 워커가 2개 이상이면 필수)
+    SCHEDULER_COORDINATION: str = os.getenv("SCHEDULER_COORDINATION", "local").strip().lower()
+    
+    # 리더 리스 TTL (초) - TTL/3 간격으로 갱신, 리더가 죽으면 최대 TTL 후 다른 워커가 인수
+    SCHEDULER_LEASE_TTL_SECONDS: int = int(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", "30"))
+    
+    # 실행 중 작업의 heartbeat가 이 시간(초) 이상 끊기면 리더가 인수해서 재실행
+    SCHEDULER_RUN_STALE_SECONDS: int = int(os.getenv("SCHEDULER_RUN_STALE_SECONDS", "120"))
+    
+    # 순위 확인 / 리뷰 수집 / 주요지표 수집을 나눌 샤드 수 (키워드·매장·검색 키 해시 % 샤드 수)
+    SCHEDULER_SHARD_COUNT: int = int(os.getenv("SCHEDULER_SHARD_COUNT", "16"))
+    
+    # cron 실행 후 이 시간(초)이 지나도 claim되지 않은 샤드는 리더가 처리
+    SCHEDULER_SHARD_CLAIM_GRACE_SECONDS: int = int(os.getenv("SCHEDULER_SHARD_CLAIM_GRACE_SECONDS", "60"))
+    
+    # ============================================
+    # Rate Limit Coordination (다중 워커)
+    # ============================================
+    
+    # 유저별 동시 수집 / 네이버 API 동시 호출 슬롯을 워커 간에 공유하는 저장소
+    # local: 프로세스 내 메모리 (단일 워커 배포, 워커마다 따로 집계)
+    # supabase: rate_limit_leases 테이블 RPC (워커가 2개 이상이면 전체 합계로 제한)
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "local").strip().lower()
+    
+    # 슬롯 리스 TTL (초, 3~300) - TTL/3 간격으로 갱신, 워커가 죽으면 최대 TTL 후 슬롯 반환
+    RATE_LIMIT_LEASE_TTL_SECONDS: int = int(os.getenv("RATE_LIMIT_LEASE_TTL_SECONDS", "30"))
+    
+    # 전체 워커 합계 네이버 API 동시 호출 수 (워커별 제한은 rate_limiter.MAX_CONCURRENT_NAVER_API_CALLS)
+    RATE_LIMIT_NAVER_GLOBAL_MAX: int = int(os.getenv("RATE_LIMIT_NAVER_GLOBAL_MAX", "20"))
+    
+    # 전역 슬롯이 없을 때 재시도 간격 상한 (초, 0.05초부터 2배씩 증가)
+    RATE_LIMIT_POLL_MAX_SECONDS: float = float(os.getenv("RATE_LIMIT_POLL_MAX_SECONDS", "0.5"))
+    
+    # 전역 슬롯 최대 대기 (초) - 초과하면 워커 내 제한만으로 네이버 API 호출 진행 (리스가 남아 있어도 멈추지 않도록)
+    RATE_LIMIT_GLOBAL_MAX_WAIT_SECONDS: float = float(os.getenv("RATE_LIMIT_GLOBAL_MAX_WAIT_SECONDS", "30"))
+    
+    # ============================================
+    # Background Jobs (긴 분석 작업 비동기 실행)
+    # ============================================
+    
+    # 작업 저장소
+    # local: 프로세스 내 메모리 (단일 워커 배포, 재시작 시 사라짐 / 모든 역할에서 워커 실행)
+    # supabase: background_jobs 테이블 (API와 워커 프로세스 분리 가능, 재시작 후에도 유지)
+    JOB_BACKEND: str = os.getenv("JOB_BACKEND", "local").strip().lower()
+    
+    # 프로세스당 동시 실행 작업 수
+    JOB_WORKER_CONCURRENCY: int = int(os.getenv("JOB_WORKER_CONCURRENCY", "2"))
+    
+    # 작업 lease (초) - lease/3 간격으로 연장, 워커가 죽으면 만료 후 다른 워커가 재실행
+    JOB_LEASE_SECONDS: int = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+    
+    # 워커 중단 시 최대 실행 횟수 (처리 중 오류는 재시도하지 않음)
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "2"))
+    
+    # 대기 작업 확인 간격 (초)
+    JOB_POLL_INTERVAL_SECONDS: float = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "1.0"))
+    
+    # ============================================
+    # Response Cache (조회 API ETag / 304)
+    # ============================================
+    
+    # 대시보드 조회 API 조건부 응답 (resource_versions 버전으로 ETag, If-None-Match 일치 시 304)
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    
+    # 워커별 응답 본문 캐시 항목 수 (LRU) / 이보다 큰 본문은 캐시하지 않음 (KB)
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+    RESPONSE_CACHE_MAX_BODY_KB: int = int(os.getenv("RESPONSE_CACHE_MAX_BODY_KB", "256"))
+    
+    # ============================================
+    # Response Encoding (orjson 직렬화 / gzip·brotli 압축)
+    # ============================================
+    
+    # JSON 응답 / SSE 이벤트를 orjson으로 직렬화 (false면 표준 json, orjson 미설치 시에도 표준 json)
+    ORJSON_ENABLED: bool = os.getenv("ORJSON_ENABLED", "true").lower() == "true"
+    
+    # Accept-Encoding에 따라 응답 압축 (br 우선, 없으면 gzip) / 이보다 작은 본문은 압축하지 않음 (byte)
+    RESPONSE_COMPRESSION_ENABLED: bool = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() == "true"
+    RESPONSE_COMPRESSION_MIN_BYTES: int = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+    
+    # 압축 수준 (gzip 1~9, brotli 0~11 - 높을수록 작지만 CPU 사용 증가)
+    RESPONSE_COMPRESSION_GZIP_LEVEL: int = int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", "6"))
+    RESPONSE_COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "4"))
+    
+    # ============================================
+    # HTML Parsing (플레이스 / 블로그 페이지)
+    # ============================================
+    
+    # auto: selectolax → lxml → BeautifulSoup 중 설치된 것 / 백엔드 고정 시 미설치면 다음 순서로 대체
+    HTML_PARSER_BACKEND: str = os.getenv("HTML_PARSER_BACKEND", "auto")
+    
+    # ============================================
+    # Blog Review Matching (활성화 / 경쟁분석 블로그 추이)
+    # ============================================
+    
+    # 매장명으로 매칭된 블로그 포스트 중 다른 매장 지도만 첨부된 포스트 제외
+    # true: 처음 보는 포스트만 PostView 요청 후 blog_post_places에 저장 (블로그 리뷰 수가 줄어들 수 있음)
+    # false: 제목·미리보기 매칭 결과 그대로 사용 (기존 방식)
+    BLOG_VERIFY_PLACE_ATTACHMENT: bool = os.getenv("BLOG_VERIFY_PLACE_ATTACHMENT", "false").lower() == "true"
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,597 @@
+"""
+스케줄러 조정 (리더 선출 + 작업 샤딩 + failover)
+
+API 워커를 여러 개 띄우면 워커마다 AsyncIOScheduler가 같은 cron을 실행합니다.
+이 모듈은 워커 간에:
+
+- 리더 선출: scheduler_leases 리스 (TTL 안에 갱신하지 못하면 다른 워커가 인수, fencing_token 증가)
+- 단독 작업 (정기결제 등): 리더만 실행 + run_key(작업:기간) claim으로 같은 기간 1회만 실행
+- 샤드 작업 (순위 확인 / 리뷰 수집 / 주요지표 수집): SCHEDULER_SHARD_COUNT개 고정 샤드를
+  살아있는 워커들이 claim해서 나눠 처리 (샤드 = id 해시 % 샤드 수)
+- failover: 실행 중 heartbeat가 SCHEDULER_RUN_STALE_SECONDS 이상 끊긴 실행은 리더가 인수해서 재실행,
+  cron 시각 이후 SCHEDULER_SHARD_CLAIM_GRACE_SECONDS가 지나도 아무도 claim하지 않은 샤드는 리더가 처리
+- 놓친 단독 작업: cron이 리더가 아닌 워커에서만 울렸거나(리더 교체) 재시작으로 cron을 놓쳐
+  기간 실행 기록이 없으면 리더가 tick에서 claim해서 실행 (register의 due_period)
+
+백엔드:
+- supabase: Postgres RPC (acquire_scheduler_lease, claim_scheduler_run 등, 다중 워커 배포)
+- local: 프로세스 내 메모리 스탠드인 (단일 워커 / 개발 / 테스트, 항상 리더 + 워커 1개)
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import socket
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE_NAME = "scheduler-leader"
+
+# 작업 함수: (담당 샤드, 기간 키, 실행 모드) → 완료까지 대기
+# 실행 모드: scheduled (cron) / sweep (미claim 샤드 정리) / recovery (끊긴 실행 인수) / backfill / catchup (놓친 단독 작업)
+JobFunc = Callable[["ShardSet", str, str], Awaitable[None]]
+
+# 단독 작업의 지금 실행되어 있어야 할 기간 키 (오늘 cron 시각 전이면 None)
+DuePeriodFunc = Callable[[], Optional[str]]
+
+
+def shard_of(key: str, count: int) -> int:
+    """키의 샤드 번호 (워커/프로세스와 무관하게 항상 같은 값: md5 앞 8자리 % 샤드 수)"""
+    if count <= 1:
+        return 0
+    digest = hashlib.md5(str(key).encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) % count
+
+
+@dataclass(frozen=True)
+class ShardSet:
+    """이 워커가 맡은 샤드 목록"""
+    indices: FrozenSet[int]
+    count: int
+    
+    def owns(self, key) -> bool:
+        return self.count <= 1 or shard_of(key, self.count) in self.indices
+    
+    def filter(self, items: Iterable[dict], key: Callable[[dict], str]) -> List[dict]:
+        return [item for item in items if self.owns(key(item))]
+    
+    @property
+    def label(self) -> str:
+        if self.count <= 1 or len(self.indices) >= self.count:
+            return "all"
+        return f"{','.join(str(i) for i in sorted(self.indices))}/{self.count}"
+
+
+ALL_SHARDS = ShardSet(frozenset({0}), 1)
+
+
+def _run_key(job_id: str, period: str, shard: Optional[int] = None, count: int = 1) -> str:
+    if shard is None:
+        return f"{job_id}:{period}"
+    return f"{job_id}:{period}:{shard}/{count}"
+
+
+# ============================================
+# 백엔드
+# ============================================
+
+class LocalCoordinationBackend:
+    """
+    프로세스 내 메모리 스탠드인 (supabase 백엔드와 같은 claim / 인수 규칙)
+    
+    여러 SchedulerCoordinator 인스턴스가 하나의 백엔드를 공유하면
+    다중 워커 리더 선출 / 샤드 분배 / failover를 한 프로세스에서 재현할 수 있습니다.
+    """
+    
+    name = "local"
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases: Dict[str, dict] = {}
+        self._workers: Dict[str, datetime] = {}
+        self._runs: Dict[str, dict] = {}
+    
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+    
+    def acquire_lease(self, name: str, holder: str, ttl_seconds: int) -> dict:
+        with self._lock:
+            now = self._now()
+            lease = self._leases.get(name)
+            if lease is None or lease["holder"] == holder or lease["expires_at"] < now:
+                token = 1 if lease is None else lease["fencing_token"] + (lease["holder"] != holder)
+                lease = {
+                    "holder": holder,
+                    "fencing_token": token,
+                    "expires_at": now + timedelta(seconds=ttl_seconds),
+                }
+                self._leases[name] = lease
+            return dict(lease)
+    
+    def release_lease(self, name: str, holder: str):
+        with self._lock:
+            lease = self._leases.get(name)
+            if lease and lease["holder"] == holder:
+                lease["expires_at"] = self._now()
+    
+    def heartbeat_worker(self, worker_id: str, role: str, ttl_seconds: int) -> int:
+        with self._lock:
+            now = self._now()
+            self._workers[worker_id] = now
+            cutoff = now - timedelta(seconds=ttl_seconds)
+            return sum(1 for seen in self._workers.values() if seen >= cutoff)
+    
+    def claim_run(self, run_key: str, job_id: str, holder: str, stale_seconds: int, meta: dict) -> bool:
+        with self._lock:
+            now = self._now()
+            run = self._runs.get(run_key)
+            if run is not None:
+                stale = run["heartbeat_at"] < now - timedelta(seconds=stale_seconds)
+                if run["status"] != "running" or not stale:
+                    return False
+                run.update(holder=holder, attempts=run["attempts"] + 1, started_at=now, heartbeat_at=now)
+                run["meta"] = {**run["meta"], **meta}
+                return True
+            self._runs[run_key] = {
+                "run_key": run_key,
+                "job_id": job_id,
+                "holder": holder,
+                "status": "running",
+                "attempts": 1,
+                "meta": dict(meta),
+                "detail": None,
+                "started_at": now,
+                "heartbeat_at": now,
+                "finished_at": None,
+            }
+            return True
+    
+    def heartbeat_runs(self, run_keys: List[str], holder: str) -> List[str]:
+        with self._lock:
+            now = self._now()
+            kept = []
+            for run_key in run_keys:
+                run = self._runs.get(run_key)
+                if run and run["holder"] == holder and run["status"] == "running":
+                    run["heartbeat_at"] = now
+                    kept.append(run_key)
+            return kept
+    
+    def finish_runs(self, run_keys: List[str], holder: str, status: str, detail: Optional[dict]):
+        with self._lock:
+            now = self._now()
+            for run_key in run_keys:
+                run = self._runs.get(run_key)
+                if run and run["holder"] == holder:
+                    run.update(status=status, detail=detail, finished_at=now, heartbeat_at=now)
+            # 오래된 실행 기록 정리
+            cutoff = now - timedelta(days=14)
+            for run_key in [key for key, run in self._runs.items() if run["started_at"] < cutoff]:
+                del self._runs[run_key]
+    
+    def stale_runs(self, stale_seconds: int) -> List[dict]:
+        with self._lock:
+            cutoff = self._now() - timedelta(seconds=stale_seconds)
+            return [
+                dict(run) for run in self._runs.values()
+                if run["status"] == "running" and run["heartbeat_at"] < cutoff
+            ]
+
+
+class SupabaseCoordinationBackend:
+    """Postgres 리스 / 실행 기록 (supabase/migrations/20261019040000_add_scheduler_coordination.sql)"""
+    
+    name = "supabase"
+    
+    @property
+    def supabase(self):
+        from app.core.database import get_supabase_client
+        return get_supabase_client()
+    
+    def acquire_lease(self, name: str, holder: str, ttl_seconds: int) -> dict:
+        result = self.supabase.rpc("acquire_scheduler_lease", {
+            "p_name": name,
+            "p_holder": holder,
+            "p_ttl_seconds": ttl_seconds,
+        }).execute()
+        return result.data[0] if result.data else {"holder": None, "fencing_token": None, "expires_at": None}
+    
+    def release_lease(self, name: str, holder: str):
+        self.supabase.rpc("release_scheduler_lease", {"p_name": name, "p_holder": holder}).execute()
+    
+    def heartbeat_worker(self, worker_id: str, role: str, ttl_seconds: int) -> int:
+        result = self.supabase.rpc("heartbeat_scheduler_worker", {
+            "p_worker_id": worker_id,
+            "p_role": role,
+            "p_ttl_seconds": ttl_seconds,
+        }).execute()
+        return int(result.data or 1)
+    
+    def claim_run(self, run_key: str, job_id: str, holder: str, stale_seconds: int, meta: dict) -> bool:
+        result = self.supabase.rpc("claim_scheduler_run", {
+            "p_run_key": run_key,
+            "p_job_id": job_id,
+            "p_holder": holder,
+            "p_stale_seconds": stale_seconds,
+            "p_meta": meta,
+        }).execute()
+        return bool(result.data)
+    
+    def heartbeat_runs(self, run_keys: List[str], holder: str) -> List[str]:
+        result = self.supabase.rpc("heartbeat_scheduler_runs", {
+            "p_run_keys": run_keys,
+            "p_holder": holder,
+        }).execute()
+        return list(result.data or [])
+    
+    def finish_runs(self, run_keys: List[str], holder: str, status: str, detail: Optional[dict]):
+        self.supabase.rpc("finish_scheduler_runs", {
+            "p_run_keys": run_keys,
+            "p_holder": holder,
+            "p_status": status,
+            "p_detail": detail,
+        }).execute()
+    
+    def stale_runs(self, stale_seconds: int) -> List[dict]:
+        result = self.supabase.rpc("get_stale_scheduler_runs", {"p_stale_seconds": stale_seconds}).execute()
+        return result.data or []
+
+
+def create_backend(kind: str):
+    if kind == "supabase":
+        return SupabaseCoordinationBackend()
+    if kind != "local":
+        logger.warning(f"[Coordination] 알 수 없는 SCHEDULER_COORDINATION={kind} → local 사용")
+    return LocalCoordinationBackend()
+
+
+# ============================================
+# 조정자
+# ============================================
+
+@dataclass
+class _ActiveRun:
+    job_id: str
+    period: str
+    mode: str
+    run_keys: List[str]
+    shards: ShardSet
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    lost: bool = False
+
+
+class SchedulerCoordinator:
+    """
+    워커 1개의 리더 리스 / 샤드 claim / 실행 heartbeat 관리
+    
+    - tick(): SCHEDULER_LEASE_TTL_SECONDS / 3 간격으로 스케줄러 interval 작업에서 호출
+      (리스 갱신 + 워커 생존 신호 + 실행 중 작업 heartbeat + 리더면 끊긴 실행 인수 / 놓친 단독 작업 실행)
+    - run_exclusive(): 리더만 실행, 기간당 1회
+    - run_sharded(): 샤드를 claim한 만큼 실행
+    """
+    
+    def __init__(
+        self,
+        backend,
+        worker_id: Optional[str] = None,
+        lease_ttl_seconds: int = 30,
+        run_stale_seconds: int = 120,
+        shard_count: int = 16,
+        claim_grace_seconds: int = 60,
+        role: str = "all",
+    ):
+        self.backend = backend
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_ttl_seconds = max(3, lease_ttl_seconds)
+        # heartbeat 간격(TTL/3)보다 충분히 길어야 살아있는 실행을 인수하지 않음
+        self.run_stale_seconds = max(run_stale_seconds, self.lease_ttl_seconds)
+        self.shard_count = max(1, shard_count)
+        self.claim_grace_seconds = max(0, claim_grace_seconds)
+        self.role = role
+        
+        self.is_leader = False
+        self.fencing_token: Optional[int] = None
+        self.leader_id: Optional[str] = None
+        self.active_workers = 1
+        self.last_tick_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        
+        self._jobs: Dict[str, JobFunc] = {}
+        self._due_periods: Dict[str, DuePeriodFunc] = {}
+        # 작업 id → 리더가 실행 기록을 확인한 마지막 기간 (기간당 claim 시도 1회)
+        self._checked_periods: Dict[str, str] = {}
+        self._active: Dict[int, _ActiveRun] = {}
+        self._tasks: set = set()
+        self._history: List[dict] = []
+    
+    @property
+    def renew_interval_seconds(self) -> int:
+        return max(1, self.lease_ttl_seconds // 3)
+    
+    def register(self, job_id: str, func: JobFunc, due_period: Optional[DuePeriodFunc] = None):
+        """
+        failover 시 재실행할 수 있도록 작업 함수 등록
+        
+        Args:
+            due_period: 단독 작업의 현재 기간 키 함수 (지정하면 리더가 실행 기록 없는 기간을 실행)
+        """
+        self._jobs[job_id] = func
+        if due_period is not None:
+            self._due_periods[job_id] = due_period
+    
+    # ---------- 리스 / heartbeat ----------
+    
+    async def tick(self):
+        """리스 갱신 + 생존 신호 + 실행 heartbeat (+ 리더면 끊긴 실행 인수)"""
+        try:
+            lease = self.backend.acquire_lease(LEADER_LEASE_NAME, self.worker_id, self.lease_ttl_seconds)
+            was_leader = self.is_leader
+            self.leader_id = lease.get("holder")
+            self.is_leader = self.leader_id == self.worker_id
+            self.fencing_token = lease.get("fencing_token") if self.is_leader else None
+            if self.is_leader != was_leader:
+                logger.info(
+                    f"[Coordination] {self.worker_id} "
+                    f"{'리더 획득 (token=' + str(self.fencing_token) + ')' if self.is_leader else '리더 상실'}"
+                )
+            
+            self.active_workers = max(1, self.backend.heartbeat_worker(
+                self.worker_id, self.role, self.lease_ttl_seconds
+            ))
+            self._heartbeat_active_runs()
+            self.last_tick_at = datetime.now(timezone.utc)
+            self.last_error = None
+        except Exception as e:
+            # 갱신 실패가 TTL 이상 이어지면 다른 워커가 리더를 인수하므로 스스로도 리더를 내려놓음
+            self.last_error = str(e)
+            if self.is_leader and self.last_tick_at and (
+                datetime.now(timezone.utc) - self.last_tick_at
+            ).total_seconds() >= self.lease_ttl_seconds:
+                self.is_leader = False
+                self.fencing_token = None
+                logger.warning(f"[Coordination] 리스 갱신 실패가 TTL을 넘어 리더 상실: {e}")
+            else:
+                logger.warning(f"[Coordination] 리스 갱신 실패: {e}")
+            return
+        
+        if self.is_leader:
+            await self.recover_stale_runs()
+            self.catch_up_missed_runs()
+        else:
+            # 리더가 다시 되면 그 사이 기간도 다시 확인
+            self._checked_periods.clear()
+    
+    def _heartbeat_active_runs(self):
+        for active in list(self._active.values()):
+            if active.lost:
+                continue
+            kept = set(self.backend.heartbeat_runs(active.run_keys, self.worker_id))
+            if len(kept) < len(active.run_keys):
+                # 네트워크 단절 등으로 heartbeat가 끊긴 사이 다른 워커가 인수함 → 중복 실행 경고
+                active.lost = True
+                logger.warning(
+                    f"[Coordination] {active.job_id} {active.period} ({active.shards.label}) "
+                    f"실행을 다른 워커가 인수함 - 이 워커의 결과는 중복일 수 있음"
+                )
+    
+    def release(self):
+        """정상 종료 시 리스 반납 (다음 워커가 TTL을 기다리지 않고 리더가 됨)"""
+        if not self.is_leader:
+            return
+        try:
+            self.backend.release_lease(LEADER_LEASE_NAME, self.worker_id)
+        except Exception as e:
+            logger.warning(f"[Coordination] 리스 반납 실패: {e}")
+        self.is_leader = False
+        self.fencing_token = None
+    
+    # ---------- 실행 ----------
+    
+    async def run_exclusive(self, job_id: str, period: str, func: JobFunc, mode: str = "scheduled") -> bool:
+        """
+        리더만 실행하는 작업 (기간당 1회)
+        
+        Returns:
+            이 워커가 실행했는지 여부
+        """
+        if not self.is_leader:
+            logger.info(f"[Coordination] {job_id} {period}: 리더가 아님 - 건너뜀 (leader={self.leader_id})")
+            return False
+        
+        run_key = _run_key(job_id, period)
+        meta = {"period": period, "mode": mode}
+        if not self.backend.claim_run(run_key, job_id, self.worker_id, self.run_stale_seconds, meta):
+            logger.info(f"[Coordination] {job_id} {period}: 이미 실행됨/실행 중 - 건너뜀")
+            return False
+        
+        await self._execute(job_id, period, mode, [run_key], ALL_SHARDS, func)
+        return True
+    
+    async def run_sharded(
+        self,
+        job_id: str,
+        period: str,
+        func: JobFunc,
+        mode: str = "scheduled",
+        claim_all: bool = False,
+    ) -> Optional[ShardSet]:
+        """
+        샤드 작업 실행
+        
+        - 기본: 살아있는 워커 수 기준 공평 몫(ceil(샤드 수 / 워커 수))까지 claim
+          (워커마다 시작 샤드를 다르게 해서 claim 경합 최소화)
+        - claim_all: 남은 샤드를 모두 claim (리더의 미claim 정리, 재시작 후 보충 수집)
+        - 리더는 cron 실행 후 claim_grace_seconds 뒤 아무도 claim하지 않은 샤드를 정리
+        
+        Returns:
+            이 워커가 처리한 샤드 (없으면 None)
+        """
+        count = self.shard_count
+        limit = count if claim_all else math.ceil(count / max(1, self.active_workers))
+        offset = shard_of(self.worker_id, count)
+        
+        claimed: List[int] = []
+        for step in range(count):
+            if len(claimed) >= limit:
+                break
+            shard = (offset + step) % count
+            meta = {"period": period, "mode": mode, "shard": shard, "shard_count": count}
+            if self.backend.claim_run(
+                _run_key(job_id, period, shard, count), job_id, self.worker_id, self.run_stale_seconds, meta
+            ):
+                claimed.append(shard)
+        
+        if self.is_leader and mode == "scheduled" and not claim_all and len(claimed) < count:
+            self._spawn(self._sweep_unclaimed(job_id, period, func))
+        
+        if not claimed:
+            logger.info(f"[Coordination] {job_id} {period}: claim할 샤드 없음 - 건너뜀")
+            return None
+        
+        shards = ShardSet(frozenset(claimed), count)
+        run_keys = [_run_key(job_id, period, shard, count) for shard in claimed]
+        await self._execute(job_id, period, mode, run_keys, shards, func)
+        return shards
+    
+    async def _sweep_unclaimed(self, job_id: str, period: str, func: JobFunc):
+        """cron 이후 유예 시간이 지나도 claim되지 않은 샤드 처리 (claim 전에 죽은 워커 몫)"""
+        await asyncio.sleep(self.claim_grace_seconds)
+        if self.is_leader:
+            await self.run_sharded(job_id, period, func, mode="sweep", claim_all=True)
+    
+    async def recover_stale_runs(self):
+        """heartbeat가 끊긴 실행(워커가 실행 중 종료)을 인수해서 재실행"""
+        try:
+            stale_runs = self.backend.stale_runs(self.run_stale_seconds)
+        except Exception as e:
+            logger.warning(f"[Coordination] 끊긴 실행 조회 실패: {e}")
+            return
+        
+        for run in stale_runs:
+            func = self._jobs.get(run["job_id"])
+            if func is None:
+                continue
+            meta = run.get("meta") or {}
+            if not self.backend.claim_run(
+                run["run_key"], run["job_id"], self.worker_id, self.run_stale_seconds, {"mode": "recovery"}
+            ):
+                continue
+            
+            shard = meta.get("shard")
+            shards = ALL_SHARDS if shard is None else ShardSet(frozenset({shard}), meta.get("shard_count", 1))
+            logger.warning(
+                f"[Coordination] {run['job_id']} {meta.get('period')} ({shards.label}) "
+                f"실행이 끊김 (holder={run['holder']}) → 인수해서 재실행"
+            )
+            self._spawn(self._execute(
+                run["job_id"], meta.get("period", ""), "recovery", [run["run_key"]], shards, func
+            ))
+    
+    def catch_up_missed_runs(self):
+        """
+        실행 기록이 없는 단독 작업 기간 실행 (리더만)
+        
+        cron은 모든 워커에서 울리지만 리더만 실행하므로, 그 시각에 리더가 없었거나(리더 교체)
+        재시작으로 cron을 놓친 기간은 다음 tick에서 리더가 claim합니다.
+        이미 실행됐거나 실행 중인 기간은 claim_run이 거절하므로 중복 실행되지 않습니다.
+        """
+        for job_id, due_period in self._due_periods.items():
+            period = due_period()
+            if period is None or self._checked_periods.get(job_id) == period:
+                continue
+            self._checked_periods[job_id] = period
+            self._spawn(self._catch_up(job_id, period, self._jobs[job_id]))
+    
+    async def _catch_up(self, job_id: str, period: str, func: JobFunc):
+        try:
+            if await self.run_exclusive(job_id, period, func, mode="catchup"):
+                logger.warning(f"[Coordination] {job_id} {period}: 실행 기록이 없어 리더가 실행함 (놓친 cron)")
+        except Exception as e:
+            # claim 실패(저장소 오류)면 다음 tick에서 다시 확인
+            self._checked_periods.pop(job_id, None)
+            logger.warning(f"[Coordination] {job_id} {period} 놓친 실행 확인 실패: {e}")
+    
+    async def _execute(
+        self, job_id: str, period: str, mode: str, run_keys: List[str], shards: ShardSet, func: JobFunc
+    ):
+        active = _ActiveRun(job_id=job_id, period=period, mode=mode, run_keys=run_keys, shards=shards)
+        self._active[id(active)] = active
+        status = "completed"
+        detail: Optional[dict] = None
+        try:
+            logger.info(f"[Coordination] {job_id} {period} 실행 ({mode}, 샤드 {shards.label})")
+            await func(shards, period, mode)
+        except Exception as e:
+            status = "failed"
+            detail = {"error": str(e)}
+            logger.error(f"[Coordination] {job_id} {period} 실패: {e}", exc_info=True)
+        finally:
+            self._active.pop(id(active), None)
+            try:
+                self.backend.finish_runs(run_keys, self.worker_id, status, detail)
+            except Exception as e:
+                # 기록 실패 시 heartbeat가 끊긴 것으로 보여 리더가 재실행할 수 있음
+                logger.warning(f"[Coordination] {job_id} {period} 종료 기록 실패: {e}")
+            self._history.append({
+                "job_id": job_id,
+                "period": period,
+                "mode": mode,
+                "shards": shards.label,
+                "status": status,
+                "lost": active.lost,
+                "started_at": active.started_at.isoformat(),
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+            })
+            del self._history[:-50]
+    
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def get_status(self) -> dict:
+        return {
+            "backend": self.backend.name,
+            "worker_id": self.worker_id,
+            "is_leader": self.is_leader,
+            "leader_id": self.leader_id,
+            "fencing_token": self.fencing_token,
+            "active_workers": self.active_workers,
+            "shard_count": self.shard_count,
+            "lease_ttl_seconds": self.lease_ttl_seconds,
+            "run_stale_seconds": self.run_stale_seconds,
+            "last_tick_at": self.last_tick_at.isoformat() if self.last_tick_at else None,
+            "last_error": self.last_error,
+            "running": [
+                {
+                    "job_id": active.job_id,
+                    "period": active.period,
+                    "mode": active.mode,
+                    "shards": active.shards.label,
+                    "started_at": active.started_at.isoformat(),
+                    "lost": active.lost,
+                }
+                for active in self._active.values()
+            ],
+            "recent_runs": list(reversed(self._history)),
+        }
+
+
+# 싱글톤 인스턴스
+scheduler_coordinator = SchedulerCoordinator(
+    create_backend(settings.SCHEDULER_COORDINATION),
+    lease_ttl_seconds=settings.SCHEDULER_LEASE_TTL_SECONDS,
+    run_stale_seconds=settings.SCHEDULER_RUN_STALE_SECONDS,
+    shard_count=settings.SCHEDULER_SHARD_COUNT,
+    claim_grace_seconds=settings.SCHEDULER_SHARD_CLAIM_GRACE_SECONDS,
+    role=settings.WORKER_ROLE,
+)
@@ -12,14 +12,24 @@ Supabase 데이터베이스 연결 설정
 """
 from supabase import create_client, Client
 from contextlib import contextmanager
+from typing import Iterator, List, Sequence, TypeVar
 import os
 import logging
 from dotenv import load_dotenv
+from app.core.metrics import instrument_supabase_client
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 일괄 처리 청크 크기
+# - IN 필터: UUID 36자 × 100개 ≈ 3.7KB (PostgREST URL 길이 제한 내)
+# - 일괄 insert/upsert: 요청 본문 크기와 트랜잭션 길이 균형
+IN_FILTER_CHUNK_SIZE = 100
+BULK_WRITE_CHUNK_SIZE = 500
+
 # Supabase 데이터 클라이언트 인스턴스 (auth 작업 절대 금지!)
 _supabase_client: Client | None = None
 
@@ -48,6 +58,8 @@ def get_supabase_client() -> Client:
             )
         
         _supabase_client = create_client(supabase_url, supabase_key)
+        # PostgREST 요청별 응답 시간/결과를 /metrics에 기록 (테이블/RPC 단위)
+        instrument_supabase_client(_supabase_client)
         logger.info("[Database] 데이터 전용 Supabase 클라이언트 생성 (Service Role Key)")
     
     return _supabase_client
@@ -158,3 +170,15 @@ async def check_database_connection() -> bool:
         return False
 
 
+
+
+def chunked(items: Sequence[T], size: int) -> Iterator[List[T]]:
+    """
+    리스트를 size 단위로 분할 (IN 필터 / 일괄 쓰기용)
+    
+    사용법:
+        for ids in chunked(tracker_ids, IN_FILTER_CHUNK_SIZE):
+            client.table("daily_metrics").select("*").in_("tracker_id", ids).execute()
+    """
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
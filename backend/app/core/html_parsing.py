@@ -0,0 +1,284 @@
+"""
+HTML 파싱 계층 (플레이스 홈 / 정보 탭, 블로그 검색 / 포스트 페이지)
+
+플레이스 홈 페이지는 500KB 안팎(대부분 스크립트)이라 BeautifulSoup(html.parser)로 트리를 만들고
+find_all로 여러 번 훑으면 요청마다 수십 ms가 이벤트 루프에서 소비됩니다.
+사용 가능한 가장 빠른 백엔드로 파싱하고, CSS 선택자로 필요한 요소만 찾습니다.
+
+- 백엔드: selectolax(lexbor) → lxml(+cssselect) → BeautifulSoup(html.parser) 순으로 설치된 것 사용
+  (HTML_PARSER_BACKEND로 고정 가능, 미설치 시 다음 백엔드 / 첫 파싱 때 결정하므로 import 비용 없음)
+- parse_html(html) → HtmlNode (문서 루트), 백엔드와 무관하게 같은 API / 같은 결과
+  - select / select_one: CSS 선택자 (하위 요소만, 문서 순서)
+  - find_all(tags, limit): 태그 이름으로 하위 요소 찾기 (BeautifulSoup find_all과 같은 순서 / limit)
+  - text(): get_text(strip=True)와 같은 텍스트, raw_text(): 공백 유지
+  - script / style 내용은 텍스트에 포함하지 않음 (BeautifulSoup get_text와 동일)
+- run_parser(func, *args): 파싱 함수를 스레드에서 실행 (이벤트 루프 점유 방지)
+
+벤치마크 / 백엔드 간 결과 비교: python -m benchmarks.html_parsing
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 선호 순서
+BACKENDS = ("selectolax", "lxml", "bs4")
+
+# 텍스트에서 제외하는 태그 (파싱 직후 제거)
+NON_TEXT_TAGS = ("script", "style")
+
+T = TypeVar("T")
+
+
+class HtmlNode(ABC):
+    """파싱된 HTML 요소 (백엔드별 구현)"""
+    
+    __slots__ = ("_node",)
+    
+    def __init__(self, node):
+        self._node = node
+    
+    @property
+    @abstractmethod
+    def tag(self) -> str:
+        """태그 이름"""
+    
+    @property
+    @abstractmethod
+    def parent(self) -> Optional["HtmlNode"]:
+        """부모 요소 (문서 루트면 None)"""
+    
+    @abstractmethod
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """속성 값 (값 없는 속성은 빈 문자열)"""
+    
+    @abstractmethod
+    def text(self) -> str:
+        """하위 텍스트 (텍스트 조각마다 strip 후 연결)"""
+    
+    @abstractmethod
+    def raw_text(self) -> str:
+        """하위 텍스트 (공백 유지)"""
+    
+    @abstractmethod
+    def select(self, css: str) -> List["HtmlNode"]:
+        """CSS 선택자에 맞는 하위 요소 (문서 순서)"""
+    
+    def select_one(self, css: str) -> Optional["HtmlNode"]:
+        matches = self.select(css)
+        return matches[0] if matches else None
+    
+    @abstractmethod
+    def find_all(self, tags: Sequence[str], limit: Optional[int] = None) -> List["HtmlNode"]:
+        """태그 이름이 tags 중 하나인 하위 요소 (문서 순서, 최대 limit개)"""
+
+
+class _LexborNode(HtmlNode):
+    __slots__ = ()
+    
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+    
+    @property
+    def parent(self) -> Optional[HtmlNode]:
+        parent = self._node.parent
+        return _LexborNode(parent) if parent is not None else None
+    
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        attributes = self._node.attributes
+        if name not in attributes:
+            return default
+        return attributes[name] or ""
+    
+    def text(self) -> str:
+        return self._node.text(deep=True, separator="", strip=True)
+    
+    def raw_text(self) -> str:
+        return self._node.text(deep=True)
+    
+    def select(self, css: str) -> List[HtmlNode]:
+        # lexbor는 자기 자신도 매칭하므로 제외
+        own_id = self._node.mem_id
+        return [_LexborNode(node) for node in self._node.css(css) if node.mem_id != own_id]
+    
+    def select_one(self, css: str) -> Optional[HtmlNode]:
+        node = self._node.css_first(css)
+        if node is None:
+            return None
+        if node.mem_id != self._node.mem_id:
+            return _LexborNode(node)
+        return super().select_one(css)
+    
+    def find_all(self, tags: Sequence[str], limit: Optional[int] = None) -> List[HtmlNode]:
+        found = []
+        nodes = self._node.traverse()
+        next(nodes, None)  # 자기 자신
+        for node in nodes:
+            if node.tag in tags:
+                found.append(_LexborNode(node))
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+
+@lru_cache(maxsize=256)
+def _lxml_selector(css: str):
+    from lxml.cssselect import CSSSelector
+    return CSSSelector(css)
+
+
+class _LxmlNode(HtmlNode):
+    __slots__ = ()
+    
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+    
+    @property
+    def parent(self) -> Optional[HtmlNode]:
+        parent = self._node.getparent()
+        return _LxmlNode(parent) if parent is not None else None
+    
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self._node.get(name, default)
+    
+    def text(self) -> str:
+        return "".join(part.strip() for part in self._node.itertext())
+    
+    def raw_text(self) -> str:
+        return "".join(self._node.itertext())
+    
+    def select(self, css: str) -> List[HtmlNode]:
+        # cssselect는 descendant-or-self로 변환되므로 자기 자신 제외
+        return [_LxmlNode(node) for node in _lxml_selector(css)(self._node) if node is not self._node]
+    
+    def find_all(self, tags: Sequence[str], limit: Optional[int] = None) -> List[HtmlNode]:
+        found = []
+        for node in self._node.iter(*tags):
+            if node is self._node:
+                continue
+            found.append(_LxmlNode(node))
+            if limit and len(found) >= limit:
+                break
+        return found
+
+
+class _SoupNode(HtmlNode):
+    __slots__ = ()
+    
+    @property
+    def tag(self) -> str:
+        return self._node.name
+    
+    @property
+    def parent(self) -> Optional[HtmlNode]:
+        parent = self._node.parent
+        return _SoupNode(parent) if parent is not None else None
+    
+    def attr(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._node.get(name, default)
+        # class 등 다중 값 속성은 공백으로 연결 (다른 백엔드와 같은 형태)
+        return " ".join(value) if isinstance(value, list) else value
+    
+    def text(self) -> str:
+        return self._node.get_text(strip=True)
+    
+    def raw_text(self) -> str:
+        return self._node.get_text()
+    
+    def select(self, css: str) -> List[HtmlNode]:
+        return [_SoupNode(node) for node in self._node.select(css)]
+    
+    def select_one(self, css: str) -> Optional[HtmlNode]:
+        node = self._node.select_one(css)
+        return _SoupNode(node) if node is not None else None
+    
+    def find_all(self, tags: Sequence[str], limit: Optional[int] = None) -> List[HtmlNode]:
+        return [_SoupNode(node) for node in self._node.find_all(list(tags), limit=limit)]
+
+
+def _parse_selectolax(html: str) -> HtmlNode:
+    from selectolax.lexbor import LexborHTMLParser
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(list(NON_TEXT_TAGS))
+    return _LexborNode(tree.root.parent or tree.root)
+
+
+def _parse_lxml(html: str) -> HtmlNode:
+    import lxml.html
+    from lxml import etree
+    root = lxml.html.fromstring(html)
+    etree.strip_elements(root, *NON_TEXT_TAGS, with_tail=False)
+    return _LxmlNode(root)
+
+
+def _parse_bs4(html: str) -> HtmlNode:
+    from bs4 import BeautifulSoup
+    return _SoupNode(BeautifulSoup(html, "html.parser"))
+
+
+_PARSERS = {
+    "selectolax": _parse_selectolax,
+    "lxml": _parse_lxml,
+    "bs4": _parse_bs4,
+}
+
+
+def backend_available(name: str) -> bool:
+    try:
+        if name == "selectolax":
+            from selectolax.lexbor import LexborHTMLParser  # noqa: F401
+        elif name == "lxml":
+            import lxml.html  # noqa: F401
+            from lxml.cssselect import CSSSelector  # noqa: F401
+        elif name == "bs4":
+            import bs4  # noqa: F401
+        else:
+            return False
+    except ImportError:
+        return False
+    return True
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 (선호 순)"""
+    return [name for name in BACKENDS if backend_available(name)]
+
+
+def _resolve_backend(preferred: str) -> str:
+    preferred = (preferred or "auto").lower()
+    if preferred != "auto" and preferred not in BACKENDS:
+        logger.warning(f"[HTML Parsing] 알 수 없는 백엔드 '{preferred}' → auto")
+        preferred = "auto"
+    candidates: Iterable[str] = BACKENDS if preferred == "auto" else (preferred,) + BACKENDS
+    for name in candidates:
+        if backend_available(name):
+            if preferred not in ("auto", name):
+                logger.warning(f"[HTML Parsing] {preferred} 미설치 → {name} 사용")
+            return name
+    # bs4는 requirements에 포함 (import 시점에 없으면 파싱할 때 ImportError)
+    return "bs4"
+
+
+@lru_cache(maxsize=1)
+def backend_name() -> str:
+    """기본 백엔드 (첫 파싱 시 결정 - 파서 패키지는 HTML 파싱 경로에서만 import)"""
+    name = _resolve_backend(settings.HTML_PARSER_BACKEND)
+    logger.info(f"[HTML Parsing] 백엔드: {name}")
+    return name
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlNode:
+    """HTML 문서 파싱 (backend 미지정 시 설정 / 설치 상태에 따른 기본 백엔드)"""
+    return _PARSERS[backend or backend_name()](html)
+
+
+async def run_parser(func: Callable[..., T], *args: Any) -> T:
+    """파싱 함수를 스레드에서 실행 (큰 페이지 파싱 중에도 이벤트 루프가 다른 요청 처리)"""
+    return await asyncio.to_thread(func, *args)
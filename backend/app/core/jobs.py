@@ -0,0 +1,513 @@
+"""
+백그라운드 작업 엔진 (긴 분석 작업의 비동기 실행)
+
+타겟 키워드 분석 / 경쟁매장 전체 분석 / 완전 진단 / 플레이스 활성화는 20~90초 걸려
+요청 안에서 실행하면 uvicorn 슬롯을 오래 잡고, 클라이언트 연결이 끊기면 결과도 사라집니다.
+
+- enqueue(): 작업 등록 (같은 사용자 + 종류 + 멱등 키면 기존 작업 반환) → API는 202 + job_id 즉시 반환
+- 워커: WORKER_ROLE=all / worker 프로세스에서 JOB_WORKER_CONCURRENCY개 루프가 claim → 실행
+  - 실행 중 JOB_LEASE_SECONDS / 3 간격으로 lease 연장 (워커가 죽으면 lease 만료 후 다른 워커가 재실행)
+  - 취소 요청 / 다른 워커 인수가 확인되면 실행 중단
+- JobContext.progress(): 진행률 / 단계 메시지 저장 → GET /api/v1/jobs/{job_id} (또는 /events SSE)
+- 결과 / 오류({status_code, detail})는 작업 행에 저장 (7일 보관)
+
+백엔드:
+- supabase: background_jobs 테이블 + RPC (supabase/migrations/20261019050000_add_background_jobs.sql)
+- local: 프로세스 내 메모리 (단일 워커 / 개발 / 테스트, 재시작 시 사라짐)
+
+핸들러 등록:
+    JOB_HANDLERS의 "모듈:함수" (첫 실행 시 import)
+    async def handler(params: dict, current_user: dict, job: JobContext) -> dict
+    - HTTPException 등 status_code / detail 속성이 있는 예외는 그대로 오류로 저장
+"""
+import asyncio
+import copy
+import importlib
+import logging
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+# 작업 종류 → 핸들러 ("모듈:함수", 첫 실행 시 import)
+JOB_HANDLERS: Dict[str, str] = {
+    "target_keyword_analysis": "app.routers.target_keywords:run_target_keyword_analysis",
+    "competitor_analysis": "app.routers.naver:run_competitor_analysis",
+    "place_diagnosis": "app.routers.naver:run_place_diagnosis",
+    "place_activation": "app.routers.naver:run_place_activation",
+}
+
+JobHandler = Callable[[dict, dict, "JobContext"], Awaitable[dict]]
+
+
+class JobContext:
+    """핸들러에 전달되는 작업 정보 / 진행률 보고 (동기 실행 시에는 NO_JOB: 아무것도 하지 않음)"""
+    
+    def __init__(self, job_id: Optional[str] = None, engine: Optional["JobEngine"] = None):
+        self.job_id = job_id
+        self._engine = engine
+    
+    @property
+    def is_background(self) -> bool:
+        return self.job_id is not None
+    
+    async def progress(self, percent: int, message: Optional[str] = None):
+        if self._engine is None:
+            return
+        self._engine.report_progress(self.job_id, max(0, min(100, int(percent))), message)
+
+
+NO_JOB = JobContext()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# ============================================
+# 백엔드
+# ============================================
+
+class LocalJobBackend:
+    """프로세스 내 메모리 작업 큐 (supabase 백엔드와 같은 claim / lease / 멱등 규칙)"""
+    
+    name = "local"
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, dict] = {}
+    
+    @staticmethod
+    def _public(job: dict) -> dict:
+        return copy.deepcopy(job)
+    
+    def enqueue(
+        self, user_id: Optional[str], kind: str, params: dict,
+        idempotency_key: Optional[str], max_attempts: int
+    ) -> Tuple[dict, bool]:
+        with self._lock:
+            if idempotency_key:
+                for job in self._jobs.values():
+                    if (job["user_id"], job["kind"], job["idempotency_key"]) == (user_id, kind, idempotency_key):
+                        return self._public(job), False
+            now = _now()
+            job = {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "kind": kind,
+                "idempotency_key": idempotency_key,
+                "status": "queued",
+                "params": copy.deepcopy(params),
+                "progress": 0,
+                "progress_message": None,
+                "result": None,
+                "error": None,
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "worker_id": None,
+                "lease_expires_at": None,
+                "cancel_requested": False,
+                "created_at": now,
+                "started_at": None,
+                "finished_at": None,
+                "updated_at": now,
+            }
+            self._jobs[job["id"]] = job
+            return self._public(job), True
+    
+    def claim(self, worker_id: str, kinds: List[str], lease_seconds: int) -> Optional[dict]:
+        with self._lock:
+            now = _now()
+            candidates = []
+            for job in self._jobs.values():
+                expired = job["status"] == "running" and job["lease_expires_at"] < now
+                if expired and job["attempts"] >= job["max_attempts"]:
+                    job.update(
+                        status="failed", finished_at=now, updated_at=now,
+                        error={"status_code": 500, "detail": "작업을 처리하던 워커가 중단되었습니다"},
+                    )
+                    continue
+                if job["kind"] in kinds and not job["cancel_requested"] and (job["status"] == "queued" or expired):
+                    candidates.append(job)
+            if not candidates:
+                return None
+            job = min(candidates, key=lambda item: item["created_at"])
+            job.update(
+                status="running",
+                worker_id=worker_id,
+                attempts=job["attempts"] + 1,
+                started_at=job["started_at"] or now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                updated_at=now,
+            )
+            return self._public(job)
+    
+    def heartbeat(
+        self, job_id: str, worker_id: str, lease_seconds: int,
+        progress: Optional[int] = None, message: Optional[str] = None
+    ) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["worker_id"] != worker_id or job["status"] != "running":
+                return False
+            now = _now()
+            job["lease_expires_at"] = now + timedelta(seconds=lease_seconds)
+            job["updated_at"] = now
+            if progress is not None:
+                job["progress"] = progress
+            if message is not None:
+                job["progress_message"] = message
+            return not job["cancel_requested"]
+    
+    def finish(
+        self, job_id: str, worker_id: str, status: str,
+        result: Optional[dict], error: Optional[dict]
+    ) -> bool:
+        with self._lock:
+            now = _now()
+            job = self._jobs.get(job_id)
+            found = bool(job and job["worker_id"] == worker_id and job["status"] == "running")
+            if found:
+                job.update(
+                    status=status, result=result, error=error,
+                    progress=100 if status == "succeeded" else job["progress"],
+                    lease_expires_at=None, finished_at=now, updated_at=now,
+                )
+            cutoff = now - timedelta(days=7)
+            for stale_id in [key for key, item in self._jobs.items() if item["finished_at"] and item["finished_at"] < cutoff]:
+                del self._jobs[stale_id]
+            return found
+    
+    def cancel(self, job_id: str, user_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["user_id"] != user_id or job["status"] not in ("queued", "running"):
+                return None
+            now = _now()
+            job["cancel_requested"] = True
+            job["updated_at"] = now
+            if job["status"] == "queued":
+                job["status"] = "cancelled"
+                job["finished_at"] = now
+            return self._public(job)
+    
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return self._public(job) if job else None
+    
+    def list_for_user(self, user_id: str, kind: Optional[str], limit: int) -> List[dict]:
+        with self._lock:
+            jobs = [
+                job for job in self._jobs.values()
+                if job["user_id"] == user_id and (kind is None or job["kind"] == kind)
+            ]
+            jobs.sort(key=lambda item: item["created_at"], reverse=True)
+            return [self._public(job) for job in jobs[:limit]]
+
+
+class SupabaseJobBackend:
+    """background_jobs 테이블 + RPC"""
+    
+    name = "supabase"
+    
+    # 목록 조회 시 결과 본문은 제외 (상세 조회에서만 반환)
+    LIST_COLUMNS = (
+        "id, user_id, kind, idempotency_key, status, progress, progress_message, error, "
+        "attempts, max_attempts, cancel_requested, created_at, started_at, finished_at, updated_at"
+    )
+    
+    @property
+    def supabase(self):
+        from app.core.database import get_supabase_client
+        return get_supabase_client()
+    
+    def enqueue(
+        self, user_id: Optional[str], kind: str, params: dict,
+        idempotency_key: Optional[str], max_attempts: int
+    ) -> Tuple[dict, bool]:
+        result = self.supabase.rpc("enqueue_background_job", {
+            "p_user_id": user_id,
+            "p_kind": kind,
+            "p_params": params,
+            "p_idempotency_key": idempotency_key,
+            "p_max_attempts": max_attempts,
+        }).execute()
+        return result.data["job"], bool(result.data["created"])
+    
+    def claim(self, worker_id: str, kinds: List[str], lease_seconds: int) -> Optional[dict]:
+        result = self.supabase.rpc("claim_background_job", {
+            "p_worker_id": worker_id,
+            "p_kinds": kinds,
+            "p_lease_seconds": lease_seconds,
+        }).execute()
+        return result.data[0] if result.data else None
+    
+    def heartbeat(
+        self, job_id: str, worker_id: str, lease_seconds: int,
+        progress: Optional[int] = None, message: Optional[str] = None
+    ) -> bool:
+        result = self.supabase.rpc("heartbeat_background_job", {
+            "p_job_id": job_id,
+            "p_worker_id": worker_id,
+            "p_lease_seconds": lease_seconds,
+            "p_progress": progress,
+            "p_message": message,
+        }).execute()
+        return bool(result.data)
+    
+    def finish(
+        self, job_id: str, worker_id: str, status: str,
+        result: Optional[dict], error: Optional[dict]
+    ) -> bool:
+        response = self.supabase.rpc("finish_background_job", {
+            "p_job_id": job_id,
+            "p_worker_id": worker_id,
+            "p_status": status,
+            "p_result": result,
+            "p_error": error,
+        }).execute()
+        return bool(response.data)
+    
+    def cancel(self, job_id: str, user_id: str) -> Optional[dict]:
+        result = self.supabase.rpc("cancel_background_job", {
+            "p_job_id": job_id,
+            "p_user_id": user_id,
+        }).execute()
+        return result.data[0] if result.data else None
+    
+    def get(self, job_id: str) -> Optional[dict]:
+        result = self.supabase.table("background_jobs").select("*").eq("id", job_id).limit(1).execute()
+        return result.data[0] if result.data else None
+    
+    def list_for_user(self, user_id: str, kind: Optional[str], limit: int) -> List[dict]:
+        query = self.supabase.table("background_jobs").select(self.LIST_COLUMNS).eq("user_id", user_id)
+        if kind:
+            query = query.eq("kind", kind)
+        result = query.order("created_at", desc=True).limit(limit).execute()
+        return result.data or []
+
+
+def create_backend(kind: str):
+    if kind == "supabase":
+        return SupabaseJobBackend()
+    if kind != "local":
+        logger.warning(f"[Jobs] 알 수 없는 JOB_BACKEND={kind} → local 사용")
+    return LocalJobBackend()
+
+
+# ============================================
+# 엔진
+# ============================================
+
+class JobEngine:
+    """작업 등록 / 조회 + 워커 루프"""
+    
+    def __init__(
+        self,
+        backend,
+        concurrency: int = 2,
+        lease_seconds: int = 60,
+        max_attempts: int = 2,
+        poll_interval_seconds: float = 1.0,
+        worker_id: Optional[str] = None,
+    ):
+        self.backend = backend
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = max(6, lease_seconds)
+        self.max_attempts = max(1, max_attempts)
+        self.poll_interval_seconds = max(0.1, poll_interval_seconds)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Dict[str, dict] = {}
+        self._stats = {"claimed": 0, "succeeded": 0, "failed": 0, "cancelled": 0, "lost": 0}
+    
+    # ---------- 등록 / 조회 ----------
+    
+    def enqueue(
+        self,
+        kind: str,
+        params: dict,
+        user_id: Optional[str],
+        idempotency_key: Optional[str] = None,
+    ) -> Tuple[dict, bool]:
+        """
+        작업 등록
+        
+        Returns:
+            (작업, 새로 생성 여부) - 같은 멱등 키의 작업이 있으면 (기존 작업, False)
+        """
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        job, created = self.backend.enqueue(
+            str(user_id) if user_id else None, kind, params, idempotency_key or None, self.max_attempts
+        )
+        if created:
+            logger.info(f"[Jobs] 등록: {kind} {job['id']} (user={user_id})")
+            if self._wakeup is not None:
+                self._wakeup.set()
+        return job, created
+    
+    def get(self, job_id: str) -> Optional[dict]:
+        return self.backend.get(job_id)
+    
+    def list_for_user(self, user_id: str, kind: Optional[str] = None, limit: int = 20) -> List[dict]:
+        return self.backend.list_for_user(str(user_id), kind, limit)
+    
+    def cancel(self, job_id: str, user_id: str) -> Optional[dict]:
+        job = self.backend.cancel(job_id, str(user_id))
+        running = self._running.get(job_id)
+        if job and running:
+            running["task"].cancel()
+        return job
+    
+    def report_progress(self, job_id: str, percent: int, message: Optional[str]):
+        running = self._running.get(job_id)
+        if running is None:
+            return
+        running["progress"] = percent
+        try:
+            if not self.backend.heartbeat(job_id, self.worker_id, self.lease_seconds, percent, message):
+                running["task"].cancel()
+        except Exception as e:
+            logger.warning(f"[Jobs] 진행률 저장 실패 ({job_id}): {e}")
+    
+    # ---------- 워커 ----------
+    
+    def _handler(self, kind: str) -> JobHandler:
+        if kind not in self._handlers:
+            module_path, func_name = JOB_HANDLERS[kind].split(":")
+            self._handlers[kind] = getattr(importlib.import_module(module_path), func_name)
+        return self._handlers[kind]
+    
+    def start(self):
+        """워커 루프 시작 (이벤트 루프 안에서 호출)"""
+        if self._workers:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(index), name=f"job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"[Jobs] 워커 {self.concurrency}개 시작 ({self.backend.name}, worker={self.worker_id})")
+    
+    async def stop(self):
+        """
+        워커 루프 종료
+        
+        실행 중이던 작업은 중단되고 lease 만료 후 다른 워커(또는 재시작한 이 워커)가 다시 실행
+        """
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def _worker_loop(self, index: int):
+        kinds = list(JOB_HANDLERS)
+        while True:
+            try:
+                job = self.backend.claim(self.worker_id, kinds, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"[Jobs] claim 실패: {e}")
+                job = None
+            
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self._run(job)
+    
+    async def _run(self, job: dict):
+        from fastapi.encoders import jsonable_encoder
+        
+        job_id = str(job["id"])
+        self._stats["claimed"] += 1
+        logger.info(f"[Jobs] 실행: {job['kind']} {job_id} (시도 {job['attempts']}/{job['max_attempts']})")
+        
+        context = JobContext(job_id, self)
+        current_user = {"id": job["user_id"]} if job.get("user_id") else None
+        task = asyncio.create_task(self._handler(job["kind"])(job["params"], current_user, context))
+        self._running[job_id] = {"task": task, "kind": job["kind"], "progress": 0, "started_at": _now()}
+        
+        status, result, error = "succeeded", None, None
+        try:
+            # 완료될 때까지 lease 연장 (다른 워커가 인수했거나 취소 요청이면 중단)
+            while not task.done():
+                await asyncio.wait({task}, timeout=self.lease_seconds / 3)
+                if not task.done() and not self.backend.heartbeat(job_id, self.worker_id, self.lease_seconds):
+                    task.cancel()
+            result = jsonable_encoder(task.result())
+        except asyncio.CancelledError:
+            if not task.done():
+                # 워커 종료 (stop) → 작업은 lease 만료 후 재실행되도록 기록하지 않음
+                task.cancel()
+                self._running.pop(job_id, None)
+                raise
+            status, error = "cancelled", {"status_code": 499, "detail": "작업이 취소되었습니다"}
+        except Exception as e:
+            status = "failed"
+            error = {
+                "status_code": getattr(e, "status_code", 500),
+                "detail": getattr(e, "detail", None) or str(e),
+            }
+            if error["status_code"] >= 500:
+                logger.error(f"[Jobs] 실패: {job['kind']} {job_id}: {e}", exc_info=True)
+        finally:
+            self._running.pop(job_id, None)
+        
+        try:
+            recorded = self.backend.finish(job_id, self.worker_id, status, result, jsonable_encoder(error))
+        except Exception as e:
+            recorded = False
+            logger.error(f"[Jobs] 결과 저장 실패 ({job_id}): {e}")
+        if not recorded:
+            # 다른 워커가 인수한 뒤 끝난 실행 (결과는 인수한 워커 기준)
+            self._stats["lost"] += 1
+        self._stats[status] += 1
+        logger.info(f"[Jobs] 종료: {job['kind']} {job_id} → {status}")
+    
+    def get_status(self) -> dict:
+        return {
+            "backend": self.backend.name,
+            "worker_id": self.worker_id,
+            "workers": len(self._workers),
+            "concurrency": self.concurrency,
+            "lease_seconds": self.lease_seconds,
+            "kinds": list(JOB_HANDLERS),
+            "running": [
+                {
+                    "job_id": job_id,
+                    "kind": running["kind"],
+                    "progress": running["progress"],
+                    "started_at": running["started_at"].isoformat(),
+                }
+                for job_id, running in self._running.items()
+            ],
+            "stats": dict(self._stats),
+        }
+
+
+# 싱글톤 인스턴스
+job_engine = JobEngine(
+    create_backend(settings.JOB_BACKEND),
+    concurrency=settings.JOB_WORKER_CONCURRENCY,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    poll_interval_seconds=settings.JOB_POLL_INTERVAL_SECONDS,
+)
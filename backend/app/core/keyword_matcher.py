@@ -0,0 +1,167 @@
+"""
+다중 패턴 키워드 매처 (Aho-Corasick)
+
+SEO 분석처럼 수백 개의 키워드(+띄어쓰기 변형)를 여러 텍스트 필드에서 세야 할 때
+키워드마다 str.count()로 텍스트를 반복 스캔하지 않고,
+오토마톤을 한 번 컴파일한 뒤 필드당 한 번의 스캔으로 모든 키워드를 카운트합니다.
+
+카운트 규칙은 기존 str.count()와 동일합니다:
+- 패턴별로 겹치지 않는(non-overlapping) 출현 횟수
+- case_sensitive=False면 텍스트/패턴 모두 lower() 후 비교
+- 빈 패턴은 카운트 0 (contains()는 `"" in text`와 동일하게 True)
+
+사용법:
+    matcher = KeywordMatcher(["종로맛집", "종로 맛집"])
+    counts = matcher.count_fields({"description": desc, "road": road})
+    counts["description"].count("종로맛집")
+"""
+from typing import Dict, Iterable, List, Tuple
+
+
+class MatchCounts:
+    """한 텍스트에 대한 패턴별 매칭 결과"""
+
+    __slots__ = ("_counts", "_case_sensitive")
+
+    def __init__(self, counts: Dict[str, int], case_sensitive: bool):
+        self._counts = counts
+        self._case_sensitive = case_sensitive
+
+    def count(self, pattern: str) -> int:
+        """패턴 출현 횟수 (str.count와 동일한 non-overlapping 기준)"""
+        if not pattern:
+            return 0
+        key = pattern if self._case_sensitive else pattern.lower()
+        return self._counts.get(key, 0)
+
+    def contains(self, pattern: str) -> bool:
+        """패턴 포함 여부 (`pattern in text`와 동일)"""
+        if not pattern:
+            return True
+        return self.count(pattern) > 0
+
+    def total(self) -> int:
+        """전체 매칭 횟수"""
+        return sum(self._counts.values())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 기반 다중 패턴 매처
+
+    - 생성 시 1회 컴파일 (trie + failure link)
+    - 상태 전이는 스캔 중 지연 계산 후 캐시 (DFA화)
+    - 패턴에 쓰이지 않는 문자는 즉시 루트로 복귀 (한글 리뷰 본문에서 대부분의 문자)
+    """
+
+    def __init__(self, patterns: Iterable[str], case_sensitive: bool = False):
+        self.case_sensitive = case_sensitive
+
+        # 패턴 정규화 + 중복 제거 (빈 패턴은 제외)
+        self._patterns: List[str] = []
+        seen = set()
+        for pattern in patterns:
+            if not pattern:
+                continue
+            key = pattern if case_sensitive else pattern.lower()
+            if key not in seen:
+                seen.add(key)
+                self._patterns.append(key)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[int, ...]] = [()]
+        self._alphabet = set()
+
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def _build(self):
+        """trie 구성 후 BFS로 failure link / output 집합 계산"""
+        goto = self._goto
+        own_outputs: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                self._alphabet.add(ch)
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    self._fail.append(0)
+                    own_outputs.append([])
+                    goto[state][ch] = nxt
+                state = nxt
+            own_outputs[state].append(pattern_id)
+
+        self._outputs = [()] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            self._outputs[state] = tuple(own_outputs[state])
+
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 자신의 패턴 + failure 경로상의 패턴 (suffix 매칭)
+                self._outputs[nxt] = tuple(own_outputs[nxt]) + self._outputs[self._fail[nxt]]
+
+    def _transition(self, state: int, ch: str) -> int:
+        """goto 함수 (failure link 추적) - 결과는 호출측에서 캐시"""
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(ch, 0)
+
+    def count(self, text: str) -> MatchCounts:
+        """텍스트 1회 스캔으로 모든 패턴의 출현 횟수 계산"""
+        counts: Dict[str, int] = {}
+        if not text or not self._patterns:
+            return MatchCounts(counts, self.case_sensitive)
+
+        if not self.case_sensitive:
+            text = text.lower()
+
+        patterns = self._patterns
+        goto = self._goto
+        outputs = self._outputs
+        alphabet = self._alphabet
+        # 패턴별 마지막 매칭 끝 위치 (non-overlapping 판정용)
+        last_end = [0] * len(patterns)
+        hits = [0] * len(patterns)
+
+        state = 0
+        for index, ch in enumerate(text):
+            if ch not in alphabet:
+                state = 0
+                continue
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = self._transition(state, ch)
+                goto[state][ch] = nxt
+            state = nxt
+
+            for pattern_id in outputs[state]:
+                end = index + 1
+                if end - len(patterns[pattern_id]) >= last_end[pattern_id]:
+                    hits[pattern_id] += 1
+                    last_end[pattern_id] = end
+
+        for pattern_id, hit in enumerate(hits):
+            if hit:
+                counts[patterns[pattern_id]] = hit
+
+        return MatchCounts(counts, self.case_sensitive)
+
+    def count_fields(self, fields: Dict[str, str]) -> Dict[str, MatchCounts]:
+        """여러 필드를 각각 1회씩 스캔"""
+        return {name: self.count(text or "") for name, text in fields.items()}
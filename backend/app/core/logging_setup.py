@@ -0,0 +1,210 @@
+"""
+로깅 설정 (큐 기반 비동기 출력 + 구조화 JSON 로그 + 런타임 레벨 변경 + 상세 덤프 샘플링)
+
+리뷰 조회 / 인증 / Selenium 등 요청 경로의 print(..., flush=True)는 이벤트 루프에서
+동기 stdout 쓰기를 하므로 부하 시 지연이 누적됩니다. 이 모듈은:
+
+- 루트 로거에 NonBlockingQueueHandler만 연결 → 호출 측은 큐에 넣기만 하고,
+  실제 포맷/출력은 QueueListener 스레드가 처리 (큐가 가득 차면 대기하지 않고 버림)
+- LOG_FORMAT=json: 한 줄에 JSON 1개 (ts, level, logger, msg + extra 필드)
+- set_logger_level(): 재시작 없이 로거별 레벨 변경 (관리자 API: /api/v1/admin/logging)
+- debug_dump_enabled(): 리뷰 ID 목록 같은 요청 단위 상세 덤프는
+  해당 로거가 DEBUG이고 요청이 샘플링된 경우에만 출력
+
+사용법:
+    logger = logging.getLogger(__name__)
+    
+    logger.debug(f"페이지 {page} 요청")
+    if debug_dump_enabled(logger):
+        for item in items:
+            logger.debug(f"  {item['id']}")
+    
+    logger.info("리뷰 조회 완료", extra={"place_id": place_id, "count": len(reviews)})
+"""
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+TEXT_FORMAT = "%(levelname)s:     %(name)s - %(message)s"
+
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# LogRecord 기본 속성 (extra로 전달된 필드만 JSON에 포함하기 위해 구분)
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷 (extra 필드는 최상위 키로 포함)"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    큐에 넣기만 하는 핸들러 (가득 차면 버리고 dropped 증가)
+    
+    메시지 인자 포맷 / 예외 문자열화는 호출 시점에 수행
+    (리스너 스레드에서 포맷하면 그 사이 변경된 객체가 찍힐 수 있음)
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+_level_overrides: Dict[str, str] = {}
+_debug_sample_rate: float = min(1.0, max(0.0, settings.LOG_DEBUG_SAMPLE_RATE))
+
+# 현재 요청(컨텍스트)의 상세 덤프 샘플링 결정 (요청 안에서는 한 번 정한 결정을 유지)
+_dump_sampled: ContextVar[Optional[bool]] = ContextVar("debug_dump_sampled", default=None)
+
+
+def _parse_level(level: str) -> int:
+    numeric = logging.getLevelName(level.upper())
+    if not isinstance(numeric, int):
+        raise ValueError(f"알 수 없는 로그 레벨: {level}")
+    return numeric
+
+
+def setup_logging():
+    """루트 로거를 큐 핸들러로 교체하고 출력 스레드 시작 (중복 호출 시 무시)"""
+    global _queue_handler, _listener
+    if _listener is not None:
+        return
+    
+    formatter = JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue: queue.Queue = queue.Queue(maxsize=max(0, settings.LOG_QUEUE_SIZE))
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    root.setLevel(_parse_level(settings.LOG_LEVEL))
+    
+    # uvicorn 로거(접근 로그 등)도 같은 큐로 출력 (요청마다 동기 쓰기 방지)
+    for name in UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        for handler in uvicorn_logger.handlers[:]:
+            uvicorn_logger.removeHandler(handler)
+        uvicorn_logger.propagate = True
+    
+    for name in filter(None, (part.strip() for part in settings.LOG_DEBUG_LOGGERS.split(","))):
+        set_logger_level(name, "DEBUG")
+    
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """출력 스레드 종료 (큐에 남은 로그는 모두 출력 후 종료)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_logger_level(name: str, level: Optional[str]) -> Dict[str, str]:
+    """
+    로거 레벨 변경 (재시작 불필요)
+    
+    Args:
+        name: 로거 이름 (예: app.services.naver_review_service, "root"는 루트 로거)
+        level: DEBUG / INFO / WARNING / ERROR, None이면 설정 해제 (상위 로거 레벨 상속)
+    
+    Returns:
+        현재 설정된 로거별 레벨
+    """
+    root = logging.getLogger()
+    logger = root if name in ("", "root") else logging.getLogger(name)
+    if level is None:
+        logger.setLevel(_parse_level(settings.LOG_LEVEL) if logger is root else logging.NOTSET)
+        _level_overrides.pop(name, None)
+    else:
+        logger.setLevel(_parse_level(level))
+        _level_overrides[name] = level.upper()
+    return dict(_level_overrides)
+
+
+def set_debug_sample_rate(rate: float) -> float:
+    """상세 덤프 샘플링 비율 변경 (0~1)"""
+    global _debug_sample_rate
+    _debug_sample_rate = min(1.0, max(0.0, rate))
+    return _debug_sample_rate
+
+
+def debug_dump_enabled(logger: logging.Logger) -> bool:
+    """
+    요청 단위 상세 덤프 출력 여부
+    
+    - 로거가 DEBUG가 아니면 즉시 False (기본 운영 설정에서는 비교 1회가 전부)
+    - DEBUG면 현재 요청마다 한 번 샘플링 (LOG_DEBUG_SAMPLE_RATE) → 같은 요청의 덤프는 전부 출력 / 전부 생략
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    sampled = _dump_sampled.get()
+    if sampled is None:
+        sampled = random.random() < _debug_sample_rate
+        _dump_sampled.set(sampled)
+    return sampled
+
+
+def get_logging_status() -> dict:
+    """로깅 설정 / 큐 상태 (관리자 API)"""
+    return {
+        "format": settings.LOG_FORMAT,
+        "root_level": logging.getLevelName(logging.getLogger().level),
+        "levels": dict(_level_overrides),
+        "debug_sample_rate": _debug_sample_rate,
+        "queue": {
+            "enabled": _listener is not None,
+            "pending": _queue_handler.queue.qsize() if _queue_handler else 0,
+            "capacity": settings.LOG_QUEUE_SIZE,
+            "dropped": _queue_handler.dropped if _queue_handler else 0,
+        },
+    }
@@ -0,0 +1,505 @@
+"""
+Prometheus 형식 메트릭 (프로세스 내 레지스트리, 외부 의존성 없음)
+
+/metrics 엔드포인트가 text exposition format(0.0.4)으로 노출합니다.
+
+수집 항목:
+- egurado_upstream_requests_total (Counter)
+- egurado_upstream_request_duration_seconds (Histogram)
+    labels: upstream / operation / outcome / connection
+    - upstream: naver_graphql, naver_html, naver_searchad, openai, nhn, supabase
+    - operation: GraphQL operationName, HTML 페이지 종류, OpenAI 모델, Supabase 테이블/RPC 등
+    - outcome: success, http_4xx, http_5xx, rate_limited, timeout, error
+    - connection: proxy / direct
+- 게이지 (스크레이프 시점에 콜백으로 계산):
+    레이트 리미터 활성/대기 수, 프록시별 동시 사용 수,
+    Playwright 브라우저 컨텍스트 수, Selenium 드라이버 수, 답글 큐 길이
+
+설계 원칙:
+- 호출 경로에서는 dict 조회 + 덧셈만 수행 (스크레이프 시점에 문자열 생성)
+- 라벨 값은 유한 집합만 사용 (키워드/place_id 등 사용자 입력 금지 → 카디널리티 폭발 방지)
+- Supabase 훅은 동기 스레드에서도 호출되므로 threading.Lock으로 보호
+"""
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.tracing import record_span
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 외부 API 응답 시간 구간 (초) - 네이버 GraphQL 0.1~3초, OpenAI 수~수십 초
+DEFAULT_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+UPSTREAM_LABELS = ("upstream", "operation", "outcome", "connection")
+
+LabelValues = Tuple[str, ...]
+GaugeCallback = Callable[[], Iterable[Tuple[Dict[str, str], float]]]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    metric_type = "untyped"
+    
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+    
+    def _label_values(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+    
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+    
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    
+    metric_type = "counter"
+    
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+    
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """누적 구간 히스토그램 (_bucket / _sum / _count)"""
+    
+    metric_type = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합 → [구간별 개수..., 합계, 전체 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+    
+    def observe(self, value: float, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+    
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        
+        lines = []
+        for key, state in items:
+            cumulative = 0.0
+            for index, bound in enumerate(self.buckets):
+                cumulative += state[index]
+                labels = _format_labels(self.label_names, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.label_names, key, ("le", "+Inf"))
+            lines.append(f"{self.name}_bucket{labels} {_format_value(state[-1])}")
+            plain = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{plain} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{plain} {_format_value(state[-1])}")
+        return lines
+
+
+class Gauge(_Metric):
+    """
+    게이지
+    
+    - set(): 직접 값 설정
+    - callback: 스크레이프 시점에 (labels, value) 목록을 계산 (리미터/큐 등 기존 상태 조회)
+    """
+    
+    metric_type = "gauge"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[GaugeCallback] = None
+    ):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback = callback
+    
+    def set(self, value: float, **labels: str):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        
+        if self._callback is not None:
+            try:
+                for labels, value in self._callback():
+                    values[self._label_values(labels)] = value
+            except Exception as e:
+                logger.warning(f"[Metrics] 게이지 콜백 실패 ({self.name}): {str(e)}")
+        
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class MetricsRegistry:
+    """메트릭 등록 + text exposition 렌더링"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+    
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[GaugeCallback] = None
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names, callback))
+    
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ============================================
+# 외부 API(upstream) 호출 메트릭
+# ============================================
+
+registry = MetricsRegistry()
+
+upstream_requests_total = registry.counter(
+    "egurado_upstream_requests_total",
+    "Upstream API requests by upstream, operation, outcome and connection type.",
+    UPSTREAM_LABELS,
+)
+upstream_request_duration_seconds = registry.histogram(
+    "egurado_upstream_request_duration_seconds",
+    "Upstream API request latency in seconds.",
+    UPSTREAM_LABELS,
+)
+
+
+def connection_type(proxy_url: Optional[str]) -> str:
+    """프록시 사용 여부 → connection 라벨"""
+    return "proxy" if proxy_url else "direct"
+
+
+def outcome_for_status(status_code: int) -> str:
+    """HTTP 상태 코드 → outcome 라벨"""
+    if status_code == 429:
+        return "rate_limited"
+    if status_code >= 500:
+        return "http_5xx"
+    if status_code >= 400:
+        return "http_4xx"
+    return "success"
+
+
+def outcome_for_exception(error: BaseException) -> str:
+    """예외 → outcome 라벨 (httpx/openai/requests 타임아웃은 이름으로 판별)"""
+    if "Timeout" in type(error).__name__ or isinstance(error, TimeoutError):
+        return "timeout"
+    status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return outcome_for_status(status_code)
+    return "error"
+
+
+def record_upstream(upstream: str, operation: str, outcome: str, connection: str, seconds: float):
+    """외부 API 호출 1건 기록"""
+    upstream_requests_total.inc(
+        upstream=upstream, operation=operation, outcome=outcome, connection=connection
+    )
+    upstream_request_duration_seconds.observe(
+        seconds, upstream=upstream, operation=operation, outcome=outcome, connection=connection
+    )
+    # 요청 트레이스가 있으면 Server-Timing span으로도 기록
+    record_span(f"{upstream}.{operation}", seconds)
+
+
+class UpstreamObservation:
+    """observe_upstream 블록 안에서 결과(outcome)를 지정하는 핸들"""
+    
+    __slots__ = ("outcome",)
+    
+    def __init__(self):
+        self.outcome = "success"
+    
+    def set_status(self, status_code: int):
+        self.outcome = outcome_for_status(status_code)
+
+
+@contextmanager
+def observe_upstream(upstream: str, operation: str = "", connection: str = "direct") -> Iterator[UpstreamObservation]:
+    """
+    외부 API 호출 시간/결과 기록
+    
+    사용법:
+        with observe_upstream("naver_graphql", operation, connection_type(proxy_url)) as obs:
+            response = await client.post(...)
+            obs.set_status(response.status_code)
+    
+    - 블록이 예외로 끝나면 예외 종류로 outcome 결정 (상태 코드를 이미 지정했다면 유지)
+    """
+    observation = UpstreamObservation()
+    started = time.perf_counter()
+    try:
+        yield observation
+    except BaseException as e:
+        if observation.outcome == "success":
+            observation.outcome = outcome_for_exception(e)
+        raise
+    finally:
+        record_upstream(
+            upstream, operation or "unknown", observation.outcome, connection,
+            time.perf_counter() - started
+        )
+
+
+async def observe_upstream_call(upstream: str, operation: str, connection: str, awaitable):
+    """
+    awaitable 하나를 observe_upstream으로 감싸 실행 (OpenAI SDK처럼 응답에 상태 코드가 없는 호출용)
+    
+    사용법:
+        response = await observe_upstream_call("openai", model, "direct", client.chat.completions.create(...))
+    """
+    with observe_upstream(upstream, operation, connection):
+        return await awaitable
+
+
+# ============================================
+# Supabase (PostgREST) 요청 메트릭 - httpx 이벤트 훅
+# ============================================
+
+def _supabase_operation(path: str) -> str:
+    """/rest/v1/{table} → table, /rest/v1/rpc/{name} → rpc:name"""
+    parts = [part for part in path.split("/") if part]
+    if "rpc" in parts:
+        index = parts.index("rpc")
+        if index + 1 < len(parts):
+            return f"rpc:{parts[index + 1]}"
+    if len(parts) >= 3 and parts[0] == "rest":
+        return parts[2]
+    return parts[-1] if parts else "unknown"
+
+
+def _on_supabase_request(request):
+    request.extensions["egurado_started_at"] = time.perf_counter()
+
+
+def _on_supabase_response(response):
+    request = response.request
+    started = request.extensions.get("egurado_started_at")
+    if started is None:
+        return
+    record_upstream(
+        "supabase",
+        _supabase_operation(request.url.path),
+        outcome_for_status(response.status_code),
+        "direct",
+        time.perf_counter() - started,
+    )
+
+
+def instrument_supabase_client(client) -> bool:
+    """
+    Supabase 클라이언트의 PostgREST 세션(httpx.Client)에 메트릭 훅 등록
+    
+    네트워크 오류(응답 없음)는 호출부 예외로 전파되므로 여기서는 응답이 있는 요청만 기록합니다.
+    
+    Returns:
+        bool: 훅 등록 여부
+    """
+    try:
+        session = client.postgrest.session
+        hooks = session.event_hooks
+        if _on_supabase_response in hooks.get("response", []):
+            return True
+        hooks.setdefault("request", []).append(_on_supabase_request)
+        hooks.setdefault("response", []).append(_on_supabase_response)
+        session.event_hooks = hooks
+        return True
+    except Exception as e:
+        logger.warning(f"[Metrics] Supabase 메트릭 훅 등록 실패: {str(e)}")
+        return False
+
+
+# ============================================
+# 게이지 (스크레이프 시점 콜백)
+# ============================================
+
+def _rate_limiter_samples(field: str):
+    from app.core.rate_limiter import (
+        naver_api_limiter, nhn_email_limiter, nhn_kakao_limiter, user_collect_limiter
+    )
+    
+    limiters = {
+        "naver_api": naver_api_limiter,
+        "nhn_kakao": nhn_kakao_limiter,
+        "nhn_email": nhn_email_limiter,
+    }
+    for name, limiter in limiters.items():
+        yield {"limiter": name}, getattr(limiter, field)
+    if field == "active_count":
+        yield {"limiter": "user_collect"}, user_collect_limiter.get_status()["total_active_requests"]
+
+
+def _proxy_active_samples():
+    from app.core.proxy import get_proxy_status
+    
+    for endpoint in get_proxy_status().get("pool", []):
+        yield {"proxy": endpoint.get("masked_url", "")}, endpoint.get("active", 0)
+
+
+def _browser_context_samples():
+    import sys
+    
+    # 브라우저 매니저가 로드되지 않았으면 컨텍스트도 없음 (게이지 때문에 playwright를 import하지 않음)
+    module = sys.modules.get("app.core.browser")
+    manager = getattr(module, "_browser_manager", None)
+    if manager is not None and manager.browser is not None:
+        yield {}, len(manager.browser.contexts)
+    else:
+        yield {}, 0
+
+
+def _selenium_driver_samples():
+    import sys
+    
+    # Selenium 서비스가 로드되지 않았으면 드라이버도 없음 (게이지 때문에 selenium을 import하지 않음)
+    module = sys.modules.get("app.services.naver_selenium_service")
+    service = getattr(module, "naver_selenium_service", None)
+    yield {}, getattr(service, "active_driver_count", 0)
+
+
+def _reply_queue_samples():
+    from app.services.reply_queue_service import reply_queue_service
+    
+    yield {"state": "queued"}, len(reply_queue_service.queue)
+    yield {"state": "processing"}, 1 if reply_queue_service.current_job_id else 0
+
+
+registry.gauge(
+    "egurado_rate_limiter_active",
+    "Requests currently holding a rate limiter slot.",
+    ("limiter",),
+    callback=lambda: _rate_limiter_samples("active_count"),
+)
+registry.gauge(
+    "egurado_rate_limiter_queue_depth",
+    "Requests currently waiting for a rate limiter slot.",
+    ("limiter",),
+    callback=lambda: _rate_limiter_samples("waiting_count"),
+)
+registry.gauge(
+    "egurado_proxy_active_requests",
+    "In-flight requests per proxy endpoint.",
+    ("proxy",),
+    callback=_proxy_active_samples,
+)
+registry.gauge(
+    "egurado_browser_contexts",
+    "Open Playwright browser contexts.",
+    callback=_browser_context_samples,
+)
+registry.gauge(
+    "egurado_selenium_drivers_active",
+    "Selenium Chrome drivers currently running.",
+    callback=_selenium_driver_samples,
+)
+registry.gauge(
+    "egurado_reply_queue_jobs",
+    "Reply posting queue length by state.",
+    ("state",),
+    callback=_reply_queue_samples,
+)
+
+
+def render_metrics() -> str:
+    """/metrics 응답 본문"""
+    return registry.render()
@@ -1,26 +1,42 @@
-"""프록시 관리 유틸리티 - 자동 폴백 메커니즘 + 실시간 모니터링"""
+"""프록시 관리 유틸리티 - 다중 프록시 풀 + 자동 폴백 메커니즘 + 실시간 모니터링
+
+프록시 설정:
+- PROXY_URLS: 여러 프록시 (쉼표 또는 줄바꿈 구분, `url|가중치`로 기본 가중치 지정 가능)
+- PROXY_URL: 단일 프록시 (PROXY_URLS가 없을 때, 기존 설정 호환)
+
+선택 전략 (place-rank-checker ProxyRotationManager 기반):
+- 건강도(최근 성공률 EWMA) × 기본 가중치 × 남은 동시 처리 여유로 가중 랜덤 선택
+- 프록시별 동시 사용 수 제한 (PROXY_MAX_CONCURRENT_PER_PROXY), 모두 가득 차면 직접 연결
+- 연속 실패 시 해당 프록시만 쿨다운 (다른 프록시는 계속 사용)
+- sticky_key(키워드 페이지네이션 등)는 같은 프록시에 고정
+"""
 import os
+import re
+import random
 import logging
 import time
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from collections import deque
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-# 프록시 상태 추적 (모듈 레벨 싱글톤)
-_proxy_state = {
-    "url": None,
-    "initialized": False,
-    "fail_count": 0,
-    "last_fail_time": 0,
-    "disabled_until": 0,  # 임시 비활성화 종료 시간
-}
-
 # 프록시 실패 임계값
 MAX_CONSECUTIVE_FAILS = 3  # 연속 3회 실패 시 임시 비활성화
 DISABLE_DURATION_SECONDS = 300  # 5분간 프록시 비활성화 후 재시도
 
+# 프록시별 동시 사용 수 제한
+MAX_CONCURRENT_PER_PROXY = int(os.getenv("PROXY_MAX_CONCURRENT_PER_PROXY", "10"))
+
+# sticky 할당 유지 시간 / 최대 보관 수
+STICKY_TTL_SECONDS = 120
+MAX_STICKY_ENTRIES = 2000
+
+# 건강도 EWMA 계수 (최근 요청 반영 비율)
+HEALTH_ALPHA = 0.2
+MIN_HEALTH_WEIGHT = 0.05
+
 # ========== 요청 통계 및 이력 추적 ==========
 _proxy_stats = {
     "proxy_requests": 0,
@@ -36,85 +52,345 @@ _proxy_stats = {
 _recent_requests: deque = deque(maxlen=50)
 
 
-def _init_proxy():
-    """프록시 초기화 (최초 1회)"""
-    if _proxy_state["initialized"]:
-        return
+def _mask_url(proxy_url: Optional[str]) -> Optional[str]:
+    """프록시 URL 마스킹 (비밀번호 숨김)"""
+    if not proxy_url:
+        return None
+    if "@" in proxy_url:
+        return f"***@{proxy_url.split('@')[-1]}"
+    return proxy_url[:30] + "..."
+
+
+class ProxyEndpoint:
+    """풀 내 개별 프록시 상태"""
+    
+    def __init__(self, url: str, weight: float = 1.0, max_concurrent: int = MAX_CONCURRENT_PER_PROXY):
+        self.url = url
+        self.weight = weight
+        self.max_concurrent = max_concurrent
+        self.active = 0  # 현재 사용 중 (lease) 수
+        self.health = 1.0  # 최근 성공률 EWMA (0~1)
+        self.success_count = 0
+        self.failure_count = 0
+        self.consecutive_fails = 0
+        self.disabled_until = 0.0
+        self.last_used = 0.0
+        self.last_success = 0.0
+        self.avg_response_time = 0.0
+    
+    def is_available(self, now: float) -> bool:
+        return self.disabled_until <= now
+    
+    def has_capacity(self) -> bool:
+        return self.active < self.max_concurrent
+    
+    def selection_weight(self) -> float:
+        """건강도 × 기본 가중치 × 남은 동시 처리 여유"""
+        headroom = 1.0 - (self.active / self.max_concurrent) if self.max_concurrent > 0 else 1.0
+        return max(self.health, MIN_HEALTH_WEIGHT) * self.weight * max(headroom, 0.1)
+    
+    def to_status(self, now: float, sticky_count: int = 0) -> dict:
+        total = self.success_count + self.failure_count
+        return {
+            "masked_url": _mask_url(self.url),
+            "available": self.is_available(now),
+            "weight": self.weight,
+            "health": round(self.health, 3),
+            "active": self.active,
+            "max_concurrent": self.max_concurrent,
+            "successes": self.success_count,
+            "failures": self.failure_count,
+            "success_rate": f"{round(self.success_count / total * 100, 1) if total else 0}%",
+            "consecutive_fails": self.consecutive_fails,
+            "disabled_remaining_sec": max(0, int(self.disabled_until - now)),
+            "avg_response_ms": round(self.avg_response_time * 1000, 1),
+            "sticky_keys": sticky_count,
+        }
+
+
+class ProxyPool:
+    """
+    다중 프록시 가중 로테이션 풀
+    
+    - acquire(): 프록시 선택 + 동시 사용 슬롯 점유 (반드시 release() 호출)
+    - pick(): 슬롯 점유 없이 선택만 (짧은 단건 요청용, 기존 get_proxy 호환)
+    - report_success / report_failure: 건강도, 연속 실패, 쿨다운 갱신
+    """
+    
+    def __init__(self, proxies: Iterable[Tuple[str, float]] = ()):
+        self._endpoints: Dict[str, ProxyEndpoint] = {}
+        self._sticky: Dict[str, Tuple[str, float]] = {}
+        for url, weight in proxies:
+            if url and url not in self._endpoints:
+                self._endpoints[url] = ProxyEndpoint(url, weight)
+    
+    @property
+    def configured(self) -> bool:
+        return bool(self._endpoints)
+    
+    @property
+    def urls(self) -> List[str]:
+        return list(self._endpoints)
+    
+    def _reactivate_expired(self, now: float):
+        """쿨다운이 끝난 프록시 재활성화"""
+        for endpoint in self._endpoints.values():
+            if endpoint.disabled_until and endpoint.disabled_until <= now:
+                logger.info(f"[PROXY] 프록시 재활성화 시도: {_mask_url(endpoint.url)}")
+                endpoint.disabled_until = 0.0
+                endpoint.consecutive_fails = 0
+    
+    def _sticky_endpoint(self, sticky_key: Optional[str], now: float) -> Optional[ProxyEndpoint]:
+        if not sticky_key:
+            return None
+        entry = self._sticky.get(sticky_key)
+        if not entry:
+            return None
+        url, expires_at = entry
+        endpoint = self._endpoints.get(url)
+        if expires_at <= now or endpoint is None or not endpoint.is_available(now):
+            self._sticky.pop(sticky_key, None)
+            return None
+        return endpoint
+    
+    def _remember_sticky(self, sticky_key: Optional[str], url: str, now: float):
+        if not sticky_key:
+            return
+        if len(self._sticky) >= MAX_STICKY_ENTRIES:
+            for key in [k for k, (_, exp) in self._sticky.items() if exp <= now]:
+                del self._sticky[key]
+            if len(self._sticky) >= MAX_STICKY_ENTRIES:
+                self._sticky.pop(next(iter(self._sticky)))
+        self._sticky[sticky_key] = (url, now + STICKY_TTL_SECONDS)
+    
+    def pick(
+        self,
+        sticky_key: Optional[str] = None,
+        exclude: Iterable[str] = (),
+        require_capacity: bool = False
+    ) -> Optional[ProxyEndpoint]:
+        """사용 가능한 프록시 선택 (없으면 None → 직접 연결)"""
+        if not self._endpoints:
+            return None
+        
+        now = time.time()
+        self._reactivate_expired(now)
+        excluded = set(exclude)
+        
+        sticky = self._sticky_endpoint(sticky_key, now)
+        if sticky and sticky.url not in excluded and (not require_capacity or sticky.has_capacity()):
+            return sticky
+        
+        candidates = [
+            endpoint for endpoint in self._endpoints.values()
+            if endpoint.url not in excluded
+            and endpoint.is_available(now)
+            and (not require_capacity or endpoint.has_capacity())
+        ]
+        if not candidates:
+            return None
+        
+        if len(candidates) == 1:
+            chosen = candidates[0]
+        else:
+            weights = [endpoint.selection_weight() for endpoint in candidates]
+            chosen = random.choices(candidates, weights=weights, k=1)[0]
+        
+        chosen.last_used = now
+        self._remember_sticky(sticky_key, chosen.url, now)
+        return chosen
+    
+    def acquire(self, sticky_key: Optional[str] = None, exclude: Iterable[str] = ()) -> Optional[str]:
+        """프록시 선택 + 동시 사용 슬롯 점유"""
+        endpoint = self.pick(sticky_key, exclude=exclude, require_capacity=True)
+        if endpoint is None:
+            return None
+        endpoint.active += 1
+        return endpoint.url
+    
+    def release(self, proxy_url: Optional[str]):
+        """동시 사용 슬롯 해제"""
+        endpoint = self._endpoints.get(proxy_url) if proxy_url else None
+        if endpoint is not None:
+            endpoint.active = max(0, endpoint.active - 1)
+    
+    def _resolve(self, proxy_url: Optional[str]) -> Optional[ProxyEndpoint]:
+        # proxy_url 미지정 (단일 프록시 시절 호출부) → 첫 번째 프록시
+        if proxy_url:
+            return self._endpoints.get(proxy_url)
+        return next(iter(self._endpoints.values()), None)
+    
+    def report_success(self, proxy_url: Optional[str] = None, response_time: float = 0.0):
+        endpoint = self._resolve(proxy_url)
+        if endpoint is None:
+            return
+        if endpoint.consecutive_fails > 0:
+            logger.info(
+                f"[PROXY] 프록시 복구됨: {_mask_url(endpoint.url)} "
+                f"(이전 실패 {endpoint.consecutive_fails}회)"
+            )
+        endpoint.consecutive_fails = 0
+        endpoint.disabled_until = 0.0
+        endpoint.success_count += 1
+        endpoint.last_success = time.time()
+        endpoint.health = (1 - HEALTH_ALPHA) * endpoint.health + HEALTH_ALPHA
+        if response_time > 0:
+            endpoint.avg_response_time = (
+                response_time if endpoint.avg_response_time == 0
+                else 0.7 * endpoint.avg_response_time + 0.3 * response_time
+            )
     
-    proxy_url = os.getenv("PROXY_URL")
-    _proxy_state["url"] = proxy_url
-    _proxy_state["initialized"] = True
+    def report_failure(self, proxy_url: Optional[str] = None, error: str = ""):
+        endpoint = self._resolve(proxy_url)
+        if endpoint is None:
+            return
+        endpoint.consecutive_fails += 1
+        endpoint.failure_count += 1
+        endpoint.health = (1 - HEALTH_ALPHA) * endpoint.health
+        
+        logger.warning(
+            f"[PROXY] 프록시 실패 {_mask_url(endpoint.url)} "
+            f"({endpoint.consecutive_fails}/{MAX_CONSECUTIVE_FAILS}): {error[:100]}"
+        )
+        
+        if endpoint.consecutive_fails >= MAX_CONSECUTIVE_FAILS:
+            endpoint.disabled_until = time.time() + DISABLE_DURATION_SECONDS
+            # 이 프록시에 고정된 sticky 할당 해제
+            for key in [k for k, (url, _) in self._sticky.items() if url == endpoint.url]:
+                del self._sticky[key]
+            logger.error(
+                f"[PROXY] 프록시 연속 {MAX_CONSECUTIVE_FAILS}회 실패 -> "
+                f"{DISABLE_DURATION_SECONDS}초간 비활성화: {_mask_url(endpoint.url)}"
+            )
+    
+    def is_available(self) -> bool:
+        now = time.time()
+        return any(endpoint.is_available(now) for endpoint in self._endpoints.values())
+    
+    def get_status(self) -> List[dict]:
+        now = time.time()
+        sticky_counts: Dict[str, int] = {}
+        for url, expires_at in self._sticky.values():
+            if expires_at > now:
+                sticky_counts[url] = sticky_counts.get(url, 0) + 1
+        return [
+            endpoint.to_status(now, sticky_counts.get(endpoint.url, 0))
+            for endpoint in self._endpoints.values()
+        ]
+
+
+def _parse_proxy_config() -> List[Tuple[str, float]]:
+    """PROXY_URLS (없으면 PROXY_URL) 파싱 → [(url, weight)]"""
+    raw = os.getenv("PROXY_URLS") or os.getenv("PROXY_URL") or ""
+    proxies = []
+    for entry in re.split(r"[,\n]", raw):
+        entry = entry.strip()
+        if not entry:
+            continue
+        url, _, weight = entry.partition("|")
+        try:
+            proxies.append((url.strip(), float(weight) if weight else 1.0))
+        except ValueError:
+            proxies.append((url.strip(), 1.0))
+    return proxies
+
+
+_pool: Optional[ProxyPool] = None
+
+
+def _init_proxy() -> ProxyPool:
+    """프록시 풀 초기화 (최초 1회)"""
+    global _pool
+    if _pool is not None:
+        return _pool
+    
+    _pool = ProxyPool(_parse_proxy_config())
     _proxy_stats["started_at"] = datetime.now().isoformat()
     
-    if proxy_url:
-        logger.info(f"[PROXY] 프록시 설정됨: {proxy_url[:60]}...")
+    if _pool.configured:
+        logger.info(
+            f"[PROXY] 프록시 {len(_pool.urls)}개 설정됨: "
+            f"{', '.join(_mask_url(url) for url in _pool.urls)}"
+        )
     else:
-        logger.info("[PROXY] 프록시 미설정 (PROXY_URL 환경변수 없음)")
+        logger.info("[PROXY] 프록시 미설정 (PROXY_URLS / PROXY_URL 환경변수 없음)")
+    return _pool
 
 
-def get_proxy() -> Optional[str]:
+def get_proxy(sticky_key: Optional[str] = None) -> Optional[str]:
     """
-    프록시 URL 가져오기 (상태 기반)
+    프록시 URL 가져오기 (상태 기반, 슬롯 점유 없음)
     
-    - 프록시가 설정되어 있고 정상이면 프록시 URL 반환
-    - 연속 실패 시 일정 시간 동안 프록시 비활성화 (직접 연결 사용)
+    - 사용 가능한 프록시 중 건강도 가중 랜덤 선택
+    - 연속 실패한 프록시는 일정 시간 동안 제외 (모두 제외되면 직접 연결)
     - 비활성화 시간이 지나면 자동으로 프록시 재활성화
     
     Returns:
         프록시 URL 문자열 또는 None
     """
-    _init_proxy()
-    
-    if not _proxy_state["url"]:
-        return None
-    
-    now = time.time()
-    
-    # 프록시가 임시 비활성화 중인지 확인
-    if _proxy_state["disabled_until"] > now:
-        remaining = int(_proxy_state["disabled_until"] - now)
-        logger.debug(f"[PROXY] 프록시 임시 비활성화 중 (잔여 {remaining}초)")
-        return None
-    
-    # 비활성화 시간이 지났으면 리셋
-    if _proxy_state["disabled_until"] > 0 and _proxy_state["disabled_until"] <= now:
-        logger.info("[PROXY] 프록시 재활성화 시도")
-        _proxy_state["fail_count"] = 0
-        _proxy_state["disabled_until"] = 0
+    endpoint = _init_proxy().pick(sticky_key)
+    return endpoint.url if endpoint else None
+
+
+def acquire_proxy(sticky_key: Optional[str] = None, exclude: Iterable[str] = ()) -> Optional[str]:
+    """
+    프록시 선택 + 동시 사용 슬롯 점유 (여러 요청을 이어서 보내는 작업용)
     
-    return _proxy_state["url"]
+    - sticky_key가 같으면 TTL 동안 같은 프록시 유지 (키워드 페이지네이션)
+    - 모든 프록시가 동시 사용 제한에 걸리면 None (직접 연결)
+    - 사용 후 반드시 release_proxy() 호출
+    """
+    return _init_proxy().acquire(sticky_key, exclude=exclude)
+
 
+def release_proxy(proxy_url: Optional[str]):
+    """acquire_proxy()로 점유한 슬롯 해제"""
+    _init_proxy().release(proxy_url)
 
-def report_proxy_success():
-    """프록시 요청 성공 보고 - 실패 카운트 리셋"""
-    if _proxy_state["fail_count"] > 0:
-        logger.info(f"[PROXY] 프록시 복구됨 (이전 실패 {_proxy_state['fail_count']}회)")
-    _proxy_state["fail_count"] = 0
-    _proxy_state["disabled_until"] = 0
 
+def report_proxy_success(proxy_url: Optional[str] = None, response_time: float = 0.0):
+    """프록시 요청 성공 보고 - 연속 실패 리셋, 건강도/응답시간 갱신"""
+    _init_proxy().report_success(proxy_url, response_time)
 
-def report_proxy_failure(error: str = ""):
+
+def report_proxy_failure(error: str = "", proxy_url: Optional[str] = None):
     """
     프록시 요청 실패 보고
     
-    연속 MAX_CONSECUTIVE_FAILS회 실패 시 DISABLE_DURATION_SECONDS 동안 프록시 비활성화
+    해당 프록시가 연속 MAX_CONSECUTIVE_FAILS회 실패 시 DISABLE_DURATION_SECONDS 동안 비활성화
     """
-    _proxy_state["fail_count"] += 1
-    _proxy_state["last_fail_time"] = time.time()
+    _init_proxy().report_failure(proxy_url, error)
+
+
+@asynccontextmanager
+async def proxy_slot(sticky_key: Optional[str] = None) -> AsyncIterator[Optional[str]]:
+    """
+    프록시 슬롯 점유 → 요청 → 결과 보고 → 슬롯 해제를 묶은 컨텍스트
     
-    logger.warning(
-        f"[PROXY] 프록시 실패 ({_proxy_state['fail_count']}/{MAX_CONSECUTIVE_FAILS}): {error[:100]}"
-    )
+    - 블록이 예외 없이 끝나면 report_proxy_success (응답시간 포함)
+    - 예외로 끝나면 report_proxy_failure 후 예외를 그대로 전달
+    - 프록시가 없거나 모두 가득 차면 None (직접 연결), 보고 생략
     
-    if _proxy_state["fail_count"] >= MAX_CONSECUTIVE_FAILS:
-        _proxy_state["disabled_until"] = time.time() + DISABLE_DURATION_SECONDS
-        logger.error(
-            f"[PROXY] 프록시 연속 {MAX_CONSECUTIVE_FAILS}회 실패 -> "
-            f"{DISABLE_DURATION_SECONDS}초간 비활성화 (직접 연결 사용)"
-        )
+    사용 예:
+        async with proxy_slot() as proxy_url, httpx.AsyncClient(proxy=proxy_url) as client:
+            ...
+    """
+    proxy_url = acquire_proxy(sticky_key)
+    started = time.monotonic()
+    try:
+        yield proxy_url
+    except Exception as e:
+        if proxy_url:
+            report_proxy_failure(str(e), proxy_url=proxy_url)
+        raise
+    else:
+        if proxy_url:
+            report_proxy_success(proxy_url, time.monotonic() - started)
+    finally:
+        release_proxy(proxy_url)
 
 
-def record_request(connection_type: str, success: bool, page: int = 0, error: str = ""):
+def record_request(connection_type: str, success: bool, page: int = 0, error: str = "", proxy_url: Optional[str] = None):
     """
     개별 요청 기록 (통계 + 이력)
     
@@ -123,6 +399,7 @@ def record_request(connection_type: str, success: bool, page: int = 0, error: st
         success: 요청 성공 여부
         page: 페이지 번호 (0이면 미지정)
         error: 실패 시 에러 메시지
+        proxy_url: 사용한 프록시 (이력에 마스킹하여 표시)
     """
     now = datetime.now()
     
@@ -147,6 +424,7 @@ def record_request(connection_type: str, success: bool, page: int = 0, error: st
     _recent_requests.append({
         "time": now.strftime("%Y-%m-%d %H:%M:%S"),
         "type": connection_type,
+        "proxy": _mask_url(proxy_url) if connection_type == "proxy" else None,
         "success": success,
         "page": page,
         "error": error[:80] if error else ""
@@ -154,54 +432,43 @@ def record_request(connection_type: str, success: bool, page: int = 0, error: st
 
 
 def is_proxy_available() -> bool:
-    """프록시가 현재 사용 가능한 상태인지 확인"""
-    _init_proxy()
-    if not _proxy_state["url"]:
-        return False
-    return _proxy_state["disabled_until"] <= time.time()
+    """사용 가능한 프록시가 하나라도 있는지 확인"""
+    pool = _init_proxy()
+    return pool.configured and pool.is_available()
 
 
 def get_proxy_status() -> dict:
     """
-    현재 프록시 상태 + 통계 + 최근 이력 조회
+    현재 프록시 풀 상태 + 통계 + 최근 이력 조회
     
     브라우저에서 /api/v1/system/proxy-status 로 확인 가능
     """
-    _init_proxy()
-    now = time.time()
-    
-    # 프록시 URL 마스킹 (비밀번호 숨김)
-    proxy_url = _proxy_state["url"]
-    masked_url = None
-    if proxy_url:
-        if "@" in proxy_url:
-            parts = proxy_url.split("@")
-            masked_url = f"***@{parts[-1]}"
-        else:
-            masked_url = proxy_url[:30] + "..."
+    pool = _init_proxy()
+    pool_status = pool.get_status()
     
     # 프록시 성공률 계산
     total_proxy = _proxy_stats["proxy_requests"]
     proxy_success_rate = (
-        round(_proxy_stats["proxy_successes"] / total_proxy * 100, 1) 
+        round(_proxy_stats["proxy_successes"] / total_proxy * 100, 1)
         if total_proxy > 0 else 0
     )
     
     total_direct = _proxy_stats["direct_requests"]
     direct_success_rate = (
-        round(_proxy_stats["direct_successes"] / total_direct * 100, 1) 
+        round(_proxy_stats["direct_successes"] / total_direct * 100, 1)
         if total_direct > 0 else 0
     )
     
     return {
         "proxy": {
-            "configured": bool(proxy_url),
-            "masked_url": masked_url,
-            "active": get_proxy() is not None,
-            "fail_count": _proxy_state["fail_count"],
+            "configured": pool.configured,
+            "proxy_count": len(pool_status),
+            "available_count": sum(1 for p in pool_status if p["available"]),
+            "active": pool.is_available(),
             "max_consecutive_fails": MAX_CONSECUTIVE_FAILS,
-            "disabled_remaining_sec": max(0, int(_proxy_state["disabled_until"] - now)),
+            "max_concurrent_per_proxy": MAX_CONCURRENT_PER_PROXY,
         },
+        "pool": pool_status,
         "stats": {
             "started_at": _proxy_stats["started_at"],
             "proxy_requests": _proxy_stats["proxy_requests"],
@@ -8,16 +8,265 @@
 - 프론트엔드 큐 시스템(매장 2 + 키워드 6 = 최대 8)과 연계
 - 서버 제한은 프론트엔드보다 넉넉하게 설정 (정상 사용자는 절대 차단 안됨)
 - 어뷰징/봇만 차단, 글로벌 네이버 API는 orderly 처리로 안정성 확보
+
+다중 워커:
+- 1, 2단계는 워커 내 카운터/세마포어에 더해 슬롯 리스(DistributedSlots)로 전체 워커 합계를 제한
+- 슬롯 1개 = 리스 1개 (TTL/3마다 갱신, 워커가 죽으면 TTL 후 자동 반환)
+- 백엔드: supabase (rate_limit_leases RPC) / local (프로세스 내 메모리 스탠드인, 같은 규칙)
+- 저장소 장애 시에는 워커 내 제한만으로 진행 (fail-open)
 """
 import asyncio
 import logging
+import os
+import socket
+import threading
 import time
-from typing import Dict
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 from collections import defaultdict
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
+# ============================================
+# 워커 간 슬롯 리스 (공유 저장소)
+# ============================================
+
+# 이 워커의 리스 보유자 ID
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+# 전역 슬롯 대기 재시도 시작 간격 (초)
+POLL_MIN_SECONDS = 0.05
+
+# 슬롯 리스 TTL 범위 (초, rate_limit_leases RPC도 같은 범위로 제한)
+LEASE_TTL_MIN_SECONDS = 3
+LEASE_TTL_MAX_SECONDS = 300
+
+
+class LocalSlotBackend:
+    """
+    프로세스 내 메모리 스탠드인 (supabase 백엔드와 같은 획득 / 갱신 / 만료 규칙)
+    
+    여러 limiter(워커 역할)가 하나의 백엔드를 공유하면 다중 워커 합계 제한을 한 프로세스에서 재현할 수 있습니다.
+    """
+    
+    name = "local"
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases: Dict[str, dict] = {}
+    
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+    
+    def acquire(self, limiter: str, key: str, limit: int, holder: str, ttl_seconds: int) -> Optional[str]:
+        with self._lock:
+            now = self._now()
+            for lease_id in [
+                lease_id for lease_id, lease in self._leases.items()
+                if lease["expires_at"] < now and lease["limiter"] == limiter and lease["slot_key"] == key
+            ]:
+                del self._leases[lease_id]
+            active = sum(
+                1 for lease in self._leases.values()
+                if lease["limiter"] == limiter and lease["slot_key"] == key
+            )
+            if active >= limit:
+                return None
+            lease_id = str(uuid.uuid4())
+            self._leases[lease_id] = {
+                "limiter": limiter,
+                "slot_key": key,
+                "holder": holder,
+                "expires_at": now + timedelta(seconds=ttl_seconds),
+            }
+            return lease_id
+    
+    def renew(self, holder: str, lease_ids: List[str], ttl_seconds: int) -> List[str]:
+        with self._lock:
+            now = self._now()
+            kept = []
+            for lease_id in lease_ids:
+                lease = self._leases.get(lease_id)
+                if lease and lease["holder"] == holder and lease["expires_at"] >= now:
+                    lease["expires_at"] = now + timedelta(seconds=ttl_seconds)
+                    kept.append(lease_id)
+            return kept
+    
+    def release(self, lease_id: str):
+        with self._lock:
+            self._leases.pop(lease_id, None)
+    
+    def usage(self) -> List[dict]:
+        with self._lock:
+            now = self._now()
+            counts: Dict[tuple, int] = defaultdict(int)
+            for lease in self._leases.values():
+                if lease["expires_at"] >= now:
+                    counts[(lease["limiter"], lease["slot_key"], lease["holder"])] += 1
+            return [
+                {"limiter": limiter, "slot_key": key, "holder": holder, "active": active}
+                for (limiter, key, holder), active in sorted(counts.items())
+            ]
+
+
+class SupabaseSlotBackend:
+    """Postgres 슬롯 리스 (supabase/migrations/20261019080000_add_rate_limit_leases.sql)"""
+    
+    name = "supabase"
+    
+    @property
+    def supabase(self):
+        from app.core.database import get_supabase_client
+        return get_supabase_client()
+    
+    def acquire(self, limiter: str, key: str, limit: int, holder: str, ttl_seconds: int) -> Optional[str]:
+        result = self.supabase.rpc("acquire_rate_limit_lease", {
+            "p_limiter": limiter,
+            "p_key": key,
+            "p_limit": limit,
+            "p_holder": holder,
+            "p_ttl_seconds": ttl_seconds,
+        }).execute()
+        return result.data or None
+    
+    def renew(self, holder: str, lease_ids: List[str], ttl_seconds: int) -> List[str]:
+        result = self.supabase.rpc("renew_rate_limit_leases", {
+            "p_holder": holder,
+            "p_lease_ids": lease_ids,
+            "p_ttl_seconds": ttl_seconds,
+        }).execute()
+        return list(result.data or [])
+    
+    def release(self, lease_id: str):
+        self.supabase.rpc("release_rate_limit_lease", {"p_lease_id": lease_id}).execute()
+    
+    def usage(self) -> List[dict]:
+        result = self.supabase.rpc("get_rate_limit_usage", {}).execute()
+        return result.data or []
+
+
+def create_slot_backend(kind: str):
+    if kind == "supabase":
+        return SupabaseSlotBackend()
+    if kind != "local":
+        logger.warning(f"[RateLimit] 알 수 없는 RATE_LIMIT_BACKEND={kind} → local 사용")
+    return LocalSlotBackend()
+
+
+class DistributedSlots:
+    """
+    limiter 1개의 워커 간 슬롯 리스
+    
+    - try_acquire(key, limit): 전체 워커 합계가 limit 미만이면 리스 획득 (보유 목록에 보관)
+    - release(key): 보유 리스 1개 반납
+    - 리스를 보유하는 동안 TTL/3 간격으로 갱신 (첫 획득 시 이벤트 루프에 갱신 작업 시작)
+    - 저장소 호출 실패 시 리스 없이 통과 (워커 내 제한은 그대로 적용)
+    - 갱신 시 만료된 리스는 리스 없는 슬롯(None)으로 바꿔 보유 (release 짝은 유지, 다시 갱신하지 않음)
+    """
+    
+    def __init__(self, limiter: str, backend, holder: str = WORKER_ID, ttl_seconds: int = 30):
+        self.limiter = limiter
+        self.backend = backend
+        self.holder = holder
+        self.ttl_seconds = min(max(LEASE_TTL_MIN_SECONDS, ttl_seconds), LEASE_TTL_MAX_SECONDS)
+        # key → 리스 ID 목록 (저장소 장애로 리스 없이 통과한 슬롯은 None)
+        self._held: Dict[str, List[Optional[str]]] = defaultdict(list)
+        self._renew_task: Optional[asyncio.Task] = None
+        self._total_denied = 0
+        self._total_errors = 0
+        self._total_lost = 0
+    
+    @property
+    def renew_interval_seconds(self) -> int:
+        return max(1, self.ttl_seconds // 3)
+    
+    async def _call(self, func, *args):
+        # supabase 클라이언트는 동기 HTTP → 이벤트 루프를 막지 않도록 스레드에서 실행
+        if self.backend.name == "local":
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+    
+    async def try_acquire(self, key: str, limit: int) -> bool:
+        self._ensure_renewal()
+        try:
+            lease_id = await self._call(
+                self.backend.acquire, self.limiter, key, limit, self.holder, self.ttl_seconds
+            )
+        except Exception as e:
+            self._total_errors += 1
+            logger.warning(f"[RateLimit] {self.limiter} 슬롯 리스 획득 실패 → 워커 내 제한만 적용: {e}")
+            self._held[key].append(None)
+            return True
+        if lease_id is None:
+            self._total_denied += 1
+            return False
+        self._held[key].append(lease_id)
+        return True
+    
+    def admit_without_lease(self, key: str):
+        """리스 없이 슬롯 1개 통과 처리 (release와 짝을 맞추기 위해 None 보관)"""
+        self._held[key].append(None)
+    
+    async def release(self, key: str):
+        leases = self._held.get(key)
+        if not leases:
+            return
+        lease_id = leases.pop()
+        if not leases:
+            del self._held[key]
+        if lease_id is None:
+            return
+        try:
+            await self._call(self.backend.release, lease_id)
+        except Exception as e:
+            # 반납하지 못한 리스는 갱신이 멈추므로 TTL 후 자동 반환
+            logger.warning(f"[RateLimit] {self.limiter} 슬롯 리스 반납 실패 (TTL 후 자동 반환): {e}")
+    
+    def _ensure_renewal(self):
+        if self._renew_task is None or self._renew_task.done():
+            self._renew_task = asyncio.get_running_loop().create_task(
+                self._renew_loop(), name=f"rate-limit-renew-{self.limiter}"
+            )
+    
+    async def _renew_loop(self):
+        while True:
+            await asyncio.sleep(self.renew_interval_seconds)
+            lease_ids = [lease_id for leases in self._held.values() for lease_id in leases if lease_id]
+            if not lease_ids:
+                continue
+            try:
+                kept = set(await self._call(self.backend.renew, self.holder, lease_ids, self.ttl_seconds))
+            except Exception as e:
+                logger.warning(f"[RateLimit] {self.limiter} 슬롯 리스 갱신 실패: {e}")
+                continue
+            lost_ids = set(lease_ids) - kept
+            if lost_ids:
+                # 갱신이 TTL 이상 끊긴 사이 만료됨 → 다른 워커가 슬롯을 가져갔을 수 있음
+                # 보유 목록에서는 None으로 바꿔 다음 갱신 / 집계에서 제외 (await 중 반납된 리스는 이미 없음)
+                for leases in self._held.values():
+                    for index, lease_id in enumerate(leases):
+                        if lease_id in lost_ids:
+                            leases[index] = None
+                self._total_lost += len(lost_ids)
+                logger.warning(f"[RateLimit] {self.limiter} 슬롯 리스 {len(lost_ids)}개 만료 (갱신 지연)")
+    
+    def get_status(self) -> dict:
+        return {
+            "backend": self.backend.name,
+            "holder": self.holder,
+            "lease_ttl_seconds": self.ttl_seconds,
+            "leases_held": sum(len(leases) for leases in self._held.values()),
+            "total_denied": self._total_denied,
+            "total_errors": self._total_errors,
+            "total_lost": self._total_lost,
+        }
+
+
 # ============================================
 # 1단계: 유저당 동시 수집 요청 제한
 # ============================================
@@ -35,13 +284,19 @@ class UserConcurrencyLimiter:
     - 유저당 최대 동시 수집 요청 수를 제한
     - 초과 시 HTTP 429 반환 (프론트엔드에서 재시도)
     - 정상 사용 시 절대 제한에 걸리지 않음 (프론트 큐 < 서버 제한)
+    - 워커 내 카운터 + 슬롯 리스로 전체 워커 합계 기준 제한 (같은 유저 요청이 여러 워커로 분산돼도 최대 max_concurrent)
     """
     
-    def __init__(self, max_concurrent: int = MAX_CONCURRENT_COLLECT_PER_USER):
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_COLLECT_PER_USER,
+        slots: Optional[DistributedSlots] = None,
+    ):
         self.max_concurrent = max_concurrent
         self._user_counts: Dict[str, int] = defaultdict(int)
         self._lock = asyncio.Lock()
         self._total_rejected = 0
+        self._slots = slots or DistributedSlots("user_collect", LocalSlotBackend())
     
     async def try_acquire(self, user_id: str) -> bool:
         """
@@ -49,7 +304,7 @@ class UserConcurrencyLimiter:
         
         Args:
             user_id: 유저 ID
-            
+        
         Returns:
             True: 슬롯 획득 성공 → 요청 처리 진행
             False: 슬롯 부족 → HTTP 429 반환해야 함
@@ -65,20 +320,37 @@ class UserConcurrencyLimiter:
                 return False
             
             self._user_counts[user_id] += 1
-            logger.debug(
-                f"[RateLimit] User {user_id[:8]}... 슬롯 획득: "
-                f"{self._user_counts[user_id]}/{self.max_concurrent}"
+        
+        # 다른 워커에서 처리 중인 같은 유저 요청까지 합산
+        if not await self._slots.try_acquire(user_id, self.max_concurrent):
+            async with self._lock:
+                self._decrement(user_id)
+                self._total_rejected += 1
+            logger.warning(
+                f"[RateLimit] User {user_id[:8]}... 차단: "
+                f"전체 워커 합계 {self.max_concurrent}개 사용 중 (총 차단: {self._total_rejected})"
             )
-            return True
+            return False
+        
+        logger.debug(
+            f"[RateLimit] User {user_id[:8]}... 슬롯 획득: "
+            f"{self._user_counts.get(user_id, 0)}/{self.max_concurrent}"
+        )
+        return True
+    
+    def _decrement(self, user_id: str):
+        if user_id in self._user_counts:
+            self._user_counts[user_id] = max(0, self._user_counts[user_id] - 1)
+            # 0이 되면 메모리 정리
+            if self._user_counts[user_id] == 0:
+                del self._user_counts[user_id]
     
     async def release(self, user_id: str):
         """유저의 슬롯 해제"""
+        await self._slots.release(user_id)
         async with self._lock:
             if user_id in self._user_counts:
-                self._user_counts[user_id] = max(0, self._user_counts[user_id] - 1)
-                # 0이 되면 메모리 정리
-                if self._user_counts[user_id] == 0:
-                    del self._user_counts[user_id]
+                self._decrement(user_id)
                 logger.debug(
                     f"[RateLimit] User {user_id[:8]}... 슬롯 해제: "
                     f"{self._user_counts.get(user_id, 0)}/{self.max_concurrent}"
@@ -98,7 +370,8 @@ class UserConcurrencyLimiter:
             "per_user": {
                 uid[:8] + "...": count 
                 for uid, count in self._user_counts.items()
-            }
+            },
+            "distributed": self._slots.get_status(),
         }
 
 
@@ -119,20 +392,44 @@ class NaverAPIRateLimiter:
     - asyncio.Semaphore 사용 → 초과 시 자동 대기 (429 아님!)
     - 대기 중인 요청은 슬롯이 빌 때 자동으로 실행
     - Naver API/프록시 과부하 방지
+    - 워커 내 세마포어(max_concurrent) 통과 후 전체 워커 합계(global_max) 슬롯 리스 대기
+      (슬롯이 없으면 POLL_MIN_SECONDS부터 2배씩 poll_max_seconds까지 늘려가며 재시도)
+    - 전역 슬롯을 global_max_wait_seconds 동안 얻지 못하면 워커 내 제한만으로 통과 (저장소 장애와 같은 fail-open)
     """
     
-    def __init__(self, max_concurrent: int = MAX_CONCURRENT_NAVER_API_CALLS):
+    GLOBAL_KEY = "global"
+    
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_NAVER_API_CALLS,
+        global_max: Optional[int] = None,
+        slots: Optional[DistributedSlots] = None,
+        poll_max_seconds: float = 0.5,
+        global_max_wait_seconds: float = 30.0,
+    ):
         self.max_concurrent = max_concurrent
+        self.global_max = global_max or max_concurrent
+        self.poll_max_seconds = max(POLL_MIN_SECONDS, poll_max_seconds)
+        self.global_max_wait_seconds = max(0.0, global_max_wait_seconds)
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._slots = slots or DistributedSlots("naver_api", LocalSlotBackend())
         self._active_count = 0
         self._total_requests = 0
         self._total_queued = 0
+        self._total_global_queued = 0
+        self._total_global_timeouts = 0
+        self._waiting_count = 0
         self._lock = asyncio.Lock()
     
     @property
     def active_count(self) -> int:
         return self._active_count
     
+    @property
+    def waiting_count(self) -> int:
+        """슬롯을 기다리는 요청 수 (대기열 길이)"""
+        return self._waiting_count
+    
     @property
     def available_slots(self) -> int:
         return self._semaphore._value
@@ -154,7 +451,16 @@ class NaverAPIRateLimiter:
                 f"총 대기 누적={self._total_queued}"
             )
         
-        await self._semaphore.acquire()
+        self._waiting_count += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self._acquire_global()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self._waiting_count -= 1
         
         async with self._lock:
             self._active_count += 1
@@ -164,8 +470,35 @@ class NaverAPIRateLimiter:
             f"[NaverRL] 슬롯 획득: {self._active_count}/{self.max_concurrent}"
         )
     
+    async def _acquire_global(self):
+        """전체 워커 합계 슬롯 대기 (다른 워커가 반납하거나 죽은 워커의 리스가 만료될 때까지, 최대 global_max_wait_seconds)"""
+        delay = POLL_MIN_SECONDS
+        queued = False
+        deadline = time.monotonic() + self.global_max_wait_seconds
+        while not await self._slots.try_acquire(self.GLOBAL_KEY, self.global_max):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # 리스가 비정상적으로 남아 있어도 모든 네이버 호출이 멈추지 않도록 워커 내 제한만 적용
+                self._total_global_timeouts += 1
+                self._slots.admit_without_lease(self.GLOBAL_KEY)
+                logger.warning(
+                    f"[NaverRL] 전역 슬롯 {self.global_max_wait_seconds}초 대기 초과 → 워커 내 제한만 적용, "
+                    f"총 대기 초과={self._total_global_timeouts}"
+                )
+                return
+            if not queued:
+                queued = True
+                self._total_global_queued += 1
+                logger.info(
+                    f"[NaverRL] ⏳ 전역 대기: 전체 워커 {self.global_max}개 사용 중, "
+                    f"총 전역 대기 누적={self._total_global_queued}"
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.poll_max_seconds)
+    
     async def release(self):
         """슬롯 해제 → 대기 중인 다음 요청이 자동 실행됨"""
+        await self._slots.release(self.GLOBAL_KEY)
         async with self._lock:
             self._active_count = max(0, self._active_count - 1)
         
@@ -181,8 +514,103 @@ class NaverAPIRateLimiter:
             "max_concurrent": self.max_concurrent,
             "active": self._active_count,
             "available": self.available_slots,
+            "waiting": self._waiting_count,
             "total_requests_processed": self._total_requests,
             "total_queued_count": self._total_queued,
+            "global_max": self.global_max,
+            "total_global_queued_count": self._total_global_queued,
+            "global_max_wait_seconds": self.global_max_wait_seconds,
+            "total_global_timeout_count": self._total_global_timeouts,
+            "distributed": self._slots.get_status(),
+        }
+
+
+# ============================================
+# 3단계: 외부 발송 API(NHN Cloud) 동시 호출 + 초당 요청 수 제한
+# ============================================
+
+# NHN 알림톡: 요청 1건에 수신자 최대 1000명 → 요청 수 자체는 적음
+NHN_KAKAO_MAX_CONCURRENT = 4
+NHN_KAKAO_REQUESTS_PER_SECOND = 10.0
+
+# NHN 이메일: 수신자별 본문이 달라 1건씩 발송 → 동시성으로 처리량 확보
+NHN_EMAIL_MAX_CONCURRENT = 10
+NHN_EMAIL_REQUESTS_PER_SECOND = 20.0
+
+
+class ProviderRateLimiter:
+    """
+    외부 API(provider)별 동시 호출 + 초당 요청 수 제한
+    
+    - 세마포어로 동시 호출 수 제한 (초과 시 대기)
+    - 요청 시작 간격을 1/requests_per_second 이상으로 유지 (버스트 방지)
+    - NaverAPIRateLimiter와 같은 acquire/release 인터페이스
+    """
+    
+    def __init__(self, name: str, max_concurrent: int, requests_per_second: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.requests_per_second = requests_per_second
+        self._min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+        self._active_count = 0
+        self._total_requests = 0
+        self._total_throttled = 0
+        self._waiting_count = 0
+    
+    @property
+    def active_count(self) -> int:
+        return self._active_count
+    
+    @property
+    def waiting_count(self) -> int:
+        """슬롯을 기다리는 요청 수 (대기열 길이)"""
+        return self._waiting_count
+    
+    async def acquire(self):
+        """슬롯 획득 + 요청 간격 대기"""
+        self._waiting_count += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting_count -= 1
+        
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._min_interval
+            self._active_count += 1
+            self._total_requests += 1
+            if wait > 0:
+                self._total_throttled += 1
+        
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except BaseException:
+                # 간격 대기 중 취소되면 슬롯 반납 (반납하지 않으면 동시 호출 수가 영구히 줄어듦)
+                self._active_count = max(0, self._active_count - 1)
+                self._semaphore.release()
+                raise
+    
+    async def release(self):
+        """슬롯 해제"""
+        async with self._lock:
+            self._active_count = max(0, self._active_count - 1)
+        self._semaphore.release()
+    
+    def get_status(self) -> dict:
+        """현재 상태 조회 (모니터링용)"""
+        return {
+            "name": self.name,
+            "max_concurrent": self.max_concurrent,
+            "requests_per_second": self.requests_per_second,
+            "active": self._active_count,
+            "waiting": self._waiting_count,
+            "total_requests_processed": self._total_requests,
+            "total_throttled": self._total_throttled,
         }
 
 
@@ -190,8 +618,60 @@ class NaverAPIRateLimiter:
 # 싱글톤 인스턴스
 # ============================================
 
-# 유저당 동시 수집 요청 제한 (최대 10개)
-user_collect_limiter = UserConcurrencyLimiter(MAX_CONCURRENT_COLLECT_PER_USER)
+# 워커 간 슬롯 리스 저장소 (RATE_LIMIT_BACKEND)
+rate_limit_backend = create_slot_backend(settings.RATE_LIMIT_BACKEND)
+
+# 유저당 동시 수집 요청 제한 (최대 10개, 전체 워커 합계)
+user_collect_limiter = UserConcurrencyLimiter(
+    MAX_CONCURRENT_COLLECT_PER_USER,
+    slots=DistributedSlots(
+        "user_collect", rate_limit_backend, ttl_seconds=settings.RATE_LIMIT_LEASE_TTL_SECONDS
+    ),
+)
 
-# 글로벌 네이버 API 동시 호출 제한 (최대 20개)
-naver_api_limiter = NaverAPIRateLimiter(MAX_CONCURRENT_NAVER_API_CALLS)
+# 글로벌 네이버 API 동시 호출 제한 (워커당 최대 20개 + 전체 워커 합계 RATE_LIMIT_NAVER_GLOBAL_MAX)
+naver_api_limiter = NaverAPIRateLimiter(
+    MAX_CONCURRENT_NAVER_API_CALLS,
+    global_max=settings.RATE_LIMIT_NAVER_GLOBAL_MAX,
+    slots=DistributedSlots(
+        "naver_api", rate_limit_backend, ttl_seconds=settings.RATE_LIMIT_LEASE_TTL_SECONDS
+    ),
+    poll_max_seconds=settings.RATE_LIMIT_POLL_MAX_SECONDS,
+    global_max_wait_seconds=settings.RATE_LIMIT_GLOBAL_MAX_WAIT_SECONDS,
+)
+
+# NHN Cloud 발송 API 제한
+nhn_kakao_limiter = ProviderRateLimiter(
+    "nhn_kakao", NHN_KAKAO_MAX_CONCURRENT, NHN_KAKAO_REQUESTS_PER_SECOND
+)
+nhn_email_limiter = ProviderRateLimiter(
+    "nhn_email", NHN_EMAIL_MAX_CONCURRENT, NHN_EMAIL_REQUESTS_PER_SECOND
+)
+
+
+async def get_distributed_usage() -> dict:
+    """
+    전체 워커 합계 슬롯 사용 현황 (모니터링용)
+    
+    Returns:
+        - backend: local / supabase
+        - limiters: limiter별 active(전체 합계) / per_worker / per_key (유저 ID는 앞 8자리)
+    """
+    if rate_limit_backend.name == "local":
+        rows = rate_limit_backend.usage()
+    else:
+        rows = await asyncio.to_thread(rate_limit_backend.usage)
+    
+    limiters: Dict[str, dict] = {}
+    for row in rows:
+        entry = limiters.setdefault(row["limiter"], {"active": 0, "per_worker": {}, "per_key": {}})
+        active = int(row["active"])
+        key = row["slot_key"] if row["limiter"] != "user_collect" else row["slot_key"][:8] + "..."
+        entry["active"] += active
+        entry["per_worker"][row["holder"]] = entry["per_worker"].get(row["holder"], 0) + active
+        entry["per_key"][key] = entry["per_key"].get(key, 0) + active
+    return {
+        "backend": rate_limit_backend.name,
+        "worker_id": WORKER_ID,
+        "limiters": limiters,
+    }
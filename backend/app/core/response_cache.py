@@ -0,0 +1,207 @@
+"""
+조회 API 조건부 응답 (ETag / If-None-Match → 304) + 응답 캐시
+
+대시보드는 매장 목록, 주요지표 추적 목록, 리뷰 통계, 읽지 않은 알림 수, 진단 히스토리를
+주기적으로 다시 호출하는데, 데이터가 그대로여도 매번 Supabase 전체 조회 + 직렬화를 반복했습니다.
+
+- 리소스 버전: resource_versions 테이블 (원본 테이블 트리거가 쓰기마다 증가)
+  → get_resource_versions RPC 1회(PK 조회)로 응답이 의존하는 scope들의 버전 확인
+- ETag = hash(캐시 키 + scope 버전) → If-None-Match가 같으면 본문을 만들지 않고 304
+- 응답 캐시: 같은 키 + 같은 버전이면 직렬화된 본문을 그대로 반환 (LRU, RESPONSE_CACHE_MAX_ENTRIES)
+- 버전 RPC를 쓸 수 없으면 (마이그레이션 미적용 등) 본문을 만든 뒤 본문 해시로 ETag → 304 (전송량만 절약)
+
+사용:
+    return await response_cache.respond(
+        request,
+        key=f"stores:list:{user_id}",        # 응답을 결정하는 모든 값 (사용자, 쿼리 파라미터)
+        scopes=[f"stores:{user_id}"],         # 응답이 의존하는 리소스 버전
+        build=lambda: _list_stores(user_id),  # 캐시 미스일 때만 호출
+        response_model=StoreListResponse,
+    )
+
+scope 이름은 supabase/migrations/20261019070000_add_resource_versions.sql의 트리거와 맞춰야 합니다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# 버전 RPC 실패 후 다시 시도하기까지 (초)
+VERSION_RETRY_SECONDS = 60
+
+# 응답 헤더: 브라우저는 캐시하되 매번 재검증 (If-None-Match 전송), 공유 캐시에는 저장 안 함
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: str) -> str:
+    digest = hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 etag를 포함하는지 (약한 비교, * 허용)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return any((value[2:] if value.startswith("W/") else value) == bare for value in candidates)
+
+
+class ResponseCache:
+    """조회 API 응답 캐시 (워커별 메모리, 무효화는 리소스 버전으로)"""
+    
+    def __init__(self, enabled: bool = True, max_entries: int = 1000, max_body_bytes: int = 256 * 1024):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_body_bytes = max_body_bytes
+        # key -> (etag, body)
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._versions_unavailable_until = 0.0
+        self._stats = {
+            "not_modified": 0,
+            "hits": 0,
+            "misses": 0,
+            "uncached": 0,
+            "version_errors": 0,
+        }
+    
+    def get_versions(self, scopes: List[str]) -> Optional[Dict[str, int]]:
+        """scope별 현재 버전 (없는 scope는 0, RPC를 쓸 수 없으면 None)"""
+        if time.monotonic() < self._versions_unavailable_until:
+            return None
+        try:
+            from app.core.database import get_supabase_client
+            result = get_supabase_client().rpc(
+                "get_resource_versions",
+                {"p_scopes": scopes}
+            ).execute()
+            versions = result.data or {}
+            return {scope: int(versions.get(scope, 0)) for scope in scopes}
+        except Exception as e:
+            self._stats["version_errors"] += 1
+            self._versions_unavailable_until = time.monotonic() + VERSION_RETRY_SECONDS
+            logger.warning(f"[ResponseCache] 리소스 버전 조회 실패 ({VERSION_RETRY_SECONDS}초간 본문 해시 ETag 사용): {e}")
+            return None
+    
+    def _get(self, key: str, etag: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry or entry[0] != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def _put(self, key: str, etag: str, body: bytes) -> None:
+        if len(body) > self.max_body_bytes:
+            return
+        with self._lock:
+            self._entries[key] = (etag, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    async def respond(
+        self,
+        request,
+        key: str,
+        scopes: List[str],
+        build: Callable[[], Awaitable[object]],
+        response_model=None,
+    ):
+        """
+        조건부 응답
+        
+        Args:
+            request: FastAPI Request (If-None-Match 확인)
+            key: 응답을 결정하는 모든 값을 담은 캐시 키 (사용자 / 경로 파라미터 / 쿼리 파라미터)
+            scopes: 응답이 의존하는 리소스 버전 scope
+            build: 본문 생성 (캐시 미스일 때만 호출, HTTPException은 그대로 전파)
+            response_model: 지정하면 build 결과를 이 모델로 검증 / 필드 필터링 (라우트의 response_model과 동일)
+        
+        Returns:
+            304 Response / 200 Response (ETag 포함), 비활성화면 build 결과 그대로
+        """
+        if not self.enabled:
+            return await build()
+        
+        from fastapi import Response
+        
+        if_none_match = request.headers.get("if-none-match")
+        versions = self.get_versions(scopes)
+        
+        etag = None
+        if versions is not None:
+            etag = make_etag(key, *(f"{scope}={versions[scope]}" for scope in scopes))
+            if etag_matches(if_none_match, etag):
+                self._stats["not_modified"] += 1
+                return self._not_modified(etag)
+            
+            body = self._get(key, etag)
+            if body is not None:
+                self._stats["hits"] += 1
+                return Response(content=body, media_type="application/json", headers=self._headers(etag))
+        
+        body = self._render(await build(), response_model)
+        
+        # 본문을 만드는 동안 쓰기가 있었으면 본문이 어느 버전인지 알 수 없으므로 캐시하지 않음
+        if etag is not None and self.get_versions(scopes) != versions:
+            etag = None
+        
+        if etag is None:
+            # 버전을 모르면 본문 해시로 ETag (본문은 만들었지만 전송량은 절약)
+            self._stats["uncached"] += 1
+            etag = make_etag(key, hashlib.sha1(body).hexdigest())
+            if etag_matches(if_none_match, etag):
+                self._stats["not_modified"] += 1
+                return self._not_modified(etag)
+        else:
+            self._stats["misses"] += 1
+            self._put(key, etag, body)
+        
+        return Response(content=body, media_type="application/json", headers=self._headers(etag))
+    
+    @staticmethod
+    def _render(result, response_model) -> bytes:
+        from fastapi.encoders import jsonable_encoder
+        if response_model is not None and not isinstance(result, response_model):
+            result = response_model.model_validate(result)
+        return dumps(jsonable_encoder(result))
+    
+    @staticmethod
+    def _headers(etag: str) -> Dict[str, str]:
+        return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    
+    def _not_modified(self, etag: str):
+        from fastapi import Response
+        return Response(status_code=304, headers=self._headers(etag))
+    
+    def get_status(self) -> dict:
+        with self._lock:
+            entries = len(self._entries)
+            cached_bytes = sum(len(body) for _, body in self._entries.values())
+        return {
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "cached_bytes": cached_bytes,
+            "versions_available": time.monotonic() >= self._versions_unavailable_until,
+            "stats": dict(self._stats),
+        }
+
+
+# 싱글톤 인스턴스
+response_cache = ResponseCache(
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_body_bytes=settings.RESPONSE_CACHE_MAX_BODY_KB * 1024,
+)
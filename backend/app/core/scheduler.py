@@ -1,13 +1,20 @@
 """
 백그라운드 작업 스케줄러
 자동 리뷰 수집, 순위 확인 등
+
+여러 워커가 같은 cron을 실행해도 scheduler_coordinator(app.core.coordination)를 거쳐
+정기결제는 리더만 하루 1회, 리뷰 수집 / 순위 확인 / 주요지표 수집은 샤드 단위로 나눠 실행
 """
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from typing import List, Optional, Tuple
 import logging
 
+from app.core.config import settings
 from app.core.database import get_supabase_client
+from app.core.collection_smoother import metric_collection_smoother, get_hour_start, filter_uncollected
+from app.core.coordination import ALL_SHARDS, ShardSet, scheduler_coordinator
 from app.services.naver_crawler import crawl_naver_reviews
 from app.services.naver_rank_service import rank_service
 from app.services.naver_rank_api_unofficial import rank_service_api_unofficial
@@ -20,10 +27,13 @@ logger = logging.getLogger(__name__)
 scheduler = AsyncIOScheduler()
 
 
-async def sync_all_stores_reviews():
+async def sync_all_stores_reviews(shards: ShardSet = ALL_SHARDS):
     """
     모든 활성 매장의 리뷰 자동 수집
     매일 오전 6시 실행
+    
+    Args:
+        shards: 이 워커가 맡은 샤드 (매장 id 해시 기준, 기본값은 전체)
     """
     try:
         print(f"[{datetime.now()}] [SYNC] Starting review collection for all stores")
@@ -39,8 +49,8 @@ async def sync_all_stores_reviews():
             print("[WARN] No active stores found")
             return
         
-        stores = result.data
-        print(f"[INFO] {len(stores)} stores scheduled for review collection")
+        stores = shards.filter(result.data, key=lambda store: store["id"])
+        print(f"[INFO] {len(stores)} stores scheduled for review collection (shard {shards.label})")
         
         for store in stores:
             try:
@@ -52,12 +62,12 @@ async def sync_all_stores_reviews():
                 continue
         
         print(f"[{datetime.now()}] [SYNC] Review collection completed")
-        
+    
     except Exception as e:
         print(f"[ERROR] Review collection scheduler error: {e}")
 
 
-async def check_all_keywords_rank():
+async def check_all_keywords_rank(shards: ShardSet = ALL_SHARDS):
     """
     등록된 모든 키워드 순위 자동 확인
     매일 오전 7시 실행
@@ -65,6 +75,9 @@ async def check_all_keywords_rank():
     - 모든 등록된 키워드의 순위 체크
     - keywords 테이블 업데이트 (current_rank, previous_rank)
     - rank_history 테이블에 오늘 날짜 데이터만 유지
+    
+    Args:
+        shards: 이 워커가 맡은 샤드 (키워드 id 해시 기준, 기본값은 전체)
     """
     try:
         logger.info(f"[{datetime.now()}] 🔍 키워드 순위 자동 확인 시작")
@@ -80,8 +93,8 @@ async def check_all_keywords_rank():
             logger.warning("[WARN] No keywords registered")
             return
         
-        keywords = result.data
-        logger.info(f"[INFO] {len(keywords)} keywords scheduled for rank check")
+        keywords = shards.filter(result.data, key=lambda kw: kw["id"])
+        logger.info(f"[INFO] {len(keywords)} keywords scheduled for rank check (shard {shards.label})")
         
         success_count = 0
         error_count = 0
@@ -106,7 +119,7 @@ async def check_all_keywords_rank():
                 
                 logger.info(f"🔍 '{keyword_text}' (매장: {store_name}, coord: {coord_x},{coord_y}) 순위 확인 중...")
                 
-                # 순위 체크 (GraphQL API, 매장 좌표 기준)
+                # 순위 체크 (GraphQL API, 매장 좌표 기준 / 순위만 사용하므로 place_id만 요청)
                 rank_result = await rank_service_api_unofficial.check_rank(
                     keyword=keyword_text,
                     target_place_id=place_id,
@@ -114,7 +127,8 @@ async def check_all_keywords_rank():
                     store_name=store_name,
                     coord_x=coord_x,
                     coord_y=coord_y,
-                    category=store_category
+                    category=store_category,
+                    profile="rank-only"
                 )
                 
                 new_rank = rank_result["rank"]
@@ -167,7 +181,7 @@ async def check_all_keywords_rank():
                     )
                 
                 success_count += 1
-                    
+            
             except Exception as e:
                 error_count += 1
                 logger.error(
@@ -180,23 +194,42 @@ async def check_all_keywords_rank():
             f"[{datetime.now()}] [CHECK] 키워드 순위 확인 완료 - "
             f"성공: {success_count}, 실패: {error_count}"
         )
-        
+    
     except Exception as e:
         logger.error(f"[ERROR] Rank check scheduler error: {str(e)}", exc_info=True)
 
 
-async def collect_all_metrics():
+async def collect_all_metrics(
+    shards: ShardSet = ALL_SHARDS,
+    mode: str = "scheduled",
+    period: Optional[str] = None
+):
     """
     주요지표 추적 - 스케줄된 시간에 자동 수집
     매 시간마다 실행하여 수집이 필요한 추적 설정들을 처리
-    수집 완료 후 알림 설정된 사용자에게 카카오 알림톡/SMS/이메일 발송
+    
+    수집 대상은 시간 내 고정 오프셋 슬롯으로 분산되어 디스패치됨 (collection_smoother)
+    각 슬롯 수집 완료 후 알림 설정된 사용자에게 카카오 알림톡/SMS/이메일 발송
+    
+    Args:
+        shards: 이 워커가 맡은 샤드 (검색 공유 키 해시 기준 → 같은 검색을 쓰는 tracker는 같은 샤드)
+        mode: scheduled (정각 cron) / backfill / sweep / recovery (이미 수집된 tracker는 제외)
+        period: 코디네이터 기간 키 (지난 시간대의 인수 실행은 건너뜀)
     """
     try:
         print(f"[{datetime.now()}] 📊 주요지표 자동 수집 시작")
         logger.info(f"[{datetime.now()}] 📊 주요지표 자동 수집 시작")
         
+        hour_start = get_hour_start()
+        if period is not None and period != hour_period(hour_start):
+            logger.info(f"[INFO] {period} 시간대가 지나 {mode} 수집 건너뜀")
+            return
+        
         # 수집이 필요한 활성 추적 설정 조회
-        trackers = metric_tracker_service.get_all_active_trackers()
+        trackers = metric_tracker_service.get_all_active_trackers(hour=hour_start.hour)
+        trackers = shards.filter(trackers, key=metric_collection_smoother.spread_key)
+        if mode != "scheduled":
+            trackers = filter_uncollected(trackers, hour_start)
         
         if not trackers:
             print("[INFO] No trackers scheduled for collection at this time")
@@ -204,12 +237,80 @@ async def collect_all_metrics():
             return
         
         print(f"[INFO] {len(trackers)} trackers scheduled for metric collection")
-        logger.info(f"[INFO] {len(trackers)} trackers scheduled for metric collection")
-        
-        success_count = 0
-        error_count = 0
-        collected_results = []  # 수집 결과 (알림 발송용)
+        logger.info(f"[INFO] {len(trackers)} trackers scheduled for metric collection (shard {shards.label})")
         
+        await _run_metric_collection_plan(
+            trackers, hour_start, mode=mode,
+            plan_id=None if shards is ALL_SHARDS else shards.label
+        )
+    
+    except Exception as e:
+        print(f"[ERROR] Metric collection scheduler error: {str(e)}")
+        logger.error(f"[ERROR] Metric collection scheduler error: {str(e)}", exc_info=True)
+
+
+async def backfill_metric_collection():
+    """
+    서버 재시작 후 현재 시간대 보충 수집
+    
+    정각 cron을 놓쳤거나(재시작) 진행 중이던 수집 계획이 중단된 경우,
+    현재 시간대에 아직 수집되지 않은 tracker만 다시 계획하여 수집
+    (예정 시각이 지난 슬롯은 즉시, 남은 슬롯은 예정 시각에 디스패치)
+    
+    다른 워커가 수집 중인 샤드는 claim되어 있으므로 제외되고,
+    아무도 claim하지 않았거나 heartbeat가 끊긴 샤드만 보충
+    """
+    try:
+        await run_coordinated_job("collect_metrics", mode="backfill")
+    except Exception as e:
+        logger.error(f"[ERROR] Metric collection backfill error: {str(e)}", exc_info=True)
+
+
+async def _run_metric_collection_plan(
+    trackers: List[dict], hour_start: datetime, mode: str, plan_id: Optional[str] = None
+):
+    """수집 계획 실행 + 전체 결과 로그"""
+    record = await metric_collection_smoother.run_hour(
+        trackers, hour_start, _collect_metrics_slot, mode=mode, plan_id=plan_id
+    )
+    if record is None:
+        return
+    
+    success_count = sum(slot["success"] for slot in record["slots"])
+    error_count = sum(slot["failed"] for slot in record["slots"])
+    print(
+        f"[{datetime.now()}] [COLLECT] 주요지표 수집 완료 - "
+        f"성공: {success_count}, 실패: {error_count}"
+    )
+    logger.info(
+        f"[{datetime.now()}] [COLLECT] 주요지표 수집 완료 - "
+        f"성공: {success_count}, 실패: {error_count}"
+    )
+
+
+async def _collect_metrics_slot(trackers: List[dict]) -> Tuple[int, int]:
+    """
+    한 슬롯의 tracker 지표 수집 + 알림 발송
+    
+    Returns:
+        (성공 수, 실패 수)
+    """
+    success_count = 0
+    error_count = 0
+    collected_results = []  # 수집 결과 (알림 발송용)
+    metric_results = {}  # tracker_id → 수집된 지표
+    
+    if settings.METRIC_BATCH_COLLECTION_ENABLED:
+        # 🚀 배치 모드: 검색 공유 그룹 단위 동시 수집 + 일괄 저장
+        try:
+            metric_results = await metric_tracker_service.collect_metrics_batch(
+                trackers, concurrency=settings.METRIC_BATCH_CONCURRENCY
+            )
+        except Exception as e:
+            logger.error(f"[ERROR] Batch metric collection failed: {str(e)}", exc_info=True)
+        success_count = len(metric_results)
+        error_count = len(trackers) - success_count
+    else:
         for tracker in trackers:
             try:
                 tracker_id = tracker["id"]
@@ -222,26 +323,11 @@ async def collect_all_metrics():
                 logger.info(f"📊 '{keyword_text}' (매장: {store_name}) 지표 수집 중...")
                 
                 # 지표 수집
-                metric_result = await metric_tracker_service.collect_metrics(tracker_id)
+                metric_results[tracker_id] = await metric_tracker_service.collect_metrics(tracker_id)
                 
                 logger.info(f"[OK] '{keyword_text}' (매장: {store_name}) 지표 수집 완료")
                 success_count += 1
-                
-                # 알림 발송을 위한 데이터 저장
-                if tracker.get("notification_enabled"):
-                    collected_results.append({
-                        "tracker_id": tracker_id,
-                        "user_id": tracker.get("user_id"),
-                        "store_id": tracker.get("store_id"),
-                        "keyword": keyword_text,
-                        "rank": metric_result.get("rank") if metric_result else None,
-                        "rank_change": metric_result.get("rank_change") if metric_result else None,
-                        "notification_enabled": tracker.get("notification_enabled", False),
-                        "notification_type": tracker.get("notification_type", "kakao"),
-                        "notification_phone": tracker.get("notification_phone"),
-                        "notification_email": tracker.get("notification_email"),
-                    })
-                    
+            
             except Exception as e:
                 error_count += 1
                 logger.error(
@@ -249,38 +335,48 @@ async def collect_all_metrics():
                     exc_info=True
                 )
                 continue
+    
+    # 알림 발송을 위한 데이터 구성
+    for tracker in trackers:
+        tracker_id = tracker["id"]
+        if tracker_id not in metric_results or not tracker.get("notification_enabled"):
+            continue
         
-        print(
-            f"[{datetime.now()}] [COLLECT] 주요지표 수집 완료 - "
-            f"성공: {success_count}, 실패: {error_count}"
-        )
-        logger.info(
-            f"[{datetime.now()}] [COLLECT] 주요지표 수집 완료 - "
-            f"성공: {success_count}, 실패: {error_count}"
-        )
-        
-        # 📢 수집 완료 후 알림 발송
-        if collected_results:
-            try:
-                from app.services.notification_service import notification_service
-                notification_stats = await notification_service.send_rank_notifications_after_collection(
-                    collected_trackers=collected_results
-                )
-                logger.info(
-                    f"[{datetime.now()}] 📢 알림 발송 완료: "
-                    f"성공={notification_stats['sent']}, "
-                    f"실패={notification_stats['failed']}, "
-                    f"건너뜀={notification_stats['skipped']}"
-                )
-            except Exception as notif_error:
-                logger.error(
-                    f"[ERROR] 알림 발송 중 오류 (수집은 정상 완료됨): {str(notif_error)}",
-                    exc_info=True
-                )
-        
-    except Exception as e:
-        print(f"[ERROR] Metric collection scheduler error: {str(e)}")
-        logger.error(f"[ERROR] Metric collection scheduler error: {str(e)}", exc_info=True)
+        metric_result = metric_results[tracker_id]
+        keyword_info = tracker.get("keywords", {})
+        collected_results.append({
+            "tracker_id": tracker_id,
+            "user_id": tracker.get("user_id"),
+            "store_id": tracker.get("store_id"),
+            "keyword": keyword_info.get("keyword", "Unknown") if keyword_info else "Unknown",
+            "rank": metric_result.get("rank") if metric_result else None,
+            "rank_change": metric_result.get("rank_change") if metric_result else None,
+            "notification_enabled": tracker.get("notification_enabled", False),
+            "notification_type": tracker.get("notification_type", "kakao"),
+            "notification_phone": tracker.get("notification_phone"),
+            "notification_email": tracker.get("notification_email"),
+        })
+    
+    # 📢 수집 완료 후 알림 발송
+    if collected_results:
+        try:
+            from app.services.notification_service import notification_service
+            notification_stats = await notification_service.send_rank_notifications_after_collection(
+                collected_trackers=collected_results
+            )
+            logger.info(
+                f"[{datetime.now()}] 📢 알림 발송 완료: "
+                f"성공={notification_stats['sent']}, "
+                f"실패={notification_stats['failed']}, "
+                f"건너뜀={notification_stats['skipped']}"
+            )
+        except Exception as notif_error:
+            logger.error(
+                f"[ERROR] 알림 발송 중 오류 (수집은 정상 완료됨): {str(notif_error)}",
+                exc_info=True
+            )
+    
+    return success_count, error_count
 
 
 async def process_billing():
@@ -301,22 +397,107 @@ async def process_billing():
         logger.info(f"[Billing] 만료 처리: {expired_count}건")
         
         logger.info(f"[{datetime.now()}] 💳 정기결제 처리 완료")
-        
+    
     except Exception as e:
         logger.error(f"[ERROR] Billing scheduler error: {str(e)}")
         import traceback
         logger.error(traceback.format_exc())
 
 
+# ============================================
+# 워커 간 조정 (app.core.coordination)
+# ============================================
+
+def day_period(now: Optional[datetime] = None) -> str:
+    """일 단위 작업 기간 키 (KST 날짜)"""
+    return get_hour_start(now).date().isoformat()
+
+
+def daily_due_period(hour: int):
+    """매일 hour시(KST) cron 작업의 현재 기간 키 함수 (오늘 hour시 전이면 None)"""
+    def due_period(now: Optional[datetime] = None) -> Optional[str]:
+        hour_start = get_hour_start(now)
+        return day_period(hour_start) if hour_start.hour >= hour else None
+    return due_period
+
+
+def hour_period(hour_start: Optional[datetime] = None) -> str:
+    """시간 단위 작업 기간 키 (KST 시간대)"""
+    return (hour_start or get_hour_start()).strftime("%Y-%m-%dT%H")
+
+
+async def _sync_reviews_job(shards: ShardSet, period: str, mode: str):
+    await sync_all_stores_reviews(shards)
+
+
+async def _check_ranks_job(shards: ShardSet, period: str, mode: str):
+    await check_all_keywords_rank(shards)
+
+
+async def _collect_metrics_job(shards: ShardSet, period: str, mode: str):
+    await collect_all_metrics(shards, mode=mode, period=period)
+
+
+async def _process_billing_job(shards: ShardSet, period: str, mode: str):
+    await process_billing()
+
+
+# 작업 id → (작업 함수, 기간 키 함수, 샤드 작업 여부)
+# 샤드 작업이 아니면 리더만 기간당 1회 실행
+COORDINATED_JOBS = {
+    "sync_reviews": (_sync_reviews_job, day_period, True),
+    "check_ranks": (_check_ranks_job, day_period, True),
+    "collect_metrics": (_collect_metrics_job, hour_period, True),
+    "process_billing": (_process_billing_job, day_period, False),
+}
+
+# 정기결제 실행 시각 (KST)
+BILLING_HOUR = 1
+
+# 단독 작업 id → 현재 기간 키 함수 (리더 교체 / 재시작으로 cron을 놓친 기간은 리더가 tick에서 실행)
+CATCH_UP_JOBS = {
+    "process_billing": daily_due_period(BILLING_HOUR),
+}
+
+
+async def run_coordinated_job(job_id: str, mode: str = "scheduled"):
+    """cron 진입점: 리더 단독 실행 또는 샤드 claim 후 실행"""
+    func, period_of, sharded = COORDINATED_JOBS[job_id]
+    if sharded:
+        await scheduler_coordinator.run_sharded(
+            job_id, period_of(), func, mode=mode, claim_all=mode == "backfill"
+        )
+    else:
+        await scheduler_coordinator.run_exclusive(job_id, period_of(), func, mode=mode)
+
+
 def start_scheduler():
     """스케줄러 시작 (KST 시간대 기준)"""
     from pytz import timezone as pytz_timezone
     kst = pytz_timezone('Asia/Seoul')
     
+    # 끊긴 실행 재실행용 작업 등록
+    for job_id, (func, _, _) in COORDINATED_JOBS.items():
+        scheduler_coordinator.register(job_id, func, due_period=CATCH_UP_JOBS.get(job_id))
+    
+    # 리더 리스 갱신 / 워커 생존 신호 (시작 즉시 1회 → 이후 TTL/3 간격)
+    scheduler.add_job(
+        scheduler_coordinator.tick,
+        "interval",
+        seconds=scheduler_coordinator.renew_interval_seconds,
+        next_run_time=datetime.now(kst),
+        id="coordination_tick",
+        name="스케줄러 리더 리스 갱신",
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
     # 매일 오전 6시 (KST): 리뷰 수집
     scheduler.add_job(
-        sync_all_stores_reviews,
+        run_coordinated_job,
         CronTrigger(hour=6, minute=0, timezone=kst),
+        args=["sync_reviews"],
         id="sync_reviews",
         name="전체 매장 리뷰 자동 수집",
         replace_existing=True
@@ -324,8 +505,9 @@ def start_scheduler():
     
     # 매일 오전 3시 (KST): 키워드 순위 확인
     scheduler.add_job(
-        check_all_keywords_rank,
+        run_coordinated_job,
         CronTrigger(hour=3, minute=0, timezone=kst),
+        args=["check_ranks"],
         id="check_ranks",
         name="키워드 순위 자동 확인",
         replace_existing=True
@@ -333,18 +515,33 @@ def start_scheduler():
     
     # 매 시간마다 (KST): 주요지표 추적 자동 수집
     # 각 추적 설정의 update_times를 확인하여 수집 시간이 된 항목만 처리
+    # 정각에 계획 후 METRIC_SMOOTHING_WINDOW_MINUTES 구간에 분산 디스패치
     scheduler.add_job(
-        collect_all_metrics,
+        run_coordinated_job,
         CronTrigger(minute=0, timezone=kst),  # 매 시간 정각 (KST)
+        args=["collect_metrics"],
         id="collect_metrics",
         name="주요지표 추적 자동 수집",
         replace_existing=True
     )
     
+    # 서버 시작 직후: 현재 시간대 미수집 tracker 보충 수집 (정각 cron을 놓친 경우)
+    if settings.METRIC_BACKFILL_ON_STARTUP:
+        scheduler.add_job(
+            backfill_metric_collection,
+            "date",
+            run_date=datetime.now(kst) + timedelta(seconds=30),
+            id="backfill_metrics",
+            name="주요지표 추적 보충 수집",
+            replace_existing=True
+        )
+    
     # 매일 오전 1시 (KST): 정기결제 및 구독 만료 처리
+    # (그 시각에 리더가 없었거나 서버가 내려가 있었으면 리더가 tick에서 오늘 기간을 실행)
     scheduler.add_job(
-        process_billing,
-        CronTrigger(hour=1, minute=0, timezone=kst),
+        run_coordinated_job,
+        CronTrigger(hour=BILLING_HOUR, minute=0, timezone=kst),
+        args=["process_billing"],
         id="process_billing",
         name="정기결제 및 구독 만료 처리",
         replace_existing=True
@@ -358,7 +555,8 @@ def start_scheduler():
     print("    - Billing: 1 AM daily (KST)")
     print("    - Rank check: 3 AM daily (KST)")
     print("    - Review sync: 6 AM daily (KST)")
-    print("    - Metric tracking: Every hour at :00 (KST)")
+    print(f"    - Metric tracking: Every hour, spread over {metric_collection_smoother.window_seconds // 60} min (KST)")
+    print(f"  [Coordination] {scheduler_coordinator.backend.name}, worker={scheduler_coordinator.worker_id}")
     print("=" * 60)
     logger.info("=" * 60)
     logger.info("[OK] Scheduler started with timezone: Asia/Seoul (KST)")
@@ -367,13 +565,18 @@ def start_scheduler():
     logger.info("    - Billing: 1 AM daily (KST)")
     logger.info("    - Rank check: 3 AM daily (KST)")
     logger.info("    - Review sync: 6 AM daily (KST)")
-    logger.info("    - Metric tracking: Every hour at :00 (KST)")
+    logger.info(f"    - Metric tracking: Every hour, spread over {metric_collection_smoother.window_seconds // 60} min (KST)")
+    logger.info(
+        f"  [Coordination] {scheduler_coordinator.backend.name}, worker={scheduler_coordinator.worker_id}, "
+        f"shards={scheduler_coordinator.shard_count}"
+    )
     logger.info("=" * 60)
 
 
 def stop_scheduler():
     """스케줄러 중지"""
     scheduler.shutdown()
+    scheduler_coordinator.release()
     print("[OK] Scheduler stopped")
 
 
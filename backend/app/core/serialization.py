@@ -0,0 +1,65 @@
+"""
+JSON 직렬화 (응답 본문 / SSE 이벤트)
+
+순위 조회(search_results 최대 300개), 경쟁매장 분석, 플레이스 상세 / 진단 응답은 본문이 크고,
+리뷰 분석 SSE는 이벤트마다 json.dumps를 호출합니다. orjson으로 직렬화 비용을 줄입니다.
+
+- dumps: orjson (ORJSON_ENABLED, 미설치 시 표준 json) → bytes
+  JSONResponse와 같은 출력 (UTF-8, 공백 없음), orjson이 처리하지 못하는 값(64bit 초과 정수 등)은 표준 json으로 재시도
+- sse_event: SSE data 이벤트 문자열 ("data: {...}\\n\\n")
+- FastJSONResponse는 main.py의 기본 응답 클래스 (render에서 dumps 사용)
+
+벤치마크: python -m benchmarks.serialization
+"""
+import json
+import logging
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _load_orjson():
+    if not settings.ORJSON_ENABLED:
+        return None
+    try:
+        import orjson
+    except ImportError:
+        logger.info("[Serialization] orjson 미설치 → 표준 json 사용")
+        return None
+    return orjson
+
+
+_orjson = _load_orjson()
+_ORJSON_OPTIONS = _orjson.OPT_NON_STR_KEYS if _orjson else 0
+
+
+def backend_name() -> str:
+    return "orjson" if _orjson else "json"
+
+
+def dumps_std(content: Any) -> bytes:
+    """표준 json 직렬화 (starlette JSONResponse.render와 같은 옵션)"""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (orjson 우선, 실패하면 표준 json)"""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(content, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return dumps_std(content)
+
+
+def sse_event(payload: Any) -> str:
+    """SSE data 이벤트 (StreamingResponse가 UTF-8로 인코딩)"""
+    return f"data: {dumps(payload).decode('utf-8')}\n\n"
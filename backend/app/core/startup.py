@@ -0,0 +1,185 @@
+"""
+워커 역할 / 시작 프로파일
+
+- WORKER_ROLE에 따라 라우터 / 스케줄러 로드 여부 결정 (main.py)
+- 시작 소요 시간, 최대 RSS, 무거운 서브시스템(selenium / playwright / openai 등) 로드 여부 리포트
+  → GET /api/v1/system/startup
+- 모듈별 import 시간 프로파일 (python -X importtime 기반):
+    
+    cd backend
+    python -m app.core.startup --role api --top 30
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+WORKER_ROLES = ("all", "api", "scheduler", "scraper", "worker")
+
+# 첫 사용 시 로드되도록 지연 import한 무거운 서브시스템 (sys.modules 키)
+HEAVY_SUBSYSTEMS = (
+    "selenium",
+    "webdriver_manager",
+    "playwright",
+    "openai",
+    "bs4",
+    "selectolax",
+    "lxml",
+    "googleapiclient",
+    "apscheduler",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+_timings: Dict[str, Optional[float]] = {"import_started": None, "import_finished": None, "ready": None}
+
+
+def worker_role() -> str:
+    role = settings.WORKER_ROLE
+    return role if role in WORKER_ROLES else "all"
+
+
+def runs_scheduler() -> bool:
+    return worker_role() in ("all", "scheduler")
+
+
+def runs_job_workers() -> bool:
+    # local 백엔드는 프로세스 내 큐라서 작업을 등록한 프로세스가 직접 실행해야 함
+    return worker_role() in ("all", "worker") or settings.JOB_BACKEND != "supabase"
+
+
+def mark(stage: str):
+    """시작 단계 시각 기록 (import_started / import_finished / ready)"""
+    _timings[stage] = time.perf_counter()
+
+
+def _seconds_between(start: str, end: str) -> Optional[float]:
+    if _timings[start] is None or _timings[end] is None:
+        return None
+    return round(_timings[end] - _timings[start], 3)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB, resource 모듈이 없는 Windows에서는 None)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(usage / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def get_startup_report() -> dict:
+    return {
+        "role": worker_role(),
+        "runs_scheduler": runs_scheduler(),
+        "runs_job_workers": runs_job_workers(),
+        "app_import_seconds": _seconds_between("import_started", "import_finished"),
+        "ready_seconds": _seconds_between("import_started", "ready"),
+        "peak_rss_mb": peak_rss_mb(),
+        "loaded_subsystems": {name: name in sys.modules for name in HEAVY_SUBSYSTEMS},
+        "loaded_module_count": len(sys.modules),
+    }
+
+
+# ============================================
+# import 시간 프로파일 (CLI)
+# ============================================
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """python -X importtime 출력 → [{module, self_us, cumulative_us, depth}]"""
+    entries = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        entries.append({
+            "module": module,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "depth": (len(indent) - 1) // 2,
+        })
+    return entries
+
+
+def profile_imports(role: str, target: str = "app.main") -> dict:
+    """별도 프로세스에서 target을 import하며 모듈별 import 시간 측정"""
+    env = dict(os.environ, WORKER_ROLE=role)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        env=env, capture_output=True, text=True,
+    )
+    wall_seconds = time.perf_counter() - started
+    
+    entries = parse_importtime(completed.stderr)
+    by_package: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        by_package[entry["module"].split(".")[0]] += entry["self_us"]
+    
+    # RUSAGE_CHILDREN은 지금까지 종료된 자식 프로세스 중 최대값 (역할을 여러 개 프로파일하면 누적 최대)
+    child_rss_mb = None
+    try:
+        import resource
+        child_rss_mb = round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+    except ImportError:
+        pass
+    
+    return {
+        "role": role,
+        "target": target,
+        "returncode": completed.returncode,
+        "wall_seconds": round(wall_seconds, 3),
+        "child_peak_rss_mb": child_rss_mb,
+        "modules": entries,
+        "packages": dict(sorted(by_package.items(), key=lambda item: item[1], reverse=True)),
+        "heavy_loaded": sorted({
+            entry["module"].split(".")[0] for entry in entries
+            if entry["module"].split(".")[0] in HEAVY_SUBSYSTEMS
+        }),
+        "error": completed.stderr.strip().splitlines()[-1] if completed.returncode else None,
+    }
+
+
+def format_profile(profile: dict, top: int) -> str:
+    lines = [
+        f"role={profile['role']}  import {profile['target']}: {profile['wall_seconds']}s "
+        f"(peak RSS {profile['child_peak_rss_mb']} MB)",
+    ]
+    if profile["error"]:
+        lines.append(f"  ⚠️ import 실패: {profile['error']}")
+    lines.append(f"  무거운 서브시스템 로드: {', '.join(profile['heavy_loaded']) or '없음'}")
+    
+    lines.append(f"\n패키지별 self 시간 (상위 {top})")
+    for package, self_us in list(profile["packages"].items())[:top]:
+        lines.append(f"  {self_us / 1000:>9.1f} ms  {package}")
+    
+    lines.append(f"\n모듈별 누적 시간 (상위 {top})")
+    for entry in sorted(profile["modules"], key=lambda item: item["cumulative_us"], reverse=True)[:top]:
+        lines.append(f"  {entry['cumulative_us'] / 1000:>9.1f} ms  {'  ' * entry['depth']}{entry['module']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.core.startup", description="모듈별 import 시간 프로파일")
+    parser.add_argument("--role", choices=WORKER_ROLES, nargs="+", default=["all"], help="프로파일할 워커 역할")
+    parser.add_argument("--target", default="app.main", help="import할 모듈")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args(argv)
+    
+    for role in args.role:
+        print(format_profile(profile_imports(role, args.target), args.top))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+요청 단위 구간(span) 측정 (contextvars 기반)
+
+느린 엔드포인트(순위 조회, 플레이스 활성화, 상세 정보 등)에서
+DB / 네이버 / LLM 중 어느 구간이 시간을 차지하는지 확인하기 위한 경량 트레이싱입니다.
+
+사용법:
+    from app.core.tracing import span, traced
+
+    with span("rank.search"):
+        ...
+
+    @traced("activation.analyze")
+    async def analyze(...):
+        ...
+
+설계 원칙:
+- 요청 트레이스는 미들웨어(RequestTimingMiddleware)가 시작 → 트레이스가 없으면 span은 즉시 반환
+  (REQUEST_TRACING_ENABLED=false면 미들웨어를 등록하지 않으므로 ContextVar 조회 1회가 전부)
+- 같은 이름의 span은 합산 (asyncio.gather로 병렬 실행된 구간은 합계가 전체 시간보다 클 수 있음)
+- 외부 API 호출(metrics.observe_upstream)은 "upstream.operation" 이름으로 자동 기록
+"""
+import functools
+import inspect
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+# Server-Timing 헤더 metric 이름에 허용되지 않는 문자
+_INVALID_TOKEN_CHARS = re.compile(r"[^A-Za-z0-9_.\-]")
+
+# 헤더 크기 제한 (span 종류가 많아도 상위 N개만)
+MAX_SERVER_TIMING_ENTRIES = 20
+
+
+class RequestTrace:
+    """요청 1건의 span 집계 (이름별 합계 시간 / 호출 수)"""
+
+    __slots__ = ("started", "spans")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans: Dict[str, List[float]] = {}
+
+    def add(self, name: str, seconds: float):
+        entry = self.spans.get(name)
+        if entry is None:
+            self.spans[name] = [seconds, 1]
+        else:
+            entry[0] += seconds
+            entry[1] += 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def breakdown(self) -> List[dict]:
+        """span 내역 (시간 내림차순)"""
+        items = sorted(self.spans.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {"name": name, "ms": round(total * 1000, 1), "count": int(count)}
+            for name, (total, count) in items
+        ]
+
+    def server_timing_header(self) -> str:
+        """Server-Timing 헤더 값 (예: naver_graphql.getPlacesList;dur=812.4;desc="x3", total;dur=1020.5)"""
+        parts = []
+        for item in self.breakdown()[:MAX_SERVER_TIMING_ENTRIES]:
+            name = _INVALID_TOKEN_CHARS.sub("_", item["name"])
+            if item["count"] > 1:
+                parts.append(f'{name};dur={item["ms"]};desc="x{item["count"]}"')
+            else:
+                parts.append(f'{name};dur={item["ms"]}')
+        parts.append(f"total;dur={round(self.elapsed * 1000, 1)}")
+        return ", ".join(parts)
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+
+def start_trace() -> RequestTrace:
+    """현재 컨텍스트에서 요청 트레이스 시작 (미들웨어 전용)"""
+    trace = RequestTrace()
+    _current_trace.set(trace)
+    return trace
+
+
+def get_current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+def record_span(name: str, seconds: float):
+    """이미 측정한 구간을 현재 요청 트레이스에 기록 (트레이스가 없으면 무시)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(name, seconds)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    구간 측정 (동기/비동기 코드 모두 사용 가능)
+
+    트레이스가 없으면(트레이싱 비활성 / 스케줄러 작업 등) 측정하지 않음
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, time.perf_counter() - started)
+
+
+def traced(name: str):
+    """함수 전체를 span으로 측정하는 데코레이터 (async/sync 함수 모두 지원)"""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return sync_wrapper
+    return decorator
@@ -11,6 +11,10 @@ import sys
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+import importlib
+
+from app.core import startup
+startup.mark("import_started")
 
 # Windows에서 Playwright async subprocess 지원을 위한 이벤트 루프 정책 설정
 if sys.platform == 'win32':
@@ -19,34 +23,62 @@ if sys.platform == 'win32':
 # 환경변수 로드
 load_dotenv()
 
-# 로깅 설정 (모든 로거에 적용)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(levelname)s:     %(name)s - %(message)s'
-)
+# 로깅 설정 (모든 로거에 적용: 큐 기반 비동기 출력, LOG_FORMAT=json이면 구조화 로그)
+from app.core.logging_setup import setup_logging, shutdown_logging
+setup_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행"""
-    # 시작 시
-    from app.core.scheduler import start_scheduler
-    start_scheduler()
-    print("[OK] Egurado API started")
+    # 시작 시 (스케줄러는 all / scheduler 역할에서만)
+    if startup.runs_scheduler():
+        from app.core.scheduler import start_scheduler
+        start_scheduler()
+    # 백그라운드 작업 워커 (all / worker 역할, local 백엔드는 모든 역할)
+    if startup.runs_job_workers():
+        from app.core.jobs import job_engine
+        job_engine.start()
+    startup.mark("ready")
+    logging.getLogger(__name__).info(
+        f"[OK] Egurado API started (role={startup.worker_role()}, {startup.get_startup_report()['ready_seconds']}s)"
+    )
     
     yield
     
     # 종료 시
-    from app.core.scheduler import stop_scheduler
-    stop_scheduler()
-    print("[OK] Egurado API stopped")
+    if startup.runs_scheduler():
+        from app.core.scheduler import stop_scheduler
+        stop_scheduler()
+    if startup.runs_job_workers():
+        from app.core.jobs import job_engine
+        await job_engine.stop()
+    
+    from app.services.nhn_kakao_service import nhn_kakao_service
+    from app.services.nhn_email_service import nhn_email_service
+    await nhn_kakao_service.aclose()
+    await nhn_email_service.aclose()
+    logging.getLogger(__name__).info("[OK] Egurado API stopped")
+    shutdown_logging()
+
+
+# 기본 응답 클래스: orjson 직렬화 (app/core/serialization.py)
+from starlette.responses import JSONResponse
+from app.core.serialization import dumps as dump_json
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse와 같은 출력을 orjson으로 직렬화 (orjson이 없으면 표준 json)"""
+    
+    def render(self, content) -> bytes:
+        return dump_json(content)
 
 
 app = FastAPI(
     title="Egurado API",
     description="네이버 플레이스 및 구글 비즈니스 프로필 관리 API",
     version="1.0.1",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정
@@ -59,6 +91,19 @@ app.add_middleware(
 )
 
 
+# 응답 압축 (br / gzip, 순수 ASGI라서 BaseHTTPMiddleware보다 먼저 등록 → 본문을 한 번에 받음)
+from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+
+if settings.RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES,
+        gzip_level=settings.RESPONSE_COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.RESPONSE_COMPRESSION_BROTLI_QUALITY,
+    )
+
+
 # 글로벌 Supabase 클라이언트 세션 무결성 보호 미들웨어
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
@@ -88,6 +133,45 @@ class SessionIntegrityMiddleware(BaseHTTPMiddleware):
 app.add_middleware(SessionIntegrityMiddleware)
 
 
+# 요청 구간 측정 미들웨어 (Server-Timing 헤더 + 느린 요청 로그)
+from app.core.tracing import start_trace
+
+request_timing_logger = logging.getLogger("app.request_timing")
+
+class RequestTimingMiddleware(BaseHTTPMiddleware):
+    """
+    요청마다 트레이스를 시작하고 서비스/외부 API span을 집계합니다.
+    
+    - REQUEST_TRACING_ENABLED: Server-Timing 응답 헤더 추가 (브라우저 개발자 도구 Timing 탭에서 확인)
+    - SLOW_REQUEST_THRESHOLD_MS: 기준 이상 걸린 요청은 span 내역과 함께 경고 로그
+    - 둘 다 꺼져 있으면 미들웨어를 등록하지 않음 (오버헤드 없음)
+    """
+    
+    async def dispatch(self, request: Request, call_next):
+        trace = start_trace()
+        response = await call_next(request)
+        
+        if settings.REQUEST_TRACING_ENABLED:
+            response.headers["Server-Timing"] = trace.server_timing_header()
+        
+        elapsed_ms = trace.elapsed * 1000
+        threshold_ms = settings.SLOW_REQUEST_THRESHOLD_MS
+        if threshold_ms > 0 and elapsed_ms >= threshold_ms:
+            breakdown = ", ".join(
+                f"{item['name']}={item['ms']}ms" + (f"(x{item['count']})" if item["count"] > 1 else "")
+                for item in trace.breakdown()
+            )
+            request_timing_logger.warning(
+                f"[SlowRequest] {request.method} {request.url.path} → {response.status_code} "
+                f"{elapsed_ms:.0f}ms (기준 {threshold_ms}ms) | {breakdown or 'span 없음'}"
+            )
+        
+        return response
+
+if settings.REQUEST_TRACING_ENABLED or settings.SLOW_REQUEST_THRESHOLD_MS > 0:
+    app.add_middleware(RequestTimingMiddleware)
+
+
 @app.get("/")
 async def root():
     """헬스체크 엔드포인트"""
@@ -123,7 +207,8 @@ async def proxy_status():
     브라우저에서 https://api.whiplace.com/api/v1/system/proxy-status 로 접속하여 확인 가능
     
     Returns:
-        - proxy: 프록시 설정 및 활성 상태
+        - proxy: 프록시 풀 설정 및 활성 상태
+        - pool: 프록시별 건강도 / 동시 사용 수 / 쿨다운 / 성공률 / sticky 할당 수
         - stats: 요청 통계 (프록시/직접 성공률)
         - recent_requests: 최근 50건의 요청 이력
     """
@@ -141,69 +226,156 @@ async def rate_limit_status():
     Returns:
         - user_limiter: 유저별 동시 요청 제한 상태
         - naver_api_limiter: 글로벌 네이버 API 동시 호출 제한 상태
+        - nhn_kakao_limiter / nhn_email_limiter: NHN Cloud 발송 API 제한 상태
+        - distributed: 전체 워커 합계 슬롯 사용 현황 (limiter별 active / per_worker / per_key)
     """
-    from app.core.rate_limiter import user_collect_limiter, naver_api_limiter
+    from app.core.rate_limiter import (
+        user_collect_limiter, naver_api_limiter, nhn_kakao_limiter, nhn_email_limiter,
+        get_distributed_usage,
+    )
+    try:
+        distributed = await get_distributed_usage()
+    except Exception as e:
+        distributed = {"error": str(e)}
     return {
         "user_collect_limiter": user_collect_limiter.get_status(),
         "naver_api_limiter": naver_api_limiter.get_status(),
+        "nhn_kakao_limiter": nhn_kakao_limiter.get_status(),
+        "nhn_email_limiter": nhn_email_limiter.get_status(),
+        "distributed": distributed,
     }
 
 
-# 라우터 등록
-# 라우터 import
-from app.routers.auth import router as auth_router
-from app.routers.naver import router as naver_router
-from app.routers.reviews import router as reviews_router
-from app.routers.keywords import router as keywords_router
-from app.routers.keyword_search_volume import router as keyword_search_volume_router
-from app.routers.target_keywords import router as target_keywords_router
-from app.routers.google import router as google_router
-from app.routers.stores import router as stores_router
-from app.routers.ai_reply import router as ai_reply_router
-from app.routers.naver_session import router as naver_session_router
-from app.routers.ai_settings import router as ai_settings_router
-from app.routers.metric_tracker import router as metric_tracker_router
-from app.routers.votes import router as votes_router
-from app.routers.onboarding import router as onboarding_router
-from app.routers.contact import router as contact_router
-
-# Credit System Routers (NEW)
-from app.routers.credits import router as credits_router
-from app.routers.subscriptions import router as subscriptions_router
-from app.routers.payments import router as payments_router
-from app.routers.coupons import router as coupons_router
-
-# New Dashboard Feature Routers (2026-02-04)
-from app.routers.notifications import router as notifications_router
-from app.routers.support import router as support_router
-from app.routers.admin import router as admin_router
-from app.routers.user_settings import router as user_settings_router
-
-# 라우터 등록
-app.include_router(auth_router, prefix="/api/v1", tags=["Auth"])
-app.include_router(stores_router, prefix="/api/v1/stores", tags=["Stores"])
-app.include_router(naver_router, prefix="/api/v1/naver", tags=["Naver"])
-app.include_router(google_router, prefix="/api/v1/google", tags=["Google"])
-app.include_router(reviews_router, prefix="/api/v1/reviews", tags=["Reviews"])
-app.include_router(keywords_router, prefix="/api/v1/keywords", tags=["Keywords"])
-app.include_router(keyword_search_volume_router, prefix="/api/v1/keyword-search-volume", tags=["Keyword Search Volume"])
-app.include_router(target_keywords_router, prefix="/api/v1/target-keywords", tags=["Target Keywords"])
-app.include_router(ai_reply_router, prefix="/api/v1/ai-reply", tags=["AI Reply"])
-app.include_router(naver_session_router, prefix="/api/v1/naver-session", tags=["Naver Session"])
-app.include_router(ai_settings_router, tags=["AI Settings"])
-app.include_router(metric_tracker_router, prefix="/api/v1/metrics", tags=["Metric Tracker"])
-app.include_router(votes_router, tags=["Feature Voting"])
-app.include_router(onboarding_router, prefix="/api/v1", tags=["Onboarding"])
-app.include_router(contact_router, prefix="/api/v1/contact", tags=["Contact"])
-
-# Credit System Routers (NEW)
-app.include_router(credits_router, tags=["Credits"])
-app.include_router(subscriptions_router, tags=["Subscriptions"])
-app.include_router(payments_router, tags=["Payments"])
-app.include_router(coupons_router, tags=["Coupons"])
-
-# New Dashboard Feature Routers (2026-02-04)
-app.include_router(notifications_router)
-app.include_router(support_router)
-app.include_router(admin_router)
-app.include_router(user_settings_router)
\ No newline at end of file
+@app.get("/api/v1/system/metric-collection-timeline")
+async def metric_collection_timeline():
+    """
+    주요지표 자동수집 디스패치 타임라인
+    
+    Returns:
+        - config: 분산 구간 / 슬롯 간격
+        - running_hours: 진행 중인 수집 시간대
+        - hours: 최근 24개 시간대의 슬롯별 예정/실제 디스패치 시각, 지연, 성공/실패 수
+    """
+    from app.core.collection_smoother import metric_collection_smoother
+    return metric_collection_smoother.get_timeline()
+
+
+@app.get("/api/v1/system/scheduler-status")
+async def scheduler_status():
+    """
+    다중 워커 스케줄러 조정 상태 (이 워커 기준)
+    
+    Returns:
+        - backend: local / supabase
+        - worker_id / is_leader / leader_id / fencing_token: 리더 리스 상태
+        - active_workers / shard_count: 샤드 분배 기준
+        - running: 이 워커에서 실행 중인 작업과 담당 샤드
+        - recent_runs: 최근 실행 (scheduled / sweep / recovery / backfill)
+    """
+    from app.core.coordination import scheduler_coordinator
+    return {
+        "runs_scheduler": startup.runs_scheduler(),
+        **scheduler_coordinator.get_status(),
+    }
+
+
+@app.get("/api/v1/system/job-workers")
+async def job_worker_status():
+    """
+    백그라운드 작업 워커 상태 (이 프로세스 기준)
+    
+    Returns:
+        - backend: local / supabase
+        - workers / concurrency: 실행 중인 워커 루프 수
+        - running: 실행 중인 작업 (종류, 진행률)
+        - stats: 시작 이후 claim / 성공 / 실패 / 취소 / 인수당함 수
+    """
+    from app.core.jobs import job_engine
+    return {
+        "runs_job_workers": startup.runs_job_workers(),
+        **job_engine.get_status(),
+    }
+
+
+@app.get("/api/v1/system/startup")
+async def startup_status():
+    """
+    워커 시작 프로파일
+    
+    Returns:
+        - role: 워커 역할 (WORKER_ROLE)
+        - app_import_seconds / ready_seconds: app.main import / 시작 완료까지 걸린 시간
+        - peak_rss_mb: 프로세스 최대 RSS
+        - loaded_subsystems: 무거운 서브시스템(selenium, playwright, openai 등) 로드 여부 (첫 사용 시 로드)
+    """
+    return startup.get_startup_report()
+
+
+@app.get("/api/v1/system/response-cache")
+async def response_cache_status():
+    """
+    조회 API 응답 캐시 상태 (이 프로세스 기준)
+    
+    Returns:
+        - entries / cached_bytes: 캐시된 응답 수 / 본문 크기
+        - versions_available: 리소스 버전 RPC 사용 가능 여부 (False면 본문 해시 ETag)
+        - stats: 304 / 캐시 적중 / 미스 / 캐시 불가 / 버전 조회 실패 수
+    """
+    from app.core.response_cache import response_cache
+    return response_cache.get_status()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """
+    Prometheus 스크레이프 엔드포인트 (text exposition format 0.0.4)
+    
+    - egurado_upstream_requests_total / egurado_upstream_request_duration_seconds:
+      외부 API(네이버 GraphQL/HTML, 검색광고, OpenAI, NHN, Supabase)별 호출 수 / 응답 시간
+    - 레이트 리미터 활성/대기, 프록시별 동시 사용, 브라우저/드라이버, 답글 큐 게이지
+    """
+    from app.core.metrics import CONTENT_TYPE_LATEST, render_metrics
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+# 라우터 등록 (WORKER_ROLE에 필요한 라우터만 import)
+API_ROLES = ("all", "api")
+SCRAPER_ROLES = ("all", "api", "scraper")
+
+ROUTERS = [
+    # (모듈, include_router 인자, 등록할 역할)
+    ("app.routers.auth", {"prefix": "/api/v1", "tags": ["Auth"]}, API_ROLES),
+    ("app.routers.stores", {"prefix": "/api/v1/stores", "tags": ["Stores"]}, API_ROLES),
+    ("app.routers.naver", {"prefix": "/api/v1/naver", "tags": ["Naver"]}, API_ROLES),
+    ("app.routers.google", {"prefix": "/api/v1/google", "tags": ["Google"]}, API_ROLES),
+    ("app.routers.reviews", {"prefix": "/api/v1/reviews", "tags": ["Reviews"]}, API_ROLES),
+    ("app.routers.keywords", {"prefix": "/api/v1/keywords", "tags": ["Keywords"]}, API_ROLES),
+    ("app.routers.keyword_search_volume", {"prefix": "/api/v1/keyword-search-volume", "tags": ["Keyword Search Volume"]}, API_ROLES),
+    ("app.routers.target_keywords", {"prefix": "/api/v1/target-keywords", "tags": ["Target Keywords"]}, API_ROLES),
+    ("app.routers.jobs", {"prefix": "/api/v1/jobs", "tags": ["Jobs"]}, API_ROLES),
+    ("app.routers.ai_reply", {"prefix": "/api/v1/ai-reply", "tags": ["AI Reply"]}, SCRAPER_ROLES),
+    ("app.routers.naver_session", {"prefix": "/api/v1/naver-session", "tags": ["Naver Session"]}, SCRAPER_ROLES),
+    ("app.routers.ai_settings", {"tags": ["AI Settings"]}, API_ROLES),
+    ("app.routers.metric_tracker", {"prefix": "/api/v1/metrics", "tags": ["Metric Tracker"]}, API_ROLES),
+    ("app.routers.votes", {"tags": ["Feature Voting"]}, API_ROLES),
+    ("app.routers.onboarding", {"prefix": "/api/v1", "tags": ["Onboarding"]}, API_ROLES),
+    ("app.routers.contact", {"prefix": "/api/v1/contact", "tags": ["Contact"]}, API_ROLES),
+    
+    # Credit System Routers (NEW)
+    ("app.routers.credits", {"tags": ["Credits"]}, API_ROLES),
+    ("app.routers.subscriptions", {"tags": ["Subscriptions"]}, API_ROLES),
+    ("app.routers.payments", {"tags": ["Payments"]}, API_ROLES),
+    ("app.routers.coupons", {"tags": ["Coupons"]}, API_ROLES),
+    
+    # New Dashboard Feature Routers (2026-02-04)
+    ("app.routers.notifications", {}, API_ROLES),
+    ("app.routers.support", {}, API_ROLES),
+    ("app.routers.admin", {}, API_ROLES),
+    ("app.routers.user_settings", {}, API_ROLES),
+]
+
+for module_path, router_kwargs, roles in ROUTERS:
+    if startup.worker_role() in roles:
+        app.include_router(importlib.import_module(module_path).router, **router_kwargs)
+
+startup.mark("import_finished")
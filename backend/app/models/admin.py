@@ -3,7 +3,7 @@ Admin Models
 관리자 기능 Pydantic 모델
 """
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -87,3 +87,11 @@ class UpdateQuotaResponse(BaseModel):
     max_keywords: Optional[int] = None
     updated_by: str
     timestamp: datetime
+
+
+class LoggingUpdateRequest(BaseModel):
+    """로깅 설정 변경 요청 (재시작 없이 적용)"""
+    # 로거 이름 → 레벨 (null이면 설정 해제, "root"는 루트 로거)
+    levels: Dict[str, Optional[Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']]] = Field(default_factory=dict)
+    # 요청 단위 상세 덤프 샘플링 비율
+    debug_sample_rate: Optional[float] = Field(None, ge=0, le=1)
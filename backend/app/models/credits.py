@@ -98,6 +98,14 @@ class CreditCheckResponse(BaseModel):
     is_god_tier: bool = Field(default=False, description="God Tier 여부")
 
 
+class CreditReservation(CreditCheckResponse):
+    """크레딧 예약 (reserve_credits 결과, commit_reservation / release_reservation에 전달)"""
+    reservation_id: Optional[UUID] = Field(default=None, description="예약 ID (None이면 예약 없음 → 확정 시 일반 차감)")
+    user_id: Optional[UUID] = Field(default=None, description="사용자 ID")
+    feature: Optional[str] = Field(default=None, description="기능 이름")
+    settled: bool = Field(default=False, description="확정 / 해제 완료 여부")
+
+
 class CreditDeductRequest(BaseModel):
     """크레딧 차감 요청"""
     feature: str = Field(description="기능 이름")
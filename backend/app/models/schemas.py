@@ -3,7 +3,7 @@ Pydantic schemas for API request/response validation
 """
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, Literal, List
-from datetime import datetime
+from datetime import datetime, date
 from uuid import UUID
 
 
@@ -433,6 +433,15 @@ class DailyMetricWithKeyword(DailyMetric):
     """Daily metric with keyword information"""
     keyword: str
     store_name: str
+    # weekly/monthly rollup fields (None for daily rows)
+    resolution: Optional[str] = None
+    period_end: Optional[date] = None
+    sample_count: Optional[int] = None
+    min_rank: Optional[int] = None
+    max_rank: Optional[int] = None
+    avg_rank: Optional[float] = None
+    visitor_review_delta: Optional[int] = None
+    blog_review_delta: Optional[int] = None
 
 
 class MetricTrackerListResponse(BaseModel):
@@ -445,3 +454,4 @@ class DailyMetricsListResponse(BaseModel):
     """Daily metrics list response"""
     metrics: list[DailyMetricWithKeyword]
     total_count: int
+    resolution: str = "daily"
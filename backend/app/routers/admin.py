@@ -14,6 +14,7 @@ from app.models.admin import (
     AdminStatsResponse,
     UpdateQuotaRequest,
     UpdateQuotaResponse,
+    LoggingUpdateRequest,
 )
 from app.models.support_ticket import (
     TicketListResponse, 
@@ -22,6 +23,7 @@ from app.models.support_ticket import (
 )
 from app.models.notification import NotificationResponse, NotificationCreate, NotificationUpdate
 from app.core.database import get_supabase_client
+from app.services.credit_service import credit_service
 import logging
 from datetime import datetime
 
@@ -268,6 +270,7 @@ async def grant_credits(
             })\
             .eq("user_id", user_id)\
             .execute()
+        credit_service.invalidate_balance(user_id)
         
         # 크레딧 트랜잭션 기록 (credit_transactions 스키마에 맞춤)
         try:
@@ -698,3 +701,40 @@ async def get_admin_stats(user=Depends(get_current_user)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get admin stats"
         )
+
+
+@router.get("/logging")
+async def get_logging_config():
+    """
+    로깅 설정 / 큐 상태 조회 (관리자 전용)
+    
+    - levels: 런타임에 변경된 로거별 레벨
+    - debug_sample_rate: 요청 단위 상세 덤프 샘플링 비율
+    - queue: 대기 중 / 버려진 로그 수
+    """
+    from app.core.logging_setup import get_logging_status
+    return get_logging_status()
+
+
+@router.put("/logging")
+async def update_logging_config(
+    request: LoggingUpdateRequest,
+    user=Depends(get_current_user)
+):
+    """
+    로거별 레벨 / 상세 덤프 샘플링 비율 변경 (관리자 전용, 재시작 불필요)
+    
+    예: {"levels": {"app.services.naver_review_service": "DEBUG"}, "debug_sample_rate": 0.1}
+    """
+    from app.core.logging_setup import get_logging_status, set_debug_sample_rate, set_logger_level
+    
+    for name, level in request.levels.items():
+        set_logger_level(name, level)
+    if request.debug_sample_rate is not None:
+        set_debug_sample_rate(request.debug_sample_rate)
+    
+    logger.warning(
+        f"[Logging] 설정 변경 by {user.get('id')}: levels={request.levels}, "
+        f"debug_sample_rate={request.debug_sample_rate}"
+    )
+    return get_logging_status()
@@ -11,7 +11,6 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel
 
 from app.services.llm_reply_service import LLMReplyService
-from app.services.naver_selenium_service import naver_selenium_service
 from app.services.reply_queue_service import reply_queue_service
 from app.core.database import get_supabase_client
 from app.models.place_ai_settings import PlaceAISettings
@@ -115,17 +114,17 @@ async def generate_reply(
     크레딧: 1 크레딧 소모
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="ai_reply_generate",
+            credits_amount=5
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="ai_reply_generate",
-                required_credits=5
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for AI reply generation")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -158,10 +157,8 @@ async def generate_reply(
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="ai_reply_generate",
-                    credits_amount=5,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_name": request.store_name,
                         "author_name": request.author_name,
@@ -181,6 +178,9 @@ async def generate_reply(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"AI 답글 생성 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/settings/{store_id}")
@@ -354,6 +354,7 @@ async def post_reply(
     - 크레딧: 2 크레딧 소모
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
         store_id = request.store_id
@@ -408,15 +409,14 @@ async def post_reply(
         else:
             logger.warning(f"[Tier Check] No profile data found for user {user_id}, defaulting to free")
         
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="ai_reply_post",
+            credits_amount=8
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="ai_reply_post",
-                required_credits=8
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for AI reply posting")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -442,10 +442,8 @@ async def post_reply(
         # 🆕 크레딧 차감 (큐 추가 성공 시 즉시 차감)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="ai_reply_post",
-                    credits_amount=8,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": store_id,
                         "naver_review_id": request.naver_review_id,
@@ -472,6 +470,9 @@ async def post_reply(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"답글 게시 요청 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/queue-status/{job_id}", response_model=QueueStatusResponse)
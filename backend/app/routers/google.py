@@ -9,7 +9,6 @@ from uuid import UUID
 import httpx
 import os
 
-from app.services.google_api import GoogleBusinessAPI, sync_google_reviews
 from app.core.database import get_supabase_client
 
 router = APIRouter()
@@ -195,7 +194,8 @@ async def sync_google_store_reviews(store_id: UUID):
         
         location_id = store.data["place_id"]
         
-        # 리뷰 동기화
+        # 리뷰 동기화 (googleapiclient는 무거우므로 사용 시점에 import)
+        from app.services.google_api import sync_google_reviews
         reviews = await sync_google_reviews(str(store_id), location_id)
         
         return {
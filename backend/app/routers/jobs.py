@@ -0,0 +1,156 @@
+"""
+백그라운드 작업 조회 API
+
+분석 API를 ?async=true로 호출하면 202 + job_id를 즉시 반환합니다.
+클라이언트는 이 API로 진행률 / 결과를 조회하고, 연결이 끊겨도 같은 job_id로 다시 조회할 수 있습니다.
+
+- GET    /api/v1/jobs                 내 작업 목록 (결과 본문 제외)
+- GET    /api/v1/jobs/{job_id}        상태 / 진행률 / 결과
+- GET    /api/v1/jobs/{job_id}/events 진행률 SSE (완료 / 실패 / 취소 시 종료)
+- DELETE /api/v1/jobs/{job_id}        취소 (대기 중이면 즉시, 실행 중이면 다음 heartbeat에서 중단)
+"""
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional
+from uuid import UUID
+import asyncio
+import logging
+import time
+
+from app.core.jobs import JOB_HANDLERS, TERMINAL_STATUSES, job_engine
+from app.core.serialization import sse_event
+from app.routers.auth import get_current_user
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# SSE 진행률 확인 간격 / 최대 연결 시간 (초과 시 timeout 이벤트 → 클라이언트 재접속)
+EVENTS_POLL_SECONDS = 1.0
+EVENTS_MAX_SECONDS = 600
+
+JOB_FIELDS = (
+    "id", "kind", "status", "progress", "progress_message", "result", "error",
+    "attempts", "created_at", "started_at", "finished_at", "updated_at",
+)
+
+
+def job_view(job: dict) -> dict:
+    """작업 응답 (워커 / lease 등 내부 필드 제외)"""
+    view = {key: job.get(key) for key in JOB_FIELDS}
+    view["id"] = str(view["id"])
+    view["status_url"] = f"/api/v1/jobs/{view['id']}"
+    view["events_url"] = f"/api/v1/jobs/{view['id']}/events"
+    return view
+
+
+def accept_job(kind: str, params: dict, current_user: Optional[dict], idempotency_key: Optional[str]) -> JSONResponse:
+    """
+    분석 API의 비동기 모드: 작업 등록 후 202 반환
+    
+    같은 Idempotency-Key로 다시 호출하면 새 작업을 만들지 않고 기존 작업을 반환합니다 (재시도 / 재접속).
+    """
+    if not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비동기 실행은 로그인이 필요합니다"
+        )
+    
+    job, created = job_engine.enqueue(kind, jsonable_encoder(params), current_user["id"], idempotency_key)
+    view = job_view(job)
+    view["created"] = created
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(view),
+        headers={"Location": view["status_url"]},
+    )
+
+
+def _get_owned_job(job_id: UUID, current_user: dict) -> dict:
+    job = job_engine.get(str(job_id))
+    if not job or str(job.get("user_id")) != str(current_user["id"]):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다")
+    return job
+
+
+@router.get("")
+async def list_jobs(
+    kind: Optional[str] = Query(None, description=f"작업 종류 ({', '.join(JOB_HANDLERS)})"),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: dict = Depends(get_current_user)
+):
+    """내 작업 목록 (최근 순, 결과 본문 제외)"""
+    jobs = job_engine.list_for_user(current_user["id"], kind=kind, limit=limit)
+    return {"jobs": [{**job_view(job), "result": None} for job in jobs]}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: UUID, current_user: dict = Depends(get_current_user)):
+    """
+    작업 상태 조회
+    
+    Returns:
+        - status: queued / running / succeeded / failed / cancelled
+        - progress / progress_message: 진행률 (0~100) / 현재 단계
+        - result: 성공 시 동기 API와 같은 응답 본문
+        - error: 실패 시 {status_code, detail} (동기 API의 HTTP 오류와 같은 값)
+    """
+    return job_view(_get_owned_job(job_id, current_user))
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: UUID, current_user: dict = Depends(get_current_user)):
+    """
+    작업 진행률 SSE
+    
+    이벤트 type: progress (상태 / 진행률이 바뀔 때) → complete / error / cancelled (종료)
+    EVENTS_MAX_SECONDS가 지나면 timeout 이벤트 후 종료 (클라이언트가 다시 연결)
+    """
+    _get_owned_job(job_id, current_user)
+    
+    async def event_generator():
+        started = time.monotonic()
+        last_state = None
+        while True:
+            job = job_engine.get(str(job_id))
+            if not job:
+                yield sse_event({'type': 'error', 'error': {'status_code': 404, 'detail': '작업을 찾을 수 없습니다'}})
+                return
+            
+            view = jsonable_encoder(job_view(job))
+            state = (view["status"], view["progress"], view["progress_message"])
+            if state != last_state:
+                last_state = state
+                progress_event = {key: view[key] for key in ("id", "status", "progress", "progress_message")}
+                yield sse_event({'type': 'progress', **progress_event})
+            
+            if view["status"] in TERMINAL_STATUSES:
+                event_type = {"succeeded": "complete", "failed": "error", "cancelled": "cancelled"}[view["status"]]
+                yield sse_event({'type': event_type, 'result': view['result'], 'error': view['error']})
+                return
+            
+            if time.monotonic() - started >= EVENTS_MAX_SECONDS:
+                yield sse_event({'type': 'timeout', 'id': view['id']})
+                return
+            
+            await asyncio.sleep(EVENTS_POLL_SECONDS)
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Nginx 버퍼링 비활성화
+        }
+    )
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: UUID, current_user: dict = Depends(get_current_user)):
+    """작업 취소 (대기 중이면 즉시 cancelled, 실행 중이면 워커가 다음 heartbeat에서 중단)"""
+    _get_owned_job(job_id, current_user)
+    job = job_engine.cancel(str(job_id), current_user["id"])
+    if not job:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="이미 종료된 작업입니다")
+    return job_view(job)
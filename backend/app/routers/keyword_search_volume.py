@@ -43,19 +43,19 @@ async def get_keyword_search_volume(
     크레딧: 키워드 수 × 2 크레딧 소모
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
-        # 🆕 크레딧 체크 (Feature Flag 확인) - 동적 크레딧
+        # 🆕 크레딧 예약 (Feature Flag 확인) - 동적 크레딧
         required_credits = len(request.keywords) * 2
         
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="keyword_search_volume",
+            credits_amount=required_credits
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="keyword_search_volume",
-                required_credits=required_credits
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 print(f"[Credits] User {user_id} has insufficient credits for keyword search volume ({required_credits} needed)")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -98,9 +98,8 @@ async def get_keyword_search_volume(
         # 🆕 크레딧 차감 (성공 시) - 동적 크레딧
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="keyword_search_volume",
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     credits_amount=required_credits,
                     metadata={
                         "keywords": request.keywords,
@@ -125,6 +124,9 @@ async def get_keyword_search_volume(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"검색량 조회 실패: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/search-volume/history/{user_id}")
@@ -2,13 +2,12 @@
 주요지표 추적 API 라우터
 Metric Tracker API Router
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from typing import List, Optional
 from uuid import UUID
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pydantic import BaseModel
 import logging
-import json
 
 from app.models.schemas import (
     MetricTrackerCreate,
@@ -21,10 +20,16 @@ from app.models.schemas import (
     DailyMetricWithKeyword,
     DailyMetricsListResponse,
 )
-from app.services.metric_tracker_service import metric_tracker_service
+from app.services.metric_tracker_service import (
+    metric_tracker_service,
+    resolve_metric_resolution,
+    METRIC_RESOLUTIONS,
+)
+from app.services.serp_snapshot_service import serp_snapshot_service
 from app.routers.auth import get_current_user
 from app.services.credit_service import credit_service
 from app.core.config import settings
+from app.core.response_cache import response_cache
 
 
 # 경쟁매장 조회 요청/응답 모델
@@ -129,6 +134,7 @@ async def create_tracker(
 
 @router.get("/trackers", response_model=MetricTrackerListResponse)
 async def get_trackers(
+    request: Request,
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -136,9 +142,22 @@ async def get_trackers(
     
     - 매장 및 키워드 정보 포함
     - 생성일 기준 내림차순 정렬
+    - ETag 지원: 추적 설정 / 수집 시각(last_collected_at) / 매장이 바뀌지 않았으면 304
     """
+    user_id = current_user["id"]
+    return await response_cache.respond(
+        request,
+        key=f"metric_trackers:list:{user_id}",
+        scopes=[f"metric_trackers:{user_id}", f"stores:{user_id}"],
+        build=lambda: _get_trackers(user_id),
+        response_model=MetricTrackerListResponse,
+    )
+
+
+async def _get_trackers(user_id: str) -> dict:
+    """추적 설정 목록 조회 (응답 캐시 미스일 때만 실행)"""
     try:
-        trackers = metric_tracker_service.get_trackers_by_user(current_user["id"])
+        trackers = metric_tracker_service.get_trackers_by_user(user_id)
         return {
             "trackers": trackers,
             "total_count": len(trackers)
@@ -270,6 +289,7 @@ async def collect_metrics_now(
             detail="동시 수집 요청이 너무 많습니다. 잠시 후 자동으로 재시도됩니다."
         )
     
+    reservation = None
     try:
         # 권한 확인
         tracker = metric_tracker_service.get_tracker(str(tracker_id), current_user["id"])
@@ -279,15 +299,14 @@ async def collect_metrics_now(
                 detail="추적 설정을 찾을 수 없습니다"
             )
         
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="rank_check",
+            credits_amount=5
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="rank_check",
-                required_credits=5
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for rank check")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -302,10 +321,8 @@ async def collect_metrics_now(
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="rank_check",
-                    credits_amount=5,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "tracker_id": str(tracker_id),
                         "keyword": tracker.get("keyword", ""),
@@ -327,6 +344,8 @@ async def collect_metrics_now(
             detail=f"지표 수집 중 오류가 발생했습니다: {str(e)}"
         )
     finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
         # 🛡️ 반드시 슬롯 해제 (성공/실패 무관)
         await user_collect_limiter.release(user_id_str)
 
@@ -336,15 +355,24 @@ async def get_tracker_metrics(
     tracker_id: UUID,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    resolution: str = "auto",
     current_user: dict = Depends(get_current_user)
 ):
     """
-    특정 추적 설정의 일별 지표 조회
+    특정 추적 설정의 지표 이력 조회
     
     - **start_date**: 시작 날짜 (YYYY-MM-DD 형식, 선택사항)
     - **end_date**: 종료 날짜 (YYYY-MM-DD 형식, 선택사항)
+    - **resolution**: auto / daily / weekly / monthly (기본값 auto)
+      - auto: 3개월 이하 일별, 1년 이하 주별, 그 이상 월별 롤업
     - 기본값: 최근 30일
     """
+    if resolution not in METRIC_RESOLUTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"resolution은 {', '.join(METRIC_RESOLUTIONS)} 중 하나여야 합니다"
+        )
+    
     try:
         # 권한 확인
         tracker = metric_tracker_service.get_tracker(str(tracker_id), current_user["id"])
@@ -358,11 +386,17 @@ async def get_tracker_metrics(
         start = date.fromisoformat(start_date) if start_date else None
         end = date.fromisoformat(end_date) if end_date else None
         
+        # 해상도 결정 (기본 기간: 최근 30일)
+        end = end or date.today()
+        start = start or end - timedelta(days=30)
+        resolution = resolve_metric_resolution(start, end, resolution)
+        
         # 지표 조회
         metrics = metric_tracker_service.get_daily_metrics(
             str(tracker_id), 
             start_date=start, 
-            end_date=end
+            end_date=end,
+            resolution=resolution
         )
         
         # 데이터 평탄화 (nested 구조를 flat하게 변환)
@@ -381,7 +415,8 @@ async def get_tracker_metrics(
         
         return {
             "metrics": flattened_metrics,
-            "total_count": len(flattened_metrics)
+            "total_count": len(flattened_metrics),
+            "resolution": resolution
         }
     except HTTPException:
         raise
@@ -413,6 +448,7 @@ async def get_competitors(
     - **store_id**: 내 매장 ID (강조 표시용)
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
         from app.core.database import get_supabase_client
@@ -434,30 +470,22 @@ async def get_competitors(
         
         logger.info(f"[Competitors] 경쟁매장 조회: keyword={request.keyword}, store={store_data['store_name']}")
         
-        # ✅ 1차: DB에서 저장된 경쟁매장 데이터 확인
-        db_result = supabase.table("competitor_rankings")\
-            .select("*")\
-            .eq("keyword", request.keyword)\
-            .eq("store_id", request.store_id)\
-            .order("collection_date", desc=True)\
-            .limit(1)\
-            .execute()
-        
-        if db_result.data and len(db_result.data) > 0:
-            cached_data = db_result.data[0]
+        # ✅ 1차: DB에서 저장된 경쟁매장 데이터 확인 (스냅샷 참조 → 기존 응답 형식으로 복원)
+        cached_data = serp_snapshot_service.get_latest_competitors(
+            keyword=request.keyword,
+            store_id=request.store_id,
+            my_place_id=my_place_id
+        )
+        
+        if cached_data:
             logger.info(
                 f"[Competitors] ✅ DB 캐시 히트: keyword={request.keyword}, "
                 f"date={cached_data['collection_date']}, "
                 f"collected_at={cached_data.get('collected_at', 'N/A')}"
             )
             
-            # JSONB 데이터 파싱
-            competitors_data = cached_data.get('competitors_data', [])
-            if isinstance(competitors_data, str):
-                competitors_data = json.loads(competitors_data)
-            
             competitors = [
-                CompetitorStore(**comp) for comp in competitors_data
+                CompetitorStore(**comp) for comp in cached_data['competitors']
             ]
             
             return CompetitorResponse(
@@ -470,14 +498,14 @@ async def get_competitors(
         # ✅ 2차: DB에 없으면 API 실시간 조회
         logger.info(f"[Competitors] DB 캐시 미스 → API 실시간 조회: keyword={request.keyword}")
         
-        # 크레딧 체크
+        # 크레딧 예약
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="rank_check",
+            credits_amount=5
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="rank_check",
-                required_credits=5
-            )
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
                     detail="크레딧이 부족합니다. 크레딧을 충전하거나 플랜을 업그레이드해주세요."
@@ -493,7 +521,8 @@ async def get_competitors(
             store_name=store_data.get("store_name"),
             coord_x=store_data.get("place_x"),
             coord_y=store_data.get("place_y"),
-            category=store_data.get("category")
+            category=store_data.get("category"),
+            profile="competitor"
         )
         
         # 검색 결과를 경쟁매장 리스트로 변환
@@ -536,7 +565,6 @@ async def get_competitors(
         try:
             from zoneinfo import ZoneInfo
             now_kst = datetime.now(ZoneInfo("Asia/Seoul"))
-            today = now_kst.date()
             
             # tracker_id 찾기 (해당 keyword + store_id 조합)
             tracker_result = supabase.table("metric_trackers")\
@@ -560,35 +588,18 @@ async def get_competitors(
                         break
             
             if tracker_id and keyword_id:
-                competitors_json = [comp.model_dump() for comp in competitors]
-                competitor_record = {
-                    'tracker_id': tracker_id,
-                    'keyword_id': keyword_id,
-                    'store_id': request.store_id,
-                    'keyword': request.keyword,
-                    'collection_date': today.isoformat(),
-                    'my_rank': my_rank,
-                    'total_count': total_count,
-                    'competitors_data': json.dumps(competitors_json, ensure_ascii=False),
-                    'collected_at': now_kst.isoformat()
-                }
-                
-                existing_comp = supabase.table('competitor_rankings')\
-                    .select('id')\
-                    .eq('tracker_id', tracker_id)\
-                    .eq('collection_date', today.isoformat())\
-                    .execute()
-                
-                if existing_comp.data and len(existing_comp.data) > 0:
-                    supabase.table('competitor_rankings')\
-                        .update(competitor_record)\
-                        .eq('tracker_id', tracker_id)\
-                        .eq('collection_date', today.isoformat())\
-                        .execute()
-                else:
-                    supabase.table('competitor_rankings')\
-                        .insert(competitor_record)\
-                        .execute()
+                serp_snapshot_service.save_competitor_ranking(
+                    tracker_id=tracker_id,
+                    keyword_id=keyword_id,
+                    store_id=request.store_id,
+                    keyword=request.keyword,
+                    coord_x=store_data.get("place_x"),
+                    coord_y=store_data.get("place_y"),
+                    search_results=search_results,
+                    my_rank=my_rank,
+                    total_count=total_count,
+                    collected_at=now_kst
+                )
                 
                 logger.info(f"[Competitors] API 결과 DB 저장 완료")
         except Exception as save_error:
@@ -597,10 +608,8 @@ async def get_competitors(
         # 크레딧 차감
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="rank_check",
-                    credits_amount=5,
+                await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "action": "competitor_view",
                         "keyword": request.keyword,
@@ -625,3 +634,6 @@ async def get_competitors(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"경쟁매장 조회 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
@@ -2,7 +2,7 @@
 네이버 플레이스 관련 API 라우터
 (경쟁매장 분석 포함)
 """
-from fastapi import APIRouter, HTTPException, status, Query, Depends, Header
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Header, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
@@ -17,6 +17,7 @@ from app.services.naver_rank_service import rank_service
 # 비공식 API 서비스 (새로 추가)
 from app.services.naver_search_api_unofficial import search_service_api_unofficial
 from app.services.naver_rank_api_unofficial import rank_service_api_unofficial
+from app.services.serp_results import as_dicts
 from app.services.naver_keywords_analyzer import keywords_analyzer_service
 from app.services.naver_competitor_analysis_service import competitor_analysis_service
 from app.core.database import get_supabase_client
@@ -24,6 +25,10 @@ from app.routers.auth import get_current_user
 from datetime import datetime, date
 from app.services.credit_service import credit_service
 from app.core.config import settings
+from app.core.metrics import observe_upstream_call
+from app.core.jobs import JobContext, NO_JOB
+from app.core.response_cache import response_cache
+from app.routers.jobs import accept_job
 
 security = HTTPBearer(auto_error=False)
 
@@ -597,7 +602,7 @@ async def check_place_rank(request: RankCheckRequest):
             previous_rank=previous_rank,
             rank_change=rank_change,
             last_checked_at=now,
-            search_results=rank_result["search_results"]
+            search_results=as_dicts(rank_result["search_results"])
         )
         
     except HTTPException:
@@ -929,17 +934,17 @@ async def check_place_rank_unofficial(
     - 타겟 매장 발견 시 즉시 중단 가능
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="rank_check",
+            credits_amount=5
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="rank_check",
-                required_credits=5
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for rank check (unofficial)")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -1097,10 +1102,8 @@ async def check_place_rank_unofficial(
         # 🆕 크레딧 차감 (성공 시, Feature Flag 확인)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="rank_check",
-                    credits_amount=5,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": str(request.store_id),
                         "keyword": request.keyword,
@@ -1124,7 +1127,7 @@ async def check_place_rank_unofficial(
             previous_rank=previous_rank,
             rank_change=rank_change,
             last_checked_at=now,
-            search_results=rank_result["search_results"],
+            search_results=as_dicts(rank_result["search_results"]),
             # 리뷰수 정보 추가 ⭐
             visitor_review_count=visitor_review_count,
             blog_review_count=blog_review_count,
@@ -1141,6 +1144,9 @@ async def check_place_rank_unofficial(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"순위 조회 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 # ============================================
@@ -1185,17 +1191,17 @@ async def analyze_main_keywords(
     크레딧: 10 크레딧 소모
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="main_keyword_analysis",
+            credits_amount=10
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="main_keyword_analysis",
-                required_credits=10
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for main keyword analysis")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -1214,10 +1220,8 @@ async def analyze_main_keywords(
         # 🆕 크레딧 차감 (성공 시)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="main_keyword_analysis",
-                    credits_amount=10,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "query": request.query,
                         "stores_count": len(result.get("stores_analyzed", []))
@@ -1239,6 +1243,9 @@ async def analyze_main_keywords(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"대표키워드 분석 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 # ============================================
@@ -1265,6 +1272,8 @@ async def get_place_details(
     mode: str = "complete", 
     store_name: str = None,
     store_id: Optional[UUID] = None,
+    async_mode: bool = Query(False, alias="async", description="true: 202 + job_id 즉시 반환 (인증 필요)"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: Optional[dict] = Depends(get_optional_current_user)
 ):
     """
@@ -1278,28 +1287,45 @@ async def get_place_details(
             - "complete": 완전 진단 (모든 데이터, 5-10초)
         store_name: 매장명 (선택, 제공하면 검색 API 사용으로 정확도 향상)
         store_id: 매장 ID (선택, 제공하면 진단 히스토리 저장, 인증 필요)
+        async_mode: true면 백그라운드 작업으로 등록하고 202 반환 (GET /api/v1/jobs/{job_id}로 결과 조회)
+        idempotency_key: 같은 키로 다시 요청하면 기존 작업 반환
     """
+    params = {"place_id": place_id, "mode": mode, "store_name": store_name, "store_id": store_id}
+    if async_mode:
+        return accept_job("place_diagnosis", params, current_user, idempotency_key)
+    return await run_place_diagnosis(params, current_user)
+
+
+async def run_place_diagnosis(params: dict, current_user: Optional[dict], job: JobContext = NO_JOB) -> dict:
+    """플레이스 완전 진단 실행 (동기 API / 백그라운드 작업 공용)"""
+    place_id = params["place_id"]
+    mode = params.get("mode", "complete")
+    store_name = params.get("store_name")
+    store_id = params.get("store_id")
+    reservation = None
+    
     try:
         logger.info(f"[플레이스 진단] 요청: place_id={place_id}, mode={mode}, store_name={store_name}, store_id={store_id}, authenticated={current_user is not None}")
         
-        # 크레딧 사전 체크 (인증된 사용자만)
+        # 크레딧 사전 예약 (인증된 사용자만)
         if current_user and settings.CREDIT_SYSTEM_ENABLED:
             user_id = current_user.get("id")
-            credit_check = await credit_service.check_sufficient_credits(
+            reservation = await credit_service.reserve_credits(
                 user_id=user_id,
                 feature="place_diagnosis",
-                required_credits=8
+                credits_amount=8
             )
-            if not credit_check.sufficient:
-                logger.warning(f"[플레이스 진단] 크레딧 부족: user_id={user_id}, required=5, available={credit_check.current_credits}")
+            if not reservation.sufficient:
+                logger.warning(f"[플레이스 진단] 크레딧 부족: user_id={user_id}, required=5, available={reservation.current_credits}")
                 raise HTTPException(
                     status_code=402,
-                    detail=f"크레딧이 부족합니다. (필요: 5 크레딧, 보유: {credit_check.current_credits} 크레딧)"
+                    detail=f"크레딧이 부족합니다. (필요: 5 크레딧, 보유: {reservation.current_credits} 크레딧)"
                 )
         
         # 완전 진단 서비스 사용
         from app.services.naver_complete_diagnosis_service import complete_diagnosis_service
         
+        await job.progress(10, "플레이스 정보 수집 중")
         details = await complete_diagnosis_service.diagnose_place(place_id, store_name)
         
         if not details:
@@ -1313,6 +1339,7 @@ async def get_place_details(
             logger.warning(f"[플레이스 진단] Name 필드가 비어있지만 진행: place_id={place_id}")
         
         # 진단 평가 실행
+        await job.progress(80, "진단 평가 중")
         from app.services.naver_diagnosis_engine import diagnosis_engine
         diagnosis_result = diagnosis_engine.diagnose(details)
         
@@ -1329,10 +1356,8 @@ async def get_place_details(
         if current_user and settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
                 user_id = current_user.get("id")
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="place_diagnosis",
-                    credits_amount=8,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "place_id": place_id,
                         "store_name": details.get("name", "Unknown"),
@@ -1399,6 +1424,9 @@ async def get_place_details(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"플레이스 진단 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 # ============================================
@@ -1482,21 +1510,38 @@ async def search_competitors(request: CompetitorSearchRequest):
 
 
 @router.post("/competitor/analyze", response_model=CompetitorAnalysisResponse)
-async def analyze_competitors(request: CompetitorAnalysisRequest):
+async def analyze_competitors(
+    request: CompetitorAnalysisRequest,
+    async_mode: bool = Query(False, alias="async", description="true: 202 + job_id 즉시 반환 (인증 필요)"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    current_user: Optional[dict] = Depends(get_optional_current_user)
+):
     """
     경쟁매장 전체 분석 및 비교
     
     Args:
         request: 분석 요청 (키워드, 우리 매장 ID, 개수)
+        async_mode: true면 백그라운드 작업으로 등록하고 202 반환 (GET /api/v1/jobs/{job_id}로 결과 조회)
+        idempotency_key: 같은 키로 다시 요청하면 기존 작업 반환
         
     Returns:
         경쟁매장 분석 결과 + 우리 매장 비교
     """
+    if async_mode:
+        return accept_job("competitor_analysis", request.model_dump(), current_user, idempotency_key)
+    return await run_competitor_analysis(request.model_dump(), current_user)
+
+
+async def run_competitor_analysis(params: dict, current_user: Optional[dict], job: JobContext = NO_JOB) -> dict:
+    """경쟁매장 전체 분석 실행 (동기 API / 백그라운드 작업 공용)"""
+    request = CompetitorAnalysisRequest(**params)
+    
     try:
         logger.info(f"[경쟁매장] 전체 분석 시작: keyword={request.keyword}, my_place_id={request.my_place_id}")
         
         # 1. 우리 매장 분석
         logger.info(f"[경쟁매장] 우리 매장 분석 중...")
+        await job.progress(5, "우리 매장 분석 중")
         my_store = await competitor_analysis_service.analyze_competitor(
             place_id=request.my_place_id,
             rank=0  # 우리 매장은 순위 0
@@ -1510,6 +1555,7 @@ async def analyze_competitors(request: CompetitorAnalysisRequest):
         
         # 2. 경쟁매장 분석
         logger.info(f"[경쟁매장] 경쟁사 분석 중...")
+        await job.progress(20, "경쟁매장 분석 중")
         competitors = await competitor_analysis_service.analyze_all_competitors(
             keyword=request.keyword,
             limit=request.limit
@@ -1517,6 +1563,7 @@ async def analyze_competitors(request: CompetitorAnalysisRequest):
         
         # 3. 비교 분석 (LLM 기반)
         logger.info(f"[경쟁매장] 비교 분석 중 (LLM 사용)...")
+        await job.progress(80, "비교 분석 중")
         comparison = await competitor_analysis_service.compare_with_my_store(
             my_store_data=my_store,
             competitors=competitors
@@ -1561,6 +1608,7 @@ async def compare_competitors(
         LLM 기반 비교 분석 결과
     """
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
         print(f"[DEBUG] 비교 분석 요청 받음")
@@ -1571,19 +1619,18 @@ async def compare_competitors(
         print(f"[DEBUG] competitors length: {len(competitors)}")
         logger.info(f"[경쟁매장] 비교 분석 요청: user_id={user_id}, {len(competitors)}개 경쟁사")
         
-        # 🆕 크레딧 사전 체크
+        # 🆕 크레딧 사전 예약
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="competitor_analysis",
+            credits_amount=30
+        )
         if settings.CREDIT_SYSTEM_ENABLED:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="competitor_analysis",
-                required_credits=30
-            )
-            
-            if not check_result.sufficient:
-                logger.warning(f"[경쟁매장 분석] 크레딧 부족: user_id={user_id}, required=30, available={check_result.current_credits}")
+            if not reservation.sufficient:
+                logger.warning(f"[경쟁매장 분석] 크레딧 부족: user_id={user_id}, required=30, available={reservation.current_credits}")
                 raise HTTPException(
                     status_code=402,
-                    detail=f"크레딧이 부족합니다. (필요: 30 크레딧, 보유: {check_result.current_credits} 크레딧)"
+                    detail=f"크레딧이 부족합니다. (필요: 30 크레딧, 보유: {reservation.current_credits} 크레딧)"
                 )
             
             logger.info(f"[경쟁매장 분석] 크레딧 체크 통과: user_id={user_id}")
@@ -1598,10 +1645,8 @@ async def compare_competitors(
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="competitor_analysis",
-                    credits_amount=30,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "my_store": my_store.get("name", "Unknown"),
                         "competitor_count": len(competitors),
@@ -1625,6 +1670,9 @@ async def compare_competitors(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"비교 분석 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/competitor/analyze-single/{place_id}")
@@ -1751,6 +1799,7 @@ async def analyze_competitors_batch(request: dict):
 
 @router.get("/diagnosis-history/{store_id}")
 async def get_diagnosis_history(
+    request: Request,
     store_id: UUID,
     current_user: dict = Depends(get_current_user),
     limit: int = Query(30, ge=1, le=100, description="조회할 히스토리 개수")
@@ -1764,10 +1813,22 @@ async def get_diagnosis_history(
         
     Returns:
         진단 히스토리 목록 (최신순)
+    
+    ETag 지원: 해당 매장의 진단 히스토리가 바뀌지 않았으면 304
     """
+    user_id = current_user["id"]
+    return await response_cache.respond(
+        request,
+        key=f"diagnosis_history:{user_id}:{store_id}:{limit}",
+        scopes=[f"diagnosis_history:{store_id}"],
+        build=lambda: _get_diagnosis_history(user_id, store_id, limit),
+    )
+
+
+async def _get_diagnosis_history(user_id: str, store_id: UUID, limit: int) -> dict:
+    """진단 히스토리 목록 조회 (응답 캐시 미스일 때만 실행)"""
     try:
         supabase = get_supabase_client()
-        user_id = current_user["id"]
         
         logger.info(f"[진단 히스토리] 조회 시작: user_id={user_id}, store_id={store_id}, limit={limit}")
         
@@ -1886,6 +1947,8 @@ class GenerateTextResponse(BaseModel):
 @router.get("/activation/{store_id}", response_model=ActivationResponse)
 async def get_activation_info(
     store_id: str,
+    async_mode: bool = Query(False, alias="async", description="true: 202 + job_id 즉시 반환"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -1893,8 +1956,20 @@ async def get_activation_info(
     
     Args:
         store_id: 매장 ID (UUID)
+        async_mode: true면 백그라운드 작업으로 등록하고 202 반환 (GET /api/v1/jobs/{job_id}로 결과 조회)
+        idempotency_key: 같은 키로 다시 요청하면 기존 작업 반환
         current_user: 현재 사용자 정보
     """
+    if async_mode:
+        return accept_job("place_activation", {"store_id": store_id}, current_user, idempotency_key)
+    return await run_place_activation({"store_id": store_id}, current_user)
+
+
+async def run_place_activation(params: dict, current_user: dict, job: JobContext = NO_JOB) -> dict:
+    """플레이스 활성화 분석 실행 (동기 API / 백그라운드 작업 공용)"""
+    store_id = params["store_id"]
+    reservation = None
+    
     try:
         logger.info(f"[플레이스 활성화] 요청: store_id={store_id}, user_id={current_user['id']}")
         
@@ -1927,16 +2002,15 @@ async def get_activation_info(
                 detail="네이버 플레이스 ID가 등록되지 않은 매장입니다"
             )
         
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
         user_id = UUID(current_user["id"])
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="place_activation",
+            credits_amount=15
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="place_activation",
-                required_credits=15
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for place activation")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -1948,6 +2022,7 @@ async def get_activation_info(
         # 3. 활성화 정보 조회
         from app.services.naver_activation_service_v3 import activation_service_v3
         
+        await job.progress(10, "리뷰 / 블로그 / 플레이스 정보 수집 중")
         activation_data = await activation_service_v3.get_activation_info(
             store_id=store_id,
             place_id=place_id,
@@ -1959,10 +2034,8 @@ async def get_activation_info(
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="place_activation",
-                    credits_amount=15,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": store_id,
                         "place_id": place_id,
@@ -1975,6 +2048,7 @@ async def get_activation_info(
                 # 크레딧 차감 실패는 기능 사용을 막지 않음 (이미 조회는 완료됨)
         
         # 4. 활성화 이력 저장
+        await job.progress(90, "활성화 이력 저장 중")
         try:
             history_data = {
                 "user_id": current_user["id"],
@@ -1995,7 +2069,7 @@ async def get_activation_info(
         return ActivationResponse(
             status="success",
             data=activation_data
-        )
+        ).model_dump()
         
     except HTTPException:
         raise
@@ -2005,6 +2079,9 @@ async def get_activation_info(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"활성화 정보 조회 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.post("/activation/generate-description", response_model=GenerateTextResponse)
@@ -2019,6 +2096,8 @@ async def generate_description(
         request: 생성 요청 (store_id, prompt)
         current_user: 현재 사용자 정보
     """
+    reservation = None
+    
     try:
         logger.info(f"[업체소개글 생성] 요청: store_id={request.store_id}")
         
@@ -2041,16 +2120,15 @@ async def generate_description(
                 detail="해당 매장에 접근할 권한이 없습니다"
             )
         
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
         user_id = UUID(current_user["id"])
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="business_description",
+            credits_amount=10
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="business_description",
-                required_credits=10
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for business description")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -2182,7 +2260,7 @@ async def generate_description(
 업체소개글:"""
 
         # OpenAI API 직접 호출
-        response = await openai_client.chat.completions.create(
+        response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -2190,7 +2268,7 @@ async def generate_description(
             ],
             temperature=0.7,
             max_tokens=3000
-        )
+        ))
         
         generated_text = response.choices[0].message.content
         logger.info(f"[업체소개글 생성] 완료: {len(generated_text)}자")
@@ -2198,10 +2276,8 @@ async def generate_description(
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="business_description",
-                    credits_amount=10,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": request.store_id,
                         "store_name": store.get("store_name"),
@@ -2226,6 +2302,9 @@ async def generate_description(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"업체소개글 생성 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.post("/activation/generate-directions", response_model=GenerateTextResponse)
@@ -2240,6 +2319,8 @@ async def generate_directions(
         request: 생성 요청 (store_id, prompt)
         current_user: 현재 사용자 정보
     """
+    reservation = None
+    
     try:
         logger.info(f"[찾아오는길 생성] 요청: store_id={request.store_id}")
         
@@ -2262,16 +2343,15 @@ async def generate_directions(
                 detail="해당 매장에 접근할 권한이 없습니다"
             )
         
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
         user_id = UUID(current_user["id"])
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="directions",
+            credits_amount=10
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="directions",
-                required_credits=10
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for directions")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -2395,7 +2475,7 @@ SEO 관점에서 최적화하는 로컬 마케팅 전문가입니다.
 찾아오는길:"""
 
         # OpenAI API 직접 호출
-        response = await openai_client.chat.completions.create(
+        response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -2403,7 +2483,7 @@ SEO 관점에서 최적화하는 로컬 마케팅 전문가입니다.
             ],
             temperature=0.7,
             max_tokens=1500
-        )
+        ))
         
         generated_text = response.choices[0].message.content
         logger.info(f"[찾아오는길 생성] 완료: {len(generated_text)}자")
@@ -2411,10 +2491,8 @@ SEO 관점에서 최적화하는 로컬 마케팅 전문가입니다.
         # 🆕 크레딧 차감 (성공 시에만)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="directions",
-                    credits_amount=10,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": request.store_id,
                         "store_name": store.get("store_name"),
@@ -2439,6 +2517,9 @@ SEO 관점에서 최적화하는 로컬 마케팅 전문가입니다.
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"찾아오는길 생성 중 오류가 발생했습니다: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/activation/history/{store_id}")
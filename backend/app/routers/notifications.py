@@ -2,7 +2,7 @@
 Notifications Router
 알림 센터 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from typing import Optional, Literal
 from app.routers.auth import get_current_user
 from app.dependencies.admin import require_god_tier
@@ -15,6 +15,7 @@ from app.models.notification import (
     MarkAsReadResponse
 )
 from app.core.database import get_supabase_client
+from app.core.response_cache import response_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -101,13 +102,26 @@ async def get_notifications(
 
 
 @router.get("/unread-count", response_model=NotificationUnreadCountResponse)
-async def get_unread_count(user=Depends(get_current_user)):
+async def get_unread_count(request: Request, user=Depends(get_current_user)):
     """
     읽지 않은 알림 개수 조회
+    
+    ETag 지원: 내 알림 / 전체 공지가 바뀌지 않았으면 304
     """
+    user_id = user["id"]
+    return await response_cache.respond(
+        request,
+        key=f"notifications:unread:{user_id}",
+        scopes=[f"notifications:{user_id}", "notifications:global"],
+        build=lambda: _get_unread_count(user_id),
+        response_model=NotificationUnreadCountResponse,
+    )
+
+
+async def _get_unread_count(user_id: str) -> NotificationUnreadCountResponse:
+    """읽지 않은 알림 개수 조회 (응답 캐시 미스일 때만 실행)"""
     try:
         supabase = get_supabase_client()
-        user_id = user["id"]
         
         result = supabase.table("notifications").select("id", count="exact") \
             .or_(f"user_id.eq.{user_id},is_global.eq.true") \
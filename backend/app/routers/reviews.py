@@ -10,10 +10,9 @@ from typing import List, Optional
 from uuid import UUID
 import pytz
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import json
 import asyncio
 
 from app.services.naver_review_service import NaverReviewService
@@ -22,6 +21,8 @@ from app.routers.auth import get_current_user
 from app.services.credit_service import credit_service
 from app.core.config import settings
 from app.core.database import get_supabase_client
+from app.core.response_cache import response_cache
+from app.core.serialization import sse_event
 
 # 한국 시간대
 KST = pytz.timezone('Asia/Seoul')
@@ -128,35 +129,33 @@ async def extract_reviews(
     크레딧을 차감하지 않습니다. 리뷰 수만 확인하는 용도입니다.
     이후 analyze-stream으로 실시간 분석을 진행할 수 있습니다.
     """
-    print("=" * 80, flush=True)
-    print("EXTRACT_REVIEWS FUNCTION CALLED!", flush=True)
-    print("=" * 80, flush=True)
+    logger.debug("EXTRACT_REVIEWS FUNCTION CALLED!")
     try:
-        print("1. try 블록 진입", flush=True)
+        logger.debug("1. try 블록 진입")
         store_id = request.store_id
-        print(f"2. store_id = {store_id}", flush=True)
+        logger.debug(f"2. store_id = {store_id}")
         kst_now = datetime.now(KST)
         today_str = kst_now.strftime("%Y-%m-%d")
         
         start_date_str = request.start_date or today_str
         end_date_str = request.end_date or today_str
-        print(f"3. Period = {start_date_str} ~ {end_date_str}", flush=True)
+        logger.debug(f"3. Period = {start_date_str} ~ {end_date_str}")
         
         start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
         end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
         
         # 날짜 범위 계산 (디버깅용)
         date_diff = (end_date - start_date).days + 1  # +1은 시작일 포함
-        print(f"   -> Total days in range: {date_diff} days (including both start and end dates)", flush=True)
-        print(f"   -> Today (KST): {today_str}", flush=True)
+        logger.debug(f"   -> Total days in range: {date_diff} days (including both start and end dates)")
+        logger.debug(f"   -> Today (KST): {today_str}")
         
-        print(f"4. 매장 정보 조회 시작", flush=True)
+        logger.debug(f"4. 매장 정보 조회 시작")
         
         # 1. 매장 정보 조회
         supabase = get_supabase_client()
-        print(f"5. Supabase 클라이언트 생성 완료", flush=True)
+        logger.debug(f"5. Supabase 클라이언트 생성 완료")
         store_result = supabase.table("stores").select("*").eq("id", store_id).single().execute()
-        print(f"6. 매장 정보 조회 완료", flush=True)
+        logger.debug(f"6. 매장 정보 조회 완료")
         if not store_result.data:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -165,7 +164,7 @@ async def extract_reviews(
         
         store = store_result.data
         naver_place_id = store.get("place_id")
-        print(f"7. naver_place_id = {naver_place_id}", flush=True)
+        logger.debug(f"7. naver_place_id = {naver_place_id}")
         
         if not naver_place_id:
             raise HTTPException(
@@ -175,14 +174,14 @@ async def extract_reviews(
         
         # 2. 네이버에서 리뷰 추출 (분석 없이)
         review_service = NaverReviewService()
-        print(f"8. get_reviews_by_date_range 호출 시작", flush=True)
+        logger.debug(f"8. get_reviews_by_date_range 호출 시작")
         visitor_reviews = await review_service.get_reviews_by_date_range(
             naver_place_id,
             start_date,
             end_date
         )
         
-        print(f"9. 리뷰 추출 완료: {len(visitor_reviews)}개", flush=True)
+        logger.debug(f"9. 리뷰 추출 완료: {len(visitor_reviews)}개")
         
         # 3. 리뷰 데이터 파싱
         parsed_reviews = []
@@ -482,21 +481,23 @@ async def analyze_reviews_stream(
         except Exception as e:
             logger.warning(f"[SSE Auth] Token validation failed: {e}")
     
-    # 🆕 크레딧 체크 (Feature Flag 확인) - user_id가 있을 때만
-    # 리뷰 수 × 2 크레딧 동적 계산
+    # 🆕 크레딧 예약 (Feature Flag 확인) - user_id가 있을 때만
+    # 리뷰 수 × 2 크레딧 동적 계산 (완료 시 실제 분석한 리뷰 수로 확정, 실패 / 중단 시 해제)
     required_credits = (review_count or 0) * 2
-    if user_id and settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT and required_credits > 0:
-        check_result = await credit_service.check_sufficient_credits(
+    reservation = None
+    if user_id:
+        reservation = await credit_service.reserve_credits(
             user_id=user_id,
             feature="review_analysis",
-            required_credits=required_credits
+            credits_amount=required_credits
         )
-        
-        if not check_result.sufficient:
-            logger.warning(f"[Credits] User {user_id} has insufficient credits for review analysis (stream): required={required_credits}, available={check_result.current_credits}")
+    
+    if reservation and settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT and required_credits > 0:
+        if not reservation.sufficient:
+            logger.warning(f"[Credits] User {user_id} has insufficient credits for review analysis (stream): required={required_credits}, available={reservation.current_credits}")
             raise HTTPException(
                 status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail=f"크레딧이 부족합니다. (필요: {required_credits} 크레딧, 보유: {check_result.current_credits} 크레딧)"
+                detail=f"크레딧이 부족합니다. (필요: {required_credits} 크레딧, 보유: {reservation.current_credits} 크레딧)"
             )
         
         logger.info(f"[Credits] User {user_id} has sufficient credits for review analysis (stream): required={required_credits}")
@@ -509,7 +510,7 @@ async def analyze_reviews_stream(
             supabase = get_supabase_client()
             store_result = supabase.table("stores").select("*").eq("id", store_id).single().execute()
             if not store_result.data:
-                yield f"data: {json.dumps({'type': 'error', 'message': '매장을 찾을 수 없습니다'})}\n\n"
+                yield sse_event({'type': 'error', 'message': '매장을 찾을 수 없습니다'})
                 return
             
             store = store_result.data
@@ -517,7 +518,7 @@ async def analyze_reviews_stream(
             category = store.get("category", "")
             
             if not naver_place_id:
-                yield f"data: {json.dumps({'type': 'error', 'message': '네이버 플레이스 ID가 없습니다'})}\n\n"
+                yield sse_event({'type': 'error', 'message': '네이버 플레이스 ID가 없습니다'})
                 return
             
             # 2. 리뷰 추출
@@ -535,7 +536,7 @@ async def analyze_reviews_stream(
             logger.info(f"추출된 리뷰 수: {total_reviews}개")
             
             # 진행 상황 초기화
-            yield f"data: {json.dumps({'type': 'init', 'total': total_reviews})}\n\n"
+            yield sse_event({'type': 'init', 'total': total_reviews})
             
             # 3. 리뷰 파싱
             parsed_reviews = []
@@ -550,7 +551,7 @@ async def analyze_reviews_stream(
             
             for idx, review in enumerate(parsed_reviews, 1):
                 # 진행 상황 전송
-                yield f"data: {json.dumps({'type': 'progress', 'current': idx, 'total': total_reviews})}\n\n"
+                yield sse_event({'type': 'progress', 'current': idx, 'total': total_reviews})
                 
                 # 빈 리뷰 처리
                 if not review.get("content", "").strip():
@@ -565,7 +566,7 @@ async def analyze_reviews_stream(
                     }
                     analyzed_reviews.append(analyzed_review)
                     stats["neutral"] = stats.get("neutral", 0) + 1
-                    print(f"Empty review included as neutral (idx={idx}): naver_id={review.get('naver_review_id')}", flush=True)
+                    logger.debug(f"Empty review included as neutral (idx={idx}): naver_id={review.get('naver_review_id')}")
                     
                     # 빈 리뷰도 전송
                     empty_review_data = {
@@ -579,10 +580,10 @@ async def analyze_reviews_stream(
                             'rating': review.get('rating')
                         }
                     }
-                    yield f"data: {json.dumps(empty_review_data)}\n\n"
+                    yield sse_event(empty_review_data)
                     
                     # 통계 전송
-                    yield f"data: {json.dumps({'type': 'stats_update', **stats})}\n\n"
+                    yield sse_event({'type': 'stats_update', **stats})
                     
                     continue
                 
@@ -614,17 +615,17 @@ async def analyze_reviews_stream(
                             'rating': review.get('rating')
                         }
                     }
-                    yield f"data: {json.dumps(review_data)}\n\n"
+                    yield sse_event(review_data)
                     
                     # 통계 전송
-                    yield f"data: {json.dumps({'type': 'stats_update', **stats})}\n\n"
+                    yield sse_event({'type': 'stats_update', **stats})
                     
                     # Rate limit 회피를 위한 짧은 대기
                     await asyncio.sleep(0.1)
                     
                 except Exception as e:
                     # 분석 실패 시에도 기본값으로 추가
-                    print(f"Review analysis failed, included as neutral (idx={idx}): {str(e)}", flush=True)
+                    logger.warning(f"Review analysis failed, included as neutral (idx={idx}): {str(e)}")
                     analyzed_review = {
                         **review,
                         "sentiment": "neutral",
@@ -648,10 +649,10 @@ async def analyze_reviews_stream(
                             'rating': review.get('rating')
                         }
                     }
-                    yield f"data: {json.dumps(failed_review_data)}\n\n"
+                    yield sse_event(failed_review_data)
                     
                     # 통계 전송
-                    yield f"data: {json.dumps({'type': 'stats_update', **stats})}\n\n"
+                    yield sse_event({'type': 'stats_update', **stats})
             
             # 5. 요약 생성
             logger.info(f"요약 생성 시작...")
@@ -724,7 +725,7 @@ async def analyze_reviews_stream(
                     raise
             
             logger.info(f"통계 데이터 저장 완료: review_stats_id={review_stats_id}")
-            print(f"[DEBUG] review_stats_id={review_stats_id}, 리뷰 저장 시작: {len(analyzed_reviews)}개", flush=True)
+            logger.debug(f"review_stats_id={review_stats_id}, 리뷰 저장 시작: {len(analyzed_reviews)}개")
             
             # 개별 리뷰 저장
             saved_count = 0
@@ -789,25 +790,24 @@ async def analyze_reviews_stream(
                             "comment_count": review.get("comment_count", 0),
                             "created_at": datetime.now(KST).isoformat()
                         }
-                        print(f"[DEBUG] 리뷰 INSERT 시도: naver_id={naver_review_id}, review_stats_id={review_stats_id}", flush=True)
+                        logger.debug(f"리뷰 INSERT 시도: naver_id={naver_review_id}, review_stats_id={review_stats_id}")
                         supabase.table("reviews").insert(review_data).execute()
-                        print(f"[DEBUG] 리뷰 INSERT 성공: {idx}/{len(analyzed_reviews)}", flush=True)
+                        logger.debug(f"리뷰 INSERT 성공: {idx}/{len(analyzed_reviews)}")
                     
                     saved_count += 1
                 except Exception as insert_error:
                     failed_count += 1
-                    print(f"Review {idx}/{len(analyzed_reviews)} save failed - naver_id={review.get('naver_review_id')}: {str(insert_error)}", flush=True)
+                    logger.warning(f"Review {idx}/{len(analyzed_reviews)} save failed - naver_id={review.get('naver_review_id')}: {str(insert_error)}")
             
-            print(f"Review save summary: {saved_count} saved ({skipped_count} updated), {failed_count} failed out of {len(analyzed_reviews)} total", flush=True)
+            logger.info(f"Review save summary: {saved_count} saved ({skipped_count} updated), {failed_count} failed out of {len(analyzed_reviews)} total")
             
             # 🆕 크레딧 차감 (성공 시) - user_id가 있을 때만
             # 리뷰 수 × 2 크레딧 동적 차감
             actual_credits = len(analyzed_reviews) * 2
             if user_id and settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT and actual_credits > 0:
                 try:
-                    transaction_id = await credit_service.deduct_credits(
-                        user_id=user_id,
-                        feature="review_analysis",
+                    transaction_id = await credit_service.commit_reservation(
+                        reservation,
                         credits_amount=actual_credits,
                         metadata={
                             "store_id": store_id,
@@ -830,13 +830,16 @@ async def analyze_reviews_stream(
                 'saved_date': save_date,  # 저장된 날짜 전달
                 'credits_used': len(analyzed_reviews) * 2  # 실제 차감된 크레딧
             }
-            yield f"data: {json.dumps(complete_data)}\n\n"
+            yield sse_event(complete_data)
             
             logger.info(f"✅ 스트리밍 분석 완료: {len(analyzed_reviews)}개, 저장 날짜: {save_date}")
             
         except Exception as e:
             logger.error(f"스트리밍 분석 오류: {str(e)}", exc_info=True)
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
+        finally:
+            # 확정되지 않은 예약 해제 (오류 / 클라이언트 연결 종료)
+            await credit_service.release_reservation(reservation)
     
     return StreamingResponse(
         event_generator(),
@@ -850,14 +853,27 @@ async def analyze_reviews_stream(
 
 
 @router.get("/stats/{store_id}", response_model=ReviewStatsResponse)
-async def get_review_stats(store_id: str, date: Optional[str] = None):
+async def get_review_stats(request: Request, store_id: str, date: Optional[str] = None):
     """
     저장된 리뷰 통계 조회
     
     Args:
         store_id: 매장 ID
         date: 날짜 (YYYY-MM-DD), None이면 최신
+    
+    ETag 지원: 해당 매장의 리뷰 통계가 바뀌지 않았으면 304
     """
+    return await response_cache.respond(
+        request,
+        key=f"review_stats:{store_id}:{date or 'latest'}",
+        scopes=[f"review_stats:{store_id}"],
+        build=lambda: _get_review_stats(store_id, date),
+        response_model=ReviewStatsResponse,
+    )
+
+
+async def _get_review_stats(store_id: str, date: Optional[str]) -> ReviewStatsResponse:
+    """리뷰 통계 조회 (응답 캐시 미스일 때만 실행)"""
     try:
         supabase = get_supabase_client()
         logger.info(f"통계 조회 요청: store_id={store_id}, date={date}")
@@ -1003,24 +1019,19 @@ async def get_place_info(store_id: str):
     - 매장명, 방문자 리뷰 수, 블로그 리뷰 수, 평점, 한줄평
     """
     try:
-        print(f"[DEBUG] 매장 정보 조회 시작: store_id={store_id}", flush=True)
-        logger.info(f"[DEBUG] 매장 정보 조회 시작: store_id={store_id}")
+        logger.debug(f"매장 정보 조회 시작: store_id={store_id}")
         
         # Supabase에서 매장 정보 조회
         supabase = get_supabase_client()
         result = supabase.table("stores").select("*").eq("id", store_id).execute()
         
-        print(f"[DEBUG] Supabase 조회 결과: found={len(result.data) if result.data else 0} rows", flush=True)
-        logger.info(f"[DEBUG] Supabase 조회 결과: found={len(result.data) if result.data else 0} rows")
+        logger.debug(f"Supabase 조회 결과: found={len(result.data) if result.data else 0} rows")
         if result.data:
-            print(f"[DEBUG] 매장 데이터: {result.data[0]}", flush=True)
-            logger.info(f"[DEBUG] 매장 데이터: {result.data[0]}")
+            logger.debug(f"매장 데이터: {result.data[0]}")
         else:
-            print(f"[DEBUG] Supabase에서 해당 store_id를 찾을 수 없음", flush=True)
-            logger.info(f"[DEBUG] Supabase에서 해당 store_id를 찾을 수 없음")
+            logger.debug(f"Supabase에서 해당 store_id를 찾을 수 없음")
         
         if not result.data:
-            print(f"[DEBUG] 매장을 찾을 수 없음: store_id={store_id}", flush=True)
             logger.error(f"[DEBUG] 매장을 찾을 수 없음: store_id={store_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1032,11 +1043,10 @@ async def get_place_info(store_id: str):
         store_name = store.get("store_name", "") or store.get("name", "")  # store_name 또는 name 컬럼
         business_type = store.get("business_type", "restaurant")  # 기본값은 restaurant
         
-        print(f"[DEBUG] place_id={place_id}, store_name='{store_name}', business_type='{business_type}'", flush=True)
         logger.info(f"📋 매장 정보: id={store_id}, name='{store_name}', place_id={place_id}, business_type='{business_type}'")
         
         if not place_id:
-            print(f"[DEBUG] place_id가 없어서 400 에러", flush=True)
+            logger.debug(f"place_id가 없어서 400 에러")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="네이버 플레이스 ID가 등록되지 않은 매장입니다"
@@ -1047,23 +1057,20 @@ async def get_place_info(store_id: str):
         
         # 매장명이 없으면 리뷰에서 가져오기 시도
         if not store_name:
-            print(f"[DEBUG] 매장명 없음. 리뷰에서 추출 시도", flush=True)
             logger.warning(f"⚠️ 매장명 없음. 리뷰에서 매장명 추출 시도: place_id={place_id}")
             try:
                 visitor_result = await review_service.get_visitor_reviews(place_id, size=1, business_type=business_type)
                 if visitor_result and visitor_result.get("items"):
                     store_name = visitor_result["items"][0].get("businessName", "")
-                    print(f"[DEBUG] 리뷰에서 매장명 추출: '{store_name}'", flush=True)
                     logger.info(f"✅ 리뷰에서 매장명 추출: '{store_name}'")
             except Exception as e:
-                print(f"[DEBUG] 리뷰에서 매장명 추출 실패: {e}", flush=True)
                 logger.error(f"리뷰에서 매장명 추출 실패: {str(e)}")
         
         x = store.get("x")
         y = store.get("y")
-        print(f"[DEBUG] get_place_info 호출 전: place_id={place_id}, store_name='{store_name}', x={x}, y={y}", flush=True)
+        logger.debug(f"get_place_info 호출 전: place_id={place_id}, store_name='{store_name}', x={x}, y={y}")
         place_info = await review_service.get_place_info(place_id, store_name, x, y)
-        print(f"[DEBUG] get_place_info 호출 후: place_info={place_info}", flush=True)
+        logger.debug(f"get_place_info 호출 후: place_info={place_info}")
         
         if not place_info:
             raise HTTPException(
@@ -1076,27 +1083,25 @@ async def get_place_info(store_id: str):
             place_info["name"] = store.get("name", "")
         
         # 썸네일 디버깅
-        print(f"[DEBUG] 썸네일 체크:", flush=True)
-        print(f"  - place_info.get('image_url'): {place_info.get('image_url')}", flush=True)
-        print(f"  - place_info.get('thumbnail'): {place_info.get('thumbnail')}", flush=True)
-        print(f"  - store.get('thumbnail'): {store.get('thumbnail')}", flush=True)
-        print(f"  - store keys: {list(store.keys())}", flush=True)
+        logger.debug(f"썸네일 체크:")
+        logger.debug(f"  - place_info.get('image_url'): {place_info.get('image_url')}")
+        logger.debug(f"  - place_info.get('thumbnail'): {place_info.get('thumbnail')}")
+        logger.debug(f"  - store.get('thumbnail'): {store.get('thumbnail')}")
+        logger.debug(f"  - store keys: {list(store.keys())}")
         
         # 썸네일이 없으면 stores 테이블의 thumbnail 사용 (fallback)
         if not place_info.get("image_url") and not place_info.get("thumbnail"):
             fallback_thumbnail = store.get("thumbnail")
-            print(f"[DEBUG] Fallback 조건 충족! fallback_thumbnail: {fallback_thumbnail}", flush=True)
+            logger.debug(f"Fallback 조건 충족! fallback_thumbnail: {fallback_thumbnail}")
             if fallback_thumbnail:
                 place_info["image_url"] = fallback_thumbnail
                 place_info["thumbnail"] = fallback_thumbnail
-                print(f"[DEBUG] ✅ Supabase thumbnail 적용 완료!", flush=True)
                 logger.info(f"📸 Supabase thumbnail fallback 적용: {fallback_thumbnail}")
             else:
-                print(f"[DEBUG] ❌ Supabase에도 thumbnail 없음!", flush=True)
+                logger.debug(f"❌ Supabase에도 thumbnail 없음!")
         else:
-            print(f"[DEBUG] ℹ️ 네이버 API에서 썸네일 받음 (fallback 불필요)", flush=True)
+            logger.debug(f"ℹ️ 네이버 API에서 썸네일 받음 (fallback 불필요)")
         
-        print(f"[DEBUG] 최종 place_info: {place_info}", flush=True)
         logger.info(f"매장 정보 조회 완료: {place_info}")
         return {
             "status": "success",
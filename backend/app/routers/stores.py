@@ -12,7 +12,7 @@ def _log(msg, data=None, hyp=None):
 _log("stores.py module loading started", {}, "H1")
 # #endregion
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Request
 from pydantic import BaseModel
 from typing import List, Optional
 from uuid import UUID, uuid4
@@ -20,6 +20,7 @@ from datetime import datetime
 import logging
 
 from app.core.database import get_supabase_client
+from app.core.response_cache import response_cache
 from app.routers.auth import get_current_user
 
 router = APIRouter()
@@ -238,16 +239,29 @@ async def create_store(
 
 
 @router.get("/", response_model=StoreListResponse)
-async def list_stores(current_user: dict = Depends(get_current_user)):
+async def list_stores(request: Request, current_user: dict = Depends(get_current_user)):
     """
     사용자의 매장 목록 조회 (인증 필요)
     
+    ETag 지원: If-None-Match가 현재 버전과 같으면 304 (매장이 바뀌지 않았으면 조회 생략)
+    
     Returns:
         매장 목록
     """
+    user_id = current_user["id"]
+    return await response_cache.respond(
+        request,
+        key=f"stores:list:{user_id}",
+        scopes=[f"stores:{user_id}"],
+        build=lambda: _list_stores(user_id),
+        response_model=StoreListResponse,
+    )
+
+
+async def _list_stores(user_id: str) -> StoreListResponse:
+    """매장 목록 조회 (응답 캐시 미스일 때만 실행)"""
     try:
         supabase = get_supabase_client()
-        user_id = current_user["id"]
         
         # 디버깅: user_id 로깅
         logger.info(f"[DEBUG] list_stores called with authenticated user_id: {user_id}")
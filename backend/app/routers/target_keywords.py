@@ -1,7 +1,7 @@
 """
 타겟 키워드 추출 및 진단 API 라우터
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Header
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -12,6 +12,8 @@ from app.core.database import get_supabase_client
 from app.routers.auth import get_current_user
 from app.services.credit_service import credit_service
 from app.core.config import settings
+from app.core.jobs import JobContext, NO_JOB
+from app.routers.jobs import accept_job
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,6 +33,8 @@ class TargetKeywordAnalysisRequest(BaseModel):
 @router.post("/analyze")
 async def analyze_target_keywords(
     request: TargetKeywordAnalysisRequest,
+    async_mode: bool = Query(False, alias="async", description="true: 202 + job_id 즉시 반환 (GET /api/v1/jobs/{job_id}로 결과 조회)"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -45,25 +49,35 @@ async def analyze_target_keywords(
     
     Args:
         request: 분석 요청 데이터
+        async_mode: true면 백그라운드 작업으로 등록하고 202 반환 (?async=true)
+        idempotency_key: 같은 키로 다시 요청하면 기존 작업 반환
         
     Returns:
-        분석 결과 (history_id 포함)
+        분석 결과 (history_id 포함) / 비동기 모드는 작업 정보 (job_id, status_url, events_url)
         
     Raises:
         HTTPException: 분석 실패 시
     """
+    if async_mode:
+        return accept_job("target_keyword_analysis", request.model_dump(), current_user, idempotency_key)
+    return await run_target_keyword_analysis(request.model_dump(), current_user)
+
+
+async def run_target_keyword_analysis(params: dict, current_user: dict, job: JobContext = NO_JOB) -> dict:
+    """타겟 키워드 분석 실행 (동기 API / 백그라운드 작업 공용)"""
+    request = TargetKeywordAnalysisRequest(**params)
     user_id = UUID(current_user["id"])
+    reservation = None
     
     try:
-        # 🆕 크레딧 체크 (Feature Flag 확인)
+        # 🆕 크레딧 예약 (Feature Flag 확인)
+        reservation = await credit_service.reserve_credits(
+            user_id=user_id,
+            feature="target_keyword_extraction",
+            credits_amount=20
+        )
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_CHECK_STRICT:
-            check_result = await credit_service.check_sufficient_credits(
-                user_id=user_id,
-                feature="target_keyword_extraction",
-                required_credits=20
-            )
-            
-            if not check_result.sufficient:
+            if not reservation.sufficient:
                 logger.warning(f"[Credits] User {user_id} has insufficient credits for target keyword extraction")
                 raise HTTPException(
                     status_code=status.HTTP_402_PAYMENT_REQUIRED,
@@ -75,6 +89,7 @@ async def analyze_target_keywords(
         logger.info(f"[타겟 키워드 API] 요청 받음: store_id={request.store_id}, user_id={user_id}")  # Modified: use user_id from current_user
         logger.info(f"[타겟 키워드 API] 입력 키워드: regions={request.regions}, landmarks={request.landmarks}, menus={request.menus}, industries={request.industries}, others={request.others}")
         
+        await job.progress(5, "키워드 조합 / 검색량 조회 중")
         service = NaverTargetKeywordService()
         
         result = await service.analyze_target_keywords(
@@ -95,6 +110,7 @@ async def analyze_target_keywords(
             )
         
         # 히스토리 저장
+        await job.progress(90, "분석 결과 저장 중")
         history_id = None
         try:
             supabase = get_supabase_client()
@@ -177,10 +193,8 @@ async def analyze_target_keywords(
         # 🆕 크레딧 차감 (성공 시)
         if settings.CREDIT_SYSTEM_ENABLED and settings.CREDIT_AUTO_DEDUCT:
             try:
-                transaction_id = await credit_service.deduct_credits(
-                    user_id=user_id,
-                    feature="target_keyword_extraction",
-                    credits_amount=20,
+                transaction_id = await credit_service.commit_reservation(
+                    reservation,
                     metadata={
                         "store_id": request.store_id,
                         "keywords_count": len(result.get('data', {}).get('top_keywords', [])),
@@ -203,6 +217,9 @@ async def analyze_target_keywords(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"타겟 키워드 분석 실패: {str(e)}"
         )
+    finally:
+        # 확정되지 않은 크레딧 예약 해제 (실패 / 예외 시)
+        await credit_service.release_reservation(reservation)
 
 
 @router.get("/history/{store_id}")
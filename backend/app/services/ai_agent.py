@@ -4,6 +4,7 @@ AI Agent - OpenAI 기반 리뷰 분석 및 답글 생성
 import os
 from typing import Literal, Optional
 from openai import AsyncOpenAI
+from app.core.metrics import observe_upstream_call
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -29,7 +30,7 @@ class AIAgent:
             str: 'positive', 'neutral', 'negative' 중 하나
         """
         try:
-            response = await client.chat.completions.create(
+            response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -47,7 +48,7 @@ class AIAgent:
                 ],
                 temperature=0.3,
                 max_tokens=10
-            )
+            ))
             
             sentiment = response.choices[0].message.content.strip().lower()
             
@@ -123,7 +124,7 @@ class AIAgent:
 답글만 작성하세요. 다른 설명은 불필요합니다.
 """
             
-            response = await client.chat.completions.create(
+            response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -133,7 +134,7 @@ class AIAgent:
                 ],
                 temperature=0.7,
                 max_tokens=250
-            )
+            ))
             
             reply = response.choices[0].message.content.strip()
             return reply
@@ -202,7 +203,7 @@ class AIAgent:
 한국어로 간결하게 작성하세요 (300자 이내).
 """
             
-            response = await client.chat.completions.create(
+            response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -212,7 +213,7 @@ class AIAgent:
                 ],
                 temperature=0.7,
                 max_tokens=400
-            )
+            ))
             
             insight = response.choices[0].message.content.strip()
             return insight
@@ -8,6 +8,7 @@ from typing import List, Optional
 import logging
 
 from app.core.database import get_supabase_client
+from app.services.credit_service import credit_service
 from app.core.config import (
     get_tier_credits, get_tier_price, get_tier_order,
     TIER_PRICES
@@ -190,6 +191,7 @@ class BillingService:
             })\
             .eq("user_id", user_id)\
             .execute()
+        credit_service.invalidate_balance(user_id)
         
         logger.info(f"[Billing] 구독 갱신 완료: user={user_id}, tier={tier}, next_billing={next_billing}")
     
@@ -208,6 +210,7 @@ class BillingService:
             })\
             .eq("user_id", user_id)\
             .execute()
+        credit_service.invalidate_balance(user_id)
         
         # 다음 결제일 갱신
         next_billing = (now + relativedelta(months=1)).date()
@@ -314,6 +317,7 @@ class BillingService:
                     })\
                     .eq("user_id", user_id)\
                     .execute()
+                credit_service.invalidate_balance(user_id)
                 
                 # 매장/키워드 데이터 정리 (유지 항목 외 삭제)
                 metadata = sub.get("metadata", {})
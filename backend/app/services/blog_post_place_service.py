@@ -0,0 +1,95 @@
+"""
+블로그 포스트 → 첨부 플레이스 캐시
+
+블로그 포스트 본문(PostView)에 첨부된 플레이스 지도는 게시 후 바뀌지 않으므로,
+포스트마다 한 번 확인한 첨부 placeId 목록을 blog_post_places 테이블에 저장합니다.
+BLOG_VERIFY_PLACE_ATTACHMENT=true일 때 활성화 / 경쟁분석의 블로그 추이 계산은 처음 보는 포스트만 PostView를 요청합니다.
+
+- place_ids: 포스트에 첨부된 플레이스 ID (지도 첨부가 없으면 빈 목록)
+  → 매장과 무관하게 저장하므로 경쟁매장 분석에서도 같은 포스트 결과를 재사용
+- PostView 요청 실패(HTTP 오류 / 타임아웃)는 저장하지 않음 → 다음 조회에서 재시도
+- 조회 순서: 프로세스 내 LRU → Supabase (저장소 오류 시 캐시 없이 진행)
+"""
+import logging
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+from app.core.database import chunked, IN_FILTER_CHUNK_SIZE, BULK_WRITE_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 최근 포스트 캐시 크기
+BLOG_POST_CACHE_SIZE = 5000
+
+
+class BlogPostPlaceService:
+    """블로그 포스트 URL → 첨부 placeId 목록 캐시"""
+    
+    def __init__(self):
+        self._recent: "OrderedDict[str, List[str]]" = OrderedDict()
+    
+    @property
+    def supabase(self):
+        from app.core.database import get_supabase_client
+        return get_supabase_client()
+    
+    def _remember(self, blog_url: str, place_ids: List[str]):
+        self._recent[blog_url] = place_ids
+        self._recent.move_to_end(blog_url)
+        if len(self._recent) > BLOG_POST_CACHE_SIZE:
+            self._recent.popitem(last=False)
+    
+    def get_many(self, blog_urls: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        저장된 포스트의 첨부 placeId 목록
+        
+        Returns:
+            {blog_url: [place_id, ...]} (확인한 적 없는 포스트는 포함하지 않음)
+        """
+        found: Dict[str, List[str]] = {}
+        missing = []
+        for blog_url in dict.fromkeys(blog_urls):
+            place_ids = self._recent.get(blog_url)
+            if place_ids is None:
+                missing.append(blog_url)
+            else:
+                self._recent.move_to_end(blog_url)
+                found[blog_url] = place_ids
+        
+        if not missing:
+            return found
+        
+        try:
+            for urls in chunked(missing, IN_FILTER_CHUNK_SIZE):
+                result = self.supabase.table("blog_post_places").select(
+                    "blog_url, place_ids"
+                ).in_("blog_url", urls).execute()
+                for row in result.data or []:
+                    place_ids = [str(place_id) for place_id in row.get("place_ids") or []]
+                    found[row["blog_url"]] = place_ids
+                    self._remember(row["blog_url"], place_ids)
+        except Exception as e:
+            logger.warning(f"[블로그 포스트 캐시] 조회 실패 (캐시 없이 진행): {e}")
+        
+        return found
+    
+    def save_many(self, entries: Dict[str, List[str]]):
+        """확인한 포스트의 첨부 placeId 목록 저장 (이미 있으면 덮어씀)"""
+        if not entries:
+            return
+        for blog_url, place_ids in entries.items():
+            self._remember(blog_url, place_ids)
+        
+        rows = [
+            {"blog_url": blog_url, "place_ids": place_ids}
+            for blog_url, place_ids in entries.items()
+        ]
+        try:
+            for chunk in chunked(rows, BULK_WRITE_CHUNK_SIZE):
+                self.supabase.table("blog_post_places").upsert(chunk, on_conflict="blog_url").execute()
+        except Exception as e:
+            logger.warning(f"[블로그 포스트 캐시] 저장 실패 ({len(rows)}개): {e}")
+
+
+# 싱글톤 인스턴스
+blog_post_place_service = BlogPostPlaceService()
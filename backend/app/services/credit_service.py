@@ -3,17 +3,20 @@ Credit Service
 크레딧 시스템 비즈니스 로직
 """
 from uuid import UUID
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 import logging
+import time
 
 from app.core.database import get_supabase_client
 from app.core.config import settings, calculate_feature_credits
+from app.core.tracing import traced
 from app.models.credits import (
     UserCredits,
     UserCreditsResponse,
     CreditTransaction,
     CreditCheckResponse,
+    CreditReservation,
     TierQuotas,
 )
 
@@ -21,14 +24,64 @@ logger = logging.getLogger(__name__)
 
 
 class CreditService:
-    """크레딧 관리 서비스"""
+    """
+    크레딧 관리 서비스
+    
+    유료 기능은 reserve_credits → (작업) → commit_reservation / release_reservation 순서로 호출합니다.
+    잔액 조회(get_user_credits)는 사용자별 짧은 TTL 캐시를 거치며, 예약 / 확정 RPC가 돌려준 잔액으로 갱신되고
+    차감 / 충전 / 리셋 / 관리자 지급 시 무효화됩니다 (캐시는 워커별, 다른 워커의 변경은 TTL 안에 반영).
+    """
     
     def __init__(self):
         self.supabase = get_supabase_client()
+        # user_id -> (만료 시각(monotonic), 잔액)
+        self._balance_cache: Dict[str, Tuple[float, UserCreditsResponse]] = {}
+    
+    def _to_credits_response(self, user_id: UUID, data: dict) -> UserCreditsResponse:
+        """user_credits 행 → UserCreditsResponse"""
+        percentage_used = 0
+        if data["monthly_credits"] > 0:
+            percentage_used = (data["monthly_used"] / data["monthly_credits"]) * 100
+        
+        return UserCreditsResponse(
+            user_id=user_id,
+            tier=data["tier"],
+            monthly_credits=data["monthly_credits"],
+            monthly_used=data["monthly_used"],
+            monthly_remaining=data["monthly_remaining"],
+            manual_credits=data["manual_credits"],
+            total_remaining=data["total_remaining"],
+            next_reset_at=data.get("next_reset_at"),
+            percentage_used=round(percentage_used, 2)
+        )
+    
+    def _cache_balance(self, user_id: UUID, data: Optional[dict]) -> None:
+        """RPC가 돌려준 user_credits 행으로 잔액 캐시 갱신"""
+        if not data or settings.CREDIT_BALANCE_CACHE_TTL_SECONDS <= 0:
+            self.invalidate_balance(user_id)
+            return
+        try:
+            credits = self._to_credits_response(user_id, data)
+        except Exception as e:
+            logger.warning(f"Failed to cache user credits: {e}")
+            self.invalidate_balance(user_id)
+            return
+        self._balance_cache[str(user_id)] = (
+            time.monotonic() + settings.CREDIT_BALANCE_CACHE_TTL_SECONDS,
+            credits,
+        )
+    
+    def invalidate_balance(self, user_id) -> None:
+        """
+        잔액 캐시 무효화
+        
+        user_credits를 직접 수정하는 곳(관리자 지급, 결제 / 구독 갱신 등)에서 수정 후 호출합니다.
+        """
+        self._balance_cache.pop(str(user_id), None)
     
     async def get_user_credits(self, user_id: UUID) -> Optional[UserCreditsResponse]:
         """
-        사용자 크레딧 조회
+        사용자 크레딧 조회 (CREDIT_BALANCE_CACHE_TTL_SECONDS 동안 캐시)
         
         Args:
             user_id: 사용자 ID
@@ -36,6 +89,10 @@ class CreditService:
         Returns:
             UserCreditsResponse: 크레딧 정보
         """
+        cached = self._balance_cache.get(str(user_id))
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             response = self.supabase.table("user_credits")\
                 .select("*")\
@@ -46,27 +103,14 @@ class CreditService:
             if not response.data:
                 return None
             
-            data = response.data
-            percentage_used = 0
-            if data["monthly_credits"] > 0:
-                percentage_used = (data["monthly_used"] / data["monthly_credits"]) * 100
-            
-            return UserCreditsResponse(
-                user_id=user_id,
-                tier=data["tier"],
-                monthly_credits=data["monthly_credits"],
-                monthly_used=data["monthly_used"],
-                monthly_remaining=data["monthly_remaining"],
-                manual_credits=data["manual_credits"],
-                total_remaining=data["total_remaining"],
-                next_reset_at=data.get("next_reset_at"),
-                percentage_used=round(percentage_used, 2)
-            )
+            self._cache_balance(user_id, response.data)
+            return self._to_credits_response(user_id, response.data)
             
         except Exception as e:
             logger.error(f"Failed to get user credits: {e}")
             return None
     
+    @traced("credits.check")
     async def check_sufficient_credits(
         self,
         user_id: UUID,
@@ -167,6 +211,7 @@ class CreditService:
                     is_god_tier=False
                 )
     
+    @traced("credits.deduct")
     async def deduct_credits(
         self,
         user_id: UUID,
@@ -203,6 +248,7 @@ class CreditService:
             ).execute()
             
             transaction_id = response.data
+            self.invalidate_balance(user_id)
             logger.info(f"Credits deducted: user={user_id}, feature={feature}, amount={credits_amount}, tx={transaction_id}")
             
             return UUID(transaction_id) if transaction_id else None
@@ -211,6 +257,185 @@ class CreditService:
             logger.error(f"Failed to deduct credits: {e}")
             raise
     
+    @traced("credits.reserve")
+    async def reserve_credits(
+        self,
+        user_id: UUID,
+        feature: str,
+        credits_amount: Optional[int] = None,
+        metadata: dict = None,
+        **kwargs
+    ) -> CreditReservation:
+        """
+        크레딧 예약 (잔액 확인 + 확보를 RPC 한 번으로)
+        
+        같은 사용자의 동시 요청은 DB에서 직렬화되고, 진행 중인 예약만큼 뺀 잔액으로 판정합니다.
+        잔액이 부족하면 예약 없이 sufficient=False (차단 여부는 호출부에서 CREDIT_CHECK_STRICT로 결정).
+        예약 RPC가 실패하면 check_sufficient_credits와 같이 STRICT 모드면 부족, 아니면 통과로 처리합니다.
+        
+        Args:
+            user_id: 사용자 ID
+            feature: 기능 이름
+            credits_amount: 예약할 크레딧 (None이면 자동 계산)
+            metadata: 메타데이터 (확정 시 트랜잭션에 기록)
+            **kwargs: 크레딧 계산용 파라미터
+            
+        Returns:
+            CreditReservation: 체크 결과 + 예약 ID (성공 시 commit_reservation, 실패 시 release_reservation)
+        """
+        # 크레딧 시스템이 비활성화면 항상 통과 (확정 / 해제할 것 없음)
+        if not settings.CREDIT_SYSTEM_ENABLED:
+            return CreditReservation(
+                sufficient=True,
+                current_credits=-1,
+                required_credits=0,
+                shortage=0,
+                is_god_tier=False,
+                user_id=user_id,
+                feature=feature,
+                settled=True
+            )
+        
+        if credits_amount is None:
+            credits_amount = calculate_feature_credits(feature, **kwargs)
+        
+        try:
+            response = self.supabase.rpc(
+                "reserve_user_credits",
+                {
+                    "p_user_id": str(user_id),
+                    "p_feature": feature,
+                    "p_credits_amount": credits_amount,
+                    "p_ttl_seconds": settings.CREDIT_RESERVATION_TTL_SECONDS,
+                    "p_metadata": metadata or {}
+                }
+            ).execute()
+            result = response.data
+            if not result:
+                logger.warning(f"No credit data found for user {user_id}. User credits record may not exist.")
+        except Exception as e:
+            logger.error(f"Failed to reserve credits: {e}")
+            result = None
+        
+        if not result:
+            # STRICT 모드면 부족, 느슨한 모드면 예약 없이 통과 (확정 시 일반 차감)
+            sufficient = not settings.CREDIT_CHECK_STRICT
+            return CreditReservation(
+                sufficient=sufficient,
+                current_credits=-1 if sufficient else 0,
+                required_credits=credits_amount,
+                shortage=0 if sufficient else credits_amount,
+                is_god_tier=False,
+                user_id=user_id,
+                feature=feature
+            )
+        
+        self._cache_balance(user_id, result.get("credits"))
+        return CreditReservation(
+            sufficient=result["sufficient"],
+            current_credits=result["current_credits"],
+            monthly_remaining=result.get("monthly_remaining"),
+            manual_credits=result.get("manual_credits"),
+            required_credits=result["required_credits"],
+            shortage=result["shortage"],
+            tier=result.get("tier"),
+            next_reset=result.get("next_reset"),
+            is_god_tier=result.get("is_god_tier", False),
+            reservation_id=result.get("reservation_id"),
+            user_id=user_id,
+            feature=feature
+        )
+    
+    @traced("credits.commit")
+    async def commit_reservation(
+        self,
+        reservation: Optional[CreditReservation],
+        credits_amount: Optional[int] = None,
+        metadata: dict = None
+    ) -> Optional[UUID]:
+        """
+        크레딧 예약 확정 (작업 성공 시 실제 차감)
+        
+        확정 RPC가 차감 후 잔액을 돌려주므로 잔액 캐시를 바로 갱신합니다.
+        예약 없이 통과한 경우(느슨한 모드 / 예약 RPC 실패)는 deduct_credits로 차감하고,
+        CREDIT_AUTO_DEDUCT가 꺼져 있으면 차감하지 않고 예약을 해제합니다.
+        
+        Args:
+            reservation: reserve_credits 결과
+            credits_amount: 실제 차감할 크레딧 (None이면 예약한 크레딧)
+            metadata: 메타데이터 (예약 시 메타데이터에 병합)
+            
+        Returns:
+            UUID: 트랜잭션 ID
+        """
+        if reservation is None or reservation.settled:
+            return None
+        
+        if not settings.CREDIT_AUTO_DEDUCT:
+            logger.info(f"Credit auto-deduct disabled. Releasing reservation for user {reservation.user_id}")
+            await self.release_reservation(reservation)
+            return None
+        
+        if not reservation.reservation_id:
+            transaction_id = await self.deduct_credits(
+                reservation.user_id,
+                reservation.feature,
+                reservation.required_credits if credits_amount is None else credits_amount,
+                metadata
+            )
+            reservation.settled = True
+            return transaction_id
+        
+        try:
+            response = self.supabase.rpc(
+                "commit_credit_reservation",
+                {
+                    "p_reservation_id": str(reservation.reservation_id),
+                    "p_credits_amount": credits_amount,
+                    "p_metadata": metadata or {}
+                }
+            ).execute()
+        except Exception as e:
+            logger.error(f"Failed to commit credit reservation: {e}")
+            self.invalidate_balance(reservation.user_id)
+            raise
+        
+        reservation.settled = True
+        result = response.data or {}
+        self._cache_balance(reservation.user_id, result.get("credits"))
+        
+        transaction_id = result.get("transaction_id")
+        logger.info(f"Credits committed: user={reservation.user_id}, feature={reservation.feature}, reservation={reservation.reservation_id}, tx={transaction_id}")
+        
+        return UUID(transaction_id) if transaction_id else None
+    
+    @traced("credits.release")
+    async def release_reservation(self, reservation: Optional[CreditReservation]) -> None:
+        """
+        크레딧 예약 해제 (작업 실패 / 취소 시)
+        
+        이미 확정 / 해제된 예약이면 아무것도 하지 않으므로 finally에서 항상 호출해도 됩니다.
+        해제 RPC가 실패해도 예약은 CREDIT_RESERVATION_TTL_SECONDS 후 잔액 계산에서 제외됩니다.
+        
+        Args:
+            reservation: reserve_credits 결과
+        """
+        if reservation is None or reservation.settled:
+            return
+        
+        reservation.settled = True
+        if not reservation.reservation_id:
+            return
+        
+        try:
+            self.supabase.rpc(
+                "release_credit_reservation",
+                {"p_reservation_id": str(reservation.reservation_id)}
+            ).execute()
+            logger.info(f"Credit reservation released: user={reservation.user_id}, feature={reservation.feature}, reservation={reservation.reservation_id}")
+        except Exception as e:
+            logger.warning(f"Failed to release credit reservation (expires automatically): {e}")
+    
     async def charge_manual_credits(
         self,
         user_id: UUID,
@@ -239,6 +464,7 @@ class CreditService:
             ).execute()
             
             transaction_id = response.data
+            self.invalidate_balance(user_id)
             logger.info(f"Credits charged: user={user_id}, amount={credits_amount}, tx={transaction_id}")
             
             return UUID(transaction_id) if transaction_id else None
@@ -298,6 +524,7 @@ class CreditService:
                 {"p_user_id": str(user_id)}
             ).execute()
             
+            self.invalidate_balance(user_id)
             logger.info(f"Monthly credits reset: user={user_id}")
             return True
             
@@ -333,6 +560,7 @@ class CreditService:
             ).execute()
             
             credits_id = response.data
+            self.invalidate_balance(user_id)
             logger.info(f"User credits initialized: user={user_id}, tier={tier}")
             
             return UUID(credits_id) if credits_id else None
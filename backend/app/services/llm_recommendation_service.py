@@ -2,7 +2,7 @@
 import os
 import logging
 from typing import Dict, Any, List
-from openai import AsyncOpenAI
+from app.core.metrics import observe_upstream_call
 import json
 
 logger = logging.getLogger(__name__)
@@ -12,12 +12,18 @@ class LLMRecommendationService:
     """ChatGPT를 활용한 개선 권장사항 생성"""
     
     def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self._client = None
+        if not self.api_key:
             logger.warning("[LLM] OPENAI_API_KEY 환경변수가 설정되지 않았습니다")
-            self.client = None
-        else:
-            self.client = AsyncOpenAI(api_key=api_key)
+    
+    @property
+    def client(self):
+        """OpenAI 클라이언트 (첫 사용 시 생성 - openai 패키지 import를 실제 호출 시점으로 지연)"""
+        if self._client is None and self.api_key:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
     
     async def generate_detailed_recommendations(
         self,
@@ -49,7 +55,7 @@ class LLMRecommendationService:
             analysis_summary = self._create_analysis_summary(my_store, competitors, gaps, new_business_rate)
             
             # ChatGPT 호출
-            response = await self.client.chat.completions.create(
+            response = await observe_upstream_call("openai", "gpt-4o-mini", "direct", self.client.chat.completions.create(
                 model="gpt-4o-mini",  # gpt-4o-mini 사용
                 messages=[
                     {
@@ -88,7 +94,7 @@ class LLMRecommendationService:
                 response_format={"type": "json_object"},
                 temperature=0.7,
                 max_tokens=2000,
-            )
+            ))
             
             # 응답 파싱
             content = response.choices[0].message.content
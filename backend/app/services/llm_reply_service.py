@@ -6,7 +6,7 @@ AI 답글 생성 서비스 (OpenAI GPT-4o-mini 사용)
 import os
 import logging
 from typing import Dict, Any, Optional
-from openai import AsyncOpenAI
+from app.core.metrics import observe_upstream_call
 from app.models.place_ai_settings import PlaceAISettings
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,7 @@ class LLMReplyService:
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
         
+        from openai import AsyncOpenAI  # 첫 사용 시 import (API 워커 시작 시간 절감)
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = "gpt-4o-mini"
     
@@ -259,7 +260,7 @@ class LLMReplyService:
                 logger.info("Using DEFAULT AI parameters")
             
             # OpenAI API 호출
-            response = await self.client.chat.completions.create(
+            response = await observe_upstream_call("openai", self.model, "direct", self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -269,7 +270,7 @@ class LLMReplyService:
                 max_tokens=max_tokens,
                 frequency_penalty=frequency_penalty,
                 presence_penalty=presence_penalty
-            )
+            ))
             
             reply_text = response.choices[0].message.content.strip()
             
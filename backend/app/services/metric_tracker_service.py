@@ -3,18 +3,43 @@
 Metric Tracker Service
 """
 import logging
-import json
+import asyncio
 from typing import List, Dict, Optional
 from datetime import datetime, date, timedelta, timezone
 from zoneinfo import ZoneInfo
 from uuid import UUID, uuid4
-from app.core.database import get_supabase_client
+from app.core.database import (
+    get_supabase_client,
+    chunked,
+    IN_FILTER_CHUNK_SIZE,
+    BULK_WRITE_CHUNK_SIZE,
+)
+from app.services.serp_snapshot_service import serp_snapshot_service
 
 logger = logging.getLogger(__name__)
 
 # KST 시간대 정의 (Asia/Seoul - 정확한 시간대 사용)
 KST = ZoneInfo("Asia/Seoul")
 
+# 지표 이력 해상도 (daily: daily_metrics 원본, weekly/monthly: daily_metric_rollups)
+METRIC_RESOLUTIONS = ('auto', 'daily', 'weekly', 'monthly')
+
+# auto 해상도 기준 (조회 기간 일수)
+DAILY_RESOLUTION_MAX_DAYS = 92     # ~3개월: 일별 (최대 93개 포인트)
+WEEKLY_RESOLUTION_MAX_DAYS = 366   # ~1년: 주별 (최대 53개 포인트), 초과 시 월별
+
+
+def resolve_metric_resolution(start_date: date, end_date: date, resolution: str = 'auto') -> str:
+    """조회 기간에 맞는 지표 해상도 결정 (auto가 아니면 그대로 반환)"""
+    if resolution != 'auto':
+        return resolution
+    days = (end_date - start_date).days
+    if days <= DAILY_RESOLUTION_MAX_DAYS:
+        return 'daily'
+    if days <= WEEKLY_RESOLUTION_MAX_DAYS:
+        return 'weekly'
+    return 'monthly'
+
 
 class MetricTrackerService:
     """주요지표 추적 서비스"""
@@ -96,11 +121,35 @@ class MetricTrackerService:
         """
         사용자의 모든 tracker 조회 (최신 지표 포함)
         
-        🚀 성능 최적화: 단일 쿼리로 모든 daily_metrics를 한 번에 조회하여
-        N+1 쿼리 문제 해결 (N*3회 → 2회 쿼리로 감소)
+        🚀 성능 최적화: tracker별 최신 2개 daily_metrics만 DB에서 조회하는
+        단일 RPC로 목록 구성 (이력 길이와 무관하게 쿼리 1회)
+        RPC 미적용 환경에서는 기존 2회 쿼리 방식으로 폴백
         
         ✅ RLS 우회: 멀티 유저 세션 충돌 방지를 위해 RPC 함수 사용
         """
+        today = datetime.now(KST).date()  # ✅ KST 시간대 명시적 사용
+        cutoff_date = (today - timedelta(days=30)).isoformat()  # 최근 30일치
+        
+        try:
+            result = self.supabase.rpc('get_metric_trackers_with_latest_metrics', {
+                'p_user_id': str(user_id),
+                'p_cutoff_date': cutoff_date
+            }).execute()
+            
+            trackers = result.data or []
+            logger.info(f"[Trackers Get All] ✅ {len(trackers)}개 tracker 조회 완료 (쿼리 1회)")
+            return trackers
+            
+        except Exception as e:
+            logger.warning(f"[Trackers Get All] 최신 지표 RPC 실패, 기존 방식으로 폴백: {str(e)}")
+            return self._get_all_trackers_with_metric_scan(user_id, cutoff_date)
+    
+    def _get_all_trackers_with_metric_scan(self, user_id: str, cutoff_date: str) -> List[dict]:
+        """
+        사용자의 모든 tracker 조회 (기존 방식: 최근 30일 daily_metrics 전체 조회 후 그룹화)
+        
+        get_metric_trackers_with_latest_metrics RPC가 없는 환경용 폴백
+        """
         try:
             # 1️⃣ 모든 trackers 조회 (RLS 우회 RPC 함수 사용)
             logger.info(f"[Trackers Get All] RPC 함수 호출: user_id={user_id}")
@@ -115,11 +164,8 @@ class MetricTrackerService:
             
             tracker_ids = [item['id'] for item in result.data]
             
-            # 2️⃣ 모든 trackers의 최근 daily_metrics를 한 번에 조회 (최적화)
-            # 각 tracker당 최근 2개의 데이터만 가져옴 (최신 + 이전 날짜)
-            today = datetime.now(KST).date()  # ✅ KST 시간대 명시적 사용
-            cutoff_date = (today - timedelta(days=30)).isoformat()  # 최근 30일치
-            logger.info(f"[Trackers Get All] 🔍 오늘(KST): {today}, cutoff_date: {cutoff_date}")
+            # 2️⃣ 모든 trackers의 최근 daily_metrics를 한 번에 조회
+            logger.info(f"[Trackers Get All] 🔍 cutoff_date: {cutoff_date}")
             
             all_metrics_result = self.supabase.table('daily_metrics')\
                 .select('*')\
@@ -228,54 +274,43 @@ class MetricTrackerService:
         """
         return self.get_all_trackers(user_id)
     
-    def get_all_active_trackers(self) -> List[dict]:
+    def get_all_active_trackers(self, hour: Optional[int] = None) -> List[dict]:
         """
         현재 시간에 수집해야 할 활성 tracker 조회
         
         스케줄러에서 매 시간마다 호출됨
-        현재 시간이 update_times 배열에 포함된 tracker들을 반환
+        update_times 필터링은 DB에서 수행 (get_due_metric_trackers RPC, GIN 인덱스)
+        RPC가 없는 환경(마이그레이션 미적용)에서는 전체 조회 후 Python 필터링으로 폴백
+        
+        Args:
+            hour: 수집 시간 (KST, 0~23). None이면 현재 시간
         
         Returns:
             현재 시간에 수집할 tracker 목록 (stores, keywords 정보 포함)
         """
         try:
             # KST 시간대로 현재 시간 조회 (UTC+9)
-            current_hour = datetime.now(KST).hour
+            current_hour = datetime.now(KST).hour if hour is None else hour
             logger.info(f"[Get Active Trackers] 현재 시간 (KST): {current_hour}시")
             
-            # 모든 활성 tracker 조회
-            result = self.supabase.table('metric_trackers')\
-                .select('*, stores(store_name, place_id, platform), keywords(keyword)')\
-                .eq('is_active', True)\
-                .execute()
-            
-            if not result.data:
-                logger.info("[Get Active Trackers] 활성 tracker 없음")
-                return []
+            try:
+                result = self.supabase.rpc(
+                    'get_due_metric_trackers',
+                    {'p_hour': current_hour}
+                ).execute()
+                scheduled_trackers = result.data or []
+            except Exception as rpc_error:
+                logger.warning(
+                    f"[Get Active Trackers] RPC 조회 실패, 전체 조회로 폴백: {str(rpc_error)}"
+                )
+                scheduled_trackers = self._filter_due_trackers_locally(current_hour)
             
-            # 현재 시간에 수집해야 할 tracker 필터링
-            scheduled_trackers = []
-            for tracker in result.data:
-                update_times = tracker.get('update_times', [])
-                
-                # update_times가 None이거나 비어있으면 기본값 사용
-                if not update_times:
-                    update_frequency = tracker.get('update_frequency', 'daily_once')
-                    if update_frequency == 'daily_once':
-                        update_times = [16]
-                    elif update_frequency == 'daily_twice':
-                        update_times = [6, 16]
-                    else:
-                        update_times = [16]
-                
-                # 현재 시간이 수집 시간에 포함되는지 확인
-                if current_hour in update_times:
-                    scheduled_trackers.append(tracker)
-                    keyword_text = tracker.get('keywords', {}).get('keyword', 'Unknown') if tracker.get('keywords') else 'Unknown'
-                    store_name = tracker.get('stores', {}).get('store_name', 'Unknown') if tracker.get('stores') else 'Unknown'
-                    logger.info(
-                        f"[Schedule] {current_hour}시 수집 예정: '{keyword_text}' (매장: {store_name})"
-                    )
+            for tracker in scheduled_trackers:
+                keyword_text = tracker.get('keywords', {}).get('keyword', 'Unknown') if tracker.get('keywords') else 'Unknown'
+                store_name = tracker.get('stores', {}).get('store_name', 'Unknown') if tracker.get('stores') else 'Unknown'
+                logger.info(
+                    f"[Schedule] {current_hour}시 수집 예정: '{keyword_text}' (매장: {store_name})"
+                )
             
             logger.info(f"[Get Active Trackers] 총 {len(scheduled_trackers)}개 tracker 수집 예정")
             return scheduled_trackers
@@ -284,6 +319,37 @@ class MetricTrackerService:
             logger.error(f"[Get Active Trackers] 오류: {str(e)}")
             return []
     
+    def _filter_due_trackers_locally(self, current_hour: int) -> List[dict]:
+        """모든 활성 tracker를 조회한 뒤 update_times를 Python에서 필터링 (RPC 폴백)"""
+        # 모든 활성 tracker 조회 (배치 수집에 필요한 매장 좌표/카테고리 포함)
+        result = self.supabase.table('metric_trackers')\
+            .select('*, stores(store_name, place_id, platform, place_x, place_y, category), keywords(keyword)')\
+            .eq('is_active', True)\
+            .execute()
+        
+        if not result.data:
+            return []
+        
+        scheduled_trackers = []
+        for tracker in result.data:
+            update_times = tracker.get('update_times', [])
+            
+            # update_times가 None이거나 비어있으면 기본값 사용
+            if not update_times:
+                update_frequency = tracker.get('update_frequency', 'daily_once')
+                if update_frequency == 'daily_once':
+                    update_times = [16]
+                elif update_frequency == 'daily_twice':
+                    update_times = [6, 16]
+                else:
+                    update_times = [16]
+            
+            # 현재 시간이 수집 시간에 포함되는지 확인
+            if current_hour in update_times:
+                scheduled_trackers.append(tracker)
+        
+        return scheduled_trackers
+    
     def update_tracker(self, tracker_id: str, user_id: str, data: dict) -> dict:
         """tracker 설정 수정"""
         try:
@@ -367,7 +433,8 @@ class MetricTrackerService:
                 store_name=store['store_name'],
                 coord_x=store.get('place_x'),
                 coord_y=store.get('place_y'),
-                category=store.get('category')
+                category=store.get('category'),
+                profile="competitor"
             )
             
             # 🆕 순위를 못 찾은 경우 재시도 로직 (스마트 재시도)
@@ -399,7 +466,8 @@ class MetricTrackerService:
                         store_name=store['store_name'],
                         coord_x=store.get('place_x'),
                         coord_y=store.get('place_y'),
-                        category=store.get('category')
+                        category=store.get('category'),
+                        profile="competitor"
                     )
                     
                     if rank_result.get('rank') is None:
@@ -522,70 +590,27 @@ class MetricTrackerService:
                 .eq('id', tracker_id)\
                 .execute()
             
+            # 주간/월간 롤업 갱신 (오늘이 속한 주/월만 재계산)
+            self.refresh_metric_rollups([tracker_id], today)
+            
             # 🆕 경쟁매장 데이터 저장 (search_results가 있으면)
+            # 검색 결과는 serp_snapshots에 1회만 저장되고 tracker는 참조 + 자기 순위만 저장
             search_results = rank_result.get('search_results', [])
             if search_results:
                 try:
-                    my_place_id = store['place_id']
-                    competitors_data = []
-                    for idx, s in enumerate(search_results, start=1):
-                        place_id = s.get('place_id', '')
-                        visitor_count = s.get('visitor_review_count', 0)
-                        if isinstance(visitor_count, str):
-                            visitor_count = int(visitor_count.replace(',', '')) if visitor_count else 0
-                        blog_count = s.get('blog_review_count', 0)
-                        if isinstance(blog_count, str):
-                            blog_count = int(blog_count.replace(',', '')) if blog_count else 0
-                        
-                        competitors_data.append({
-                            'rank': idx,
-                            'place_id': place_id,
-                            'name': s.get('name', ''),
-                            'category': s.get('category', ''),
-                            'address': s.get('address', ''),
-                            'road_address': s.get('road_address', ''),
-                            'rating': s.get('rating'),
-                            'visitor_review_count': visitor_count,
-                            'blog_review_count': blog_count,
-                            'thumbnail': s.get('thumbnail', ''),
-                            'is_my_store': (place_id == my_place_id)
-                        })
-                    
-                    total_count = rank_result.get('total_count', 0)
-                    if isinstance(total_count, str):
-                        total_count = int(total_count.replace(',', '')) if total_count else 0
-                    
-                    competitor_record = {
-                        'tracker_id': tracker_id,
-                        'keyword_id': tracker['keyword_id'],
-                        'store_id': tracker['store_id'],
-                        'keyword': keyword,
-                        'collection_date': today.isoformat(),
-                        'my_rank': rank_result.get('rank'),
-                        'total_count': total_count,
-                        'competitors_data': json.dumps(competitors_data, ensure_ascii=False),
-                        'collected_at': now_kst.isoformat()
-                    }
-                    
-                    # 오늘 데이터가 이미 있으면 업데이트, 없으면 삽입
-                    existing_comp = self.supabase.table('competitor_rankings')\
-                        .select('id')\
-                        .eq('tracker_id', tracker_id)\
-                        .eq('collection_date', today.isoformat())\
-                        .execute()
-                    
-                    if existing_comp.data and len(existing_comp.data) > 0:
-                        self.supabase.table('competitor_rankings')\
-                            .update(competitor_record)\
-                            .eq('tracker_id', tracker_id)\
-                            .eq('collection_date', today.isoformat())\
-                            .execute()
-                    else:
-                        self.supabase.table('competitor_rankings')\
-                            .insert(competitor_record)\
-                            .execute()
-                    
-                    logger.info(f"[Metrics Collect] 경쟁매장 데이터 저장 완료: {len(competitors_data)}개 매장")
+                    serp_snapshot_service.save_competitor_ranking(
+                        tracker_id=tracker_id,
+                        keyword_id=tracker['keyword_id'],
+                        store_id=tracker['store_id'],
+                        keyword=keyword,
+                        coord_x=store.get('place_x'),
+                        coord_y=store.get('place_y'),
+                        search_results=search_results,
+                        my_rank=rank_result.get('rank'),
+                        total_count=rank_result.get('total_count', 0),
+                        collected_at=now_kst
+                    )
+                    logger.info(f"[Metrics Collect] 경쟁매장 데이터 저장 완료: {len(search_results)}개 매장")
                 except Exception as comp_error:
                     # 경쟁매장 저장 실패해도 메인 수집은 성공으로 처리
                     logger.error(f"[Metrics Collect] 경쟁매장 데이터 저장 실패: {str(comp_error)}")
@@ -609,22 +634,237 @@ class MetricTrackerService:
             logger.error(f"[Metrics Collect] 오류: {str(e)}")
             raise Exception(f"지표 수집 실패: {str(e)}")
     
+    async def collect_metrics_batch(self, trackers: List[dict], concurrency: int = 10) -> Dict[str, dict]:
+        """
+        여러 tracker 지표 일괄 수집 (스케줄러 배치 모드)
+        
+        collect_metrics()를 tracker마다 순차 호출하면 tracker당 검색 1회 + DB 왕복 ~8회가 발생하므로:
+        1. 같은 검색(키워드 × 매장 좌표 × 쿼리 타입)을 공유하는 tracker를 그룹화
+        2. 그룹별 검색 1회를 제한된 동시성으로 실행
+        3. daily_metrics / last_collected_at / 경쟁매장 데이터를 일괄 저장
+        
+        Args:
+            trackers: get_all_active_trackers() 결과 (stores, keywords 조인 포함)
+            concurrency: 동시에 진행할 검색 그룹 수
+        
+        Returns:
+            {tracker_id: 저장된 지표 데이터} (수집/저장에 실패한 tracker는 제외)
+        """
+        from app.services.naver_rank_api_unofficial import rank_service_api_unofficial
+        
+        # 1️⃣ 검색 공유 그룹 구성
+        groups: Dict[tuple, List[dict]] = {}
+        for tracker in trackers:
+            store = tracker.get('stores') or {}
+            keyword = (tracker.get('keywords') or {}).get('keyword')
+            if not store.get('place_id') or not keyword:
+                logger.warning(f"[Metrics Batch] 매장/키워드 정보 없음, 건너뜀: {tracker.get('id')}")
+                continue
+            
+            group_key = (
+                keyword,
+                store.get('place_x') or None,
+                store.get('place_y') or None,
+                rank_service_api_unofficial._get_query_type(store.get('category'))
+            )
+            groups.setdefault(group_key, []).append(tracker)
+        
+        logger.info(f"[Metrics Batch] {len(trackers)}개 tracker → 검색 그룹 {len(groups)}개 (동시성 {concurrency})")
+        
+        # 2️⃣ 그룹별 검색 (제한된 동시성)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        rank_results: Dict[str, dict] = {}
+        
+        async def collect_group(group_key: tuple, group_trackers: List[dict]):
+            keyword, coord_x, coord_y, _ = group_key
+            category = group_trackers[0]['stores'].get('category')
+            
+            async with semaphore:
+                try:
+                    by_place = await rank_service_api_unofficial.check_rank_for_targets(
+                        keyword=keyword,
+                        targets=[
+                            {'place_id': t['stores']['place_id'], 'store_name': t['stores'].get('store_name')}
+                            for t in group_trackers
+                        ],
+                        coord_x=coord_x,
+                        coord_y=coord_y,
+                        category=category,
+                        profile="competitor"
+                    )
+                except Exception as e:
+                    logger.error(f"[Metrics Batch] 검색 그룹 실패: keyword={keyword} - {str(e)}")
+                    return
+                
+                for tracker in group_trackers:
+                    store = tracker['stores']
+                    rank_result = by_place.get(store['place_id'])
+                    if rank_result is None:
+                        continue
+                    
+                    # collect_metrics와 동일한 스마트 재시도 (300위 밖 확정이면 생략)
+                    if rank_result.get('rank') is None and (
+                        rank_result.get('found', False) or not rank_result.get('total_results', 0)
+                    ):
+                        logger.info(f"[Metrics Batch] 🔄 5초 후 재시도: tracker={tracker['id']}, keyword={keyword}")
+                        await asyncio.sleep(5)
+                        try:
+                            rank_result = await rank_service_api_unofficial.check_rank(
+                                keyword=keyword,
+                                target_place_id=store['place_id'],
+                                store_name=store.get('store_name'),
+                                coord_x=coord_x,
+                                coord_y=coord_y,
+                                category=store.get('category'),
+                                profile="competitor"
+                            )
+                        except Exception as e:
+                            logger.error(f"[Metrics Batch] 재시도 실패: tracker={tracker['id']} - {str(e)}")
+                    
+                    rank_results[tracker['id']] = rank_result
+        
+        await asyncio.gather(*(
+            collect_group(group_key, group_trackers)
+            for group_key, group_trackers in groups.items()
+        ))
+        
+        if not rank_results:
+            return {}
+        
+        # 3️⃣ 일괄 저장
+        now_kst = datetime.now(KST)
+        today = now_kst.date()
+        yesterday = today - timedelta(days=1)
+        tracker_map = {t['id']: t for t in trackers}
+        tracker_ids = list(rank_results.keys())
+        
+        # 오늘/전일 지표 일괄 조회 (리뷰수 0 방어 + 순위 변동 계산)
+        recent_metrics: Dict[tuple, dict] = {}
+        for ids in chunked(tracker_ids, IN_FILTER_CHUNK_SIZE):
+            recent_result = self.supabase.table('daily_metrics')\
+                .select('tracker_id, collection_date, rank, visitor_review_count, blog_review_count')\
+                .in_('tracker_id', ids)\
+                .in_('collection_date', [yesterday.isoformat(), today.isoformat()])\
+                .execute()
+            for row in recent_result.data or []:
+                recent_metrics[(row['tracker_id'], row['collection_date'])] = row
+        
+        metric_rows = []
+        for tracker_id, rank_result in rank_results.items():
+            tracker = tracker_map[tracker_id]
+            today_metric = recent_metrics.get((tracker_id, today.isoformat()))
+            prev_metric = recent_metrics.get((tracker_id, yesterday.isoformat()))
+            
+            new_visitor = rank_result.get('visitor_review_count', 0)
+            new_blog = rank_result.get('blog_review_count', 0)
+            
+            # 리뷰수 0 방어 로직: 오늘 → 전일 순으로 이전 정상 값 보존
+            if new_visitor == 0 and new_blog == 0:
+                fallback = today_metric or prev_metric or {}
+                prev_visitor = fallback.get('visitor_review_count') or 0
+                prev_blog = fallback.get('blog_review_count') or 0
+                if prev_visitor > 0 or prev_blog > 0:
+                    logger.warning(
+                        f"[Metrics Batch] 리뷰수 0 방어 발동: {tracker_id} - "
+                        f"이전 값(visitor={prev_visitor}, blog={prev_blog}) 유지"
+                    )
+                    new_visitor = prev_visitor
+                    new_blog = prev_blog
+            
+            rank = rank_result.get('rank')
+            previous_rank = None
+            rank_change = None
+            if prev_metric and prev_metric.get('rank') and rank:
+                previous_rank = prev_metric['rank']
+                rank_change = prev_metric['rank'] - rank
+            
+            metric_rows.append({
+                'tracker_id': tracker_id,
+                'keyword_id': tracker['keyword_id'],
+                'store_id': tracker['store_id'],
+                'collection_date': today.isoformat(),
+                'rank': rank,
+                'visitor_review_count': new_visitor,
+                'blog_review_count': new_blog,
+                'previous_rank': previous_rank,
+                'rank_change': rank_change,
+                'collected_at': now_kst.isoformat()
+            })
+        
+        # daily_metrics 일괄 upsert (UNIQUE(tracker_id, collection_date))
+        saved: Dict[str, dict] = {}
+        for rows in chunked(metric_rows, BULK_WRITE_CHUNK_SIZE):
+            try:
+                self.supabase.table('daily_metrics')\
+                    .upsert(rows, on_conflict='tracker_id,collection_date')\
+                    .execute()
+                for row in rows:
+                    saved[row['tracker_id']] = row
+            except Exception as e:
+                logger.error(f"[Metrics Batch] daily_metrics 일괄 저장 실패 ({len(rows)}개): {str(e)}")
+        
+        # last_collected_at 일괄 업데이트
+        for ids in chunked(list(saved.keys()), IN_FILTER_CHUNK_SIZE):
+            try:
+                self.supabase.table('metric_trackers')\
+                    .update({'last_collected_at': now_kst.isoformat()})\
+                    .in_('id', ids)\
+                    .execute()
+            except Exception as e:
+                logger.error(f"[Metrics Batch] last_collected_at 업데이트 실패: {str(e)}")
+        
+        # 주간/월간 롤업 일괄 갱신
+        for ids in chunked(list(saved.keys()), IN_FILTER_CHUNK_SIZE):
+            self.refresh_metric_rollups(ids, today)
+        
+        # 경쟁매장 데이터 일괄 저장 (같은 그룹은 스냅샷 1개 공유)
+        try:
+            competitor_entries = []
+            for tracker_id in saved:
+                rank_result = rank_results[tracker_id]
+                if not rank_result.get('search_results'):
+                    continue
+                tracker = tracker_map[tracker_id]
+                competitor_entries.append({
+                    'tracker_id': tracker_id,
+                    'keyword_id': tracker['keyword_id'],
+                    'store_id': tracker['store_id'],
+                    'keyword': tracker['keywords']['keyword'],
+                    'coord_x': tracker['stores'].get('place_x'),
+                    'coord_y': tracker['stores'].get('place_y'),
+                    'search_results': rank_result['search_results'],
+                    'my_rank': rank_result.get('rank'),
+                    'total_count': rank_result.get('total_count', 0),
+                })
+            serp_snapshot_service.save_competitor_rankings_bulk(competitor_entries, now_kst)
+        except Exception as comp_error:
+            # 경쟁매장 저장 실패해도 메인 수집은 성공으로 처리
+            logger.error(f"[Metrics Batch] 경쟁매장 데이터 저장 실패: {str(comp_error)}")
+        
+        logger.info(
+            f"[Metrics Batch] 완료: 검색 {len(rank_results)}/{len(trackers)}개, "
+            f"저장 {len(saved)}개"
+        )
+        return saved
+    
     def get_daily_metrics(
         self, 
         tracker_id: str, 
         start_date: Optional[date] = None, 
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        resolution: str = 'daily'
     ) -> List[dict]:
         """
-        특정 tracker의 일별 지표 조회
+        특정 tracker의 지표 이력 조회
         
         Args:
             tracker_id: 추적 설정 ID
             start_date: 시작 날짜
             end_date: 종료 날짜
+            resolution: daily / weekly / monthly / auto (기간 길이에 따라 선택)
         
         Returns:
-            일별 지표 목록
+            지표 목록 (weekly/monthly는 기간 시작일 기준 롤업 행)
         """
         try:
             # 기본값: 최근 30일
@@ -633,6 +873,10 @@ class MetricTrackerService:
             if not start_date:
                 start_date = end_date - timedelta(days=30)
             
+            resolution = resolve_metric_resolution(start_date, end_date, resolution)
+            if resolution != 'daily':
+                return self._get_metric_rollups(tracker_id, start_date, end_date, resolution)
+            
             result = self.supabase.table('daily_metrics')\
                 .select('*, keywords(keyword), stores(store_name)')\
                 .eq('tracker_id', tracker_id)\
@@ -646,6 +890,79 @@ class MetricTrackerService:
             logger.error(f"[Daily Metrics Get] 오류: {str(e)}")
             return []
     
+    def _get_metric_rollups(
+        self,
+        tracker_id: str,
+        start_date: date,
+        end_date: date,
+        resolution: str
+    ) -> List[dict]:
+        """
+        주간/월간 롤업 조회 (daily_metrics 행과 같은 키로 변환)
+        
+        - collection_date: 기간 시작일
+        - rank: 기간 평균 순위 (반올림), min_rank / max_rank / avg_rank 별도 제공
+        - 리뷰 수: 기간 마지막 값, 증감은 visitor_review_delta / blog_review_delta
+        """
+        # 시작일이 속한 기간도 포함되도록 기간 시작일 기준으로 보정
+        if resolution == 'weekly':
+            period_floor = start_date - timedelta(days=start_date.weekday())
+        else:
+            period_floor = start_date.replace(day=1)
+        
+        result = self.supabase.table('daily_metric_rollups')\
+            .select('*, keywords(keyword), stores(store_name)')\
+            .eq('tracker_id', tracker_id)\
+            .eq('resolution', resolution)\
+            .gte('period_start', period_floor.isoformat())\
+            .lte('period_start', end_date.isoformat())\
+            .order('period_start', desc=True)\
+            .execute()
+        
+        metrics = []
+        for rollup in (result.data or []):
+            avg_rank = rollup.get('avg_rank')
+            metrics.append({
+                'id': rollup['id'],
+                'tracker_id': rollup['tracker_id'],
+                'keyword_id': rollup['keyword_id'],
+                'store_id': rollup['store_id'],
+                'collection_date': rollup['period_start'],
+                'collected_at': rollup.get('updated_at'),
+                'rank': round(float(avg_rank)) if avg_rank is not None else None,
+                'visitor_review_count': rollup.get('last_visitor_review_count') or 0,
+                'blog_review_count': rollup.get('last_blog_review_count') or 0,
+                'rank_change': None,
+                'previous_rank': None,
+                'resolution': resolution,
+                'period_end': rollup.get('period_end'),
+                'sample_count': rollup.get('sample_count'),
+                'min_rank': rollup.get('min_rank'),
+                'max_rank': rollup.get('max_rank'),
+                'avg_rank': float(avg_rank) if avg_rank is not None else None,
+                'visitor_review_delta': rollup.get('visitor_review_delta'),
+                'blog_review_delta': rollup.get('blog_review_delta'),
+                'keywords': rollup.get('keywords'),
+                'stores': rollup.get('stores'),
+            })
+        return metrics
+    
+    def refresh_metric_rollups(self, tracker_ids: List[str], collection_date: date) -> None:
+        """
+        tracker들의 collection_date가 속한 주/월 롤업 재계산
+        
+        롤업 갱신 실패는 지표 수집 결과에 영향을 주지 않음 (다음 수집 시 재계산)
+        """
+        if not tracker_ids:
+            return
+        try:
+            self.supabase.rpc('refresh_daily_metric_rollups', {
+                'p_tracker_ids': [str(tracker_id) for tracker_id in tracker_ids],
+                'p_date': collection_date.isoformat()
+            }).execute()
+        except Exception as e:
+            logger.warning(f"[Metric Rollups] 롤업 갱신 실패 ({len(tracker_ids)}개): {str(e)}")
+    
     def get_latest_metric(self, tracker_id: str) -> Optional[dict]:
         """가장 최근 지표 조회"""
         try:
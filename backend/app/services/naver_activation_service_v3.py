@@ -6,10 +6,13 @@
 - 다른 기능과 0% 연관성
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 from datetime import datetime, timedelta, timezone
+from app.core.config import settings
+from app.core.tracing import traced
 
 from app.services.naver_complete_diagnosis_service import complete_diagnosis_service
+from app.services.naver_dates import parse_dates
 from app.services.naver_review_service import naver_review_service
 from app.services.naver_additional_info_service import additional_info_service
 
@@ -27,7 +30,7 @@ class NaverActivationServiceV3:
             store_id: 매장 ID (Supabase stores 테이블)
             place_id: 네이버 플레이스 ID
             store_name: 매장명
-            
+        
         Returns:
             활성화 분석 결과
         """
@@ -138,11 +141,12 @@ class NaverActivationServiceV3:
             
             logger.info(f"[플레이스 활성화 V3-독립] 완료")
             return result
-            
+        
         except Exception as e:
             logger.error(f"[플레이스 활성화 V3-독립] 오류: {str(e)}", exc_info=True)
             raise
     
+    @traced("activation.visitor_review_trends")
     async def _calculate_visitor_review_trends_realtime(
         self, 
         place_id: str,
@@ -154,7 +158,7 @@ class NaverActivationServiceV3:
         Args:
             place_id: 네이버 플레이스 ID
             total_visitor_review_count: 전체 방문자 리뷰 수 (API 실패 시 추정용)
-            
+        
         Returns:
             리뷰 추이 정보 (7일, 30일, 60일 일평균)
         """
@@ -220,14 +224,15 @@ class NaverActivationServiceV3:
             count_30d = 0
             count_60d = 0
             
-            for review in all_reviews:
+            # 날짜 파싱 (ISO 형식, "1.27.금" / "24.12.31.화", 상대적 표기 - 페이지 전체를 같은 기준 시각으로)
+            review_dates = parse_dates((review.get("created") for review in all_reviews), tz=timezone.utc, reference=now)
+            
+            for review, review_date in zip(all_reviews, review_dates):
                 created_str = review.get("created")
                 if not created_str:
                     continue
                 
                 try:
-                    # 날짜 파싱 (ISO 형식 또는 상대적 표기)
-                    review_date = self._parse_review_date(created_str)
                     if not review_date:
                         continue
                     
@@ -267,7 +272,7 @@ class NaverActivationServiceV3:
                 'last_60days_avg': round(avg_60d, 2),
                 'comparisons': comparisons
             }
-            
+        
         except Exception as e:
             logger.error(f"[활성화-실시간] 방문자 리뷰 추이 계산 실패: {str(e)}", exc_info=True)
             return self._get_empty_trend()
@@ -278,7 +283,7 @@ class NaverActivationServiceV3:
         
         Args:
             total_visitor_count: 전체 방문자 리뷰 수
-            
+        
         Returns:
             리뷰 추이 정보 (추정값)
         """
@@ -304,6 +309,7 @@ class NaverActivationServiceV3:
             }
         }
     
+    @traced("activation.blog_review_trends")
     async def _calculate_blog_review_trends_realtime(
         self, 
         place_id: str,
@@ -319,7 +325,7 @@ class NaverActivationServiceV3:
             store_name: 매장명 (검색 쿼리 및 필터링용)
             road_address: 도로명주소 (필터링용)
             total_blog_review_count: 전체 블로그 리뷰 수 (API 실패 시 추정용)
-            
+        
         Returns:
             리뷰 추이 정보 (7일, 30일, 60일 일평균)
         """
@@ -330,7 +336,8 @@ class NaverActivationServiceV3:
                 place_id=place_id,
                 store_name=store_name,
                 road_address=road_address,
-                max_pages=10  # 사용 안 함 (호환성)
+                max_pages=10,  # 사용 안 함 (호환성)
+                verify_place=settings.BLOG_VERIFY_PLACE_ATTACHMENT  # 다른 매장 지도만 첨부된 포스트 제외 (설정 시)
             )
             
             if not all_reviews:
@@ -387,16 +394,17 @@ class NaverActivationServiceV3:
                 title = review.get("title", "N/A")[:50]
                 logger.info(f"[블로그 리뷰 #{idx+1}] 날짜: {date_str}, 원본: {date_string}, 제목: {title}")
             
-            for review in all_reviews:
+            # ISO 형식 날짜 파싱 (timezone 없으면 UTC)
+            review_dates = parse_dates((review.get("date") for review in all_reviews), tz=timezone.utc, reference=now)
+            
+            for review, review_date in zip(all_reviews, review_dates):
                 date_str = review.get("date")  # ISO 형식 문자열
                 if not date_str:
                     continue
                 
                 try:
-                    # ISO 형식 날짜 파싱
-                    review_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    if review_date.tzinfo is None:
-                        review_date = review_date.replace(tzinfo=timezone.utc)
+                    if not review_date:
+                        raise ValueError("ISO 형식 아님")
                     
                     days_ago = (now - review_date).days
                     
@@ -434,74 +442,18 @@ class NaverActivationServiceV3:
                 'last_60days_avg': round(avg_60d, 2),
                 'comparisons': comparisons
             }
-            
+        
         except Exception as e:
             logger.error(f"[활성화-블로그 HTML] 블로그 리뷰 추이 계산 실패: {str(e)}", exc_info=True)
             return self._calculate_blog_review_trends_estimated(total_blog_review_count)
     
-    def _parse_blog_review_date(self, date_str: str) -> Optional[datetime]:
-        """
-        블로그 리뷰 날짜 파싱
-        
-        지원 형식:
-        - "2025.09.30."
-        - "25.9.30.화"
-        - "14시간 전", "3일 전"
-        """
-        try:
-            date_str = date_str.strip()
-            
-            # "2025.09.30." 형식
-            if date_str.count('.') >= 2:
-                parts = date_str.replace('.', '').split()
-                if parts:
-                    date_only = parts[0]
-                    # "20250930" 또는 "250930" 형식
-                    if len(date_only) == 8:  # "20250930"
-                        year = int(date_only[:4])
-                        month = int(date_only[4:6])
-                        day = int(date_only[6:8])
-                    elif len(date_only) == 6:  # "250930"
-                        year = 2000 + int(date_only[:2])
-                        month = int(date_only[2:4])
-                        day = int(date_only[4:6])
-                    else:
-                        # "2025.9.30" 형식
-                        date_parts = date_str.split('.')
-                        if len(date_parts) >= 3:
-                            year = int(date_parts[0])
-                            if year < 100:
-                                year = 2000 + year
-                            month = int(date_parts[1])
-                            day = int(date_parts[2])
-                        else:
-                            return None
-                    
-                    return datetime(year, month, day, tzinfo=timezone.utc)
-            
-            # "X일 전", "X시간 전" 형식
-            if "일 전" in date_str:
-                days = int(date_str.split("일")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(days=days)
-            elif "시간 전" in date_str:
-                hours = int(date_str.split("시간")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(hours=hours)
-            elif "분 전" in date_str:
-                minutes = int(date_str.split("분")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            
-        except Exception as e:
-            logger.debug(f"[활성화-블로그 날짜파싱] 실패: {date_str}, {str(e)}")
-        
-        return None
-    
     def _calculate_blog_review_trends_estimated(self, total_blog_count: int) -> Dict[str, Any]:
         """
         블로그 리뷰 추정 (네이버 API 미지원으로 추정값 사용)
         
         Args:
             total_blog_count: 전체 블로그 리뷰 수
-            
+        
         Returns:
             리뷰 추이 정보 (추정값)
         """
@@ -527,13 +479,14 @@ class NaverActivationServiceV3:
             }
         }
     
+    @traced("activation.pending_replies")
     async def _get_pending_reply_count(self, place_id: str) -> Dict[str, Any]:
         """
         답글 대기 중인 리뷰 수 계산 (최근 300개 기준)
         
         Args:
             place_id: 네이버 플레이스 ID
-            
+        
         Returns:
             답글 정보 (대기 수, 답글률, 가장 오래된 날짜)
         """
@@ -610,7 +563,7 @@ class NaverActivationServiceV3:
                 "reply_rate": round(reply_rate, 1),
                 "oldest_pending_date": oldest_pending_date
             }
-            
+        
         except Exception as e:
             logger.error(f"[활성화-답글] 계산 실패: {str(e)}", exc_info=True)
             return {
@@ -621,13 +574,14 @@ class NaverActivationServiceV3:
                 "oldest_pending_date": None
             }
     
+    @traced("activation.announcements")
     async def _analyze_announcements(self, place_id: str) -> Dict[str, Any]:
         """
         공지사항 분석 (최근 7일 내)
         
         Args:
             place_id: 네이버 플레이스 ID
-            
+        
         Returns:
             공지사항 정보 (개수, 마지막 날짜, 내용 리스트)
         """
@@ -671,7 +625,7 @@ class NaverActivationServiceV3:
                 "days_since_last": latest_days,
                 "items": recent_items
             }
-            
+        
         except Exception as e:
             logger.error(f"[활성화-공지] 분석 실패: {str(e)}", exc_info=True)
             return {"count": 0, "last_date": None, "days_since_last": 999, "items": []}
@@ -800,62 +754,6 @@ class NaverActivationServiceV3:
         else:
             return "down"
     
-    def _parse_review_date(self, date_str: str) -> Optional[datetime]:
-        """
-        리뷰 날짜 파싱 (ISO 형식 또는 상대적 표기)
-        
-        Args:
-            date_str: 날짜 문자열 (예: "2024-01-27T10:30:00+09:00" 또는 "1.27.전" 또는 "1.23.금")
-            
-        Returns:
-            datetime 객체 또는 None
-        """
-        try:
-            # 1. ISO 형식 시도
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except:
-            pass
-        
-        try:
-            # 2. 상대적 날짜 표기 파싱 (예: "1.27.전", "1.23.금")
-            import re
-            from datetime import timedelta
-            
-            # "M.D.전" 또는 "M.D.요일" 형식
-            match = re.match(r'(\d+)\.(\d+)\.', date_str)
-            if match:
-                month = int(match.group(1))
-                day = int(match.group(2))
-                current_date = datetime.now(timezone.utc)
-                
-                # 올해 날짜로 생성
-                try:
-                    review_date = datetime(current_date.year, month, day, tzinfo=timezone.utc)
-                    
-                    # 미래 날짜면 작년으로 조정
-                    if review_date > current_date:
-                        review_date = datetime(current_date.year - 1, month, day, tzinfo=timezone.utc)
-                    
-                    return review_date
-                except ValueError:
-                    pass
-            
-            # "X일 전", "X시간 전" 형식
-            if "일 전" in date_str:
-                days = int(date_str.split("일")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(days=days)
-            elif "시간 전" in date_str:
-                hours = int(date_str.split("시간")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(hours=hours)
-            elif "분 전" in date_str:
-                minutes = int(date_str.split("분")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            
-        except Exception as e:
-            logger.debug(f"[활성화-날짜파싱] 실패: {date_str}, {str(e)}")
-        
-        return None
-    
     def _compare_values(self, current: float, baseline: float) -> Dict[str, Any]:
         """값 비교 분석"""
         if current == 0 and baseline == 0:
@@ -2,6 +2,7 @@
 import httpx
 import logging
 from typing import Dict, Any, List
+from app.core.metrics import observe_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -88,11 +89,13 @@ class NaverAdditionalInfoService:
             }
             
             async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=query,
-                    headers=self.headers
-                )
+                with observe_upstream("naver_graphql", query["operationName"], "direct") as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=query,
+                        headers=self.headers
+                    )
+                    obs.set_status(response.status_code)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -152,11 +155,13 @@ class NaverAdditionalInfoService:
             }
             
             async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=query,
-                    headers=self.headers
-                )
+                with observe_upstream("naver_graphql", query["operationName"], "direct") as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=query,
+                        headers=self.headers
+                    )
+                    obs.set_status(response.status_code)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -203,11 +208,13 @@ class NaverAdditionalInfoService:
             }
             
             async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=query,
-                    headers=self.headers
-                )
+                with observe_upstream("naver_graphql", query["operationName"], "direct") as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=query,
+                        headers=self.headers
+                    )
+                    obs.set_status(response.status_code)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -2,15 +2,19 @@
 네이버 인증 및 세션 관리
 쿠키 암호화 저장 및 브라우저 세션 주입
 """
+from __future__ import annotations
+
 from cryptography.fernet import Fernet
 import json
 import os
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, TYPE_CHECKING
 from dotenv import load_dotenv
-from playwright.async_api import BrowserContext, Page
 
 from app.core.database import get_supabase_client
 
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
 load_dotenv()
 
 # 암호화 키 로드 또는 생성
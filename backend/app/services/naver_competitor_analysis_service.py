@@ -10,11 +10,13 @@ from datetime import datetime, timedelta, timezone
 import asyncio
 import re
 
+from app.core.config import settings
 from .naver_search_api_unofficial import NaverPlaceNewAPIService
 from .naver_complete_diagnosis_service import complete_diagnosis_service
 from .naver_diagnosis_engine import diagnosis_engine
 from .llm_recommendation_service import llm_recommendation_service
 from .naver_keyword_search_volume_service import NaverKeywordSearchVolumeService
+from .naver_dates import parse_date, parse_dates
 from .naver_review_service import NaverReviewService
 
 logger = logging.getLogger(__name__)
@@ -38,7 +40,7 @@ class NaverCompetitorAnalysisService:
         Args:
             keyword: 검색 키워드
             limit: 가져올 매장 수 (기본 20개)
-            
+        
         Returns:
             상위 매장 목록 (기본 정보 포함)
         """
@@ -53,7 +55,7 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[경쟁분석] {len(top_stores)}개 매장 검색 완료")
             return top_stores
-            
+        
         except Exception as e:
             logger.error(f"[경쟁분석] 검색 실패: {str(e)}")
             raise
@@ -71,7 +73,7 @@ class NaverCompetitorAnalysisService:
             place_id: 네이버 플레이스 ID
             rank: 검색 순위
             store_name: 매장명 (선택, 제공하면 정확도 향상)
-            
+        
         Returns:
             매장 상세 정보 + 진단 결과
         """
@@ -197,7 +199,7 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[경쟁분석] 매장 {place_id} 분석 완료 (점수: {result['diagnosis_score']})")
             return result
-            
+        
         except Exception as e:
             import traceback
             logger.error(f"[경쟁분석] 매장 {place_id} 분석 실패: {str(e)}")
@@ -217,7 +219,7 @@ class NaverCompetitorAnalysisService:
             keyword: 검색 키워드
             limit: 분석할 매장 수
             callback: 진행 상황 콜백 함수 (optional)
-            
+        
         Returns:
             분석된 매장 목록
         """
@@ -288,7 +290,7 @@ class NaverCompetitorAnalysisService:
         Args:
             my_store_data: 우리 매장 분석 결과
             competitors: 경쟁매장 분석 결과 리스트
-            
+        
         Returns:
             비교 분석 결과
         """
@@ -442,27 +444,8 @@ class NaverCompetitorAnalysisService:
         return estimated_daily_avg * days
     
     def _parse_review_date(self, date_str: str) -> datetime:
-        """리뷰 날짜 파싱"""
-        try:
-            # None이나 빈 문자열 처리
-            if not date_str:
-                return datetime.min
-            
-            # "3일 전", "1주일 전" 등 파싱
-            if "일 전" in date_str:
-                days = int(date_str.split("일")[0].strip())
-                return datetime.now() - timedelta(days=days)
-            elif "주일 전" in date_str:
-                weeks = int(date_str.split("주일")[0].strip())
-                return datetime.now() - timedelta(weeks=weeks)
-            elif "개월 전" in date_str:
-                months = int(date_str.split("개월")[0].strip())
-                return datetime.now() - timedelta(days=months * 30)
-            else:
-                # 날짜 형식이면 파싱
-                return datetime.strptime(date_str, "%Y.%m.%d")
-        except:
-            return datetime.min
+        """리뷰 날짜 파싱 (naive, 실패 시 datetime.min)"""
+        return parse_date(date_str, tz=None) or datetime.min
     
     def _count_recent_announcements(
         self,
@@ -496,10 +479,10 @@ class NaverCompetitorAnalysisService:
         
         Args:
             store_name: 매장명
-            
+        
         Returns:
             검색량 (전체 검색량)
-            
+        
         로직:
         - 매장명의 띄어쓰기를 제거한 형태의 검색량만 조회
         - 예: "금금 광화문점" → "금금광화문점"의 검색량
@@ -551,7 +534,7 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[검색량] {store_name} 총 검색량: {total_volume:,}")
             return total_volume
-            
+        
         except Exception as e:
             logger.error(f"[검색량] 조회 실패 ({store_name}): {str(e)}")
             import traceback
@@ -731,7 +714,10 @@ class NaverCompetitorAnalysisService:
                 logger.info(f"[경쟁분석] 첫 번째 리뷰 필드: {list(first_review.keys())}")
                 logger.info(f"[경쟁분석] created={first_review.get('created')}, visited={first_review.get('visited')}")
             
-            for idx, review in enumerate(all_reviews):
+            # 방문자 리뷰 날짜 파싱 (활성화 서비스와 같은 naver_dates 파서, 페이지 전체를 같은 기준 시각으로)
+            review_dates = parse_dates((review.get("created") for review in all_reviews), tz=timezone.utc, reference=now)
+            
+            for idx, (review, review_date) in enumerate(zip(all_reviews, review_dates)):
                 created_str = review.get("created")
                 if not created_str:
                     if idx < 3:  # 처음 3개만 로깅
@@ -739,8 +725,6 @@ class NaverCompetitorAnalysisService:
                     continue
                 
                 try:
-                    # 방문자 리뷰 날짜 파싱 (활성화 서비스와 동일한 로직 사용)
-                    review_date = self._parse_visitor_review_date(created_str)
                     if not review_date:
                         if idx < 3:  # 처음 3개만 로깅
                             logger.warning(f"[경쟁분석] 리뷰 #{idx}: 날짜 파싱 실패 - {created_str}")
@@ -767,7 +751,7 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[경쟁분석] 방문자리뷰 7일: {count_7d}개 (전체 조회: {len(all_reviews)}개)")
             return float(count_7d)
-            
+        
         except Exception as e:
             logger.error(f"[경쟁분석] 방문자리뷰 계산 실패: {str(e)}")
             import traceback
@@ -801,7 +785,8 @@ class NaverCompetitorAnalysisService:
                 place_id=place_id,
                 store_name=store_name,
                 road_address=road_address,
-                max_pages=3  # 7일치는 보통 1-2페이지에 있음 (속도 최적화)
+                max_pages=3,  # 7일치는 보통 1-2페이지에 있음 (속도 최적화)
+                verify_place=settings.BLOG_VERIFY_PLACE_ATTACHMENT  # 다른 매장 지도만 첨부된 포스트 제외 (설정 시)
             )
             
             logger.info(f"[경쟁분석] 블로그 리뷰 HTML 파싱 결과: {len(all_reviews) if all_reviews else 0}개")
@@ -816,10 +801,11 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[경쟁분석] 블로그 리뷰 날짜 필터링 시작 - cutoff_date: {cutoff_date}")
             
-            for idx, review in enumerate(all_reviews):
-                date_str = review.get("dateString") or review.get("date", "")
+            date_strs = [review.get("dateString") or review.get("date", "") for review in all_reviews]
+            review_dates = parse_dates(date_strs, tz=None)
+            
+            for idx, (date_str, review_date) in enumerate(zip(date_strs, review_dates)):
                 if date_str:
-                    review_date = self._parse_blog_review_date(date_str)
                     if review_date:
                         days_ago = (datetime.now() - review_date).days
                         if idx < 3:  # 처음 3개만 로깅
@@ -833,152 +819,10 @@ class NaverCompetitorAnalysisService:
             
             logger.info(f"[경쟁분석] 블로그리뷰 7일: {recent_count}개 (전체: {len(all_reviews)}개)")
             return float(recent_count)
-            
+        
         except Exception as e:
             logger.error(f"[경쟁분석] 블로그 리뷰 계산 실패: {str(e)}")
             return 0.0
-    
-    def _parse_review_date_enhanced(self, date_str: str) -> Optional[datetime]:
-        """
-        방문자 리뷰 날짜 파싱 (다양한 형식 지원)
-        
-        지원 형식:
-        - ISO 8601: "2025-01-28T12:30:45" 또는 "2025-01-28"
-        - 한국어: "3일 전", "1주일 전", "2개월 전"
-        - 점 형식: "2025.01.28"
-        """
-        if not date_str:
-            return None
-        
-        try:
-            # ISO 8601 형식 (T 포함)
-            if "T" in date_str:
-                # "2025-01-28T12:30:45" 또는 "2025-01-28T12:30:45.123Z"
-                date_str_clean = date_str.split(".")[0].replace("Z", "")  # Z와 밀리초 제거
-                return datetime.fromisoformat(date_str_clean)
-            
-            # ISO 날짜만 (YYYY-MM-DD)
-            if "-" in date_str and len(date_str) >= 10:
-                return datetime.strptime(date_str[:10], "%Y-%m-%d")
-            
-            # "N일 전", "N주일 전", "N개월 전" 형식
-            if "전" in date_str:
-                if "시간" in date_str or "분" in date_str:
-                    return datetime.now()
-                elif "일" in date_str:
-                    days = int(re.search(r'\d+', date_str).group())
-                    return datetime.now() - timedelta(days=days)
-                elif "주" in date_str:
-                    weeks = int(re.search(r'\d+', date_str).group())
-                    return datetime.now() - timedelta(weeks=weeks)
-                elif "개월" in date_str:
-                    months = int(re.search(r'\d+', date_str).group())
-                    return datetime.now() - timedelta(days=months * 30)
-            
-            # "YYYY.MM.DD" 형식
-            if "." in date_str:
-                date_str_clean = date_str.replace(".", "").strip()
-                if len(date_str_clean) == 8:  # YYYYMMDD
-                    return datetime.strptime(date_str_clean, "%Y%m%d")
-                elif len(date_str_clean) == 6:  # YYMMDD
-                    return datetime.strptime(date_str_clean, "%y%m%d")
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"[경쟁분석] 날짜 파싱 실패: '{date_str}' - {str(e)}")
-            return None
-    
-    def _parse_visitor_review_date(self, date_str: str) -> Optional[datetime]:
-        """
-        방문자 리뷰 날짜 파싱 (활성화 서비스와 동일한 로직)
-        
-        Args:
-            date_str: 날짜 문자열 (예: "2024-01-27T10:30:00+09:00" 또는 "1.27.전" 또는 "1.23.금")
-            
-        Returns:
-            datetime 객체 또는 None
-        """
-        try:
-            # 1. ISO 형식 시도
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except:
-            pass
-        
-        try:
-            # 2. 상대적 날짜 표기 파싱 (예: "1.27.전", "1.23.금")
-            # "M.D.전" 또는 "M.D.요일" 형식
-            match = re.match(r'(\d+)\.(\d+)\.', date_str)
-            if match:
-                month = int(match.group(1))
-                day = int(match.group(2))
-                current_date = datetime.now(timezone.utc)
-                
-                # 올해 날짜로 생성
-                try:
-                    review_date = datetime(current_date.year, month, day, tzinfo=timezone.utc)
-                    
-                    # 미래 날짜면 작년으로 조정
-                    if review_date > current_date:
-                        review_date = datetime(current_date.year - 1, month, day, tzinfo=timezone.utc)
-                    
-                    return review_date
-                except ValueError:
-                    pass
-            
-            # "X일 전", "X시간 전" 형식
-            if "일 전" in date_str:
-                days = int(date_str.split("일")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(days=days)
-            elif "시간 전" in date_str:
-                hours = int(date_str.split("시간")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(hours=hours)
-            elif "분 전" in date_str:
-                minutes = int(date_str.split("분")[0].strip())
-                return datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            
-        except Exception as e:
-            logger.debug(f"[경쟁분석] 방문자 리뷰 날짜 파싱 실패: {date_str}, {str(e)}")
-        
-        return None
-    
-    def _parse_blog_review_date(self, date_str: str) -> Optional[datetime]:
-        """
-        블로그 리뷰 날짜 파싱
-        
-        지원 형식:
-        - "2025.09.30."
-        - "25.9.30."
-        - "14시간 전", "3일 전"
-        """
-        if not date_str:
-            return None
-        
-        try:
-            # "N일 전", "N주 전", "N시간 전" 형식
-            if "전" in date_str:
-                if "시간" in date_str or "분" in date_str:
-                    # 시간/분 전 -> 오늘
-                    return datetime.now()
-                elif "일" in date_str:
-                    days = int(re.search(r'\d+', date_str).group())
-                    return datetime.now() - timedelta(days=days)
-                elif "주" in date_str:
-                    weeks = int(re.search(r'\d+', date_str).group())
-                    return datetime.now() - timedelta(weeks=weeks)
-            
-            # "YYYY.MM.DD." 또는 "YY.MM.DD." 형식
-            date_str_clean = date_str.replace(".", "").strip()
-            if len(date_str_clean) == 6:  # YYMMDD
-                return datetime.strptime(date_str_clean, "%y%m%d")
-            elif len(date_str_clean) == 8:  # YYYYMMDD
-                return datetime.strptime(date_str_clean, "%Y%m%d")
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"[경쟁분석] 날짜 파싱 실패: {date_str} - {str(e)}")
-            return None
 
 
 # 싱글톤 인스턴스
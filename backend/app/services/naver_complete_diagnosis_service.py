@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from typing import Dict, Any
+from app.core.tracing import traced
 from app.services.naver_search_api_unofficial import search_service_api_unofficial
 from app.services.naver_review_service import naver_review_service
 from app.services.naver_html_parser_service import html_parser_service
@@ -13,6 +14,7 @@ logger = logging.getLogger(__name__)
 class NaverCompleteDiagnosisService:
     """네이버 플레이스 완전 진단 서비스"""
     
+    @traced("diagnosis.diagnose_place")
     async def diagnose_place(self, place_id: str, store_name: str = None) -> Dict[str, Any]:
         """플레이스 완전 진단 실행
         
@@ -2,16 +2,20 @@
 네이버 플레이스 크롤러
 네트워크 인터셉션을 통한 리뷰 데이터 수집
 """
+from __future__ import annotations
+
 import asyncio
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime
-from playwright.async_api import Page, Response, BrowserContext
 
 from app.core.browser import get_browser_manager
 from app.core.database import get_supabase_client
 from app.services.naver_auth import inject_naver_session
 
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Response, BrowserContext
+
 
 class NaverCrawler:
     """네이버 플레이스 데이터 크롤러"""
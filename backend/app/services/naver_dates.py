@@ -0,0 +1,155 @@
+"""
+네이버 날짜 문자열 파싱 (방문자 리뷰 / 블로그 리뷰 / 블로그 검색 결과)
+
+지원 형식 (앞뒤 공백 무시):
+- "1.10.금", "1.27.전": M.D (연도 없음 → 기준일보다 미래면 작년)
+- "24.12.31.화", "25.9.30.": YY.M.D (20YY년)
+- "2025.09.30.", "2025.9.30": YYYY.M.D
+- "3일 전", "2주 전", "1주일 전", "14시간 전", "5분 전", "2개월 전"(30일 단위): 기준 시각에서 뺀 시각
+- ISO 8601: "2025-01-28", "2025-01-28T12:30:45.123Z", "2025-01-28T12:30:45+09:00"
+
+결과 시간대 (tz):
+- KST(기본) / timezone.utc: aware datetime, 날짜만 있는 형식은 해당 시간대 자정, ISO는 tz로 변환
+  (오프셋 없는 ISO는 tz 시각으로 간주)
+- None: naive datetime (날짜 형식은 자정, ISO는 KST 벽시계 시각 - 오프셋 없으면 적힌 그대로, 상대 표기는 datetime.now() 기준)
+
+문자열 해석은 (문자열, tz, 기준 날짜) 단위로 LRU 캐시 - 상대 표기는 기준 시각과의 차이만 캐시하므로
+같은 날 같은 문자열("3일 전", "1.10.금")은 페이지 / 요청이 달라도 다시 해석하지 않습니다.
+
+- parse_date(text, tz, reference) / parse_dates(texts, tz, reference): 한 페이지를 같은 기준 시각으로 파싱
+- visit_date_str / visit_date_strs: 방문자 리뷰의 방문일 "YYYY-MM-DD" (visited 실패 시 리뷰 ID)
+
+벤치마크 / 기존 파서와 결과 비교: python -m benchmarks.date_parsing
+"""
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+KST = timezone(timedelta(hours=9), "KST")
+
+# (문자열, tz, 기준 날짜) 해석 결과 캐시 크기
+DATE_CACHE_SIZE = 4096
+
+_RELATIVE_PATTERN = re.compile(r'(\d+)\s*(분|시간|주일|일|주|개월)\s*전')
+_YMD_PATTERN = re.compile(r'^(\d{4}|\d{2})\.\s*(\d{1,2})\.\s*(\d{1,2})(?!\d)')
+_MD_PATTERN = re.compile(r'^(\d{1,2})\.(\d{1,2})(?:\.|$)')
+_ISO_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+_RELATIVE_UNITS = {
+    "분": timedelta(minutes=1),
+    "시간": timedelta(hours=1),
+    "일": timedelta(days=1),
+    "주": timedelta(weeks=1),
+    "주일": timedelta(weeks=1),
+    "개월": timedelta(days=30),
+}
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _interpret(text: str, tz: Optional[tzinfo], reference_date: date) -> Union[datetime, timedelta, None]:
+    """절대 시각(datetime) 또는 기준 시각과의 차이(timedelta), 해석 불가면 None"""
+    try:
+        if _ISO_PATTERN.match(text):
+            parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+            if tz is None:
+                # naive 비교 기준(KST 벽시계)에 맞춤 - "...Z"와 "+09:00"이 같은 시각이 되도록
+                return parsed.astimezone(KST).replace(tzinfo=None) if parsed.tzinfo else parsed
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=tz)
+            return parsed.astimezone(tz)
+        
+        match = _RELATIVE_PATTERN.search(text)
+        if match:
+            return int(match.group(1)) * _RELATIVE_UNITS[match.group(2)]
+        
+        match = _YMD_PATTERN.match(text)
+        if match:
+            year, month, day = (int(group) for group in match.groups())
+            if year < 100:
+                year += 2000
+            return datetime(year, month, day, tzinfo=tz)
+        
+        match = _MD_PATTERN.match(text)
+        if match:
+            month, day = int(match.group(1)), int(match.group(2))
+            candidate = date(reference_date.year, month, day)
+            # 미래 날짜라면 작년
+            if candidate > reference_date:
+                candidate = date(reference_date.year - 1, month, day)
+            return datetime(candidate.year, candidate.month, candidate.day, tzinfo=tz)
+    except (ValueError, OverflowError) as e:
+        logger.debug(f"[날짜 파싱] 실패: {text}, {e}")
+        return None
+    
+    logger.debug(f"[날짜 파싱] 알 수 없는 형식: {text}")
+    return None
+
+
+def _now(tz: Optional[tzinfo]) -> datetime:
+    return datetime.now(tz) if tz is not None else datetime.now()
+
+
+def parse_date(text: Optional[str], tz: Optional[tzinfo] = KST, reference: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    네이버 날짜 문자열 → datetime
+    
+    Args:
+        text: 날짜 문자열 (모듈 설명의 형식)
+        tz: 결과 시간대 (KST / timezone.utc / None=naive)
+        reference: 기준 시각 (상대 표기 / 연도 없는 날짜 기준, 기본: 현재 시각)
+    
+    Returns:
+        datetime 또는 None (빈 문자열 / 해석 불가)
+    """
+    if not text or not isinstance(text, str):
+        return None
+    text = text.strip()
+    if not text:
+        return None
+    if reference is None:
+        reference = _now(tz)
+    parsed = _interpret(text, tz, reference.date())
+    if isinstance(parsed, timedelta):
+        return reference - parsed
+    return parsed
+
+
+def parse_dates(
+    texts: Iterable[Optional[str]], tz: Optional[tzinfo] = KST, reference: Optional[datetime] = None
+) -> List[Optional[datetime]]:
+    """한 페이지의 날짜 문자열 일괄 파싱 (같은 기준 시각 사용)"""
+    if reference is None:
+        reference = _now(tz)
+    return [parse_date(text, tz, reference) for text in texts]
+
+
+def object_id_date_str(review_id: Optional[str]) -> Optional[str]:
+    """리뷰 ID(MongoDB ObjectId, 첫 8자 = Unix timestamp hex)의 작성일 "YYYY-MM-DD" (KST)"""
+    try:
+        timestamp = int(review_id[:8], 16)
+        return datetime.fromtimestamp(timestamp, tz=KST).strftime("%Y-%m-%d")
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def visit_date_str(
+    visited: Optional[str], review_id: Optional[str] = None, reference: Optional[datetime] = None
+) -> Optional[str]:
+    """방문자 리뷰 방문일 "YYYY-MM-DD" (visited "1.10.금" 등, 실패 시 리뷰 ID에서 추출)"""
+    parsed = parse_date(visited, KST, reference)
+    if parsed:
+        return parsed.strftime("%Y-%m-%d")
+    if review_id:
+        return object_id_date_str(str(review_id))
+    return None
+
+
+def visit_date_strs(items: Iterable[Dict[str, Any]], reference: Optional[datetime] = None) -> List[Optional[str]]:
+    """방문자 리뷰 한 페이지의 방문일 목록 (items 순서, visited → 리뷰 ID 순으로 추출)"""
+    if reference is None:
+        reference = _now(KST)
+    return [visit_date_str(item.get("visited"), item.get("id"), reference) for item in items]
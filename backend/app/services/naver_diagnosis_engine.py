@@ -5,6 +5,9 @@ import re
 import logging
 import hashlib
 
+from app.core.keyword_matcher import KeywordMatcher
+from app.core.tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +50,14 @@ class NaverPlaceDiagnosisEngine:
         "smart_call": "스마트콜",
     }
     
+    # 찾아오는길 디테일 항목별 키워드
+    DIRECTIONS_DETAIL_KEYWORDS = {
+        "exit_walk": ["번 출구", "도보", "분 거리"],
+        "landmark": ["건물", "앞", "옆", "근처", "맞은편"],
+        "parking": ["주차"],
+        "transport": ["버스", "지하철", "택시"],
+    }
+    
     def _is_food_cafe_category(self, category: str) -> bool:
         """식당, 카페, 베이커리 업종인지 판단"""
         if not category:
@@ -101,6 +112,7 @@ class NaverPlaceDiagnosisEngine:
         
         return variants[index]
     
+    @traced("diagnosis.evaluate")
     def diagnose(self, place_data: Dict[str, Any]) -> Dict[str, Any]:
         """플레이스 데이터를 진단하고 평가 결과 반환
         
@@ -1154,16 +1166,26 @@ class NaverPlaceDiagnosisEngine:
             si_match = re.findall(r'([가-힣]+시)', address)
             address_regions.extend([s.replace('시', '') for s in si_match])
         
-        # 소개글에 포함된 지역 키워드 카운트
+        category_keywords = category.split(",") if category else []
+        menu_names = [m.get("name", "") for m in menus[:5] if m.get("name")]
+        trust_keywords = ["좌석", "예약", "주차", "추천", "대표", "시그니처", "인기", "맛집"]
+        
+        # 지역/업종/메뉴/신뢰성 키워드를 하나의 매처로 컴파일 → 소개글 1회 스캔
         all_regions = regions + address_regions
+        matches = KeywordMatcher(
+            all_regions + [kw.strip() for kw in category_keywords] + menu_names + trust_keywords,
+            case_sensitive=True
+        ).count(description)
+        
+        # 소개글에 포함된 지역 키워드 카운트
         # 중복 제거 + 최소 2자 이상 필터링 (1자 키워드는 너무 모호함)
-        found_regions = list(set([r for r in all_regions if r in description and len(r) >= 2]))
+        found_regions = list(set([r for r in all_regions if matches.contains(r) and len(r) >= 2]))
         # 긴 것부터 정렬 (예: "성수동" > "성수")
         found_regions.sort(key=len, reverse=True)
         region_count = len(found_regions)
         
         # 주소에서 추출한 지역 중 소개글에 없는 것
-        missing_from_address = [r for r in address_regions if r not in description]
+        missing_from_address = [r for r in address_regions if not matches.contains(r)]
         
         if region_count > 0:
             keyword_score += 2
@@ -1172,8 +1194,7 @@ class NaverPlaceDiagnosisEngine:
             region_check = False
         
         # 업종 키워드 분석 (2점)
-        category_keywords = category.split(",") if category else []
-        category_count = sum(1 for kw in category_keywords if kw.strip() in description)
+        category_count = sum(1 for kw in category_keywords if matches.contains(kw.strip()))
         
         if category_count > 0:
             keyword_score += 2
@@ -1182,8 +1203,7 @@ class NaverPlaceDiagnosisEngine:
             category_check = False
         
         # 대표 메뉴 키워드 분석 (2점)
-        menu_names = [m.get("name", "") for m in menus[:5] if m.get("name")]
-        menu_count = sum(1 for menu in menu_names if menu in description)
+        menu_count = sum(1 for menu in menu_names if matches.contains(menu))
         
         if menu_count > 0:
             keyword_score += 2
@@ -1205,8 +1225,7 @@ class NaverPlaceDiagnosisEngine:
         }
         
         # 신뢰성/가독성 (최대 2점)
-        trust_keywords = ["좌석", "예약", "주차", "추천", "대표", "시그니처", "인기", "맛집"]
-        trust_score = min(sum(1 for kw in trust_keywords if kw in description) // 3, 2)
+        trust_score = min(sum(1 for kw in trust_keywords if matches.contains(kw)) // 3, 2)
         
         total_score = length_score + keyword_score + trust_score
         
@@ -1299,18 +1318,23 @@ class NaverPlaceDiagnosisEngine:
         # 길이/명확성 (최대 3점)
         length_score = 3 if length >= 200 else (1 if length >= 100 else 0)
         
+        category = data.get("category", "")
+        
+        # 디테일/업종 키워드를 하나의 매처로 컴파일 → 찾아오는길 1회 스캔
+        matches = KeywordMatcher(
+            [kw for kws in self.DIRECTIONS_DETAIL_KEYWORDS.values() for kw in kws] + [category],
+            case_sensitive=True
+        ).count(directions)
+        
         # 디테일 점수 (최대 4점) - 각 요소당 1점
         detail_checks = {
-            "exit_walk": any(kw in directions for kw in ["번 출구", "도보", "분 거리"]),
-            "landmark": any(kw in directions for kw in ["건물", "앞", "옆", "근처", "맞은편"]),
-            "parking": "주차" in directions,
-            "transport": any(kw in directions for kw in ["버스", "지하철", "택시"]),
+            name: any(matches.contains(kw) for kw in kws)
+            for name, kws in self.DIRECTIONS_DETAIL_KEYWORDS.items()
         }
         detail_score = sum(detail_checks.values())
         
         # 키워드 (최대 1점)
-        category = data.get("category", "")
-        keyword_score = 1 if category and category in directions else 0
+        keyword_score = 1 if category and matches.contains(category) else 0
         
         total_score = length_score + detail_score + keyword_score
         
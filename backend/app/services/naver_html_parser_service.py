@@ -4,10 +4,14 @@ import json
 import httpx
 import logging
 from typing import Dict, Any, Optional, List
-from bs4 import BeautifulSoup
+from app.core.html_parsing import parse_html, run_parser
+from app.core.metrics import observe_upstream
 
 logger = logging.getLogger(__name__)
 
+# "주문" 버튼 텍스트 (BeautifulSoup string=re.compile(r'^주문$')와 같은 조건)
+_ORDER_TEXT_PATTERN = re.compile(r'^주문$')
+
 
 class NaverHtmlParserService:
     """네이버 플레이스 HTML 파싱 서비스"""
@@ -26,7 +30,9 @@ class NaverHtmlParserService:
             url = f"https://m.place.naver.com/place/{place_id}/home"
             
             async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-                response = await client.get(url, headers=self.headers)
+                with observe_upstream("naver_html", "place_home", "direct") as obs:
+                    response = await client.get(url, headers=self.headers)
+                    obs.set_status(response.status_code)
                 
                 if response.status_code != 200:
                     logger.warning(f"[HTML Parser] HTTP {response.status_code} for place_id {place_id}")
@@ -35,10 +41,10 @@ class NaverHtmlParserService:
                 html_content = response.text
                 
                 # HTML에서 직접 정보 추출 (우선순위 높음)
-                html_data = self._parse_html_content(html_content)
+                html_data = await run_parser(self._parse_html_content, html_content)
                 
                 # window.__APOLLO_STATE__ 추출
-                apollo_state = self._extract_apollo_state(html_content)
+                apollo_state = await run_parser(self._extract_apollo_state, html_content)
                 
                 if apollo_state:
                     # PlaceDetailBase에서 정보 추출
@@ -58,9 +64,11 @@ class NaverHtmlParserService:
                 # 정보 탭에서 업체소개글 추출 시도
                 try:
                     info_url = f"https://m.place.naver.com/place/{place_id}/information"
-                    info_response = await client.get(info_url, headers=self.headers)
+                    with observe_upstream("naver_html", "place_information", "direct") as obs:
+                        info_response = await client.get(info_url, headers=self.headers)
+                        obs.set_status(info_response.status_code)
                     if info_response.status_code == 200:
-                        info_description = self._parse_description_from_info_page(info_response.text)
+                        info_description = await run_parser(self._parse_description_from_info_page, info_response.text)
                         if info_description:
                             place_data["description"] = info_description
                             logger.info(f"[HTML Parser] 업체소개글 추출 성공: {len(info_description)}자")
@@ -75,37 +83,37 @@ class NaverHtmlParserService:
             return {}
     
     def _parse_html_content(self, html: str) -> Dict[str, Any]:
-        """HTML 페이지에서 직접 정보 추출 (BeautifulSoup 사용)"""
+        """HTML 페이지에서 직접 정보 추출 (html_parsing 계층, run_parser로 스레드에서 호출)"""
         result = {}
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = parse_html(html)
             
             # 1. 전화번호 (class="xlx7Q")
-            phone_elem = soup.find('span', class_='xlx7Q')
+            phone_elem = doc.select_one('span.xlx7Q')
             if phone_elem:
-                result["phone_number"] = phone_elem.get_text(strip=True)
+                result["phone_number"] = phone_elem.text()
                 logger.info(f"[HTML Parser] 전화번호: {result['phone_number']}")
             
             # 2. 영업시간 및 영업상태
-            business_status_elem = soup.find('div', class_='A_cdD')
+            business_status_elem = doc.select_one('div.A_cdD')
             if business_status_elem:
-                status_text = business_status_elem.get_text(strip=True)
+                status_text = business_status_elem.text()
                 result["business_status_text"] = status_text
                 result["is_open"] = "영업 중" in status_text
                 logger.info(f"[HTML Parser] 영업 상태: {status_text}")
             
             # 3. 홈페이지 (class="CHmqa")
-            homepage_elem = soup.find('a', class_='CHmqa')
-            if homepage_elem and homepage_elem.get('href'):
-                result["homepage"] = homepage_elem.get('href')
+            homepage_elem = doc.select_one('a.CHmqa')
+            if homepage_elem and homepage_elem.attr('href'):
+                result["homepage"] = homepage_elem.attr('href')
                 logger.info(f"[HTML Parser] 홈페이지: {result['homepage']}")
             
             # 4. 블로그 및 인스타그램 (class="iBUwB")
-            social_links = soup.find_all('a', class_='iBUwB')
+            social_links = doc.select('a.iBUwB')
             for link in social_links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
+                href = link.attr('href', '')
+                text = link.text()
                 
                 if '블로그' in text and href:
                     result["blog"] = href
@@ -115,16 +123,16 @@ class NaverHtmlParserService:
                     logger.info(f"[HTML Parser] 인스타그램: {href}")
             
             # 5. TV 방송 정보 (class="UFXr9")
-            tv_elem = soup.find('div', class_='UFXr9')
+            tv_elem = doc.select_one('div.UFXr9')
             if tv_elem:
-                tv_text = tv_elem.get_text(strip=True)
+                tv_text = tv_elem.text()
                 result["tv_program"] = tv_text
                 logger.info(f"[HTML Parser] TV 방송: {tv_text}")
             
             # 6. 편의시설 (class="xPvPE")
-            convenience_elem = soup.find('div', class_='xPvPE')
+            convenience_elem = doc.select_one('div.xPvPE')
             if convenience_elem:
-                convenience_text = convenience_elem.get_text(strip=True)
+                convenience_text = convenience_elem.text()
                 result["conveniences_text"] = convenience_text
                 
                 # 리스트로 변환
@@ -141,16 +149,15 @@ class NaverHtmlParserService:
                 logger.info(f"[HTML Parser] 편의시설: {len(conveniences_list)}개")
             
             # 7. 업체소개글 (class="AX_W3 _6sPQ")
-            description_elem = soup.find('div', class_='AX_W3')
+            description_elem = doc.select_one('div.AX_W3')
             if description_elem:
-                description_text = description_elem.get_text(strip=True)
+                description_text = description_elem.text()
                 result["description"] = description_text
                 logger.info(f"[HTML Parser] 업체소개글: {len(description_text)}자")
             
             # 8. 플레이스 플러스 (class="jpqsT" - 플레이스 플러스 로고)
             try:
-                place_plus_elem = soup.find('span', class_='jpqsT')
-                if place_plus_elem:
+                if doc.select_one('span.jpqsT'):
                     result["is_place_plus"] = True
                     logger.info(f"[HTML Parser] 플레이스 플러스: True")
                 else:
@@ -162,13 +169,12 @@ class NaverHtmlParserService:
             # 9. 새로오픈 (class="PXMot S6RhH" - "새로오픈" 텍스트)
             # dAsGb 클래스 내부의 모든 PXMot 스팬 확인
             try:
-                badges_container = soup.find('div', class_='dAsGb')
+                badges_container = doc.select_one('div.dAsGb')
                 result["is_new_business"] = False
                 
                 if badges_container:
-                    badge_spans = badges_container.find_all('span', class_='PXMot')
-                    for span in badge_spans:
-                        span_text = span.get_text(strip=True)
+                    for span in badges_container.select('span.PXMot'):
+                        span_text = span.text()
                         if '새로오픈' in span_text or '새로 오픈' in span_text:
                             result["is_new_business"] = True
                             logger.info(f"[HTML Parser] 새로오픈: True")
@@ -182,20 +188,11 @@ class NaverHtmlParserService:
             
             # 10. 네이버톡톡 감지 (talk.naver.com 링크)
             try:
-                result["has_naver_talk"] = False
-                all_links = soup.find_all('a', href=True)
-                
-                for link in all_links:
-                    href = link.get('href', '')
-                    link_text = link.get_text(strip=True)
-                    
-                    # talk.naver.com 링크이거나 "문의" 버튼인 경우
-                    if 'talk.naver.com' in href:
-                        result["has_naver_talk"] = True
-                        logger.info(f"[HTML Parser] 네이버톡톡: True (링크: {href})")
-                        break
-                
-                if not result["has_naver_talk"]:
+                talk_link = doc.select_one('a[href*="talk.naver.com"]')
+                result["has_naver_talk"] = talk_link is not None
+                if talk_link:
+                    logger.info(f"[HTML Parser] 네이버톡톡: True (링크: {talk_link.attr('href')})")
+                else:
                     logger.info(f"[HTML Parser] 네이버톡톡: False")
             except Exception as e:
                 logger.warning(f"[HTML Parser] 네이버톡톡 파싱 실패: {str(e)}")
@@ -205,37 +202,28 @@ class NaverHtmlParserService:
             try:
                 result["has_naver_order"] = False
                 
-                # 1) 가장 확실한 패턴: m.booking.naver.com/order 직접 확인
-                all_links = soup.find_all('a', href=True)
-                for link in all_links:
-                    href = link.get('href', '')
-                    link_text = link.get_text(strip=True)
-                    
-                    # 최우선 패턴: booking.naver.com/order 또는 order.store.naver.com
-                    if 'booking.naver.com/order' in href or 'm.booking.naver.com/order' in href:
-                        result["has_naver_order"] = True
-                        logger.info(f"[HTML Parser] ✅ 네이버 주문: True (booking/order URL, 텍스트: '{link_text}')")
-                        break
-                    
-                    if 'order.store.naver.com' in href:
-                        result["has_naver_order"] = True
-                        logger.info(f"[HTML Parser] ✅ 네이버 주문: True (order.store URL, 텍스트: '{link_text}')")
-                        break
+                # 1) 가장 확실한 패턴: booking.naver.com/order (m.booking 포함) 또는 order.store.naver.com
+                order_link = doc.select_one('a[href*="booking.naver.com/order"], a[href*="order.store.naver.com"]')
+                if order_link:
+                    result["has_naver_order"] = True
+                    link_kind = "booking/order" if 'booking.naver.com/order' in order_link.attr('href', '') else "order.store"
+                    logger.info(f"[HTML Parser] ✅ 네이버 주문: True ({link_kind} URL, 텍스트: '{order_link.text()}')")
                 
                 # 2) booking.naver.com 링크는 제외 (예약과 주문을 구분하기 어려움)
                 # 1단계에서 /order 경로가 있는 경우만 감지하도록 함
                 
                 # 3) 역방향: "주문" 텍스트가 있는 요소에서 부모 링크 확인 (반드시 /order 경로 포함)
                 if not result["has_naver_order"]:
-                    order_texts = soup.find_all(['span', 'button'], string=re.compile(r'^주문$'))
-                    for text_elem in order_texts:
+                    for text_elem in doc.find_all(('span', 'button')):
+                        if not _ORDER_TEXT_PATTERN.search(text_elem.raw_text()):
+                            continue
                         # 부모 링크 찾기 (최대 5단계)
                         parent = text_elem.parent
                         for _ in range(5):
                             if not parent:
                                 break
-                            if parent.name == 'a' and parent.get('href'):
-                                href = parent.get('href', '')
+                            if parent.tag == 'a' and parent.attr('href'):
+                                href = parent.attr('href', '')
                                 # 반드시 naver.com + /order 또는 order.store 패턴이어야 함
                                 if 'naver.com' in href and ('/order' in href or 'order.store' in href or 'order/bizes' in href):
                                     result["has_naver_order"] = True
@@ -248,14 +236,12 @@ class NaverHtmlParserService:
                 # 4) 기타 명확한 주문 패턴만 확인
                 if not result["has_naver_order"]:
                     # 스마트스토어는 주문 기능이 명확함
-                    for link in all_links:
-                        href = link.get('href', '')
-                        link_text = link.get_text(strip=True)
-                        if 'smartstore.naver.com' in href:
-                            if any(keyword in link_text for keyword in ['주문', '구매', '장바구니']):
-                                result["has_naver_order"] = True
-                                logger.info(f"[HTML Parser] ✅ 네이버 주문: True (스마트스토어, 텍스트: '{link_text}')")
-                                break
+                    for link in doc.select('a[href*="smartstore.naver.com"]'):
+                        link_text = link.text()
+                        if any(keyword in link_text for keyword in ['주문', '구매', '장바구니']):
+                            result["has_naver_order"] = True
+                            logger.info(f"[HTML Parser] ✅ 네이버 주문: True (스마트스토어, 텍스트: '{link_text}')")
+                            break
                 
                 if not result["has_naver_order"]:
                     logger.info(f"[HTML Parser] ❌ 네이버 주문: False")
@@ -271,15 +257,14 @@ class NaverHtmlParserService:
             return result
     
     def _parse_description_from_info_page(self, html: str) -> Optional[str]:
-        """정보 탭 페이지에서 업체소개글 추출"""
+        """정보 탭 페이지에서 업체소개글 추출 (run_parser로 스레드에서 호출)"""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            doc = parse_html(html)
             
             # 업체소개글 (class="AX_W3 _6sPQ" 또는 "AX_W3")
-            description_elem = soup.find('div', class_='AX_W3')
+            description_elem = doc.select_one('div.AX_W3')
             if description_elem:
-                description_text = description_elem.get_text(strip=True)
-                return description_text
+                return description_elem.text()
             
             return None
             
@@ -11,6 +11,7 @@ import httpx
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.core.database import get_supabase_client
+from app.core.metrics import observe_upstream
 
 
 class NaverKeywordSearchVolumeService:
@@ -101,12 +102,14 @@ class NaverKeywordSearchVolumeService:
         
         try:
             # API 호출
-            response = requests.get(
-                f"{self.BASE_URL}{uri}",
-                headers=headers,
-                params=params,
-                timeout=30
-            )
+            with observe_upstream("naver_searchad", uri, "direct") as obs:
+                response = requests.get(
+                    f"{self.BASE_URL}{uri}",
+                    headers=headers,
+                    params=params,
+                    timeout=30
+                )
+                obs.set_status(response.status_code)
             
             print(f"[검색량 서비스] 응답 상태 코드: {response.status_code}")
             print(f"[검색량 서비스] 응답 내용: {response.text[:500]}")
@@ -185,11 +188,13 @@ class NaverKeywordSearchVolumeService:
         
         try:
             async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}{uri}",
-                    headers=headers,
-                    params=params
-                )
+                with observe_upstream("naver_searchad", uri, "direct") as obs:
+                    response = await client.get(
+                        f"{self.BASE_URL}{uri}",
+                        headers=headers,
+                        params=params
+                    )
+                    obs.set_status(response.status_code)
                 
                 print(f"[검색량 서비스 ASYNC] 응답 상태 코드: {response.status_code}")
                 
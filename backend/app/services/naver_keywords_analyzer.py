@@ -10,6 +10,7 @@ import json
 from typing import List, Dict, Optional, Any
 import asyncio
 from fastapi import HTTPException
+from app.core.metrics import observe_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +41,9 @@ class NaverKeywordsAnalyzerService:
             url = f"https://m.place.naver.com/place/{place_id}/home"
             
             async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, headers=self.base_headers)
+                with observe_upstream("naver_html", "place_home", "direct") as obs:
+                    response = await client.get(url, headers=self.base_headers)
+                    obs.set_status(response.status_code)
                 response.raise_for_status()
                 
                 html = response.text
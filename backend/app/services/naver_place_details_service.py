@@ -7,8 +7,8 @@ import httpx
 import json
 from typing import Dict, Optional, List, Any
 import re
-from bs4 import BeautifulSoup
-from app.core.proxy import get_proxy, report_proxy_success, report_proxy_failure
+from app.core.proxy import proxy_slot
+from app.core.metrics import connection_type, observe_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ class NaverPlaceDetailsService:
         }
         self.timeout = 20.0
         # 프록시는 요청 시점에 동적으로 가져옴 (상태 기반 자동 폴백)
-        
+    
     async def get_place_details_via_search(self, place_name: str, place_id: str) -> Dict[str, Any]:
         """
         신API 검색으로 플레이스 상세 정보 조회
@@ -38,7 +38,7 @@ class NaverPlaceDetailsService:
         Args:
             place_name: 매장명
             place_id: 네이버 플레이스 ID
-            
+        
         Returns:
             상세 정보 딕셔너리
         """
@@ -58,7 +58,7 @@ class NaverPlaceDetailsService:
             
             logger.warning(f"[플레이스 진단] 매칭 실패")
             return {}
-            
+        
         except Exception as e:
             logger.error(f"[플레이스 진단] 오류: {str(e)}")
             return {}
@@ -107,18 +107,17 @@ class NaverPlaceDetailsService:
         }
         
         try:
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.timeout}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=self.base_headers
-                )
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_graphql", payload["operationName"], connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=payload,
+                        headers=self.base_headers
+                    )
+                    obs.set_status(response.status_code)
                 response.raise_for_status()
                 data = response.json()
                 
@@ -152,7 +151,7 @@ class NaverPlaceDetailsService:
                 
                 logger.info(f"[기본 정보] 완료: {result.get('name')}")
                 return result
-                
+        
         except Exception as e:
             logger.error(f"[기본 정보] 오류: {str(e)}")
             import traceback
@@ -174,16 +173,15 @@ class NaverPlaceDetailsService:
         url = f"https://m.place.naver.com/place/{place_id}/home"
         
         try:
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.timeout, "follow_redirects": True}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.get(url, headers={
-                    "User-Agent": self.base_headers["User-Agent"]
-                })
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_html", "place_home", connection_type(proxy_url)) as obs:
+                    response = await client.get(url, headers={
+                        "User-Agent": self.base_headers["User-Agent"]
+                    })
+                    obs.set_status(response.status_code)
                 response.raise_for_status()
                 html = response.text
                 
@@ -237,7 +235,7 @@ class NaverPlaceDetailsService:
                 
                 logger.info(f"[HTML 파싱] 완료: {result.get('name')}")
                 return result
-                
+        
         except Exception as e:
             logger.error(f"[HTML 파싱] 오류: {str(e)}")
             import traceback
@@ -271,7 +269,7 @@ class NaverPlaceDetailsService:
             
             json_str = html[json_start:json_end]
             return json.loads(json_str)
-            
+        
         except Exception as e:
             logger.error(f"APOLLO_STATE 추출 오류: {str(e)}")
             return {}
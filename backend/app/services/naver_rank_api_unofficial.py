@@ -11,11 +11,21 @@ Naver Place Rank Service (신API 방식)
 1차: 프록시 경유 → 2차: 직접 연결 → 3차: Playwright 크롤링
 """
 import logging
+import time
 import httpx
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 import asyncio
-from app.core.proxy import get_proxy, report_proxy_success, report_proxy_failure
+from app.core.proxy import (
+    acquire_proxy,
+    release_proxy,
+    report_proxy_success,
+    report_proxy_failure,
+)
+from app.core.metrics import connection_type, observe_upstream
+from app.core.tracing import traced
+from app.services.serp_results import DEFAULT_PROFILE, SerpResults, profile_fields
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +98,7 @@ class NaverRankNewAPIService:
         
         return "restaurant"
     
+    @traced("rank.check_rank")
     async def check_rank(
         self, 
         keyword: str, 
@@ -96,7 +107,8 @@ class NaverRankNewAPIService:
         store_name: str = None,
         coord_x: str = None,
         coord_y: str = None,
-        category: str = None
+        category: str = None,
+        profile: str = DEFAULT_PROFILE
     ) -> Dict:
         """
         특정 키워드에서 매장의 순위 확인 (신API - 빠름!)
@@ -113,6 +125,8 @@ class NaverRankNewAPIService:
             coord_x: 경도 (매장 위치 기준 검색)
             coord_y: 위도 (매장 위치 기준 검색)
             category: 매장 카테고리 (쿼리 타입 결정에 사용)
+            profile: 검색 항목 필드 프로필 (rank-only / competitor / full, serp_results.FIELD_PROFILES)
+                rank-only면 search_results에는 place_id만 채워지고 리뷰수 보강 조회를 하지 않음
             
         Returns:
             {
@@ -120,7 +134,7 @@ class NaverRankNewAPIService:
                 'total_results': int (검색 결과 개수),
                 'total_count': str (전체 업체 수, 예: "1,234"),
                 'found': bool (매장 발견 여부),
-                'search_results': List[Dict] (순위 내 모든 매장 정보),
+                'search_results': SerpResults (순위 내 모든 매장 정보, API 응답에서는 as_dicts로 변환),
                 'target_store': Dict (타겟 매장의 상세 정보) - 리뷰수 포함,
                 'visitor_review_count': int (방문자 리뷰수),
                 'blog_review_count': int (블로그 리뷰수),
@@ -130,129 +144,29 @@ class NaverRankNewAPIService:
         # 🛡️ 2단계: 글로벌 네이버 API 레이트 리밋 (세마포어)
         from app.core.rate_limiter import naver_api_limiter
         
+        profile_fields(profile)  # 알 수 없는 프로필은 폴백 없이 바로 ValueError
         await naver_api_limiter.acquire()
         query_type = self._get_query_type(category)
-        logger.info(f"[신API Rank] 순위 체크 시작: keyword={keyword}, place_id={target_place_id}, store_name={store_name}, x={coord_x}, y={coord_y}, query_type={query_type}")
+        logger.info(f"[신API Rank] 순위 체크 시작: keyword={keyword}, place_id={target_place_id}, store_name={store_name}, x={coord_x}, y={coord_y}, query_type={query_type}, profile={profile}")
         
         try:
-            # 1. GraphQL로 검색 결과 가져오기 (프록시 -> 직접 연결 폴백 포함)
-            search_results, total_count = await self._search_places_with_fallback(keyword, max_results, coord_x, coord_y, query_type=query_type)
-            
-            if not search_results:
-                # 2순위: 직접 연결로 재시도
-                logger.warning(f"[신API Rank] 1차 프록시 결과 0개 -> 직접 연결로 재시도 (2순위)")
-                await asyncio.sleep(1)
-                search_results, total_count = await self._search_places_with_fallback(
-                    keyword, max_results, coord_x, coord_y, force_direct=True, query_type=query_type
-                )
-            
-            if not search_results:
-                # 3순위: 프록시 재시도
-                logger.warning(f"[신API Rank] 직접 연결도 결과 0개 -> 프록시 재시도 (3순위)")
-                await asyncio.sleep(2)
-                search_results, total_count = await self._search_places_with_fallback(
-                    keyword, max_results, coord_x, coord_y, query_type=query_type
-                )
+            # 1. GraphQL로 검색 결과 가져오기 (프록시 -> 직접 연결 -> 프록시 재시도)
+            search_results, total_count = await self._search_with_retries(
+                keyword, max_results, coord_x, coord_y, query_type, profile=profile
+            )
             
             if not search_results:
                 # 4순위: 크롤링 폴백
                 logger.warning(f"[신API Rank] 프록시/직접 모두 결과 없음 -> 크롤링 폴백 (4순위)")
                 raise Exception("GraphQL 검색 결과 없음 - 프록시/직접/프록시 재시도 모두 실패")
             
-            # 2. 순위 찾기
-            rank = None
-            found = False
-            target_store_data = {}
-            
-            for idx, store in enumerate(search_results, start=1):
-                if store.get("place_id") == target_place_id:
-                    rank = idx
-                    found = True
-                    # 검색 결과에서 이미 리뷰수 정보가 포함되어 있음
-                    target_store_data = {
-                        "place_id": target_place_id,
-                        "visitor_review_count": store.get("visitor_review_count", 0),
-                        "blog_review_count": int(str(store.get("blog_review_count", "0")).replace(",", "")),
-                        "save_count": 0  # 검색 결과에는 save_count가 없으므로 0
-                    }
-                    
-                    # 🔧 리뷰 수가 둘 다 0일 때 추가 조회 (GraphQL 응답에 누락된 경우 대비)
-                    if target_store_data["visitor_review_count"] == 0 and target_store_data["blog_review_count"] == 0:
-                        logger.info(f"[신API Rank] ⚠️ 리뷰 수가 0, 추가 조회 시도: place_id={target_place_id}")
-                        try:
-                            place_detail = await self._get_place_detail(target_place_id)
-                            if place_detail:
-                                target_store_data["visitor_review_count"] = place_detail.get("visitor_review_count", 0)
-                                target_store_data["blog_review_count"] = place_detail.get("blog_review_count", 0)
-                                target_store_data["save_count"] = place_detail.get("save_count", 0)
-                                logger.info(f"[신API Rank] ✅ 추가 조회 성공: 방문자={target_store_data['visitor_review_count']}, 블로그={target_store_data['blog_review_count']}")
-                        except Exception as e:
-                            logger.warning(f"[신API Rank] 추가 조회 실패: {str(e)}")
-                    
-                    break
-            
-            # 3. 순위를 못 찾았을 때 매장명으로 리뷰 수 조회
-            if not found:
-                logger.info(f"[신API Rank] ⭐ 순위 없음(300위 밖), 매장명으로 리뷰 수 조회 시도: place_id={target_place_id}, store_name={store_name}")
-                try:
-                    # naver_review_service 사용 (매장명 검색 방식)
-                    from .naver_review_service import NaverReviewService
-                    review_service = NaverReviewService()
-                    place_info = await review_service.get_place_info(
-                        place_id=target_place_id,
-                        store_name=store_name,
-                        x=coord_x,
-                        y=coord_y
-                    )
-                    
-                    if place_info:
-                        target_store_data = {
-                            "place_id": target_place_id,
-                            "visitor_review_count": place_info.get("visitor_review_count", 0),
-                            "blog_review_count": place_info.get("blog_review_count", 0),
-                            "save_count": 0
-                        }
-                        logger.info(f"[신API Rank] ✅ 매장명 검색 성공: 방문자={target_store_data['visitor_review_count']}, 블로그={target_store_data['blog_review_count']}")
-                    else:
-                        logger.warning(f"[신API Rank] 매장 정보 없음 → 리뷰수 0으로 설정")
-                        target_store_data = {
-                            "place_id": target_place_id,
-                            "visitor_review_count": 0,
-                            "blog_review_count": 0,
-                            "save_count": 0
-                        }
-                except Exception as e:
-                    logger.error(f"[신API Rank] ❌ 매장 정보 조회 실패: {str(e)}")
-                    target_store_data = {
-                        "place_id": target_place_id,
-                        "visitor_review_count": 0,
-                        "blog_review_count": 0,
-                        "save_count": 0
-                    }
-                    logger.warning(f"[신API Rank] 매장 정보 조회 실패 → 리뷰수 0으로 설정")
-            
-            # 4. 결과 구성
-            result = {
-                "rank": rank,
-                "total_results": len(search_results),
-                "total_count": total_count,  # 실제 전체 업체수
-                "found": found,
-                "search_results": search_results,
-                "target_store": target_store_data,
-                "visitor_review_count": target_store_data.get("visitor_review_count", 0),
-                "blog_review_count": target_store_data.get("blog_review_count", 0),
-                "save_count": target_store_data.get("save_count", 0)
-            }
-            
-            logger.info(
-                f"[신API Rank] 결과: Found={found}, Rank={rank}, "
-                f"방문자리뷰={result['visitor_review_count']}, "
-                f"블로그리뷰={result['blog_review_count']}, "
-                f"저장수={result['save_count']}"
+            # 2~4. 순위 찾기 + 결과 구성
+            return await self._build_rank_result(
+                search_results, total_count, target_place_id,
+                store_name=store_name, coord_x=coord_x, coord_y=coord_y,
+                enrich_reviews=profile != "rank-only"
             )
             
-            return result
-            
         except Exception as e:
             logger.error(f"[신API Rank] 오류: {str(e)}")
             # 오류 시 크롤링 방식으로 폴백
@@ -265,10 +179,228 @@ class NaverRankNewAPIService:
             # 🛡️ 반드시 세마포어 해제 (성공/실패/폴백 무관)
             await naver_api_limiter.release()
     
+    async def check_rank_for_targets(
+        self,
+        keyword: str,
+        targets: List[Dict],
+        max_results: int = 300,
+        coord_x: str = None,
+        coord_y: str = None,
+        category: str = None,
+        profile: str = DEFAULT_PROFILE
+    ) -> Dict[str, Dict]:
+        """
+        같은 검색(키워드 × 좌표 × 쿼리 타입)을 공유하는 여러 매장의 순위를 1회 검색으로 확인
+        
+        배치 지표 수집에서 같은 키워드/위치의 tracker들이 검색을 중복 호출하지 않도록 사용
+        GraphQL 검색이 실패하면 매장별 check_rank (크롤링 폴백 포함)로 전환
+        
+        Args:
+            targets: [{"place_id": str, "store_name": str}, ...]
+            profile: 검색 항목 필드 프로필 (check_rank와 동일)
+            
+        Returns:
+            {place_id: check_rank와 동일한 형식의 결과}
+        """
+        from app.core.rate_limiter import naver_api_limiter
+        
+        profile_fields(profile)
+        query_type = self._get_query_type(category)
+        logger.info(
+            f"[신API Rank] 공유 검색 시작: keyword={keyword}, 대상 {len(targets)}개 매장, "
+            f"x={coord_x}, y={coord_y}, query_type={query_type}"
+        )
+        
+        await naver_api_limiter.acquire()
+        try:
+            search_results, total_count = await self._search_with_retries(
+                keyword, max_results, coord_x, coord_y, query_type, profile=profile
+            )
+            
+            if search_results:
+                results = {}
+                for target in targets:
+                    place_id = target["place_id"]
+                    if place_id in results:
+                        continue
+                    results[place_id] = await self._build_rank_result(
+                        search_results, total_count, place_id,
+                        store_name=target.get("store_name"), coord_x=coord_x, coord_y=coord_y,
+                        enrich_reviews=profile != "rank-only"
+                    )
+                return results
+        except Exception as e:
+            logger.error(f"[신API Rank] 공유 검색 오류: {str(e)}")
+        finally:
+            await naver_api_limiter.release()
+        
+        # 공유 검색 실패 → 매장별 개별 확인 (크롤링 폴백 포함)
+        logger.warning(f"[신API Rank] 공유 검색 결과 없음 -> 매장별 개별 확인: keyword={keyword}")
+        results = {}
+        for target in targets:
+            place_id = target["place_id"]
+            if place_id in results:
+                continue
+            results[place_id] = await self.check_rank(
+                keyword=keyword,
+                target_place_id=place_id,
+                max_results=max_results,
+                store_name=target.get("store_name"),
+                coord_x=coord_x,
+                coord_y=coord_y,
+                category=category,
+                profile=profile
+            )
+        return results
+    
+    async def _search_with_retries(
+        self, keyword: str, max_results: int, coord_x: str = None, coord_y: str = None,
+        query_type: str = "restaurant", profile: str = DEFAULT_PROFILE
+    ) -> tuple[SerpResults, int]:
+        """검색 재시도 체인: 1순위 프록시 → 2순위 직접 연결 → 3순위 프록시 재시도"""
+        search_results, total_count = await self._search_places_with_fallback(
+            keyword, max_results, coord_x, coord_y, query_type=query_type, profile=profile
+        )
+        
+        if not search_results:
+            # 2순위: 직접 연결로 재시도
+            logger.warning(f"[신API Rank] 1차 프록시 결과 0개 -> 직접 연결로 재시도 (2순위)")
+            await asyncio.sleep(1)
+            search_results, total_count = await self._search_places_with_fallback(
+                keyword, max_results, coord_x, coord_y, force_direct=True, query_type=query_type,
+                profile=profile
+            )
+        
+        if not search_results:
+            # 3순위: 프록시 재시도
+            logger.warning(f"[신API Rank] 직접 연결도 결과 0개 -> 프록시 재시도 (3순위)")
+            await asyncio.sleep(2)
+            search_results, total_count = await self._search_places_with_fallback(
+                keyword, max_results, coord_x, coord_y, query_type=query_type, profile=profile
+            )
+        
+        return search_results, total_count
+    
+    async def _build_rank_result(
+        self,
+        search_results: SerpResults,
+        total_count,
+        target_place_id: str,
+        store_name: str = None,
+        coord_x: str = None,
+        coord_y: str = None,
+        enrich_reviews: bool = True
+    ) -> Dict:
+        """검색 결과에서 대상 매장의 순위/리뷰수를 찾아 check_rank 결과 형식으로 구성
+        
+        enrich_reviews=False (rank-only 프로필): 검색 결과에 리뷰수가 없으므로 리뷰수 추가 조회 없이 0으로 채움
+        """
+        # 2. 순위 찾기
+        rank = None
+        found = False
+        target_store_data = {}
+        
+        # 검색 결과 place_id 색인으로 위치 확인
+        position = search_results.index_of(target_place_id)
+        if position is not None:
+            store = search_results[position]
+            rank = position + 1
+            found = True
+            # 검색 결과에서 이미 리뷰수 정보가 포함되어 있음
+            target_store_data = {
+                "place_id": target_place_id,
+                "visitor_review_count": store.get("visitor_review_count", 0),
+                "blog_review_count": int(str(store.get("blog_review_count", "0")).replace(",", "")),
+                "save_count": 0  # 검색 결과에는 save_count가 없으므로 0
+            }
+            
+            # 🔧 리뷰 수가 둘 다 0일 때 추가 조회 (GraphQL 응답에 누락된 경우 대비)
+            if enrich_reviews and target_store_data["visitor_review_count"] == 0 and target_store_data["blog_review_count"] == 0:
+                logger.info(f"[신API Rank] ⚠️ 리뷰 수가 0, 추가 조회 시도: place_id={target_place_id}")
+                try:
+                    place_detail = await self._get_place_detail(target_place_id)
+                    if place_detail:
+                        target_store_data["visitor_review_count"] = place_detail.get("visitor_review_count", 0)
+                        target_store_data["blog_review_count"] = place_detail.get("blog_review_count", 0)
+                        target_store_data["save_count"] = place_detail.get("save_count", 0)
+                        logger.info(f"[신API Rank] ✅ 추가 조회 성공: 방문자={target_store_data['visitor_review_count']}, 블로그={target_store_data['blog_review_count']}")
+                except Exception as e:
+                    logger.warning(f"[신API Rank] 추가 조회 실패: {str(e)}")
+        
+        # 3. 순위를 못 찾았을 때 매장명으로 리뷰 수 조회
+        if not found and not enrich_reviews:
+            target_store_data = {
+                "place_id": target_place_id,
+                "visitor_review_count": 0,
+                "blog_review_count": 0,
+                "save_count": 0
+            }
+        elif not found:
+            logger.info(f"[신API Rank] ⭐ 순위 없음(300위 밖), 매장명으로 리뷰 수 조회 시도: place_id={target_place_id}, store_name={store_name}")
+            try:
+                # naver_review_service 사용 (매장명 검색 방식)
+                from .naver_review_service import NaverReviewService
+                review_service = NaverReviewService()
+                place_info = await review_service.get_place_info(
+                    place_id=target_place_id,
+                    store_name=store_name,
+                    x=coord_x,
+                    y=coord_y
+                )
+                
+                if place_info:
+                    target_store_data = {
+                        "place_id": target_place_id,
+                        "visitor_review_count": place_info.get("visitor_review_count", 0),
+                        "blog_review_count": place_info.get("blog_review_count", 0),
+                        "save_count": 0
+                    }
+                    logger.info(f"[신API Rank] ✅ 매장명 검색 성공: 방문자={target_store_data['visitor_review_count']}, 블로그={target_store_data['blog_review_count']}")
+                else:
+                    logger.warning(f"[신API Rank] 매장 정보 없음 → 리뷰수 0으로 설정")
+                    target_store_data = {
+                        "place_id": target_place_id,
+                        "visitor_review_count": 0,
+                        "blog_review_count": 0,
+                        "save_count": 0
+                    }
+            except Exception as e:
+                logger.error(f"[신API Rank] ❌ 매장 정보 조회 실패: {str(e)}")
+                target_store_data = {
+                    "place_id": target_place_id,
+                    "visitor_review_count": 0,
+                    "blog_review_count": 0,
+                    "save_count": 0
+                }
+                logger.warning(f"[신API Rank] 매장 정보 조회 실패 → 리뷰수 0으로 설정")
+        
+        # 4. 결과 구성
+        result = {
+            "rank": rank,
+            "total_results": len(search_results),
+            "total_count": total_count,  # 실제 전체 업체수
+            "found": found,
+            "search_results": search_results,
+            "target_store": target_store_data,
+            "visitor_review_count": target_store_data.get("visitor_review_count", 0),
+            "blog_review_count": target_store_data.get("blog_review_count", 0),
+            "save_count": target_store_data.get("save_count", 0)
+        }
+        
+        logger.info(
+            f"[신API Rank] 결과: Found={found}, Rank={rank}, "
+            f"방문자리뷰={result['visitor_review_count']}, "
+            f"블로그리뷰={result['blog_review_count']}, "
+            f"저장수={result['save_count']}"
+        )
+        
+        return result
+    
+    @traced("rank.search")
     async def _search_places_with_fallback(
         self, keyword: str, max_results: int, coord_x: str = None, coord_y: str = None,
-        force_direct: bool = False, query_type: str = "restaurant"
-    ) -> tuple[List[Dict], int]:
+        force_direct: bool = False, query_type: str = "restaurant", profile: str = DEFAULT_PROFILE
+    ) -> tuple[SerpResults, int]:
         """
         페이지별 프록시 -> 직접 연결 자동 폴백이 포함된 검색
         
@@ -279,18 +411,22 @@ class NaverRankNewAPIService:
         
         Args:
             force_direct: True이면 프록시 무시하고 직접 연결만 사용
+            profile: 검색 항목 필드 프로필
         
         Returns:
             (검색 결과 리스트, 전체 업체수)
         """
         from app.core.proxy import record_request
         
-        proxy_url = get_proxy() if not force_direct else None
-        use_proxy = bool(proxy_url)
-        
         search_x = coord_x if coord_x else "127.0276"
         search_y = coord_y if coord_y else "37.4979"
         
+        # 같은 검색의 페이지들은 같은 프록시로 (sticky), 프록시 슬롯은 검색 완료까지 점유
+        sticky_key = f"rank:{keyword}:{search_x}:{search_y}:{query_type}"
+        proxy_url = acquire_proxy(sticky_key) if not force_direct else None
+        use_proxy = bool(proxy_url)
+        tried_proxies = set()
+        
         if force_direct:
             logger.info(f"[신API Rank] 직접 연결 모드 (force_direct)")
         elif use_proxy:
@@ -306,72 +442,79 @@ class NaverRankNewAPIService:
             "place": "places",
         }.get(query_type, "places")
         
-        all_stores = []
+        all_stores = SerpResults()
         total_count = 0
         page_size = 100
         proxy_page_successes = 0
         direct_page_successes = 0
         page_num = 0
         
-        for start_idx in range(1, max_results + 1, page_size):
-            remaining = max_results - len(all_stores)
-            if remaining <= 0:
-                break
-            
-            current_display = min(remaining, page_size)
-            page_num += 1
-            page_data = None
-            
-            # --- 프록시 시도 ---
-            if use_proxy and proxy_url:
-                try:
-                    logger.info(f"[신API Rank] 페이지{page_num} 요청: start={start_idx}, display={current_display}, 연결=프록시")
-                    page_data = await self._fetch_single_page(
-                        keyword, start_idx, current_display, search_x, search_y, proxy_url, query_type=query_type
-                    )
-                    proxy_page_successes += 1
-                    record_request("proxy", True, page=page_num)
-                    logger.info(f"[신API Rank] 페이지{page_num} 프록시 성공")
-                except Exception as e:
-                    record_request("proxy", False, page=page_num, error=str(e))
-                    logger.warning(f"[신API Rank] 페이지{page_num} 프록시 실패: {str(e)[:80]} → 이 페이지부터 직접 연결")
-                    use_proxy = False  # 남은 페이지도 직접 연결로 전환
-            
-            # --- 직접 연결 폴백 (프록시 실패 또는 미설정) ---
-            if page_data is None:
-                try:
-                    logger.info(f"[신API Rank] 페이지{page_num} 요청: start={start_idx}, display={current_display}, 연결=직접")
-                    page_data = await self._fetch_single_page(
-                        keyword, start_idx, current_display, search_x, search_y, None, query_type=query_type
-                    )
-                    direct_page_successes += 1
-                    record_request("direct", True, page=page_num)
-                    logger.info(f"[신API Rank] 페이지{page_num} 직접 연결 성공")
-                except Exception as e:
-                    record_request("direct", False, page=page_num, error=str(e))
-                    logger.error(f"[신API Rank] 페이지{page_num} 직접 연결도 실패: {str(e)[:80]}")
-                    break  # 직접 연결도 실패하면 중단
-            
-            # --- 데이터 추출 ---
-            if start_idx == 1:
-                total_count = page_data.get("data", {}).get(response_key, {}).get("total", 0)
-                logger.info(f"[신API Rank] 전체 업체수: {total_count}개 ({response_key})")
-            
-            items = page_data.get("data", {}).get(response_key, {}).get("items", [])
-            if not items:
-                logger.info(f"[신API Rank] 더 이상 결과 없음 (start={start_idx})")
-                break
-            
-            for item in items:
-                all_stores.append(self._parse_store_item(item))
-            
-            logger.info(f"[신API Rank] 누적 결과: {len(all_stores)}개")
-        
-        # --- 프록시 상태 보고 ---
-        if proxy_page_successes > 0:
-            report_proxy_success()
-        if proxy_page_successes == 0 and proxy_url:
-            report_proxy_failure("모든 페이지에서 프록시 실패")
+        try:
+            for start_idx in range(1, max_results + 1, page_size):
+                remaining = max_results - len(all_stores)
+                if remaining <= 0:
+                    break
+                
+                current_display = min(remaining, page_size)
+                page_num += 1
+                page_data = None
+                
+                # --- 프록시 시도 (실패 시 풀의 다른 프록시로 교체) ---
+                while page_data is None and use_proxy and proxy_url:
+                    try:
+                        logger.info(f"[신API Rank] 페이지{page_num} 요청: start={start_idx}, display={current_display}, 연결=프록시")
+                        started = time.monotonic()
+                        page_data = await self._fetch_single_page(
+                            keyword, start_idx, current_display, search_x, search_y, proxy_url,
+                            query_type=query_type, profile=profile
+                        )
+                        proxy_page_successes += 1
+                        record_request("proxy", True, page=page_num, proxy_url=proxy_url)
+                        report_proxy_success(proxy_url, time.monotonic() - started)
+                        logger.info(f"[신API Rank] 페이지{page_num} 프록시 성공")
+                    except Exception as e:
+                        record_request("proxy", False, page=page_num, error=str(e), proxy_url=proxy_url)
+                        report_proxy_failure(str(e), proxy_url=proxy_url)
+                        release_proxy(proxy_url)
+                        tried_proxies.add(proxy_url)
+                        proxy_url = acquire_proxy(sticky_key, exclude=tried_proxies)
+                        use_proxy = bool(proxy_url)
+                        if use_proxy:
+                            logger.warning(f"[신API Rank] 페이지{page_num} 프록시 실패: {str(e)[:80]} → 다른 프록시로 재시도")
+                        else:
+                            logger.warning(f"[신API Rank] 페이지{page_num} 프록시 실패: {str(e)[:80]} → 이 페이지부터 직접 연결")
+                
+                # --- 직접 연결 폴백 (프록시 실패 또는 미설정) ---
+                if page_data is None:
+                    try:
+                        logger.info(f"[신API Rank] 페이지{page_num} 요청: start={start_idx}, display={current_display}, 연결=직접")
+                        page_data = await self._fetch_single_page(
+                            keyword, start_idx, current_display, search_x, search_y, None,
+                            query_type=query_type, profile=profile
+                        )
+                        direct_page_successes += 1
+                        record_request("direct", True, page=page_num)
+                        logger.info(f"[신API Rank] 페이지{page_num} 직접 연결 성공")
+                    except Exception as e:
+                        record_request("direct", False, page=page_num, error=str(e))
+                        logger.error(f"[신API Rank] 페이지{page_num} 직접 연결도 실패: {str(e)[:80]}")
+                        break  # 직접 연결도 실패하면 중단
+                
+                # --- 데이터 추출 ---
+                if start_idx == 1:
+                    total_count = page_data.get("data", {}).get(response_key, {}).get("total", 0)
+                    logger.info(f"[신API Rank] 전체 업체수: {total_count}개 ({response_key})")
+                
+                items = page_data.get("data", {}).get(response_key, {}).get("items", [])
+                if not items:
+                    logger.info(f"[신API Rank] 더 이상 결과 없음 (start={start_idx})")
+                    break
+                
+                all_stores.extend_items(items)
+                
+                logger.info(f"[신API Rank] 누적 결과: {len(all_stores)}개")
+        finally:
+            release_proxy(proxy_url)
         
         logger.info(
             f"[신API Rank] 검색 완료: 총 {len(all_stores)}개, "
@@ -380,40 +523,11 @@ class NaverRankNewAPIService:
         
         return (all_stores, total_count)
     
-    async def _fetch_single_page(
-        self, keyword: str, start: int, display: int,
-        x: str, y: str, proxy_url: str = None,
-        query_type: str = "restaurant"
-    ) -> dict:
-        """GraphQL 단일 페이지 요청
-        
-        Args:
-            keyword: 검색 키워드
-            start: 시작 인덱스
-            display: 요청 개수
-            x: 경도
-            y: 위도
-            proxy_url: 프록시 URL (None이면 직접 연결)
-            query_type: "restaurant" | "hospital" | "place"
-            
-        Returns:
-            GraphQL API 응답 JSON
-            
-        Raises:
-            Exception: 요청 실패 시 (호출자가 폴백 처리)
-        """
-        item_fields = """
-                    id
-                    name
-                    category
-                    address
-                    roadAddress
-                    x
-                    y
-                    imageUrl
-                    blogCafeReviewCount
-                    visitorReviewCount
-                    visitorReviewScore"""
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_search_query(query_type: str = "restaurant", profile: str = DEFAULT_PROFILE) -> tuple[str, str]:
+        """검색 GraphQL 쿼리 (operationName, 쿼리 본문) - 쿼리 타입 × 필드 프로필별로 1회만 생성"""
+        item_fields = "".join(f"\n                    {field}" for field in profile_fields(profile))
         
         if query_type == "restaurant":
             graphql_query = f"""
@@ -449,6 +563,33 @@ class NaverRankNewAPIService:
             """
             operation_name = "getPlacesList"
         
+        return operation_name, graphql_query
+    
+    async def _fetch_single_page(
+        self, keyword: str, start: int, display: int,
+        x: str, y: str, proxy_url: str = None,
+        query_type: str = "restaurant", profile: str = DEFAULT_PROFILE
+    ) -> dict:
+        """GraphQL 단일 페이지 요청
+        
+        Args:
+            keyword: 검색 키워드
+            start: 시작 인덱스
+            display: 요청 개수
+            x: 경도
+            y: 위도
+            proxy_url: 프록시 URL (None이면 직접 연결)
+            query_type: "restaurant" | "hospital" | "place"
+            profile: 항목 필드 프로필 "rank-only" | "competitor" | "full"
+            
+        Returns:
+            GraphQL API 응답 JSON
+            
+        Raises:
+            Exception: 요청 실패 시 (호출자가 폴백 처리)
+        """
+        operation_name, graphql_query = self._build_search_query(query_type, profile)
+        
         input_type = "RestaurantListInput" if query_type == "restaurant" else "PlacesInput"
         
         variables = {
@@ -475,74 +616,36 @@ class NaverRankNewAPIService:
             client_kwargs["proxy"] = proxy_url
         
         async with httpx.AsyncClient(**client_kwargs) as client:
-            response = await client.post(
-                self.api_url,
-                json=payload,
-                headers=self.base_headers,
-                follow_redirects=True
-            )
+            with observe_upstream("naver_graphql", operation_name, connection_type(proxy_url)) as obs:
+                response = await client.post(
+                    self.api_url,
+                    json=payload,
+                    headers=self.base_headers,
+                    follow_redirects=True
+                )
+                obs.set_status(response.status_code)
             response.raise_for_status()
             return response.json()
     
-    @staticmethod
-    def _parse_store_item(item: dict) -> dict:
-        """GraphQL 응답의 매장 항목을 표준 형식으로 변환"""
-        def parse_int(value):
-            if value is None:
-                return 0
-            if isinstance(value, int):
-                return value
-            try:
-                return int(str(value).replace(',', ''))
-            except (ValueError, AttributeError):
-                return 0
-        
-        def parse_rating(value):
-            if value is None or value == "" or value == "None":
-                return None
-            try:
-                rating = float(value)
-                return rating if rating > 0 else None
-            except (ValueError, TypeError):
-                return None
-        
-        visitor_count = parse_int(item.get("visitorReviewCount"))
-        blog_count = parse_int(item.get("blogCafeReviewCount"))
-        rating = parse_rating(item.get("visitorReviewScore"))
-        
-        return {
-            "place_id": str(item.get("id", "")),
-            "name": item.get("name", ""),
-            "category": item.get("category", ""),
-            "address": item.get("address", ""),
-            "road_address": item.get("roadAddress", ""),
-            "phone": "",
-            "rating": rating,
-            "review_count": str(visitor_count),
-            "blog_review_count": str(blog_count),
-            "visitor_review_count": visitor_count,
-            "thumbnail": item.get("imageUrl", ""),
-            "x": str(item.get("x", "")),
-            "y": str(item.get("y", ""))
-        }
-    
     async def _get_place_detail(self, place_id: str) -> Dict:
         """특정 매장의 상세 정보 가져오기 (리뷰수, 저장수 등)
         
         🛡️ 프록시 → 직접 연결 폴백 포함
         """
         # 프록시 시도 → 직접 연결 폴백
-        proxy_url = get_proxy()
+        proxy_url = acquire_proxy()
         
         if proxy_url:
             try:
                 result = await self._get_place_detail_internal(place_id, proxy_url=proxy_url)
                 if result:
-                    report_proxy_success()
+                    report_proxy_success(proxy_url)
                     return result
             except Exception as e:
-                report_proxy_failure(str(e))
+                report_proxy_failure(str(e), proxy_url=proxy_url)
                 logger.warning(f"[신API Rank] 상세 조회 프록시 실패: {str(e)} → 직접 연결")
+            finally:
+                release_proxy(proxy_url)
         
         return await self._get_place_detail_internal(place_id, proxy_url=None)
     
@@ -601,12 +704,14 @@ class NaverRankNewAPIService:
                 client_kwargs["proxy"] = proxy_url
             
             async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=self.base_headers,
-                    follow_redirects=True
-                )
+                with observe_upstream("naver_graphql", payload["operationName"], connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=payload,
+                        headers=self.base_headers,
+                        follow_redirects=True
+                    )
+                    obs.set_status(response.status_code)
                 
                 logger.info(f"[신API Rank] GraphQL 응답 status: {response.status_code}")
                 
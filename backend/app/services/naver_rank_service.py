@@ -12,7 +12,6 @@ import logging
 import time
 import urllib.parse
 from typing import Dict, Optional, List
-from playwright.sync_api import sync_playwright
 import re
 
 logger = logging.getLogger(__name__)
@@ -68,6 +67,7 @@ class NaverRankService:
         
         try:
             # Playwright 시작
+            from playwright.sync_api import sync_playwright
             playwright_manager = sync_playwright().start()
             
             browser = playwright_manager.chromium.launch(
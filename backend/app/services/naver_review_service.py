@@ -3,20 +3,39 @@
 - 방문자 리뷰 (GraphQL API)
 - 블로그 리뷰 (GraphQL API + HTML 파싱)
 """
+from __future__ import annotations
+
 import asyncio
 import httpx
 import logging
-import pytz
 import base64
 import json
 import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
 from datetime import datetime, timedelta
-from playwright.async_api import Page
-from app.core.proxy import get_proxy, report_proxy_success, report_proxy_failure
+from app.core.html_parsing import HtmlNode, parse_html, run_parser
+from app.core.proxy import proxy_slot
+from app.core.metrics import connection_type, observe_upstream
+from app.core.logging_setup import debug_dump_enabled
+from app.services.naver_dates import object_id_date_str, parse_date, visit_date_str, visit_date_strs
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
+# 블로그 검색 페이지 동시 요청 수 (파이프라인 창 크기) / 같은 창에서 요청 시작 간격 (초)
+BLOG_SEARCH_CONCURRENCY = 3
+BLOG_SEARCH_START_INTERVAL_SECONDS = 0.1
+
+# 블로그 포스트 첨부 플레이스 확인 동시 요청 수 (캐시에 없는 포스트만 요청)
+BLOG_POST_VERIFY_CONCURRENCY = 8
+
+_BLOG_POST_URL_PATTERN = re.compile(r'https://blog\.naver\.com/([^/?#]+)/(\d+)')
+_PLACE_LINK_PATTERN = re.compile(r'place\.naver\.com.*/place/(\d+)')
+_PLACE_IFRAME_ID_PATTERN = re.compile(r'/(\d{5,})')
+_BLOG_LINK_PATTERN = re.compile(r'blog\.naver\.com/[^/]+/\d+')
+
 
 class NaverReviewService:
     """네이버 플레이스 리뷰 조회 서비스"""
@@ -118,27 +137,23 @@ class NaverReviewService:
         if after:
             variables["input"]["after"] = after
         
-        print(f"[DEBUG] GraphQL Request - place_id={place_id}, size={size}, after={after[:20] if after else 'None'}...", flush=True)
-        
         try:
-            logger.info(f"방문자 리뷰 조회 시작: place_id={place_id}, size={size}, after={after[:20] if after else 'None'}...")
+            logger.debug(f"방문자 리뷰 조회 시작: place_id={place_id}, size={size}, after={after[:20] if after else 'None'}...")
             
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.TIMEOUT}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
                 payload = {"query": query, "variables": variables}
-                logger.debug(f"GraphQL 요청: {payload}")
-                print(f"[DEBUG] GraphQL variables: {variables}", flush=True)
+                logger.debug(f"GraphQL 요청 variables: {variables}")
                 
-                response = await client.post(
-                    self.GRAPHQL_URL,
-                    json=payload,
-                    headers=self.headers
-                )
+                with observe_upstream("naver_graphql", "getVisitorReviews", connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        self.GRAPHQL_URL,
+                        json=payload,
+                        headers=self.headers
+                    )
+                    obs.set_status(response.status_code)
                 
                 if response.status_code != 200:
                     logger.error(f"방문자 리뷰 조회 실패: status={response.status_code}, body={response.text}")
@@ -147,26 +162,27 @@ class NaverReviewService:
                 data = response.json()
                 
                 # 응답 구조 디버깅
-                print(f"[DEBUG] Response keys: {list(data.keys())}", flush=True)
-                if 'data' in data:
-                    print(f"[DEBUG] data keys: {list(data.get('data', {}).keys()) if data.get('data') else 'data is None'}", flush=True)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Response keys: {list(data.keys())}, data keys: "
+                        f"{list(data['data'].keys()) if data.get('data') else 'data is None'}"
+                    )
                 
                 if "errors" in data:
                     logger.error(f"GraphQL 에러: {data['errors']}")
-                    print(f"[DEBUG] GraphQL errors: {data['errors']}", flush=True)
                     return {"total": 0, "items": [], "has_more": False, "last_cursor": None}
                 
                 # visitor_reviews가 None일 수 있으므로 안전하게 처리
                 visitor_reviews = data.get("data", {})
                 if visitor_reviews is None:
                     logger.error(f"data is None in response")
-                    print(f"[DEBUG] data is None in response", flush=True)
                     return {"total": 0, "items": [], "has_more": False, "last_cursor": None}
                 
                 visitor_reviews = visitor_reviews.get("visitorReviews")
                 if visitor_reviews is None:
                     logger.error(f"visitorReviews is None in response")
-                    print(f"[DEBUG] visitorReviews is None in response, full response: {data}", flush=True)
+                    if debug_dump_enabled(logger):
+                        logger.debug(f"visitorReviews is None - full response: {data}")
                     return {"total": 0, "items": [], "has_more": False, "last_cursor": None}
                 
                 items = visitor_reviews.get("items", [])
@@ -179,13 +195,15 @@ class NaverReviewService:
                     first_id = items[0].get('id', 'N/A')
                     last_id = items[-1].get('id', 'N/A')
                     first_cursor = items[0].get('cursor', 'N/A')
-                    print(f"[DEBUG] GraphQL Response - items={len(items)}, first_id={first_id[:16]}, last_id={last_id[:16]}", flush=True)
-                    print(f"[DEBUG] Cursors - first={first_cursor[:20] if first_cursor != 'N/A' else 'N/A'}..., last={last_cursor[:20] if last_cursor else 'None'}...", flush=True)
+                    logger.debug(
+                        f"GraphQL Response - items={len(items)}, first_id={first_id[:16]}, last_id={last_id[:16]}, "
+                        f"cursors first={first_cursor[:20] if first_cursor != 'N/A' else 'N/A'}..., last={last_cursor[:20] if last_cursor else 'None'}..."
+                    )
                 
                 # has_more: cursor가 있고, size만큼 가져왔다면 다음이 있을 가능성
                 has_more = len(items) == size and last_cursor is not None
                 
-                logger.info(f"방문자 리뷰 조회 성공: place_id={place_id}, total={total}, items_count={len(items)}, has_more={has_more}, last_cursor={last_cursor[:20] if last_cursor else 'None'}...")
+                logger.debug(f"방문자 리뷰 조회 성공: place_id={place_id}, total={total}, items_count={len(items)}, has_more={has_more}, last_cursor={last_cursor[:20] if last_cursor else 'None'}...")
                 
                 return {
                     "total": total,
@@ -193,7 +211,7 @@ class NaverReviewService:
                     "has_more": has_more,
                     "last_cursor": last_cursor
                 }
-                
+        
         except Exception as e:
             logger.error(f"방문자 리뷰 조회 예외: {type(e).__name__} - {str(e)}")
             return {"total": 0, "items": [], "has_more": False, "last_cursor": None}
@@ -280,22 +298,21 @@ class NaverReviewService:
             logger.info(f"[블로그 리뷰] 모바일 API 사용: place_id={place_id}, page={page}")
         
         try:
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.TIMEOUT}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(
-                    api_url,
-                    json=[{
-                        "operationName": "getFsasReviews",
-                        "variables": variables,
-                        "query": query
-                    }],
-                    headers=headers
-                )
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_graphql", "getFsasReviews", connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        api_url,
+                        json=[{
+                            "operationName": "getFsasReviews",
+                            "variables": variables,
+                            "query": query
+                        }],
+                        headers=headers
+                    )
+                    obs.set_status(response.status_code)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -346,7 +363,7 @@ class NaverReviewService:
                     "page": page,
                     "has_more": has_more
                 }
-                
+        
         except Exception as e:
             logger.error(f"블로그 리뷰 조회 예외: {type(e).__name__} - {str(e)}")
             return {
@@ -453,11 +470,12 @@ class NaverReviewService:
             target_reviews = 1000
             max_pages = 50
         
-        print(f"[DEBUG] get_reviews_by_date_range START: place_id={place_id}, period={start_date_str} ~ {end_date_str}", flush=True)
-        try:
-            print(f"[DEBUG] 📊 기간: {date_diff}일 → 목표={target_reviews}개, max_pages={max_pages}, page_size={page_size}", flush=True)
-        except UnicodeEncodeError:
-            print(f"[DEBUG] [STATS] Period: {date_diff}days -> target={target_reviews}, max_pages={max_pages}, page_size={page_size}", flush=True)
+        logger.debug(
+            f"get_reviews_by_date_range START: place_id={place_id}, period={start_date_str} ~ {end_date_str}, "
+            f"기간={date_diff}일 → 목표={target_reviews}개, max_pages={max_pages}, page_size={page_size}"
+        )
+        # 요청 단위 상세 덤프 (리뷰 ID 목록 등): DEBUG + 샘플링된 요청에서만
+        dump = debug_dump_enabled(logger)
         
         page_dates = []  # 각 페이지의 날짜 범위 추적
         seen_review_ids = set()  # 이미 본 리뷰 ID 추적 (중복 방지)
@@ -466,15 +484,15 @@ class NaverReviewService:
         iteration = 1
         
         while iteration <= max_pages:
-            print(f"[DEBUG] Iteration {iteration}/{max_pages} requesting (size={page_size}, cursor={cursor[:20] if cursor else 'None'}...)...", flush=True)
+            logger.debug(f"Iteration {iteration}/{max_pages} requesting (size={page_size}, cursor={cursor[:20] if cursor else 'None'}...)")
             result = await self.get_visitor_reviews(place_id, size=page_size, after=cursor)
             items = result.get("items", [])
             last_cursor = result.get("last_cursor")
             
-            print(f"[DEBUG] Iteration {iteration}: items={len(items)}, total={result.get('total', 0)}", flush=True)
+            logger.debug(f"Iteration {iteration}: items={len(items)}, total={result.get('total', 0)}")
             
             if not items:
-                print(f"[DEBUG] Iteration {iteration}: No items, stopping", flush=True)
+                logger.debug(f"Iteration {iteration}: No items, stopping")
                 break
             
             # 해당 기간 내의 리뷰만 필터링 (날짜 감지 로직 사용)
@@ -484,38 +502,32 @@ class NaverReviewService:
             page_excluded_future = 0
             page_excluded_past = 0
             
-            # 상세 로깅 (디버깅용, 100개 이하일 때만)
-            if len(items) <= 100:
+            # 상세 로깅 (디버깅용, 샘플링된 요청 + 100개 이하일 때만)
+            if dump and len(items) <= 100:
                 all_ids = [item.get('id') for item in items]
                 unique_ids = len(set(all_ids))
-                print(f"\n{'='*100}", flush=True)
-                try:
-                    print(f"[DEBUG] 📋 Iteration {iteration} 수신 (Total: {len(items)}개, Unique: {unique_ids})", flush=True)
-                except UnicodeEncodeError:
-                    print(f"[DEBUG] [LIST] Iteration {iteration} received (Total: {len(items)}, Unique: {unique_ids})", flush=True)
-                
+                logger.debug(f"📋 Iteration {iteration} 수신 (Total: {len(items)}개, Unique: {unique_ids})")
                 if unique_ids < len(all_ids):
-                    try:
-                        print(f"[DEBUG] ⚠️ WARNING: Duplicate IDs found within response!", flush=True)
-                    except UnicodeEncodeError:
-                        print(f"[DEBUG] [WARNING] Duplicate IDs found within response!", flush=True)
-                print(f"{'='*100}\n", flush=True)
+                    logger.debug("⚠️ WARNING: Duplicate IDs found within response!")
             
             # 첫 2번의 iteration에서 모든 리뷰 ID 출력 (페이지네이션 검증)
-            if iteration <= 2:
-                print(f"\n[VERIFY] ===== Iteration {iteration} - 전체 리뷰 ID 목록 =====", flush=True)
+            if dump and iteration <= 2:
+                lines = [f"[VERIFY] Iteration {iteration} - 전체 리뷰 ID 목록"]
                 for idx, item in enumerate(items, 1):
                     review_id = item.get('id', 'N/A')
                     visited = item.get('visited', 'N/A')
                     cursor_preview = item.get('cursor', 'N/A')
                     cursor_preview = cursor_preview[:20] + '...' if cursor_preview != 'N/A' else 'N/A'
-                    print(f"  [{idx:2d}] ID: {review_id}, 방문일: {visited}, cursor: {cursor_preview}", flush=True)
-                print(f"[VERIFY] ===== Iteration {iteration} 끝 =====\n", flush=True)
+                    lines.append(f"  [{idx:2d}] ID: {review_id}, 방문일: {visited}, cursor: {cursor_preview}")
+                logger.debug("\n".join(lines))
             
             new_reviews_in_page = 0  # 이 페이지에서 새로 발견한 리뷰 수
             duplicates_in_page = 0  # 이 페이지에서 발견한 중복 수
             
-            for item in items:
+            # 페이지 단위 방문일 추출 (visited "1.10.금" 형식, 실패시 ID에서 추출)
+            item_dates = visit_date_strs(items)
+            
+            for item, review_date_str in zip(items, item_dates):
                 review_id = item.get("id")
                 if not review_id:
                     continue
@@ -527,33 +539,25 @@ class NaverReviewService:
                 
                 seen_review_ids.add(review_id)
                 new_reviews_in_page += 1
-                    
-                # visited 필드에서 날짜 추출 ("1.10.금" 형식)
-                visited_str = item.get("visited", "")
-                review_date_str = self.parse_naver_date(visited_str)
                 
-                # visited 실패시 ID에서 추출 시도 (fallback)
-                if not review_date_str:
-                    review_date_str = self.extract_date_from_id(review_id)
+                visited_str = item.get("visited", "")
                 
                 # 첫 iteration 첫 리뷰 디버깅
-                if iteration == 1 and len(page_review_dates) == 0:
-                    print(f"[DEBUG] ========== FIRST REVIEW DATA ==========", flush=True)
-                    print(f"[DEBUG] ID: {review_id}", flush=True)
-                    print(f"[DEBUG] visited (raw): {visited_str}", flush=True)
-                    print(f"[DEBUG] Parsed date: {review_date_str}", flush=True)
-                    print(f"[DEBUG] =========================================", flush=True)
+                if dump and iteration == 1 and len(page_review_dates) == 0:
+                    logger.debug(f"FIRST REVIEW DATA - ID: {review_id}, visited (raw): {visited_str}, Parsed date: {review_date_str}")
                 
                 if not review_date_str:
-                    print(f"[DEBUG] Iteration {iteration}: Failed to extract date: visited={visited_str}, id={review_id}", flush=True)
+                    logger.debug(f"Iteration {iteration}: Failed to extract date: visited={visited_str}, id={review_id}")
                     continue
-                    
+                
                 page_review_dates.append(review_date_str)
                 
                 # 첫 iteration 첫 3개 리뷰의 날짜 비교 로그
-                if iteration == 1 and len(page_review_dates) <= 3:
-                    print(f"[DEBUG] Review #{len(page_review_dates)}: date={review_date_str}, range={start_date_str}~{end_date_str}", flush=True)
-                    print(f"[DEBUG] Comparison: {start_date_str} <= {review_date_str} <= {end_date_str} = {start_date_str <= review_date_str <= end_date_str}", flush=True)
+                if dump and iteration == 1 and len(page_review_dates) <= 3:
+                    logger.debug(
+                        f"Review #{len(page_review_dates)}: date={review_date_str}, range={start_date_str}~{end_date_str}, "
+                        f"in_range={start_date_str <= review_date_str <= end_date_str}"
+                    )
                 
                 if start_date_str <= review_date_str <= end_date_str:
                     all_reviews.append(item)
@@ -567,51 +571,51 @@ class NaverReviewService:
                     # ⚠️ 범위 내 리뷰가 하나라도 있으면 중단, 아니면 계속 (최신 리뷰라도 보여주기 위해)
                     if len(all_reviews) > 0:
                         # 이미 범위 내 리뷰를 찾았으면 중단
-                        print(f"[DEBUG] Found older review: {review_date_str} < {start_date_str}, stopping", flush=True)
+                        logger.debug(f"Found older review: {review_date_str} < {start_date_str}, stopping")
                         found_older_review = True
                         break
                     # 아직 범위 내 리뷰를 못 찾았으면 최신 리뷰라도 포함
                     all_reviews.append(item)
                     page_included += 1
-        
+            
             # Iteration 처리 결과 로깅
             if duplicates_in_page > 0:
-                print(f"[DEBUG] Iteration {iteration}: DUPLICATES = {duplicates_in_page}/{len(items)}", flush=True)
+                logger.debug(f"Iteration {iteration}: DUPLICATES = {duplicates_in_page}/{len(items)}")
             
             if page_review_dates:
                 min_date = min(page_review_dates)
                 max_date = max(page_review_dates)
-                print(f"[DEBUG] Iteration {iteration}: 날짜범위={min_date}~{max_date}, 추출={new_reviews_in_page}, 중복={duplicates_in_page}, 포함={page_included}, 미래제외={page_excluded_future}, 과거제외={page_excluded_past}", flush=True)
+                logger.debug(f"Iteration {iteration}: 날짜범위={min_date}~{max_date}, 추출={new_reviews_in_page}, 중복={duplicates_in_page}, 포함={page_included}, 미래제외={page_excluded_future}, 과거제외={page_excluded_past}")
                 page_dates.append((iteration, min_date, max_date, page_included))
             else:
-                print(f"[DEBUG] Iteration {iteration}: 추출={new_reviews_in_page}, 중복={duplicates_in_page}, 포함={page_included}", flush=True)
+                logger.debug(f"Iteration {iteration}: 추출={new_reviews_in_page}, 중복={duplicates_in_page}, 포함={page_included}")
             
             # 조기 종료 조건
             # 1. 과거 리뷰 발견 - 오래된 리뷰가 나왔으므로 중단
             if found_older_review:
-                print(f"[DEBUG] STOP: Iteration {iteration} found older review", flush=True)
+                logger.debug(f"STOP: Iteration {iteration} found older review")
                 break
             
             # 2. 이번 iteration에서 새로운 리뷰가 0개 - 모두 중복이므로 중단
             if new_reviews_in_page == 0 and iteration > 1:
-                print(f"[DEBUG] STOP: Iteration {iteration} has no new reviews (all duplicates)", flush=True)
+                logger.debug(f"STOP: Iteration {iteration} has no new reviews (all duplicates)")
                 break
             
             # 3. 이번 iteration에서 포함된 리뷰가 0개 - 범위 밖 리뷰만 있을 때
             # 첫 페이지가 아니고, 이미 일부 리뷰를 찾았다면 중단
             if page_included == 0 and iteration > 1 and len(all_reviews) > 0:
-                print(f"[DEBUG] STOP: Iteration {iteration} has 0 included reviews (already found some)", flush=True)
+                logger.debug(f"STOP: Iteration {iteration} has 0 included reviews (already found some)")
                 break
             # 첫 페이지에서 포함된 리뷰가 0개면 계속 진행 (최신 리뷰라도 보여주기 위해)
             
             # 4. 목표 개수 달성
             if len(all_reviews) >= target_reviews:
-                print(f"[DEBUG] STOP: Target reached ({len(all_reviews)}/{target_reviews})", flush=True)
+                logger.debug(f"STOP: Target reached ({len(all_reviews)}/{target_reviews})")
                 break
             
             # 5. 더 이상 페이지 없음 (cursor가 없거나 has_more가 False)
             if not result.get("has_more") or not last_cursor:
-                print(f"[DEBUG] STOP: No more items (has_more={result.get('has_more')}, cursor={last_cursor is not None})", flush=True)
+                logger.debug(f"STOP: No more items (has_more={result.get('has_more')}, cursor={last_cursor is not None})")
                 break
             
             # 다음 iteration을 위해 cursor 업데이트
@@ -620,67 +624,40 @@ class NaverReviewService:
         
         # 최종 요약
         iterations_processed = len(page_dates)
-        print(f"\n{'='*100}", flush=True)
-        print(f"[결과] 기간별 리뷰 추출 완료 (Cursor 기반 페이지네이션)", flush=True)
-        print(f"  요청 기간: {start_date_str} ~ {end_date_str} ({date_diff}일)", flush=True)
-        print(f"  목표 개수: {target_reviews}개", flush=True)
-        print(f"  처리 Iterations: {iterations_processed}회 (size={page_size})", flush=True)
-        print(f"  최종 결과: {len(all_reviews)}개", flush=True)
-        
-        if page_dates:
-            print(f"  Iteration별 요약:", flush=True)
-            for it, min_d, max_d, included in page_dates:
-                print(f"    Iteration {it}: {min_d}~{max_d}, 포함={included}", flush=True)
-        
-        print(f"{'='*100}\n", flush=True)
-        
+        if page_dates and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Iteration별 요약: " + ", ".join(
+                f"#{it} {min_d}~{max_d} 포함={included}" for it, min_d, max_d, included in page_dates
+            ))
+        
+        summary = {
+            "place_id": place_id,
+            "start_date": start_date_str,
+            "end_date": end_date_str,
+            "target_reviews": target_reviews,
+            "iterations": iterations_processed,
+            "review_count": len(all_reviews),
+        }
         if all_reviews:
-            logger.info(f"[OK] 기간별 리뷰 조회 완료: {len(all_reviews)}개 (요청: {start_date_str}~{end_date_str})")
+            logger.info(f"[OK] 기간별 리뷰 조회 완료: {len(all_reviews)}개 (요청: {start_date_str}~{end_date_str}, {iterations_processed}회)", extra=summary)
         else:
-            logger.info(f"[WARN] 기간별 리뷰 조회 완료: 0개 (기간: {start_date_str} ~ {end_date_str})")
+            logger.info(f"[WARN] 기간별 리뷰 조회 완료: 0개 (기간: {start_date_str} ~ {end_date_str})", extra=summary)
         
         return all_reviews
     
     def parse_naver_date(self, date_str: str) -> Optional[str]:
         """
-        네이버 날짜 형식 파싱: "1.10.금" → "2026-01-10"
+        네이버 날짜 형식 파싱: "1.10.금" → "2026-01-10", "24.12.31.화" → "2024-12-31"
         
         Args:
-            date_str: "월.일.요일" 형식 (예: "1.10.금", "12.25.수")
+            date_str: "월.일.요일" / "연.월.일.요일" 형식 (예: "1.10.금", "12.25.수")
         
         Returns:
-            ISO 형식 날짜 문자열 (YYYY-MM-DD)
+            ISO 형식 날짜 문자열 (YYYY-MM-DD, KST 기준, 연도 없으면 미래가 아닌 가장 최근 연도)
         """
-        try:
-            if not date_str or date_str == "":
-                return None
-            
-            # "1.10.금" → ["1", "10", "금"]
-            parts = date_str.split(".")
-            if len(parts) < 2:
-                return None
-            
-            month = int(parts[0])
-            day = int(parts[1])
-            
-            # 현재 년도 가정 (KST 기준)
-            KST = pytz.timezone('Asia/Seoul')
-            now = datetime.now(KST)
-            current_year = now.year
-            
-            # 날짜 생성
-            review_date = datetime(current_year, month, day)
-            
-            # 미래 날짜라면 작년으로 변경
-            if review_date.replace(tzinfo=None) > now.replace(tzinfo=None):
-                review_date = datetime(current_year - 1, month, day)
-            
-            return review_date.strftime("%Y-%m-%d")
-        except Exception as e:
-            logger.debug(f"네이버 날짜 파싱 실패: {date_str}, {str(e)}")
-            return None
+        review_date = parse_date(date_str)
+        return review_date.strftime("%Y-%m-%d") if review_date else None
     
-    def extract_date_from_id(self, review_id: str) -> str:
+    def extract_date_from_id(self, review_id: str) -> Optional[str]:
         """
         리뷰 ID(MongoDB ObjectId)에서 작성 날짜 추출
         
@@ -688,22 +665,9 @@ class NaverReviewService:
             review_id: 네이버 리뷰 ID (24자 hex string)
         
         Returns:
-            ISO 형식 날짜 문자열 (YYYY-MM-DD, KST 기준)
+            ISO 형식 날짜 문자열 (YYYY-MM-DD, KST 기준), 실패 시 None
         """
-        try:
-            # ObjectId의 첫 8자는 Unix timestamp (hex)
-            timestamp_hex = review_id[:8]
-            timestamp = int(timestamp_hex, 16)
-            
-            # UTC 시간으로 변환 후 KST로 변경
-            dt_utc = datetime.fromtimestamp(timestamp, tz=pytz.utc)
-            KST = pytz.timezone('Asia/Seoul')
-            dt_kst = dt_utc.astimezone(KST)
-            return dt_kst.strftime("%Y-%m-%d")
-        except Exception as e:
-            # 파싱 실패 시 None 반환
-            logger.debug(f"리뷰 ID 날짜 추출 실패: {review_id}, {str(e)}")
-            return None
+        return object_id_date_str(review_id)
     
     def parse_review_data(self, review: Dict[str, Any], review_type: str) -> Dict[str, Any]:
         """
@@ -723,12 +687,8 @@ class NaverReviewService:
             
             review_id = str(review.get("id", ""))
             # visited 필드에서 날짜 추출 ("1.10.금" 형식)
-            visited_str = review.get("visited", "")
-            review_date = self.parse_naver_date(visited_str)
-            
             # visited 실패시 ID에서 추출 시도
-            if not review_date:
-                review_date = self.extract_date_from_id(review_id)
+            review_date = visit_date_str(review.get("visited", ""), review_id)
             
             # 작성자 리뷰 수는 Naver API에서 제공하지 않음 (reviewCount 필드 없음)
             # 향후 개선: 작성자 프로필 페이지 크롤링 또는 다른 방법 필요
@@ -856,22 +816,21 @@ class NaverReviewService:
                     # 여전히 매장명이 없으면 place_id 그대로 사용 (실패할 확률 높음)
                     search_query = place_id
             
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.TIMEOUT}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(
-                    self.GRAPHQL_URL,
-                    json={
-                        "operationName": "getPlacesList",
-                        "variables": variables,
-                        "query": query
-                    },
-                    headers=self.headers
-                )
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_graphql", "getPlacesList", connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        self.GRAPHQL_URL,
+                        json={
+                            "operationName": "getPlacesList",
+                            "variables": variables,
+                            "query": query
+                        },
+                        headers=self.headers
+                    )
+                    obs.set_status(response.status_code)
                 
                 if response.status_code != 200:
                     logger.error(f"매장 정보 조회 실패: status={response.status_code}")
@@ -952,7 +911,7 @@ class NaverReviewService:
                 
                 logger.info(f"매장 정보 조회 성공: {result}")
                 return result
-                
+        
         except Exception as e:
             logger.error(f"매장 정보 조회 예외: {type(e).__name__} - {str(e)}")
             return None
@@ -962,16 +921,19 @@ class NaverReviewService:
         place_id: str,
         store_name: str,
         road_address: str = None,
-        max_pages: int = 15
+        max_pages: int = 15,
+        verify_place: bool = False
     ) -> List[Dict[str, Any]]:
         """
         네이버 통합 검색 블로그 탭에서 HTML 파싱 (활성화 기능 전용)
         
         Args:
-            place_id: 네이버 플레이스 ID (로깅용)
+            place_id: 네이버 플레이스 ID (verify_place일 때 첨부 지도 비교)
             store_name: 매장명 (검색 쿼리)
             road_address: 도로명주소 (필터링용)
             max_pages: 사용 안 함 (호환성 유지)
+            verify_place: 매장명으로 매칭된 포스트 중 다른 매장 지도만 첨부된 포스트 제외
+                (filter_blog_reviews_by_place, 확인 결과는 blog_post_places에 캐시)
         
         Returns:
             List[Dict]: 블로그 리뷰 목록 (date, title, author 등)
@@ -1004,18 +966,15 @@ class NaverReviewService:
             max_pages = 10  # 최대 10페이지 (약 300개)
             target_days = 60  # 60일 일평균 계산을 위해
             
-            from datetime import datetime, timezone, timedelta
+            from datetime import timezone
             cutoff_date = datetime.now(timezone.utc) - timedelta(days=target_days)
             found_old_enough = False
             
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": 10.0}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                for page in range(max_pages):
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                async def fetch_page(page: int, delay: float):
                     start = page * 30 + 1  # 네이버는 1, 31, 61, 91... 형태로 페이징
                     url = f"https://search.naver.com/search.naver?ssc=tab.blog.all&query={query}&sm=tab_opt&nso=so:dd,p:all&start={start}"
                     
@@ -1023,120 +982,86 @@ class NaverReviewService:
                         logger.info(f"[블로그 검색] HTTP 요청 시작: {url}")
                         logger.info(f"[블로그 검색] 검색어: '{search_query}', Place ID: {place_id}, 목표: {target_days}일 이전까지")
                     
-                    try:
+                    # 같은 창에서 동시에 시작하는 요청은 간격을 둠 (bot 감지 방지)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    with observe_upstream("naver_html", "blog_search", connection_type(proxy_url)) as obs:
                         response = await client.get(url, headers=search_headers, follow_redirects=True)
+                        obs.set_status(response.status_code)
+                    return response
+                
+                # 페이지 요청 파이프라인: 현재 페이지를 파싱하는 동안 다음 페이지들을 미리 요청
+                # (최대 BLOG_SEARCH_CONCURRENCY개, 결과는 페이지 순서대로 처리, 조기 종료 시 남은 요청 취소)
+                pending: Dict[int, asyncio.Task] = {}
+                next_page = 0
+                
+                def schedule_pages():
+                    nonlocal next_page
+                    while next_page < max_pages and len(pending) < BLOG_SEARCH_CONCURRENCY:
+                        delay = BLOG_SEARCH_START_INTERVAL_SECONDS * len(pending)
+                        pending[next_page] = asyncio.create_task(fetch_page(next_page, delay))
+                        next_page += 1
+                
+                try:
+                    for page in range(max_pages):
+                        schedule_pages()
                         
-                        if response.status_code != 200:
-                            logger.warning(f"[블로그 검색] 페이지 {page+1} HTTP {response.status_code}")
-                            continue
-                        
-                        html = response.text
-                        
-                        if page == 0:
-                            logger.info(f"[블로그 검색] HTML 길이: {len(html)} bytes")
-                        
-                        # HTML 파싱 (한 번만 수행하여 성능 최적화)
-                        from bs4 import BeautifulSoup
-                        import re
-                        
-                        soup = BeautifulSoup(html, 'html.parser')
-                        blog_links_in_page = soup.find_all('a', href=re.compile(r'blog\.naver\.com/[^/]+/\d+'))
-                        
-                        # HTML에 블로그 링크가 아예 없으면 진짜 페이지 끝
-                        if len(blog_links_in_page) == 0:
-                            logger.info(f"[블로그 검색] 페이지 {page+1}: HTML에 블로그 링크 없음 (페이지 종료)")
-                            break
-                        
-                        # 이 페이지의 모든 블로그 중 가장 오래된 날짜 찾기 (매칭 여부 무관)
-                        oldest_date_in_page = None
-                        checked_dates = 0
-                        
-                        # 페이지 내 일부 블로그 링크의 날짜만 샘플링 확인 (속도 최적화)
-                        # 최대 3개만 확인하여 빠르게 60일 기준 확인
-                        for link_idx, link in enumerate(blog_links_in_page):
-                            if link_idx >= 3:  # 최대 3개까지 샘플링 (속도 최적화)
-                                break
+                        try:
+                            response = await pending.pop(page)
                             
-                            try:
-                                parent = link.parent
-                                date_found_for_link = False  # 이 링크의 날짜를 찾았는지 여부
-                                
-                                for level in range(5):
-                                    if not parent or date_found_for_link:
-                                        break
-                                    
-                                    date_candidates = parent.find_all(['span', 'time', 'div'], limit=10)
-                                    for candidate in date_candidates:
-                                        text = candidate.get_text(strip=True)
-                                        
-                                        if not text or len(text) > 20:
-                                            continue
-                                        
-                                        # 날짜 패턴 확인
-                                        is_date = False
-                                        if re.match(r'^\d+\s*(일|주|시간|분)\s*전', text):
-                                            is_date = True
-                                        elif re.match(r'^\d{2,4}\.\d{1,2}\.\d{1,2}\.?', text):
-                                            is_date = True
-                                        
-                                        if is_date:
-                                            parsed_date = self._parse_naver_search_date(text)
-                                            if parsed_date:
-                                                checked_dates += 1
-                                                if oldest_date_in_page is None or parsed_date < oldest_date_in_page:
-                                                    oldest_date_in_page = parsed_date
-                                                date_found_for_link = True  # 이 링크의 날짜를 찾았음
-                                                
-                                                # 조기 종료: 60일 이전 날짜 발견 시 더 이상 확인 안 함
-                                                if parsed_date <= cutoff_date:
-                                                    logger.debug(f"[블로그 검색] 조기 발견: {(datetime.now(timezone.utc) - parsed_date).days}일 전 블로그 (샘플 {link_idx+1}번째)")
-                                                    break  # 이 링크의 다른 날짜는 확인하지 않음
-                                                break  # 이 링크의 다른 날짜는 확인하지 않음
-                                    
-                                    if date_found_for_link:
-                                        break  # 이 링크의 부모를 더 탐색하지 않음
-                                    parent = parent.parent
-                                
-                                # 60일 이전 날짜를 이미 찾았으면 다음 링크 확인 불필요
-                                if oldest_date_in_page and oldest_date_in_page <= cutoff_date:
-                                    break
-                                    
-                            except:
+                            if response.status_code != 200:
+                                logger.warning(f"[블로그 검색] 페이지 {page+1} HTTP {response.status_code}")
                                 continue
-                        
-                        # 블로그 리뷰 추출 (매장명 필터링 적용, 이미 파싱된 soup 재사용)
-                        page_reviews = self._parse_naver_blog_search_html(soup, store_name)
-                        all_reviews.extend(page_reviews)
-                        
-                        # Early stopping 판단: 이 페이지의 가장 오래된 블로그가 60일 이전인지 확인
-                        if oldest_date_in_page:
-                            days_old = (datetime.now(timezone.utc) - oldest_date_in_page).days
-                            logger.info(f"[블로그 검색] 페이지 {page+1}/{max_pages}: 매칭 {len(page_reviews)}개 (누적: {len(all_reviews)}개), 페이지 가장 오래된: {days_old}일 전 (확인: {checked_dates}개)")
                             
-                            # 60일 이전 블로그 발견 → 조기 종료
-                            if oldest_date_in_page <= cutoff_date:
-                                found_old_enough = True
-                                logger.info(f"[블로그 검색] ✓ {target_days}일 이전 블로그 발견 (조기 종료)")
+                            html = response.text
+                            
+                            if page == 0:
+                                logger.info(f"[블로그 검색] HTML 길이: {len(html)} bytes")
+                            
+                            # HTML 파싱 (스레드에서 한 번만 파싱: 블로그 링크 / 날짜 샘플 / 매장명 필터링 리뷰)
+                            parsed_page = await run_parser(self._parse_blog_search_page, html, store_name, cutoff_date)
+                            
+                            # HTML에 블로그 링크가 아예 없으면 진짜 페이지 끝
+                            if parsed_page["link_count"] == 0:
+                                logger.info(f"[블로그 검색] 페이지 {page+1}: HTML에 블로그 링크 없음 (페이지 종료)")
                                 break
-                        else:
-                            logger.info(f"[블로그 검색] 페이지 {page+1}/{max_pages}: 매칭 {len(page_reviews)}개 (누적: {len(all_reviews)}개), 날짜 파싱 실패")
-                        
+                            
+                            oldest_date_in_page = parsed_page["oldest_date"]
+                            checked_dates = parsed_page["checked_dates"]
+                            page_reviews = parsed_page["reviews"]
+                            all_reviews.extend(page_reviews)
+                            
+                            # Early stopping 판단: 이 페이지의 가장 오래된 블로그가 60일 이전인지 확인
+                            if oldest_date_in_page:
+                                days_old = (datetime.now(timezone.utc) - oldest_date_in_page).days
+                                logger.info(f"[블로그 검색] 페이지 {page+1}/{max_pages}: 매칭 {len(page_reviews)}개 (누적: {len(all_reviews)}개), 페이지 가장 오래된: {days_old}일 전 (확인: {checked_dates}개)")
+                                
+                                # 60일 이전 블로그 발견 → 조기 종료
+                                if oldest_date_in_page <= cutoff_date:
+                                    found_old_enough = True
+                                    logger.info(f"[블로그 검색] ✓ {target_days}일 이전 블로그 발견 (조기 종료)")
+                                    break
+                            else:
+                                logger.info(f"[블로그 검색] 페이지 {page+1}/{max_pages}: 매칭 {len(page_reviews)}개 (누적: {len(all_reviews)}개), 날짜 파싱 실패")
                         
-                        # 페이지 간 딜레이 (bot 감지 방지, 최소화)
-                        if page < max_pages - 1:
-                            await asyncio.sleep(0.3)
-                    
-                    except Exception as e:
-                        logger.warning(f"[블로그 검색] 페이지 {page+1} 오류: {str(e)}")
-                        continue
+                        except Exception as e:
+                            logger.warning(f"[블로그 검색] 페이지 {page+1} 오류: {str(e)}")
+                            continue
+                finally:
+                    for task in pending.values():
+                        task.cancel()
+                    await asyncio.gather(*pending.values(), return_exceptions=True)
                 
                 if not found_old_enough and len(all_reviews) > 0:
                     logger.warning(f"[블로그 검색] ⚠ {target_days}일 이전 블로그를 찾지 못함 ({max_pages}페이지 도달)")
                 
                 logger.info(f"[블로그 검색] 파싱 완료: 총 {len(all_reviews)}개")
-                
-                return all_reviews
             
+            if verify_place and all_reviews:
+                all_reviews = await self.filter_blog_reviews_by_place(all_reviews, place_id)
+            
+            return all_reviews
+        
         except Exception as e:
             logger.error(f"[블로그 검색] 예외 발생: {type(e).__name__} - {str(e)}", exc_info=True)
             return []
@@ -1176,23 +1101,114 @@ class NaverReviewService:
             logger.warning(f"[주소 파싱] 예외 발생: {str(e)}")
             return None
     
+    def _parse_blog_search_page(self, html: str, store_name: str, cutoff_date: datetime) -> Dict[str, Any]:
+        """
+        블로그 검색 결과 1페이지 파싱 (run_parser로 스레드에서 호출)
+        
+        Returns:
+            link_count: 페이지의 블로그 링크 수 (0이면 페이지 끝)
+            oldest_date / checked_dates: 샘플링한 블로그 날짜 중 가장 오래된 날짜 / 확인한 날짜 수
+            reviews: 매장명 필터링을 통과한 블로그 리뷰 (_parse_naver_blog_search_html)
+        """
+        from datetime import timezone
+        
+        doc = parse_html(html)
+        blog_links = self._find_blog_links(doc)
+        if not blog_links:
+            return {"link_count": 0, "oldest_date": None, "checked_dates": 0, "reviews": []}
+        
+        # 이 페이지의 모든 블로그 중 가장 오래된 날짜 찾기 (매칭 여부 무관)
+        oldest_date_in_page = None
+        checked_dates = 0
+        
+        # 페이지 내 일부 블로그 링크의 날짜만 샘플링 확인 (속도 최적화)
+        # 최대 3개만 확인하여 빠르게 60일 기준 확인
+        for link_idx, link in enumerate(blog_links):
+            if link_idx >= 3:  # 최대 3개까지 샘플링 (속도 최적화)
+                break
+            
+            try:
+                parent = link.parent
+                date_found_for_link = False  # 이 링크의 날짜를 찾았는지 여부
+                
+                for level in range(5):
+                    if not parent or date_found_for_link:
+                        break
+                    
+                    date_candidates = parent.find_all(('span', 'time', 'div'), limit=10)
+                    for candidate in date_candidates:
+                        text = candidate.text()
+                        
+                        if not text or len(text) > 20:
+                            continue
+                        
+                        # 날짜 패턴 확인
+                        is_date = False
+                        if re.match(r'^\d+\s*(일|주|시간|분)\s*전', text):
+                            is_date = True
+                        elif re.match(r'^\d{2,4}\.\d{1,2}\.\d{1,2}\.?', text):
+                            is_date = True
+                        
+                        if is_date:
+                            parsed_date = parse_date(text)
+                            if parsed_date:
+                                checked_dates += 1
+                                if oldest_date_in_page is None or parsed_date < oldest_date_in_page:
+                                    oldest_date_in_page = parsed_date
+                                date_found_for_link = True  # 이 링크의 날짜를 찾았음
+                                
+                                # 조기 종료: 60일 이전 날짜 발견 시 더 이상 확인 안 함
+                                if parsed_date <= cutoff_date:
+                                    logger.debug(f"[블로그 검색] 조기 발견: {(datetime.now(timezone.utc) - parsed_date).days}일 전 블로그 (샘플 {link_idx+1}번째)")
+                                    break  # 이 링크의 다른 날짜는 확인하지 않음
+                                break  # 이 링크의 다른 날짜는 확인하지 않음
+                    
+                    if date_found_for_link:
+                        break  # 이 링크의 부모를 더 탐색하지 않음
+                    parent = parent.parent
+                
+                # 60일 이전 날짜를 이미 찾았으면 다음 링크 확인 불필요
+                if oldest_date_in_page and oldest_date_in_page <= cutoff_date:
+                    break
+            
+            except:
+                continue
+        
+        
+        
+        return {
+            "link_count": len(blog_links),
+            "oldest_date": oldest_date_in_page,
+            "checked_dates": checked_dates,
+            # 블로그 리뷰 추출 (매장명 필터링 적용, 이미 파싱된 문서 / 링크 재사용)
+            "reviews": self._parse_naver_blog_search_html(doc, store_name, blog_links),
+        }
+    
+    @staticmethod
+    def _find_blog_links(doc: HtmlNode) -> List[HtmlNode]:
+        """블로그 포스트 링크 (blog.naver.com/{blogId}/{logNo})"""
+        return [
+            link for link in doc.select('a[href*="blog.naver.com/"]')
+            if _BLOG_LINK_PATTERN.search(link.attr('href', ''))
+        ]
+    
     def _parse_naver_blog_search_html(
         self, 
-        soup,  # BeautifulSoup 객체를 직접 받아서 재파싱 방지 (성능 최적화)
-        store_name: str
+        doc: HtmlNode,  # 파싱된 문서를 직접 받아서 재파싱 방지 (성능 최적화)
+        store_name: str,
+        blog_links: Optional[List[HtmlNode]] = None
     ) -> List[Dict[str, Any]]:
         """
         네이버 통합 검색 블로그 탭 HTML 파싱 (매장명 필터링 적용)
         
         Args:
-            soup: BeautifulSoup 파싱된 객체 (성능 최적화를 위해 재사용)
+            doc: parse_html로 파싱된 문서 (성능 최적화를 위해 재사용)
             store_name: 매장명 (필터링에 사용)
+            blog_links: 이미 찾은 블로그 링크 (없으면 doc에서 찾음)
         
         Returns:
             List[Dict]: 파싱된 블로그 리뷰 목록 (매장명 필터링 적용)
         """
-        from datetime import datetime, timedelta
-        
         reviews = []
         
         # 매장명 필터링 준비 (단순화)
@@ -1213,7 +1229,8 @@ class NaverReviewService:
             logger.info(f"[블로그 필터링] 매장명: '{exact_store_name}' (정규화: '{exact_store_lower}', 띄어쓰기 없음)")
         
         # 블로그 링크를 직접 찾기
-        blog_links = soup.find_all('a', href=re.compile(r'blog\.naver\.com/[^/]+/\d+'))
+        if blog_links is None:
+            blog_links = self._find_blog_links(doc)
         logger.info(f"[블로그 검색] 발견된 블로그 링크: {len(blog_links)}개")
         
         processed_urls = set()  # 중복 방지
@@ -1221,14 +1238,14 @@ class NaverReviewService:
         
         for idx, link in enumerate(blog_links):
             try:
-                url = link.get('href', '')
+                url = link.attr('href', '')
                 if not url or url in processed_urls:
                     continue
                 
                 processed_urls.add(url)
                 
                 # 제목 추출
-                title = link.get_text(strip=True)
+                title = link.text()
                 if not title or len(title) < 5:  # 너무 짧은 제목은 무시
                     continue
                 
@@ -1239,7 +1256,7 @@ class NaverReviewService:
                     if not parent_for_desc:
                         break
                     # 부모 요소의 모든 텍스트에서 제목을 제외한 나머지가 미리보기
-                    parent_text = parent_for_desc.get_text(strip=True)
+                    parent_text = parent_for_desc.text()
                     # 제목보다 긴 텍스트가 있으면 그것이 미리보기를 포함
                     if len(parent_text) > len(title) + 10:  # 제목보다 충분히 길면
                         description = parent_text
@@ -1291,9 +1308,9 @@ class NaverReviewService:
                     # 날짜 찾기
                     if not date_str:
                         # 다양한 패턴의 날짜 요소 찾기
-                        date_candidates = parent.find_all(['span', 'time', 'div'], limit=20)
+                        date_candidates = parent.find_all(('span', 'time', 'div'), limit=20)
                         for candidate in date_candidates:
-                            text = candidate.get_text(strip=True)
+                            text = candidate.text()
                             
                             # 날짜는 보통 짧음 (20자 이내)
                             if not text or len(text) > 20:
@@ -1311,7 +1328,7 @@ class NaverReviewService:
                             
                             if is_date:
                                 date_str = text
-                                review_date = self._parse_naver_search_date(date_str)
+                                review_date = parse_date(date_str)
                                 if review_date:  # 파싱 성공한 경우만
                                     break
                     
@@ -1334,166 +1351,137 @@ class NaverReviewService:
         
         return reviews
     
-    def _parse_naver_search_date(self, date_str: str) -> Optional[datetime]:
+    async def filter_blog_reviews_by_place(
+        self, reviews: List[Dict[str, Any]], place_id: str
+    ) -> List[Dict[str, Any]]:
         """
-        네이버 검색 결과의 날짜 파싱
-        
-        형식:
-        - "1일 전", "2일 전" → 상대 날짜
-        - "1주 전", "2주 전" → 상대 주
-        - "1시간 전", "2시간 전" → 상대 시간
-        - "2025.12.05.", "2025.12.5." → 절대 날짜
-        - "25.12.05.", "25.12.5." → 절대 날짜 (20xx년 가정)
+        매장명으로 매칭된 블로그 포스트 중 다른 매장 지도만 첨부된 포스트 제외
+        
+        - 지도 첨부가 없는 포스트 / 확인 실패한 포스트는 유지 (제목·미리보기 매칭 결과 그대로)
+        - 첨부 placeId에 place_id가 있으면 유지, 다른 placeId만 있으면 제외 (같은 이름의 다른 지점 등)
         """
-        if not date_str:
-            return None
+        place_ids_by_url = await self.get_blog_post_place_ids([review["url"] for review in reviews])
         
-        KST = pytz.timezone('Asia/Seoul')
-        now = datetime.now(KST)
+        kept = []
+        for review in reviews:
+            place_ids = place_ids_by_url.get(review["url"])
+            if not place_ids or str(place_id) in place_ids:
+                kept.append(review)
         
-        try:
-            # "N일 전"
-            if "일 전" in date_str or "일전" in date_str:
-                match = re.search(r'(\d+)일\s*전', date_str)
-                if match:
-                    days = int(match.group(1))
-                    return now - timedelta(days=days)
-            
-            # "N주 전"
-            if "주 전" in date_str or "주전" in date_str:
-                match = re.search(r'(\d+)주\s*전', date_str)
-                if match:
-                    weeks = int(match.group(1))
-                    return now - timedelta(weeks=weeks)
-            
-            # "N시간 전"
-            if "시간 전" in date_str or "시간전" in date_str:
-                match = re.search(r'(\d+)시간\s*전', date_str)
-                if match:
-                    hours = int(match.group(1))
-                    return now - timedelta(hours=hours)
-            
-            # "N분 전"
-            if "분 전" in date_str or "분전" in date_str:
-                match = re.search(r'(\d+)분\s*전', date_str)
-                if match:
-                    minutes = int(match.group(1))
-                    return now - timedelta(minutes=minutes)
+        logger.info(f"[블로그 필터링] 첨부 지도 확인: {len(reviews)}개 → {len(kept)}개 (다른 매장 {len(reviews) - len(kept)}개 제외)")
+        return kept
+    
+    async def get_blog_post_place_ids(self, blog_urls: List[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        블로그 포스트별 첨부 placeId 목록 (캐시에 없는 포스트만 PostView 요청)
+        
+        Returns:
+            {blog_url: [place_id, ...] (첨부 없으면 빈 목록) 또는 None (확인 실패)}
+        """
+        from app.services.blog_post_place_service import blog_post_place_service
+        
+        blog_urls = list(dict.fromkeys(blog_urls))
+        results: Dict[str, Optional[List[str]]] = dict(blog_post_place_service.get_many(blog_urls))
+        missing = [blog_url for blog_url in blog_urls if blog_url not in results]
+        if not missing:
+            logger.info(f"[블로그 필터링] 첨부 지도 캐시 적중: {len(blog_urls)}개")
+            return results
+        
+        logger.info(f"[블로그 필터링] 첨부 지도 확인: 캐시 {len(results)}개, 새 포스트 {len(missing)}개 요청")
+        
+        client_kwargs = {"timeout": 5.0}
+        
+        semaphore = asyncio.Semaphore(BLOG_POST_VERIFY_CONCURRENCY)
+        
+        # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+        async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+            async def fetch(blog_url: str):
+                async with semaphore:
+                    return blog_url, await self._fetch_blog_post_place_ids(client, blog_url, proxy_url)
             
-            # "YYYY.MM.DD." 또는 "YYYY.M.D."
-            match = re.match(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?', date_str)
-            if match:
-                year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                return datetime(year, month, day, tzinfo=KST)
+            fetched = await asyncio.gather(*(fetch(blog_url) for blog_url in missing))
+        
+        verified = {blog_url: place_ids for blog_url, place_ids in fetched if place_ids is not None}
+        blog_post_place_service.save_many(verified)
+        results.update(fetched)
+        return results
+    
+    async def _fetch_blog_post_place_ids(
+        self, client: httpx.AsyncClient, blog_url: str, proxy_url: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """
+        블로그 포스트(PostView) 본문의 첨부 placeId 목록
+        
+        Returns:
+            placeId 목록 (첨부 없으면 빈 목록), 요청 실패 시 None (캐시하지 않음)
+        """
+        # URL을 PostView.naver 형식으로 직접 변환
+        # https://blog.naver.com/username/postid → https://blog.naver.com/PostView.naver?blogId=username&logNo=postid
+        match = _BLOG_POST_URL_PATTERN.match(blog_url)
+        if not match:
+            logger.info(f"[블로그 필터링] URL 패턴 불일치: {blog_url}")
+            return []
+        
+        username, post_id = match.groups()
+        postview_url = f"https://blog.naver.com/PostView.naver?blogId={username}&logNo={post_id}"
+        
+        try:
+            # PostView URL로 직접 실제 컨텐츠 가져오기
+            with observe_upstream("naver_html", "blog_post", connection_type(proxy_url)) as obs:
+                response = await client.get(postview_url, headers=self.headers, follow_redirects=True)
+                obs.set_status(response.status_code)
             
-            # "YY.MM.DD." 또는 "YY.M.D." (20xx년 가정)
-            match = re.match(r'(\d{2})\.(\d{1,2})\.(\d{1,2})\.?', date_str)
-            if match:
-                year_short = int(match.group(1))
-                year = 2000 + year_short if year_short < 50 else 1900 + year_short
-                month, day = int(match.group(2)), int(match.group(3))
-                return datetime(year, month, day, tzinfo=KST)
+            if response.status_code != 200:
+                logger.info(f"[블로그 필터링] HTTP {response.status_code}: {postview_url}")
+                return None
             
-            logger.warning(f"[블로그 검색] 알 수 없는 날짜 형식: {date_str}")
-            return None
-        
+            place_ids = await run_parser(self._extract_blog_post_place_ids, response.text)
         except Exception as e:
-            logger.error(f"[블로그 검색] 날짜 파싱 오류: {date_str}, {str(e)}")
+            logger.debug(f"[블로그 필터링] 예외 {type(e).__name__}: {blog_url}")
             return None
+        
+        logger.debug(f"[블로그 필터링] 첨부 placeId {place_ids[:3]}: {blog_url}")
+        return place_ids
+    
+    @staticmethod
+    def _extract_blog_post_place_ids(html: str) -> List[str]:
+        """PostView 본문 HTML의 첨부 placeId 목록 (중복 제거, run_parser로 스레드에서 호출)"""
+        doc = parse_html(html)
+        found_place_ids = []
+        
+        # 방법 1: data-linkdata 속성에서 placeId 추출
+        for link in doc.select('a[data-linkdata]'):
+            try:
+                link_data = json.loads(link.attr('data-linkdata', '').replace('&quot;', '"'))
+                post_place_id = str(link_data.get('placeId', '') or '')
+                if post_place_id:
+                    found_place_ids.append(post_place_id)
+            except (json.JSONDecodeError, KeyError, AttributeError):
+                continue
+        
+        # 방법 2: iframe src에서 placeId 추출
+        for iframe in doc.select('iframe[src*="place.naver.com"]'):
+            found_place_ids.extend(_PLACE_IFRAME_ID_PATTERN.findall(iframe.attr('src', '')))
+        
+        # 방법 3: 직접 링크에서 placeId 추출
+        for link in doc.select('a[href*="place.naver.com"]'):
+            found_place_ids.extend(_PLACE_LINK_PATTERN.findall(link.attr('href', '')))
+        
+        return list(dict.fromkeys(found_place_ids))
     
     async def _extract_place_id_from_blog_post(self, blog_url: str, place_id: str) -> bool:
         """
-        블로그 포스트에서 placeId 추출하여 일치 여부 확인 (병렬 처리용)
+        블로그 포스트에 place_id 지도가 첨부되어 있는지 확인 (blog_post_places 캐시 사용)
         
         Args:
             blog_url: 블로그 포스트 URL
             place_id: 확인할 placeId
         
         Returns:
-            bool: placeId가 일치하면 True, 아니면 False
+            bool: placeId가 일치하면 True, 아니면 False (확인 실패 포함)
         """
-        try:
-            import json
-            from bs4 import BeautifulSoup
-            
-            # URL을 PostView.naver 형식으로 직접 변환
-            # https://blog.naver.com/username/postid → https://blog.naver.com/PostView.naver?blogId=username&logNo=postid
-            match = re.match(r'https://blog\.naver\.com/([^/]+)/(\d+)', blog_url)
-            if not match:
-                logger.info(f"[블로그 필터링] URL 패턴 불일치: {blog_url}")
-                return False
-            
-            username, post_id = match.groups()
-            postview_url = f"https://blog.naver.com/PostView.naver?blogId={username}&logNo={post_id}"
-            
-            logger.info(f"[블로그 필터링] PostView URL 변환: {blog_url} → {postview_url}")
-            
-            # 프록시 조건부 설정
-            client_kwargs = {"timeout": 5.0}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
-            
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                # PostView URL로 직접 실제 컨텐츠 가져오기
-                response = await client.get(postview_url, headers=self.headers, follow_redirects=True)
-                
-                if response.status_code != 200:
-                    logger.info(f"[블로그 필터링] HTTP {response.status_code}: {postview_url}")
-                    return False
-                
-                frame_html = response.text
-                frame_soup = BeautifulSoup(frame_html, 'html.parser')
-                
-                logger.info(f"[블로그 필터링] HTML 길이: {len(frame_html)} bytes")
-                
-                # placeId 검색
-                found_place_ids = []
-                
-                # 방법 1: data-linkdata 속성에서 placeId 추출
-                map_links = frame_soup.find_all('a', attrs={'data-linkdata': True})
-                logger.info(f"[블로그 필터링] data-linkdata 링크 {len(map_links)}개 발견: {blog_url}")
-                
-                for link in map_links:
-                    try:
-                        link_data_str = link['data-linkdata'].replace('&quot;', '"')
-                        link_data = json.loads(link_data_str)
-                        post_place_id = str(link_data.get('placeId', ''))
-                        if post_place_id:
-                            found_place_ids.append(post_place_id)
-                        if post_place_id == place_id:
-                            logger.info(f"[블로그 필터링] ✅ placeId 일치 (data-linkdata): {blog_url}")
-                            return True
-                    except (json.JSONDecodeError, KeyError):
-                        continue
-                
-                # 방법 2: iframe src에서 placeId 추출
-                iframes = frame_soup.find_all('iframe', src=re.compile(r'place\.naver\.com'))
-                logger.info(f"[블로그 필터링] iframe {len(iframes)}개 발견: {blog_url}")
-                
-                for iframe in iframes:
-                    src = iframe.get('src', '')
-                    if place_id in src:
-                        logger.info(f"[블로그 필터링] ✅ placeId 일치 (iframe): {blog_url}")
-                        return True
-                
-                # 방법 3: 직접 링크에서 placeId 확인
-                place_links = frame_soup.find_all('a', href=re.compile(rf'place\.naver\.com.*/place/{place_id}'))
-                logger.info(f"[블로그 필터링] place 링크 {len(place_links)}개 발견: {blog_url}")
-                
-                if place_links:
-                    logger.info(f"[블로그 필터링] ✅ placeId 일치 (링크): {blog_url}")
-                    return True
-                
-                logger.info(f"[블로그 필터링] ❌ placeId 불일치 (찾은 placeId: {found_place_ids[:3]}...): {blog_url}")
-                return False
-                
-        except asyncio.TimeoutError:
-            logger.debug(f"[블로그 필터링] Timeout: {blog_url}")
-            return False
-        except Exception as e:
-            logger.debug(f"[블로그 필터링] 예외 {type(e).__name__}: {blog_url}")
-            return False
+        place_ids = (await self.get_blog_post_place_ids([blog_url])).get(blog_url)
+        return bool(place_ids) and str(place_id) in place_ids
     
     def _parse_blog_reviews_from_html(self, html: str) -> List[Dict[str, Any]]:
         """
@@ -1505,30 +1493,28 @@ class NaverReviewService:
         Returns:
             List[Dict]: 파싱된 리뷰 목록
         """
-        from bs4 import BeautifulSoup
-        
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = parse_html(html)
         reviews = []
         
         # listitem 요소 찾기 (블로그 리뷰 아이템)
-        list_items = soup.find_all('li', role='listitem')
+        list_items = doc.select('li[role="listitem"]')
         logger.info(f"[블로그 HTML] listitem 개수: {len(list_items)}")
         
         for idx, item in enumerate(list_items):
             try:
                 # time 태그에서 날짜 추출 (예: "24.7.17.수")
-                time_tag = item.find('time')
+                time_tag = item.select_one('time')
                 if not time_tag:
                     if idx < 3:  # 처음 3개만 로그
                         logger.debug(f"[블로그 HTML] 아이템 {idx}: time 태그 없음")
                     continue
                 
-                date_str = time_tag.get_text(strip=True)
+                date_str = time_tag.text()
                 if idx < 3:
                     logger.debug(f"[블로그 HTML] 아이템 {idx}: date_str={date_str}")
                 
                 # 날짜 파싱 (YY.M.D.요일 형식)
-                review_date = self._parse_blog_review_date_from_text(date_str)
+                review_date = parse_date(date_str, tz=None)
                 if not review_date:
                     if idx < 3:
                         logger.debug(f"[블로그 HTML] 아이템 {idx}: 날짜 파싱 실패")
@@ -1536,11 +1522,11 @@ class NaverReviewService:
                 
                 # 제목 추출 (첫 번째 generic 태그)
                 title_elem = item.select_one('div > div')
-                title = title_elem.get_text(strip=True) if title_elem else ""
+                title = title_elem.text() if title_elem else ""
                 
                 # 작성자 추출
                 author_elem = item.select_one('img[alt="프로필"] + div > div:first-child')
-                author = author_elem.get_text(strip=True) if author_elem else ""
+                author = author_elem.text() if author_elem else ""
                 
                 if idx < 3:
                     logger.debug(f"[블로그 HTML] 아이템 {idx}: title={title[:30]}..., author={author}")
@@ -1551,7 +1537,7 @@ class NaverReviewService:
                     "title": title,
                     "author": author
                 })
-                
+            
             except Exception as e:
                 if idx < 3:
                     logger.warning(f"[블로그 HTML] 아이템 {idx} 파싱 예외: {e}")
@@ -1591,7 +1577,7 @@ class NaverReviewService:
                                 # 날짜 파싱
                                 date_str = item.get('date') or item.get('createdString', '')
                                 if date_str:
-                                    review_date = self._parse_blog_review_date_from_text(date_str)
+                                    review_date = parse_date(date_str, tz=None)
                                     if review_date:
                                         reviews.append({
                                             'date': review_date.isoformat(),
@@ -1602,53 +1588,10 @@ class NaverReviewService:
             
             logger.info(f"[블로그 HTML-Fast] Apollo State에서 {len(reviews)}개 추출")
             return reviews
-            
+        
         except Exception as e:
             logger.warning(f"[블로그 HTML-Fast] Apollo State 파싱 실패: {e}")
             return []
-    
-    def _parse_blog_review_date_from_text(self, date_str: str) -> Optional[datetime]:
-        """
-        블로그 리뷰 날짜 문자열 파싱
-        
-        지원 형식:
-        - "24.7.17.수", "26.1.1.목" (YY.M.D.요일)
-        - "2025.09.30." (YYYY.MM.DD.)
-        - ISO 형식
-        
-        Args:
-            date_str: 날짜 문자열
-        
-        Returns:
-            datetime 객체 또는 None
-        """
-        try:
-            # 1. ISO 형식 시도
-            if 'T' in date_str or '-' in date_str:
-                try:
-                    dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    return dt.replace(tzinfo=None)  # naive datetime으로 변환
-                except:
-                    pass
-            
-            # 2. YYYY.MM.DD. 형식 (예: "2025.09.30.")
-            match = re.match(r'(\d{4})\.(\d{1,2})\.(\d{1,2})', date_str)
-            if match:
-                year, month, day = match.groups()
-                return datetime(int(year), int(month), int(day))
-            
-            # 3. YY.M.D.요일 형식 (예: "24.7.17.수")
-            match = re.match(r'(\d{2})\.(\d{1,2})\.(\d{1,2})', date_str)
-            if match:
-                year_short, month, day = match.groups()
-                year = 2000 + int(year_short)
-                return datetime(year, int(month), int(day))
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"[블로그 HTML-Fast] 날짜 파싱 실패: {date_str}, {e}")
-            return None
 
 
 # 싱글톤 인스턴스
@@ -12,7 +12,6 @@ import asyncio
 import logging
 import time
 from typing import List, Dict
-from playwright.sync_api import sync_playwright
 import re
 
 logger = logging.getLogger(__name__)
@@ -48,6 +47,7 @@ class NaverStoreSearchService:
         try:
             # Playwright 초기화 (동기 버전)
             logger.info("[Step 2/4] Initializing browser...")
+            from playwright.sync_api import sync_playwright
             playwright_context = sync_playwright()
             playwright = playwright_context.__enter__()
             
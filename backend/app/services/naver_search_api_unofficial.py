@@ -13,7 +13,8 @@ import json
 from typing import List, Dict, Optional
 import asyncio
 import random
-from app.core.proxy import get_proxy, report_proxy_success, report_proxy_failure
+from app.core.proxy import proxy_slot
+from app.core.metrics import connection_type, observe_upstream
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +47,7 @@ class NaverPlaceNewAPIService:
         
         self.timeout = 15.0
         # 프록시는 요청 시점에 동적으로 가져옴 (상태 기반 자동 폴백)
-        
+    
     async def search_stores(self, query: str, max_results: int = 100) -> List[Dict[str, str]]:
         """
         네이버 플레이스에서 매장 검색 (신API - 빠름!)
@@ -54,7 +55,7 @@ class NaverPlaceNewAPIService:
         Args:
             query: 검색할 매장명
             max_results: 최대 결과 개수 (기본 100개)
-            
+        
         Returns:
             매장 정보 리스트
         """
@@ -80,19 +81,18 @@ class NaverPlaceNewAPIService:
                 "query": graphql_query
             }
             
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.timeout}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.post(
-                    self.api_url,
-                    json=payload,
-                    headers=self.base_headers,
-                    follow_redirects=True
-                )
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_graphql", payload["operationName"], connection_type(proxy_url)) as obs:
+                    response = await client.post(
+                        self.api_url,
+                        json=payload,
+                        headers=self.base_headers,
+                        follow_redirects=True
+                    )
+                    obs.set_status(response.status_code)
                 
                 response.raise_for_status()
                 data = response.json()
@@ -102,7 +102,7 @@ class NaverPlaceNewAPIService:
                 
                 logger.info(f"[신API] 검색 완료: {len(stores)}개 발견")
                 return stores
-                
+        
         except httpx.HTTPStatusError as e:
             logger.error(f"[신API] HTTP 오류 {e.response.status_code}: {e.response.text[:200]}")
             # GraphQL API 실패 시 크롤링 방식으로 폴백
@@ -221,15 +221,15 @@ class NaverPlaceNewAPIService:
         except Exception as e:
             logger.error(f"[신API → 크롤링] 크롤링도 실패: {str(e)}")
             raise Exception(f"신API와 크롤링 모두 실패: {str(e)}")
-
-
+    
+    
     async def check_naverpay_from_search_html(self, place_id: str, store_name: str) -> bool:
         """검색 결과 HTML에서 네이버페이 아이콘 확인
         
         Args:
             place_id: 네이버 플레이스 ID
             store_name: 매장명
-            
+        
         Returns:
             네이버페이 사용 여부 (True: 사용중, False: 미사용)
         """
@@ -247,14 +247,13 @@ class NaverPlaceNewAPIService:
                 "Connection": "keep-alive",
             }
             
-            # 프록시 조건부 설정
             client_kwargs = {"timeout": self.timeout}
-            proxy_url = get_proxy()
-            if proxy_url:
-                client_kwargs["proxy"] = proxy_url
             
-            async with httpx.AsyncClient(**client_kwargs) as client:
-                response = await client.get(search_url, headers=headers, follow_redirects=True)
+            # 프록시 슬롯 점유 + 성공/실패 보고 (동시 사용 제한, 헬스 추적)
+            async with proxy_slot() as proxy_url, httpx.AsyncClient(**client_kwargs, proxy=proxy_url) as client:
+                with observe_upstream("naver_html", "map_search", connection_type(proxy_url)) as obs:
+                    response = await client.get(search_url, headers=headers, follow_redirects=True)
+                    obs.set_status(response.status_code)
                 response.raise_for_status()
                 html = response.text
             
@@ -337,7 +336,7 @@ class NaverPlaceNewAPIService:
                 logger.info(f"[네이버페이 체크] ❌ 네이버페이 미사용: {store_name} (hasNPay:true 없음)")
             
             return has_naverpay
-            
+        
         except Exception as e:
             logger.error(f"[네이버페이 체크] 오류: {str(e)}")
             # 오류 시 False 반환 (보수적 판단)
@@ -10,7 +10,6 @@ import logging
 import time
 import urllib.parse
 from typing import List, Dict
-from playwright.sync_api import sync_playwright
 import re
 
 logger = logging.getLogger(__name__)
@@ -45,6 +44,7 @@ class NaverPlaceSearchService:
         
         try:
             # Playwright 시작
+            from playwright.sync_api import sync_playwright
             playwright_manager = sync_playwright().start()
             
             browser = playwright_manager.chromium.launch(
@@ -27,11 +27,12 @@ class NaverSeleniumService:
     def __init__(self):
         self.active_user_id = "default"
         self._loading_progress: Dict[str, Dict] = {}
+        self.active_driver_count = 0  # 실행 중인 Chrome 드라이버 수 (/metrics)
 
     def set_active_user(self, user_id: str):
         """활성 사용자 설정"""
         self.active_user_id = user_id
-        print(f"[SWITCH] Active user switched to: {user_id}")
+        logger.info(f"[SWITCH] Active user switched to: {user_id}")
 
     def _load_session_from_supabase(self, user_id: str = "default", store_id: str = None):
         """Supabase의 stores 테이블에서 세션 로드"""
@@ -60,14 +61,14 @@ class NaverSeleniumService:
                                 # Debug: Check critical cookies
                                 critical_cookies = [c['name'] for c in cookies if c.get('name') in ['NID_AUT', 'NID_SES']]
                                 identifier = f"store '{store_id}'" if store_id else f"user '{user_id}'"
-                                print(f"[BATCH] Found session in Supabase for {identifier} ({len(cookies)} cookies, critical: {critical_cookies})")
+                                logger.debug(f"[BATCH] Found session in Supabase for {identifier} ({len(cookies)} cookies, critical: {critical_cookies})")
                                 return {'cookies': cookies}
                         except json.JSONDecodeError as je:
                             logger.error(f"[ERROR] Failed to parse session JSON: {je}")
                             continue
 
             identifier = f"store '{store_id}'" if store_id else f"user '{user_id}'"
-            print(f"[WARN] No valid session found in Supabase for {identifier}")
+            logger.warning(f"[WARN] No valid session found in Supabase for {identifier}")
             return None
         except Exception as e:
             logger.error(f"[ERROR] Supabase session load error: {e}")
@@ -77,7 +78,7 @@ class NaverSeleniumService:
         """Chrome WebDriver 생성"""
         effective_user_id = user_id if user_id else self.active_user_id
 
-        print(f"[WEB] Creating Chrome WebDriver for user: {effective_user_id}")
+        logger.info(f"[WEB] Creating Chrome WebDriver for user: {effective_user_id}")
 
         chrome_options = Options()
         if headless:
@@ -100,7 +101,7 @@ class NaverSeleniumService:
         cookies = None
 
         if session_data:
-            print(f"[OK] Using session from Supabase for user: {effective_user_id}")
+            logger.info(f"[OK] Using session from Supabase for user: {effective_user_id}")
             cookies = session_data.get('cookies')
             # #region agent log
             import json as json_module
@@ -116,7 +117,7 @@ class NaverSeleniumService:
 
         # Load cookies if found
         if cookies:
-            print(f"[LOAD] Loading {len(cookies)} cookies...")
+            logger.debug(f"[LOAD] Loading {len(cookies)} cookies...")
 
             # Check expiry of cookies before loading
             current_time = time.time()
@@ -126,11 +127,11 @@ class NaverSeleniumService:
                     expiry = cookie.get('expiry')
                     if expiry:
                         if expiry < current_time:
-                            print(f"   [WARN] Cookie '{cookie['name']}' in DB is EXPIRED! (expired {int((current_time - expiry) / 3600)} hours ago)")
+                            logger.warning(f"   [WARN] Cookie '{cookie['name']}' in DB is EXPIRED! (expired {int((current_time - expiry) / 3600)} hours ago)")
                         else:
-                            print(f"   [OK] Cookie '{cookie['name']}' in DB is valid (expires in {int((expiry - current_time) / 3600)} hours)")
+                            logger.debug(f"   [OK] Cookie '{cookie['name']}' in DB is valid (expires in {int((expiry - current_time) / 3600)} hours)")
                     else:
-                        print(f"   [INFO] Cookie '{cookie['name']}' is a session cookie (no expiry)")
+                        logger.debug(f"   [INFO] Cookie '{cookie['name']}' is a session cookie (no expiry)")
 
             driver.get('https://www.naver.com')
             time.sleep(1)
@@ -174,41 +175,41 @@ class NaverSeleniumService:
                     cookie_name = cookie.get('name', 'unknown')
                     failed_cookies.append(cookie_name)
                     if cookie_name in critical_cookies:
-                        print(f"[ERROR] CRITICAL: Failed to add cookie '{cookie_name}': {str(e)[:80]}")
+                        logger.error(f"[ERROR] CRITICAL: Failed to add cookie '{cookie_name}': {str(e)[:80]}")
                     else:
                         logger.debug(f"Failed to add cookie '{cookie_name}': {str(e)}")
 
-            print(f"[OK] Added {cookies_added}/{len(cookies)} cookies")
-            print(f"[KEY] Critical cookies added: {critical_added}")
+            logger.info(f"[OK] Added {cookies_added}/{len(cookies)} cookies")
+            logger.info(f"[KEY] Critical cookies added: {critical_added}")
 
             # Check if critical cookies were added
             missing_critical = [c for c in critical_cookies if c not in critical_added]
             if missing_critical:
-                print(f"[WARN] WARNING: Missing critical cookies: {missing_critical}")
-                print(f"   This may cause login issues!")
+                logger.warning(f"[WARN] WARNING: Missing critical cookies: {missing_critical}")
+                logger.warning(f"   This may cause login issues!")
 
             driver.refresh()
             time.sleep(2)
             
             # CRITICAL: Navigate to smartplace BIZES domain to activate session
             # This ensures cookies work for business pages, not just main page
-            print("[SESSION] Activating session on smartplace bizes domain...")
+            logger.info("[SESSION] Activating session on smartplace bizes domain...")
             driver.get('https://new.smartplace.naver.com/bizes')
             time.sleep(3)
             
             # Verify not redirected to login
             current_url = driver.current_url
             if 'nidlogin.login' in current_url or 'nid.naver.com/nidlogin' in current_url:
-                print(f"[ERROR] Session invalid! Redirected to login page: {current_url}")
+                logger.error(f"[ERROR] Session invalid! Redirected to login page: {current_url}")
                 raise Exception("세션 쿠키가 유효하지 않습니다. '네이버 세션 관리'에서 다시 로그인해주세요.")
             
-            print("[OK] Session cookies loaded and verified")
+            logger.info("[OK] Session cookies loaded and verified")
 
         return driver
 
     def get_reviews(self, place_id: str, load_count: int = 50) -> Dict:
         """리뷰 가져오기 (Selenium 스크롤 방식)"""
-        print(f"[NOTE] Getting {load_count} reviews for place: {place_id}")
+        logger.info(f"[NOTE] Getting {load_count} reviews for place: {place_id}")
 
         # Initialize progress
         self._loading_progress[place_id] = {
@@ -221,9 +222,10 @@ class NaverSeleniumService:
         driver = None
         try:
             driver = self._create_driver(headless=True, user_id=self.active_user_id)
+            self.active_driver_count += 1
 
             reviews_url = f'https://new.smartplace.naver.com/bizes/place/{place_id}/reviews?menu=visitor'
-            print(f"[LINK] Accessing: {reviews_url}")
+            logger.debug(f"[LINK] Accessing: {reviews_url}")
             self._loading_progress[place_id]['message'] = '[PAGE] 리뷰 페이지 접속 중...'
 
             driver.get(reviews_url)
@@ -239,7 +241,7 @@ class NaverSeleniumService:
                 pass
 
             # Scroll to load reviews (IMPROVED: More aggressive scrolling)
-            print(f"[SCROLL] Scrolling to load {load_count} reviews...")
+            logger.debug(f"[SCROLL] Scrolling to load {load_count} reviews...")
             self._loading_progress[place_id]['message'] = f'[SCROLL] 스크롤 시작! (목표: {load_count}개)'
 
             last_count = 0
@@ -272,18 +274,18 @@ class NaverSeleniumService:
                     'timestamp': datetime.now()
                 })
 
-                print(f"  Scroll {scroll + 1}: {current_count} reviews loaded")
+                logger.debug(f"  Scroll {scroll + 1}: {current_count} reviews loaded")
 
                 # Check if enough reviews loaded
                 if current_count >= load_count:
-                    print(f"[OK] Target reached: {current_count} reviews")
+                    logger.info(f"[OK] Target reached: {current_count} reviews")
                     break
 
                 # Check if no new reviews loaded (more patient)
                 if current_count == last_count:
                     no_change += 1
                     if no_change >= 5:  # Increased from 3 to 5
-                        print(f"[WARN] No more reviews to load after {no_change} attempts")
+                        logger.warning(f"[WARN] No more reviews to load after {no_change} attempts")
                         break
                 else:
                     no_change = 0
@@ -306,7 +308,7 @@ class NaverSeleniumService:
                 time.sleep(1.0)  # Increased from 0.5 to 1.0
 
             # Parse reviews
-            print(f"[BATCH] Parsing {len(valid_reviews)} reviews...")
+            logger.debug(f"[BATCH] Parsing {len(valid_reviews)} reviews...")
             parsed_reviews = []
 
             for idx, li in enumerate(valid_reviews[:load_count]):
@@ -387,7 +389,7 @@ class NaverSeleniumService:
                 'timestamp': datetime.now()
             })
 
-            print(f"[OK] Successfully parsed {len(parsed_reviews)} reviews")
+            logger.info(f"[OK] Successfully parsed {len(parsed_reviews)} reviews")
 
             return {
                 'reviews': parsed_reviews,
@@ -396,7 +398,7 @@ class NaverSeleniumService:
 
         except Exception as e:
             error_msg = str(e)
-            print(f"[ERROR] Error loading reviews: {error_msg}")
+            logger.error(f"[ERROR] Error loading reviews: {error_msg}")
             logger.error(f"Error in get_reviews: {error_msg}")
 
             self._loading_progress[place_id].update({
@@ -409,6 +411,7 @@ class NaverSeleniumService:
 
         finally:
             if driver:
+                self.active_driver_count = max(0, self.active_driver_count - 1)
                 try:
                     driver.quit()
                 except:
@@ -432,27 +435,28 @@ class NaverSeleniumService:
 
         driver = None
         try:
-            print(f"[MSG] Posting reply to: {author} ({date}) for user: {current_user_id}")
+            logger.info(f"[MSG] Posting reply to: {author} ({date}) for user: {current_user_id}")
 
             driver = self._create_driver(headless=True, user_id=current_user_id, store_id=store_id)
+            self.active_driver_count += 1
 
             # Skip pre-verification, go directly to smartplace
             # (Verification will happen when we check the URL after loading)
 
             # Go to reviews page with unreplied filter
             reviews_url = f'https://new.smartplace.naver.com/bizes/place/{place_id}/reviews?menu=visitor&hasReply=false'
-            print(f"[LINK] Opening: {reviews_url}")
+            logger.debug(f"[LINK] Opening: {reviews_url}")
             driver.get(reviews_url)
 
             # Optimized wait: reduced from 5s to 3s
-            print(f"[WAIT] Waiting for page to load...")
+            logger.debug(f"[WAIT] Waiting for page to load...")
             time.sleep(3)
             
             # Check if redirected to login page
             current_url = driver.current_url
             if 'nidlogin.login' in current_url or 'nid.naver.com/nidlogin' in current_url:
-                print(f"[ERROR] Session expired! Redirected to login page")
-                print(f"   Current URL: {current_url}")
+                logger.error(f"[ERROR] Session expired! Redirected to login page")
+                logger.error(f"   Current URL: {current_url}")
                 raise Exception("세션이 만료되었습니다. '네이버 세션 관리'에서 다시 로그인해주세요.")
 
             # [DEBUG] Check if redirected to login page
@@ -465,23 +469,23 @@ class NaverSeleniumService:
             if smartplace_match:
                 actual_smartplace_id = smartplace_match.group(1)
                 if actual_smartplace_id != place_id:
-                    print(f"[INFO] Redirected: place_id {place_id} -> smartplace_id {actual_smartplace_id}")
+                    logger.info(f"[INFO] Redirected: place_id {place_id} -> smartplace_id {actual_smartplace_id}")
                     # Update the place_id for subsequent operations
                     place_id = actual_smartplace_id
             if 'nidlogin' in current_url or 'login' in current_url.lower():
                 error_msg = "로그인 세션이 만료되었거나 유효하지 않습니다. 네이버 세션 관리에서 다시 로그인해주세요."
-                print(f"[ERROR] {error_msg}")
-                print(f"   Current URL: {current_url}")
-                print(f"   Loaded cookies: {cookies_added}/{len(cookies)}")
-                print(f"   Critical cookies: {critical_added}")
+                logger.error(f"[ERROR] {error_msg}")
+                logger.error(f"   Current URL: {current_url}")
+                logger.error(f"   Loaded cookies: {cookies_added}/{len(cookies)}")
+                logger.error(f"   Critical cookies: {critical_added}")
 
                 # Get current cookies from browser
                 try:
                     current_cookies = driver.get_cookies()
                     naver_cookies = [c for c in current_cookies if 'naver.com' in c.get('domain', '')]
                     critical_in_browser = [c['name'] for c in naver_cookies if c['name'] in ['NID_AUT', 'NID_SES']]
-                    print(f"   Browser has {len(naver_cookies)} naver cookies")
-                    print(f"   Critical cookies in browser: {critical_in_browser}")
+                    logger.debug(f"   Browser has {len(naver_cookies)} naver cookies")
+                    logger.debug(f"   Critical cookies in browser: {critical_in_browser}")
 
                     # Check expiry of critical cookies
                     for c in naver_cookies:
@@ -490,17 +494,17 @@ class NaverSeleniumService:
                             if expiry:
                                 current_time = time.time()
                                 if expiry < current_time:
-                                    print(f"   [WARN] Cookie '{c['name']}' is EXPIRED! (expired {int((current_time - expiry) / 3600)} hours ago)")
+                                    logger.warning(f"   [WARN] Cookie '{c['name']}' is EXPIRED! (expired {int((current_time - expiry) / 3600)} hours ago)")
                                 else:
-                                    print(f"   [OK] Cookie '{c['name']}' is valid (expires in {int((expiry - current_time) / 3600)} hours)")
+                                    logger.debug(f"   [OK] Cookie '{c['name']}' is valid (expires in {int((expiry - current_time) / 3600)} hours)")
                 except Exception as e:
-                    print(f"   Error checking browser cookies: {e}")
+                    logger.debug(f"   Error checking browser cookies: {e}")
 
                 # Take screenshot for debugging
                 try:
                     screenshot_path = f"login_error_{place_id}.png"
                     driver.save_screenshot(screenshot_path)
-                    print(f"   [SCREENSHOT] Screenshot saved: {screenshot_path}")
+                    logger.debug(f"   [SCREENSHOT] Screenshot saved: {screenshot_path}")
                 except:
                     pass
 
@@ -511,14 +515,14 @@ class NaverSeleniumService:
                 popup_btn = driver.find_element(By.CSS_SELECTOR, "button.Modal_btn_confirm__uQZFR")
                 if popup_btn.is_displayed():
                     driver.execute_script("arguments[0].click();", popup_btn)
-                    print(f"[OK] Closed popup")
+                    logger.debug(f"[OK] Closed popup")
                     time.sleep(2)
             except:
-                print(f"[INFO] No popup found")
+                logger.debug(f"[INFO] No popup found")
                 pass
 
             # Wait for reviews to load (optimized)
-            print(f"[WAIT] Waiting for reviews to render...")
+            logger.debug(f"[WAIT] Waiting for reviews to render...")
             time.sleep(2)  # Optimized: reduced wait time
 
             # [TARGET] SMART FILTER: Apply date filter to reduce search time
@@ -556,19 +560,19 @@ class NaverSeleniumService:
                 target_month = date_parts[0]  # "1"
                 target_day = date_parts[1]    # "10"
 
-                print(f"[CALENDAR] No year in date, assuming current year: {target_year}")
+                logger.debug(f"[CALENDAR] No year in date, assuming current year: {target_year}")
             else:
                 # Cannot parse date
                 raise Exception(f"Cannot parse date: {date}")
 
             filter_date = f"{target_year}.{target_month.zfill(2)}.{target_day.zfill(2)}"  # "2025.12.21"
-            print(f"[CALENDAR] Attempting to apply date filter: {filter_date}")
-            print(f"   -> Target: Year={target_year}, Month={target_month}, Day={target_day}")
+            logger.debug(f"[CALENDAR] Attempting to apply date filter: {filter_date}")
+            logger.debug(f"   -> Target: Year={target_year}, Month={target_month}, Day={target_day}")
 
             try:
                 # NEW SIMPLE APPROACH: Use "일간" (daily) mode + prev/next buttons
                 # Step 1: Find and click "전체" dropdown button
-                print(f"\n[CALENDAR] Step 1: Looking for '전체' dropdown button...")
+                logger.debug(f"[CALENDAR] Step 1: Looking for '전체' dropdown button...")
 
                 jeonche_button = None
                 jeonche_selectors = [
@@ -588,7 +592,7 @@ class NaverSeleniumService:
                                 btn_text = btn.text.strip()
                                 if '전체' in btn_text:
                                     jeonche_button = btn
-                                    print(f"   [OK] Found '전체' button")
+                                    logger.debug(f"   [OK] Found '전체' button")
                                     break
                             except:
                                 continue
@@ -602,12 +606,12 @@ class NaverSeleniumService:
                     raise Exception("Could not find '전체' button")
 
                 # Click the "전체" button to open dropdown
-                print(f"[CALENDAR] Clicking '전체' button...")
+                logger.debug(f"[CALENDAR] Clicking '전체' button...")
                 driver.execute_script("arguments[0].click();", jeonche_button)
                 time.sleep(1)  # Optimized: reduced from 2s to 1s
 
                 # Step 2: Find and click "일간" (daily) option
-                print(f"\n[CALENDAR] Step 2: Looking for '일간' option...")
+                logger.debug(f"[CALENDAR] Step 2: Looking for '일간' option...")
 
                 ilgan_button = None
                 ilgan_selectors = [
@@ -628,7 +632,7 @@ class NaverSeleniumService:
                                 elem_text = elem.text.strip()
                                 if '일간' in elem_text and elem.is_displayed():
                                     ilgan_button = elem
-                                    print(f"   [OK] Found '일간' option")
+                                    logger.debug(f"   [OK] Found '일간' option")
                                     break
                             except:
                                 continue
@@ -642,12 +646,12 @@ class NaverSeleniumService:
                     raise Exception("Could not find '일간' option")
 
                 # Click the "일간" option
-                print(f"[CALENDAR] Clicking '일간' option...")
+                logger.debug(f"[CALENDAR] Clicking '일간' option...")
                 driver.execute_script("arguments[0].click();", ilgan_button)
                 time.sleep(1)  # Optimized: reduced from 2s to 1s
 
                 # Step 3: Calculate days difference and click "이전" button
-                print(f"\n[CALENDAR] Step 3: Calculating date difference...")
+                logger.debug(f"[CALENDAR] Step 3: Calculating date difference...")
 
                 from datetime import datetime, timedelta
 
@@ -656,20 +660,20 @@ class NaverSeleniumService:
                 today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
                 days_diff = (today - target_date_obj).days
-                print(f"   Today: {today.strftime('%Y-%m-%d')}")
-                print(f"   Target: {target_date_obj.strftime('%Y-%m-%d')}")
-                print(f"   Days difference: {days_diff} days")
+                logger.debug(f"   Today: {today.strftime('%Y-%m-%d')}")
+                logger.debug(f"   Target: {target_date_obj.strftime('%Y-%m-%d')}")
+                logger.debug(f"   Days difference: {days_diff} days")
 
                 if days_diff < 0:
-                    print(f"   [ERROR] Target date is in the future! Cannot navigate.")
+                    logger.error(f"   [ERROR] Target date is in the future! Cannot navigate.")
                     raise Exception(f"Target date {filter_date} is in the future")
 
                 if days_diff == 0:
-                    print(f"   [OK] Target date is today, no navigation needed")
+                    logger.debug(f"   [OK] Target date is today, no navigation needed")
                     filter_applied = True
                 else:
                     # Find the "이전" (previous) button
-                    print(f"\n[CALENDAR] Step 4: Finding '이전' button...")
+                    logger.debug(f"[CALENDAR] Step 4: Finding '이전' button...")
 
                     prev_button = None
                     prev_selectors = [
@@ -687,7 +691,7 @@ class NaverSeleniumService:
 
                             if buttons:
                                 prev_button = buttons[0]
-                                print(f"   [OK] Found '이전' button")
+                                logger.debug(f"   [OK] Found '이전' button")
                                 break
                         except:
                             continue
@@ -696,7 +700,7 @@ class NaverSeleniumService:
                         raise Exception("Could not find '이전' (previous) button")
 
                     # Click the "이전" button multiple times (OPTIMIZED)
-                    print(f"\n[CALENDAR] Step 5: Clicking '이전' button {days_diff} times...")
+                    logger.debug(f"[CALENDAR] Step 5: Clicking '이전' button {days_diff} times...")
 
                     # Optimized click strategy
                     for i in range(days_diff):
@@ -705,24 +709,24 @@ class NaverSeleniumService:
 
                             # Progress indicator every 20 clicks (less frequent)
                             if (i + 1) % 20 == 0:
-                                print(f"   Progress: {i + 1}/{days_diff} clicks")
+                                logger.debug(f"   Progress: {i + 1}/{days_diff} clicks")
 
                             # Optimized delay: faster clicks for better performance
                             # 0.05초 = 50ms (충분히 빠르면서도 안정적)
                             time.sleep(0.05)
                         except Exception as e:
-                            print(f"   [ERROR] Failed to click at iteration {i + 1}: {e}")
+                            logger.error(f"   [ERROR] Failed to click at iteration {i + 1}: {e}")
                             raise
 
-                    print(f"   [OK] Successfully navigated to {filter_date} ({days_diff} clicks completed)")
+                    logger.debug(f"   [OK] Successfully navigated to {filter_date} ({days_diff} clicks completed)")
                     filter_applied = True
 
                     # Reduced wait time for page update
                     time.sleep(1.5)
 
             except Exception as e:
-                print(f"   [WARN] Failed to apply date filter via calendar UI: {e}")
-                print(f"   -> Falling back to scroll method")
+                logger.warning(f"   [WARN] Failed to apply date filter via calendar UI: {e}")
+                logger.warning(f"   -> Falling back to scroll method")
                 filter_applied = False
 
             # Clean target date - "월.일" 형식으로 정규화
@@ -745,20 +749,20 @@ class NaverSeleniumService:
 
             author_prefix = author[:min(3, len(author))]
 
-            print(f"[TARGET] Target: author='{author_prefix}...', date_original='{date}' -> date_clean='{date_clean}'")
-            print(f"   [DATE] Date normalization steps:")
+            logger.debug(f"[TARGET] Target: author='{author_prefix}...', date_original='{date}' -> date_clean='{date_clean}'")
+            logger.debug(f"   [DATE] Date normalization steps:")
             temp = date
-            print(f"      1. Original: '{temp}'")
+            logger.debug(f"      1. Original: '{temp}'")
             temp = re.sub(r'^\d{4}\.\s*', '', temp)
-            print(f"      2. After removing 4-digit year: '{temp}'")
+            logger.debug(f"      2. After removing 4-digit year: '{temp}'")
             temp = re.sub(r'^(\d{2})\.(\s*)(?=(?:1[0-2]|[1-9])\.)', '', temp)
-            print(f"      3. After removing 2-digit year (smart): '{temp}'")
+            logger.debug(f"      3. After removing 2-digit year (smart): '{temp}'")
             temp = re.sub(r'\([^)]*\)', '', temp)
-            print(f"      4. After removing (...): '{temp}'")
+            logger.debug(f"      4. After removing (...): '{temp}'")
             temp = re.sub(r'\.(월|화|수|목|금|토|일)$', '', temp)
-            print(f"      5. After removing .요일: '{temp}'")
+            logger.debug(f"      5. After removing .요일: '{temp}'")
             temp = re.sub(r'\s+', '', temp).strip()
-            print(f"      6. Final (no spaces): '{temp}'")
+            logger.debug(f"      6. Final (no spaces): '{temp}'")
 
             # Scroll to find target review
             target_review = None
@@ -768,25 +772,25 @@ class NaverSeleniumService:
             if filter_applied:
                 max_scrolls = 5  # Much fewer scrolls needed with date filter!
                 max_reviews_limit = 30  # Should be very few reviews after filtering
-                print(f"[TARGET] Using optimized search (filter applied): max {max_scrolls} scrolls")
+                logger.debug(f"[TARGET] Using optimized search (filter applied): max {max_scrolls} scrolls")
             else:
                 max_scrolls = 50  # More scrolls needed without filter
                 max_reviews_limit = expected_count * 5
-                print(f"[RELOAD] Using full search (no filter): max {max_scrolls} scrolls")
+                logger.info(f"[RELOAD] Using full search (no filter): max {max_scrolls} scrolls")
 
             last_check_count = 0
             no_new_reviews_count = 0  # Count consecutive scrolls with no new reviews
 
             # [DEBUG] Debug: Check page state
-            print(f"[DEBUG] Page URL: {driver.current_url}")
-            print(f"[DEBUG] Page title: {driver.title}")
+            logger.debug(f"Page URL: {driver.current_url}")
+            logger.debug(f"Page title: {driver.title}")
             
             # [CHECK] Check if redirected to login page
             if "nid.naver.com/nidlogin" in driver.current_url or "네이버 : 로그인" in driver.title or "네이버: 로그인" in driver.title:
                 try:
-                    print("[ERROR] Redirected to login page!")
+                    logger.error("[ERROR] Redirected to login page!")
                 except:
-                    print("[ERROR] Redirected to login page!")
+                    logger.error("[ERROR] Redirected to login page!")
                 raise Exception("로그인 세션이 만료되었거나 유효하지 않습니다. 크롬 익스텐션으로 네이버 로그인 세션을 다시 저장해주세요.")
 
             for scroll_count in range(max_scrolls):
@@ -794,24 +798,24 @@ class NaverSeleniumService:
 
                 # [DEBUG] Debug: Show what we found
                 if scroll_count == 0:
-                    print(f"[DEBUG] Found {len(all_lis)} total <li> elements")
+                    logger.debug(f"Found {len(all_lis)} total <li> elements")
 
                 valid_reviews = [li for li in all_lis if self._is_valid_review_li(li)]
 
                 current_count = len(valid_reviews)
                 newly_loaded = current_count - last_check_count
 
-                print(f"  [BATCH] Batch {scroll_count + 1}: {current_count} total reviews ({newly_loaded} newly loaded, target={expected_count})")
+                logger.debug(f"  [BATCH] Batch {scroll_count + 1}: {current_count} total reviews ({newly_loaded} newly loaded, target={expected_count})")
 
                 # [DEBUG] Debug: If no reviews found in first iteration, check why
                 if scroll_count == 0 and current_count == 0:
-                    print(f"[WARN] No reviews found! Checking page state...")
-                    print(f"   - Has <li> elements: {len(all_lis) > 0}")
-                    print(f"   - Looking for class: pui__JiVbY3")
+                    logger.warning(f"[WARN] No reviews found! Checking page state...")
+                    logger.warning(f"   - Has <li> elements: {len(all_lis) > 0}")
+                    logger.warning(f"   - Looking for class: pui__JiVbY3")
                     # Try to find any element with review-like classes
                     try:
                         test_elems = driver.find_elements(By.CSS_SELECTOR, "[class*='pui']")
-                        print(f"   - Found {len(test_elems)} elements with 'pui' in class")
+                        logger.debug(f"   - Found {len(test_elems)} elements with 'pui' in class")
                     except:
                         pass
 
@@ -822,7 +826,7 @@ class NaverSeleniumService:
                 if scroll_count == 0 and len(search_reviews) > 0:
                     try:
                         first_li = search_reviews[0]
-                        print(f"\n[DEBUG] ===== FIRST REVIEW RAW DATA =====")
+                        logger.debug(f"[DEBUG] ===== FIRST REVIEW RAW DATA =====")
                         # Find all text elements
                         text_elems = first_li.find_elements(By.XPATH, ".//*[contains(@class, 'pui__')]")
                         for elem in text_elems[:10]:  # First 10 elements
@@ -830,12 +834,12 @@ class NaverSeleniumService:
                                 classes = elem.get_attribute("class")
                                 text = elem.text.strip()
                                 if text:
-                                    print(f"   Class: {classes[:50]}... | Text: {text}")
+                                    logger.debug(f"   Class: {classes[:50]}... | Text: {text}")
                             except:
                                 pass
-                        print(f"[DEBUG] ===== END FIRST REVIEW =====\n")
+                        logger.debug(f"===== END FIRST REVIEW =====")
                     except Exception as e:
-                        print(f"[WARN] Could not extract first review debug info: {e}")
+                        logger.warning(f"[WARN] Could not extract first review debug info: {e}")
 
                 for idx, li in enumerate(search_reviews):
                     try:
@@ -930,7 +934,7 @@ class NaverSeleniumService:
                         if author_match and date_match and content_match:
                             # Safe print without emoji issues
                             try:
-                                print(f"  [OK] Found exact match at position {last_check_count + idx}: '{li_author}' ({li_date_clean})")
+                                logger.debug(f"  [OK] Found exact match at position {last_check_count + idx}: '{li_author}' ({li_date_clean})")
                             except:
                                 logger.info(f"Found exact match at position {last_check_count + idx}")
                             target_review = li
@@ -939,15 +943,15 @@ class NaverSeleniumService:
                         # Debug log for first few comparisons OR when author+date matches (AFTER critical operations)
                         if (scroll_count == 0 and idx < 3) or (author_match and date_match):
                             try:
-                                print(f"  [DEBUG] Review {last_check_count + idx + 1}:")
-                                print(f"     Author: '{li_author}' (match={author_match}, looking for '{author_prefix}...')")
-                                print(f"     Date: '{li_date}' -> cleaned='{li_date_clean}' (match={date_match}, target='{date_clean}')")
+                                logger.debug(f"  [DEBUG] Review {last_check_count + idx + 1}:")
+                                logger.debug(f"     Author: '{li_author}' (match={author_match}, looking for '{author_prefix}...')")
+                                logger.debug(f"     Date: '{li_date}' -> cleaned='{li_date_clean}' (match={date_match}, target='{date_clean}')")
                                 if content_match_attempted:
-                                    print(f"     Content: match={content_match}, attempted={content_match_attempted}")
-                                    print(f"       Target (first 30): '{content[:30]}...'")
-                                    print(f"       Found (first 30): '{li_content[:30] if li_content else 'NOT EXTRACTED'}...'")
+                                    logger.debug(f"     Content: match={content_match}, attempted={content_match_attempted}")
+                                    logger.debug(f"       Target (first 30): '{content[:30]}...'")
+                                    logger.debug(f"       Found (first 30): '{li_content[:30] if li_content else 'NOT EXTRACTED'}...'")
                                 else:
-                                    print(f"     Content: skipped (author+date matching only)")
+                                    logger.debug(f"     Content: skipped (author+date matching only)")
                             except UnicodeEncodeError:
                                 # Ignore emoji encoding errors in debug logs
                                 logger.debug(f"Review {last_check_count + idx + 1}: author_match={author_match}, date_match={date_match}")
@@ -964,8 +968,8 @@ class NaverSeleniumService:
                 if not target_review and scroll_count == max_scrolls - 1:
                     if hasattr(self, '_date_matched_reviews') and len(self._date_matched_reviews) == 1:
                         match = self._date_matched_reviews[0]
-                        print(f"  [INFO] Only one review found for date '{date_clean}'")
-                        print(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
+                        logger.debug(f"  [INFO] Only one review found for date '{date_clean}'")
+                        logger.debug(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
                         target_review = match['li']
                         break
 
@@ -973,13 +977,13 @@ class NaverSeleniumService:
                 if newly_loaded == 0:
                     no_new_reviews_count += 1
                     if no_new_reviews_count >= 3:  # Stop after 3 consecutive scrolls with no new reviews
-                        print(f"[WARN] No new reviews loaded for 3 consecutive scrolls. Stopping.")
+                        logger.warning(f"[WARN] No new reviews loaded for 3 consecutive scrolls. Stopping.")
                         # Check date-matched reviews before stopping
                         if not target_review and hasattr(self, '_date_matched_reviews') and len(self._date_matched_reviews) > 0:
                             if len(self._date_matched_reviews) == 1:
                                 match = self._date_matched_reviews[0]
-                                print(f"  [INFO] Only one review found for date '{date_clean}'")
-                                print(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
+                                logger.debug(f"  [INFO] Only one review found for date '{date_clean}'")
+                                logger.debug(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
                                 target_review = match['li']
                         break
                 else:
@@ -987,13 +991,13 @@ class NaverSeleniumService:
 
                 # Stop if we've loaded way more reviews than expected
                 if current_count >= max_reviews_limit:
-                    print(f"[WARN] Loaded {current_count} reviews (>{max_reviews_limit} limit). Stopping search.")
+                    logger.warning(f"[WARN] Loaded {current_count} reviews (>{max_reviews_limit} limit). Stopping search.")
                     # Check date-matched reviews before stopping
                     if not target_review and hasattr(self, '_date_matched_reviews') and len(self._date_matched_reviews) > 0:
                         if len(self._date_matched_reviews) == 1:
                             match = self._date_matched_reviews[0]
-                            print(f"  [INFO] Only one review found for date '{date_clean}'")
-                            print(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
+                            logger.debug(f"  [INFO] Only one review found for date '{date_clean}'")
+                            logger.debug(f"  [INFO] Accepting as match despite author mismatch: '{match['author']}' (looking for '{author_prefix}...')")
                             target_review = match['li']
                     break
 
@@ -1012,18 +1016,18 @@ class NaverSeleniumService:
             # Final check: if no exact match, but only one review for the target date
             if not target_review and hasattr(self, '_date_matched_reviews') and len(self._date_matched_reviews) == 1:
                 match = self._date_matched_reviews[0]
-                print(f"\n[INFO] Only one review found for date '{date_clean}'")
-                print(f"[INFO] Accepting as match despite author mismatch:")
-                print(f"   Expected author prefix: '{author_prefix}...'")
-                print(f"   Found author: '{match['author']}'")
-                print(f"   Date match: {match['date']}")
+                logger.info(f"[INFO] Only one review found for date '{date_clean}'")
+                logger.info(f"[INFO] Accepting as match despite author mismatch:")
+                logger.debug(f"   Expected author prefix: '{author_prefix}...'")
+                logger.debug(f"   Found author: '{match['author']}'")
+                logger.debug(f"   Date match: {match['date']}")
                 target_review = match['li']
 
             if not target_review:
                 # Show what we found for debugging
-                print(f"\n[ERROR] Could not find review: {author} ({date_clean})")
-                print(f"   Loaded {current_count} reviews total")
-                print(f"   Looking for: author starting with '{author_prefix}', date='{date_clean}'")
+                logger.error(f"[ERROR] Could not find review: {author} ({date_clean})")
+                logger.error(f"   Loaded {current_count} reviews total")
+                logger.error(f"   Looking for: author starting with '{author_prefix}', date='{date_clean}'")
 
                 # Show date distribution (first 50 reviews)
                 date_distribution = {}
@@ -1046,9 +1050,9 @@ class NaverSeleniumService:
                     except:
                         continue
 
-                print(f"\n   [DATE] Date distribution (first 50 reviews):")
+                logger.debug(f"   [DATE] Date distribution (first 50 reviews):")
                 for date_info, count in list(date_distribution.items())[:10]:
-                    print(f"      - {date_info}: {count} review(s)")
+                    logger.debug(f"      - {date_info}: {count} review(s)")
 
                 # Show reviews with matching dates
                 matching_dates = []
@@ -1072,16 +1076,16 @@ class NaverSeleniumService:
                         continue
 
                 if matching_dates:
-                    print(f"\n   [INFO] Reviews with matching date '{date_clean}':")
+                    logger.debug(f"   [INFO] Reviews with matching date '{date_clean}':")
                     for match in matching_dates[:5]:
-                        print(f"      - {match}")
+                        logger.debug(f"      - {match}")
                 else:
-                    print(f"\n   [INFO] No reviews found with date '{date_clean}'")
+                    logger.debug(f"   [INFO] No reviews found with date '{date_clean}'")
 
                 raise Exception(f"Could not find review: {author} ({date_clean})")
 
             # Click reply button - try multiple strategies
-            print("[CLICK] Searching for reply button...")
+            logger.info("[CLICK] Searching for reply button...")
             try:
                 reply_btn = None
 
@@ -1089,7 +1093,7 @@ class NaverSeleniumService:
                 try:
                     reply_btn = target_review.find_element(By.XPATH,
                         ".//button[contains(text(), '답글') or contains(text(), '댓글') or contains(text(), 'Reply')]")
-                    print("   [OK] Found reply button by text")
+                    logger.debug("   [OK] Found reply button by text")
                 except:
                     pass
 
@@ -1098,7 +1102,7 @@ class NaverSeleniumService:
                     try:
                         reply_btn = target_review.find_element(By.XPATH,
                             ".//button[contains(@aria-label, '답글') or contains(@aria-label, '댓글')]")
-                        print("   [OK] Found reply button by aria-label")
+                        logger.debug("   [OK] Found reply button by aria-label")
                     except:
                         pass
 
@@ -1107,15 +1111,15 @@ class NaverSeleniumService:
                     try:
                         reply_btn = target_review.find_element(By.CSS_SELECTOR,
                             "button[class*='reply'], button[class*='comment'], button[class*='Reply']")
-                        print("   [OK] Found reply button by class")
+                        logger.debug("   [OK] Found reply button by class")
                     except:
                         pass
 
                 # Method 4: Debug - show all buttons in this review
                 if not reply_btn:
-                    print("   [WARN] Reply button not found. Debugging available buttons:")
+                    logger.warning("   [WARN] Reply button not found. Debugging available buttons:")
                     all_buttons = target_review.find_elements(By.TAG_NAME, "button")
-                    print(f"   Found {len(all_buttons)} total buttons in this review")
+                    logger.debug(f"   Found {len(all_buttons)} total buttons in this review")
 
                     for idx, btn in enumerate(all_buttons[:10]):  # First 10 buttons
                         try:
@@ -1123,12 +1127,12 @@ class NaverSeleniumService:
                             btn_class = btn.get_attribute("class") or ""
                             btn_aria = btn.get_attribute("aria-label") or ""
                             is_visible = btn.is_displayed()
-                            print(f"   Button {idx+1}: visible={is_visible}, text='{btn_text[:30]}', class='{btn_class[:50]}', aria='{btn_aria[:30]}'")
+                            logger.debug(f"   Button {idx+1}: visible={is_visible}, text='{btn_text[:30]}', class='{btn_class[:50]}', aria='{btn_aria[:30]}'")
 
                             # Try to find button with any reply-related text
                             if is_visible and ('답글' in btn_text or '댓글' in btn_text or '답글' in btn_aria):
                                 reply_btn = btn
-                                print(f"   [OK] Found reply button at position {idx+1}")
+                                logger.debug(f"   [OK] Found reply button at position {idx+1}")
                                 break
                         except Exception as e:
                             continue
@@ -1137,25 +1141,25 @@ class NaverSeleniumService:
                     if not reply_btn:
                         textareas = target_review.find_elements(By.TAG_NAME, "textarea")
                         if textareas and any(ta.is_displayed() for ta in textareas):
-                            print("   [INFO] Textarea already visible - reply area might already be open")
+                            logger.debug("   [INFO] Textarea already visible - reply area might already be open")
                             raise Exception("Reply area already open - no button click needed")
 
                 if not reply_btn:
                     raise Exception("Could not find reply button using any method")
 
                 # Click the button
-                print("   [CLICK] Clicking reply button...")
+                logger.debug("   [CLICK] Clicking reply button...")
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", reply_btn)
                 time.sleep(0.5)
                 driver.execute_script("arguments[0].click();", reply_btn)
                 time.sleep(1.5)  # Increased wait time for reply area to open
-                print("   [OK] Reply button clicked")
+                logger.debug("   [OK] Reply button clicked")
 
             except Exception as e:
                 raise Exception(f"Failed to click reply button: {e}")
 
             # Enter reply text
-            print("[TYPE] Searching for reply textarea...")
+            logger.info("[TYPE] Searching for reply textarea...")
             try:
                 # Wait for textarea to appear
                 textarea = WebDriverWait(driver, 5).until(
@@ -1171,7 +1175,7 @@ class NaverSeleniumService:
                 time.sleep(0.3)
 
                 # Enter text using a method that React/Vue will detect
-                print(f"   [NOTE] Entering reply text ({len(reply_text)} chars)...")
+                logger.debug(f"   [NOTE] Entering reply text ({len(reply_text)} chars)...")
 
                 # Method: Use JavaScript to properly trigger React's internal tracking
                 # This is necessary for modern frameworks that don't detect direct value changes
@@ -1214,9 +1218,9 @@ class NaverSeleniumService:
                 # Verify text was entered and character count updated
                 entered_text = driver.execute_script('return arguments[0].value;', textarea)
                 if entered_text == reply_text:
-                    print(f"   [OK] Reply text entered successfully ({len(reply_text)} chars)")
+                    logger.debug(f"   [OK] Reply text entered successfully ({len(reply_text)} chars)")
                 else:
-                    print(f"   [WARN] Text entered but may not match exactly (expected {len(reply_text)}, got {len(entered_text)} chars)")
+                    logger.warning(f"   [WARN] Text entered but may not match exactly (expected {len(reply_text)}, got {len(entered_text)} chars)")
 
                 # Additional verification: check if submit button is enabled
                 time.sleep(0.5)
@@ -1225,32 +1229,32 @@ class NaverSeleniumService:
                     char_count_elements = driver.find_elements(By.XPATH, "//*[contains(text(), '/ 500') or contains(text(), '/500')]")
                     if char_count_elements:
                         char_count_text = char_count_elements[0].text
-                        print(f"   [STAT] Character count shown: {char_count_text}")
+                        logger.debug(f"   [STAT] Character count shown: {char_count_text}")
                         if '0' in char_count_text and '500' in char_count_text:
-                            print(f"   [WARN] WARNING: Character count still shows 0 - React may not have detected input!")
+                            logger.warning(f"   [WARN] WARNING: Character count still shows 0 - React may not have detected input!")
                 except:
                     pass
 
             except Exception as e:
-                print(f"   [ERROR] Failed to find/enter textarea")
+                logger.error(f"   [ERROR] Failed to find/enter textarea")
                 # Debug: show all textareas
                 try:
                     all_textareas = driver.find_elements(By.TAG_NAME, "textarea")
-                    print(f"   Found {len(all_textareas)} total textareas on page")
+                    logger.debug(f"   Found {len(all_textareas)} total textareas on page")
                     for idx, ta in enumerate(all_textareas[:3]):
                         is_visible = ta.is_displayed()
                         placeholder = ta.get_attribute("placeholder") or ""
-                        print(f"   Textarea {idx+1}: visible={is_visible}, placeholder='{placeholder[:30]}'")
+                        logger.debug(f"   Textarea {idx+1}: visible={is_visible}, placeholder='{placeholder[:30]}'")
                 except:
                     pass
                 raise Exception(f"Failed to enter reply text: {e}")
 
             # Click submit button - search NEAR textarea only
             # Wait a bit for React to update button states after text input
-            print("[SUBMIT] Waiting for submit button to become active...")
+            logger.info("[SUBMIT] Waiting for submit button to become active...")
             time.sleep(1)
 
-            print("   [DEBUG] Searching for submit button near textarea...")
+            logger.debug("   [DEBUG] Searching for submit button near textarea...")
             try:
                 submit_btn = None
                 reply_form = None
@@ -1259,21 +1263,21 @@ class NaverSeleniumService:
                 try:
                     # Try to find form element
                     reply_form = textarea.find_element(By.XPATH, "./ancestor::form")
-                    print("   [OK] Found form element")
+                    logger.debug("   [OK] Found form element")
                 except:
                     try:
                         # Try to find modal/dialog container (common in modern web apps)
                         reply_form = textarea.find_element(By.XPATH, "./ancestor::div[contains(@class, 'modal') or contains(@class, 'dialog') or contains(@class, 'popup')]")
-                        print("   [OK] Found modal/dialog container")
+                        logger.debug("   [OK] Found modal/dialog container")
                     except:
                         try:
                             # Get parent container (3-5 levels up should capture the reply form)
                             reply_form = textarea.find_element(By.XPATH, "./ancestor::div[4]")
-                            print("   [OK] Found parent container (4 levels up)")
+                            logger.debug("   [OK] Found parent container (4 levels up)")
                         except:
                             # Last resort: use textarea's immediate parent area
                             reply_form = textarea.find_element(By.XPATH, "./parent::*")
-                            print("   [WARN] Using textarea's parent only")
+                            logger.warning("   [WARN] Using textarea's parent only")
 
                 # Method 1: Search within the reply form container by text
                 try:
@@ -1283,12 +1287,12 @@ class NaverSeleniumService:
                     if visible_btns:
                         submit_btn = visible_btns[0]
                         btn_text = submit_btn.text.strip()
-                        print(f"   [OK] Found submit button in form by text: '{btn_text}'")
+                        logger.debug(f"   [OK] Found submit button in form by text: '{btn_text}'")
 
                         # Check if button is actually enabled (not disabled attribute)
                         is_disabled = submit_btn.get_attribute('disabled')
                         if is_disabled:
-                            print(f"   [WARN] Warning: Button '{btn_text}' has disabled attribute")
+                            logger.warning(f"   [WARN] Warning: Button '{btn_text}' has disabled attribute")
                             submit_btn = None
                 except:
                     pass
@@ -1302,7 +1306,7 @@ class NaverSeleniumService:
                         visible_btns = [b for b in nearby_btns if b.is_displayed()]
                         if visible_btns:
                             submit_btn = visible_btns[0]
-                            print(f"   [OK] Found submit button as sibling: '{submit_btn.text.strip()}'")
+                            logger.debug(f"   [OK] Found submit button as sibling: '{submit_btn.text.strip()}'")
                     except:
                         pass
 
@@ -1313,7 +1317,7 @@ class NaverSeleniumService:
                         visible_btns = [b for b in submit_btns if b.is_displayed()]
                         if visible_btns:
                             submit_btn = visible_btns[0]
-                            print("   [OK] Found submit button by type='submit'")
+                            logger.debug("   [OK] Found submit button by type='submit'")
                     except:
                         pass
 
@@ -1322,7 +1326,7 @@ class NaverSeleniumService:
                     try:
                         all_btns_in_form = reply_form.find_elements(By.TAG_NAME, "button")
                         visible_btns = [b for b in all_btns_in_form if b.is_displayed()]
-                        print(f"   [INFO] Found {len(visible_btns)} visible buttons in reply form")
+                        logger.debug(f"   [INFO] Found {len(visible_btns)} visible buttons in reply form")
 
                         # Try to auto-select based on text
                         for btn in visible_btns:
@@ -1330,7 +1334,7 @@ class NaverSeleniumService:
                                 btn_text = btn.text.strip()
                                 if any(keyword in btn_text for keyword in ['등록', '완료', '저장', '확인', 'Submit', 'OK']):
                                     submit_btn = btn
-                                    print(f"   [OK] Auto-selected button with text: '{btn_text}'")
+                                    logger.debug(f"   [OK] Auto-selected button with text: '{btn_text}'")
                                     break
                             except:
                                 continue
@@ -1338,17 +1342,17 @@ class NaverSeleniumService:
                         # If still not found, take first visible button
                         if not submit_btn and visible_btns:
                             submit_btn = visible_btns[0]
-                            print(f"   [WARN] Using first visible button: '{submit_btn.text.strip()}'")
+                            logger.warning(f"   [WARN] Using first visible button: '{submit_btn.text.strip()}'")
                     except:
                         pass
 
                 # Debug: show all buttons in reply form
                 if not submit_btn:
-                    print("   [ERROR] Submit button not found in reply form. Debugging:")
+                    logger.error("   [ERROR] Submit button not found in reply form. Debugging:")
                     try:
                         all_btns = reply_form.find_elements(By.TAG_NAME, "button")
                         visible_btns = [b for b in all_btns if b.is_displayed()]
-                        print(f"   Found {len(visible_btns)} visible buttons in reply form:")
+                        logger.debug(f"   Found {len(visible_btns)} visible buttons in reply form:")
 
                         has_close_button = False
                         for idx, btn in enumerate(visible_btns[:5]):
@@ -1357,7 +1361,7 @@ class NaverSeleniumService:
                                 btn_class = btn.get_attribute("class") or ""
                                 btn_type = btn.get_attribute("type") or ""
                                 btn_disabled = btn.get_attribute("disabled")
-                                print(f"   Button {idx+1}: text='{btn_text[:30]}', type='{btn_type}', disabled={btn_disabled}, class='{btn_class[:50]}'")
+                                logger.debug(f"   Button {idx+1}: text='{btn_text[:30]}', type='{btn_type}', disabled={btn_disabled}, class='{btn_class[:50]}'")
 
                                 if btn_text in ['닫기', 'Close', '취소', 'Cancel']:
                                     has_close_button = True
@@ -1365,16 +1369,16 @@ class NaverSeleniumService:
                                 continue
 
                         if has_close_button:
-                            print(f"   [WARN] Found '닫기' or '취소' button but no '등록' button!")
-                            print(f"   [WARN] This usually means the textarea value was not properly detected by React")
-                            print(f"   [WARN] The '등록' button only appears when text is entered and React state updates")
+                            logger.warning(f"   [WARN] Found '닫기' or '취소' button but no '등록' button!")
+                            logger.warning(f"   [WARN] This usually means the textarea value was not properly detected by React")
+                            logger.warning(f"   [WARN] The '등록' button only appears when text is entered and React state updates")
                     except:
                         pass
 
                     raise Exception("Could not find enabled '등록' submit button in reply form - text may not have been properly entered")
 
                 # Click the button
-                print("   [CLICK] Clicking submit button...")
+                logger.debug("   [CLICK] Clicking submit button...")
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_btn)
                 time.sleep(0.5)
 
@@ -1382,15 +1386,15 @@ class NaverSeleniumService:
                 try:
                     btn_text = submit_btn.text.strip()
                     btn_html = submit_btn.get_attribute('outerHTML')[:100]
-                    print(f"   [NOTE] Button to click: '{btn_text}', HTML: {btn_html}...")
+                    logger.debug(f"   [NOTE] Button to click: '{btn_text}', HTML: {btn_html}...")
                 except:
                     pass
 
                 driver.execute_script("arguments[0].click();", submit_btn)
-                print("   [OK] Submit button clicked")
+                logger.debug("   [OK] Submit button clicked")
 
                 # Wait for response and check for success/error
-                print("   [WAIT] Waiting for server response...")
+                logger.debug("   [WAIT] Waiting for server response...")
                 time.sleep(3)
 
                 # Check for error messages or alerts
@@ -1401,7 +1405,7 @@ class NaverSeleniumService:
 
                     if visible_errors:
                         error_text = visible_errors[0].text
-                        print(f"   [ERROR] Error message detected: {error_text[:100]}")
+                        logger.error(f"   [ERROR] Error message detected: {error_text[:100]}")
                         raise Exception(f"Reply posting failed: {error_text[:200]}")
                 except:
                     pass
@@ -1410,7 +1414,7 @@ class NaverSeleniumService:
                 try:
                     textarea_still_exists = driver.find_elements(By.TAG_NAME, "textarea")
                     if any(ta.is_displayed() for ta in textarea_still_exists):
-                        print("   [WARN] Warning: Reply textarea still visible - submission may have failed")
+                        logger.warning("   [WARN] Warning: Reply textarea still visible - submission may have failed")
                 except:
                     pass
 
@@ -1418,24 +1422,24 @@ class NaverSeleniumService:
                 try:
                     success_indicators = driver.find_elements(By.XPATH, "//*[contains(text(), '등록되었습니다') or contains(text(), '성공') or contains(text(), '완료')]")
                     if any(s.is_displayed() for s in success_indicators):
-                        print("   [OK] Success message detected")
+                        logger.debug("   [OK] Success message detected")
                 except:
                     pass
 
-                print("   [OK] Reply submission completed")
+                logger.debug("   [OK] Reply submission completed")
 
             except Exception as e:
                 raise Exception(f"Failed to submit reply: {e}")
 
             # Final verification - wait a bit more and check page state
-            print("[DEBUG] Final verification...")
+            logger.debug("Final verification...")
             time.sleep(2)
 
             # Take screenshot for debugging (optional)
             try:
                 screenshot_path = f"reply_posted_{place_id}_{author[:10]}.png"
                 driver.save_screenshot(screenshot_path)
-                print(f"   [SCREENSHOT] Screenshot saved: {screenshot_path}")
+                logger.debug(f"   [SCREENSHOT] Screenshot saved: {screenshot_path}")
             except:
                 pass
 
@@ -1454,14 +1458,14 @@ class NaverSeleniumService:
                 reply_elements = target_review.find_elements(By.XPATH, ".//*[contains(@class, 'reply') or contains(@class, 'Reply') or contains(@class, 'comment')]")
 
                 if reply_elements:
-                    print(f"   [OK] Found {len(reply_elements)} potential reply element(s)")
+                    logger.debug(f"   [OK] Found {len(reply_elements)} potential reply element(s)")
                     verification_passed = True
                 else:
-                    print(f"   [WARN] No reply elements found yet (may need more time)")
+                    logger.warning(f"   [WARN] No reply elements found yet (may need more time)")
             except Exception as e:
-                print(f"   [WARN] Verification check failed: {e}")
+                logger.warning(f"   [WARN] Verification check failed: {e}")
 
-            print("[OK] Reply posted successfully!")
+            logger.info("[OK] Reply posted successfully!")
 
             return {
                 'success': True,
@@ -1473,7 +1477,7 @@ class NaverSeleniumService:
 
         except Exception as e:
             error_msg = str(e)
-            print(f"[ERROR] Error posting reply: {error_msg}")
+            logger.error(f"[ERROR] Error posting reply: {error_msg}")
             logger.error(f"Error in post_reply_by_composite: {error_msg}")
 
             return {
@@ -1485,6 +1489,7 @@ class NaverSeleniumService:
 
         finally:
             if driver:
+                self.active_driver_count = max(0, self.active_driver_count - 1)
                 try:
                     driver.quit()
                 except:
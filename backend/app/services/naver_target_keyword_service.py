@@ -11,6 +11,7 @@ from itertools import product
 from app.services.naver_keyword_search_volume_service import NaverKeywordSearchVolumeService
 from app.services.naver_html_parser_service import NaverHtmlParserService
 from app.core.database import get_supabase_client
+from app.core.keyword_matcher import KeywordMatcher, MatchCounts
 
 logger = logging.getLogger(__name__)
 
@@ -408,7 +409,10 @@ class NaverTargetKeywordService:
                     try:
                         # 개별 키워드 타임아웃 30초
                         result = await asyncio.wait_for(
-                            rank_service.check_rank(keyword, place_id, coord_x=coord_x, coord_y=coord_y, category=category),
+                            rank_service.check_rank(
+                                keyword, place_id, coord_x=coord_x, coord_y=coord_y, category=category,
+                                profile="rank-only"
+                            ),
                             timeout=30
                         )
                         
@@ -582,21 +586,40 @@ class NaverTargetKeywordService:
         # 중복 제거
         all_keywords = list(set(all_keywords))
         
+        # 띄어쓰기 변형 미리 생성 (필드 루프 밖에서 1회)
+        # 간단한 휴리스틱: 모든 위치에 띄어쓰기 삽입
+        # 예: "종로맛집" → "종로 맛집"
+        spaced_variants = {}
+        for keyword in all_keywords:
+            if " " not in keyword and len(keyword) > 2:
+                spaced_variants[keyword] = [
+                    keyword[:i] + " " + keyword[i:] for i in range(1, len(keyword))
+                ]
+            else:
+                spaced_variants[keyword] = []
+        
+        # 타겟 키워드의 구성요소 띄어쓰기 버전 (예: "종로 맛집")
+        keywords_with_space = {
+            kw["keyword"]: self._add_space_to_keyword(kw["keyword"], kw.get("components", {}))
+            for kw in top_keywords
+        }
+        
+        # 🚀 모든 키워드 + 변형을 하나의 매처로 컴파일 → 필드당 1회 스캔
+        patterns = list(all_keywords) + list(keywords_with_space.values())
+        for variants in spaced_variants.values():
+            patterns.extend(variants)
+        matcher = KeywordMatcher(patterns)
+        field_counts = matcher.count_fields(seo_fields)
+        logger.info(f"[SEO 분석] 매처 컴파일 완료: 패턴 {len(matcher)}개")
+        
         # 각 필드별 키워드 매칭 카운트 (띄어쓰기 버전 포함)
         field_analysis = {}
-        for field_name, field_text in seo_fields.items():
+        for field_name, counts in field_counts.items():
             keyword_counts = {}
             for keyword in all_keywords:
-                # 기본 매칭
-                count = self._count_keyword_in_text(keyword, field_text)
-                
-                # 띄어쓰기 버전도 체크 (2단어 이상 키워드인 경우)
-                if " " not in keyword and len(keyword) > 2:
-                    # 간단한 휴리스틱: 2글자씩 나눠서 띄어쓰기 버전 생성
-                    # 예: "종로맛집" → "종로 맛집"
-                    for i in range(1, len(keyword)):
-                        spaced_version = keyword[:i] + " " + keyword[i:]
-                        count += self._count_keyword_in_text(spaced_version, field_text)
+                count = counts.count(keyword)
+                for spaced_version in spaced_variants[keyword]:
+                    count += counts.count(spaced_version)
                 
                 if count > 0:
                     keyword_counts[keyword] = count
@@ -612,40 +635,26 @@ class NaverTargetKeywordService:
         # 전체 키워드별 매칭 횟수
         keyword_total_counts = {}
         for keyword in all_keywords:
-            total_count = 0
-            for field_text in seo_fields.values():
-                total_count += self._count_keyword_in_text(keyword, field_text)
-            keyword_total_counts[keyword] = total_count
+            keyword_total_counts[keyword] = sum(
+                counts.count(keyword) for counts in field_counts.values()
+            )
         
         # 타겟 키워드별 각 필드 매칭 횟수 (띄어쓰기 버전 포함)
         keyword_field_matches = {}
         for kw in top_keywords:
             keyword_text = kw["keyword"]
+            keyword_with_space = keywords_with_space[keyword_text]
             
-            # 띄어쓰기 버전 생성 (구성요소 사이에 띄어쓰기)
-            keyword_with_space = self._add_space_to_keyword(keyword_text, kw.get("components", {}))
-            
-            keyword_field_matches[keyword_text] = {
-                "menu": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["menu"]),
-                "conveniences": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["conveniences"]),
-                "microReviews": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["microReviews"]),
-                "description": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["description"]),
-                "ai_briefing": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["ai_briefing"]),
-                "road": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["road"]),
-                "visitor_reviews": self._count_keyword_with_variants(keyword_text, keyword_with_space, seo_fields["visitor_reviews"]),
-                "total": 0  # 나중에 계산
+            matches = {
+                field_name: self._count_keyword_with_variants(
+                    keyword_text, keyword_with_space, field_counts[field_name]
+                )
+                for field_name in seo_fields
             }
             
             # 전체 합계 계산
-            keyword_field_matches[keyword_text]["total"] = sum([
-                keyword_field_matches[keyword_text]["menu"],
-                keyword_field_matches[keyword_text]["conveniences"],
-                keyword_field_matches[keyword_text]["microReviews"],
-                keyword_field_matches[keyword_text]["description"],
-                keyword_field_matches[keyword_text]["ai_briefing"],
-                keyword_field_matches[keyword_text]["road"],
-                keyword_field_matches[keyword_text]["visitor_reviews"]
-            ])
+            matches["total"] = sum(matches.values())
+            keyword_field_matches[keyword_text] = matches
         
         logger.info(f"[타겟 키워드] SEO 분석 완료: {len(keyword_field_matches)}개 키워드")
         
@@ -683,28 +692,16 @@ class NaverTargetKeywordService:
         parts = list(components.values())
         return " ".join(parts) if len(parts) > 1 else keyword
     
-    def _count_keyword_with_variants(self, keyword: str, keyword_with_space: str, text: str) -> int:
-        """키워드 매칭 (띄어쓰기 버전 포함)"""
-        if not text:
-            return 0
-        
-        text_lower = text.lower()
+    def _count_keyword_with_variants(self, keyword: str, keyword_with_space: str, counts: MatchCounts) -> int:
+        """키워드 매칭 (띄어쓰기 버전 포함) - 컴파일된 매처의 필드 결과에서 조회"""
         count = 0
         
         # 1. 원본 키워드 매칭 (예: "종로맛집")
         if keyword:
-            count += text_lower.count(keyword.lower())
+            count += counts.count(keyword)
         
         # 2. 띄어쓰기 버전 매칭 (예: "종로 맛집")
         if keyword_with_space and keyword_with_space != keyword:
-            count += text_lower.count(keyword_with_space.lower())
+            count += counts.count(keyword_with_space)
         
         return count
-    
-    def _count_keyword_in_text(self, keyword: str, text: str) -> int:
-        """텍스트에서 키워드 출현 횟수 카운트 (대소문자 무시)"""
-        if not keyword or not text:
-            return 0
-        
-        # 대소문자 무시하고 카운트
-        return text.lower().count(keyword.lower())
@@ -8,6 +8,8 @@ from typing import List, Optional
 import httpx
 
 from app.core.config import settings
+from app.core.metrics import observe_upstream
+from app.core.rate_limiter import nhn_email_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,37 @@ class NHNEmailService:
         self.secret_key = settings.NHN_EMAIL_SECRET_KEY
         self.sender_address = settings.NHN_EMAIL_SENDER
         self.sender_name = "윕플(Whiplace)"
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """커넥션 재사용용 공유 클라이언트 (요청마다 TLS 연결을 새로 맺지 않음)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+        return self._client
+    
+    async def aclose(self):
+        """공유 클라이언트 종료 (앱 종료 시)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    async def _post(self, payload: dict) -> httpx.Response:
+        """이메일 발송 API 호출 (공유 클라이언트 + provider 제한)"""
+        await nhn_email_limiter.acquire()
+        try:
+            with observe_upstream("nhn", "email", "direct") as obs:
+                response = await self._get_client().post(
+                    self._get_send_url(),
+                    headers=self._get_headers(),
+                    json=payload,
+                )
+                obs.set_status(response.status_code)
+            return response
+        finally:
+            await nhn_email_limiter.release()
     
     def _get_headers(self) -> dict:
         """API 요청 헤더"""
@@ -87,37 +120,32 @@ class NHNEmailService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._get_send_url(),
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                
-                result = response.json()
-                
-                logger.info(
-                    f"[NHN Email] 순위 알림 발송 - "
-                    f"매장: {store_name}, 수신자: {to_email}, "
-                    f"status: {response.status_code}"
-                )
-                
-                header = result.get("header", {})
-                if header.get("isSuccessful"):
-                    return {
-                        "success": True,
-                        "message": "순위 알림 이메일이 발송되었습니다",
-                        "request_id": result.get("body", {}).get("data", {}).get("requestId"),
-                    }
-                else:
-                    error_msg = header.get("resultMessage", "알 수 없는 오류")
-                    logger.error(f"[NHN Email] 발송 실패: {error_msg}")
-                    return {
-                        "success": False,
-                        "message": f"이메일 발송 실패: {error_msg}",
-                        "error_code": header.get("resultCode"),
-                    }
-                    
+            response = await self._post(payload)
+            
+            result = response.json()
+            
+            logger.info(
+                f"[NHN Email] 순위 알림 발송 - "
+                f"매장: {store_name}, 수신자: {to_email}, "
+                f"status: {response.status_code}"
+            )
+            
+            header = result.get("header", {})
+            if header.get("isSuccessful"):
+                return {
+                    "success": True,
+                    "message": "순위 알림 이메일이 발송되었습니다",
+                    "request_id": result.get("body", {}).get("data", {}).get("requestId"),
+                }
+            else:
+                error_msg = header.get("resultMessage", "알 수 없는 오류")
+                logger.error(f"[NHN Email] 발송 실패: {error_msg}")
+                return {
+                    "success": False,
+                    "message": f"이메일 발송 실패: {error_msg}",
+                    "error_code": header.get("resultCode"),
+                }
+        
         except httpx.TimeoutException:
             logger.error("[NHN Email] 요청 타임아웃")
             return {"success": False, "message": "요청 시간 초과"}
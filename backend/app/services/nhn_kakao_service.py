@@ -1,23 +1,29 @@
 """
 NHN Cloud KakaoTalk Bizmessage (알림톡) 서비스
 - 인증코드 발송
-- 키워드 순위 알림 발송
+- 키워드 순위 알림 발송 (recipientList 다건 발송 지원)
 - SMS fallback 지원
 
 ⚠️ 카카오 알림톡 템플릿 변수 값은 최대 14자까지만 허용됩니다.
    모든 templateParameter 값은 14자 이내로 잘라서 전송해야 합니다.
 """
+import asyncio
 import logging
 from typing import Dict, List, Optional
 import httpx
 
 from app.core.config import settings
+from app.core.metrics import observe_upstream
+from app.core.rate_limiter import nhn_kakao_limiter
 
 logger = logging.getLogger(__name__)
 
 # 카카오 알림톡 템플릿 변수 최대 길이
 MAX_TEMPLATE_VAR_LENGTH = 14
 
+# 알림톡 발송 요청 1건당 최대 수신자 수 (NHN Cloud recipientList 제한)
+MAX_RECIPIENTS_PER_REQUEST = 1000
+
 
 class NHNKakaoService:
     """NHN Cloud 카카오 알림톡 서비스"""
@@ -27,6 +33,37 @@ class NHNKakaoService:
         self.appkey = settings.NHN_KAKAO_APPKEY
         self.secret_key = settings.NHN_KAKAO_SECRET_KEY
         self.sender_key = settings.NHN_KAKAO_SENDER_KEY
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """커넥션 재사용용 공유 클라이언트 (요청마다 TLS 연결을 새로 맺지 않음)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._client
+    
+    async def aclose(self):
+        """공유 클라이언트 종료 (앱 종료 시)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    async def _post(self, payload: dict) -> httpx.Response:
+        """알림톡 발송 API 호출 (공유 클라이언트 + provider 제한)"""
+        await nhn_kakao_limiter.acquire()
+        try:
+            with observe_upstream("nhn", "alimtalk", "direct") as obs:
+                response = await self._get_client().post(
+                    self._get_send_url(),
+                    headers=self._get_headers(),
+                    json=payload,
+                )
+                obs.set_status(response.status_code)
+            return response
+        finally:
+            await nhn_kakao_limiter.release()
     
     def _get_headers(self) -> dict:
         """API 요청 헤더 생성"""
@@ -92,39 +129,34 @@ class NHNKakaoService:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._get_send_url(),
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                
-                result = response.json()
-                
-                logger.info(
-                    f"[NHN Kakao] 인증코드 발송 - "
-                    f"수신자: {recipient_no[-4:].rjust(len(recipient_no), '*')}, "
-                    f"status: {response.status_code}, "
-                    f"result: {result.get('header', {}).get('resultCode')}"
-                )
-                
-                # NHN Cloud 응답 처리
-                header = result.get("header", {})
-                if header.get("isSuccessful"):
-                    return {
-                        "success": True,
-                        "message": "인증코드가 발송되었습니다",
-                        "request_id": result.get("message", {}).get("requestId"),
-                    }
-                else:
-                    error_msg = header.get("resultMessage", "알 수 없는 오류")
-                    logger.error(f"[NHN Kakao] 발송 실패: {error_msg}")
-                    return {
-                        "success": False,
-                        "message": f"알림톡 발송 실패: {error_msg}",
-                        "error_code": header.get("resultCode"),
-                    }
-                    
+            response = await self._post(payload)
+            
+            result = response.json()
+            
+            logger.info(
+                f"[NHN Kakao] 인증코드 발송 - "
+                f"수신자: {recipient_no[-4:].rjust(len(recipient_no), '*')}, "
+                f"status: {response.status_code}, "
+                f"result: {result.get('header', {}).get('resultCode')}"
+            )
+            
+            # NHN Cloud 응답 처리
+            header = result.get("header", {})
+            if header.get("isSuccessful"):
+                return {
+                    "success": True,
+                    "message": "인증코드가 발송되었습니다",
+                    "request_id": result.get("message", {}).get("requestId"),
+                }
+            else:
+                error_msg = header.get("resultMessage", "알 수 없는 오류")
+                logger.error(f"[NHN Kakao] 발송 실패: {error_msg}")
+                return {
+                    "success": False,
+                    "message": f"알림톡 발송 실패: {error_msg}",
+                    "error_code": header.get("resultCode"),
+                }
+        
         except httpx.TimeoutException:
             logger.error("[NHN Kakao] 요청 타임아웃")
             return {"success": False, "message": "요청 시간 초과"}
@@ -167,6 +199,27 @@ class NHNKakaoService:
             logger.error("[NHN Kakao] API 설정이 완료되지 않았습니다")
             return {"success": False, "message": "카카오 알림톡 설정이 완료되지 않았습니다"}
         
+        recipient = self.build_rank_alert_recipient(
+            phone_number=phone_number,
+            store_name=store_name,
+            metrics_list=metrics_list,
+            collected_at=collected_at,
+        )
+        results = await self.send_rank_alerts_bulk([recipient])
+        return results[0]
+    
+    def build_rank_alert_recipient(
+        self,
+        phone_number: str,
+        store_name: str,
+        metrics_list: List[dict],
+        collected_at: str,
+    ) -> dict:
+        """
+        rank_alert_v2 recipientList 항목 생성
+        
+        ⚠️ 모든 변수 값은 14자 이내
+        """
         recipient_no = phone_number.replace("-", "").replace(" ", "")
         
         # ⚠️ 모든 변수값을 14자 이내로 자르기
@@ -176,76 +229,136 @@ class NHNKakaoService:
         # result1 ~ result5 생성
         results = self.format_results_for_v2(metrics_list)
         
-        logger.info(
+        logger.debug(
             f"[NHN Kakao] 순위 알림 v2 파라미터: "
             f"storeName='{safe_store_name}', "
             f"results={results}, "
             f"collectedAt='{safe_collected_at}'"
         )
         
+        return {
+            "recipientNo": recipient_no,
+            "templateParameter": {
+                "storeName": safe_store_name,
+                "result1": results[0],
+                "result2": results[1],
+                "result3": results[2],
+                "result4": results[3],
+                "result5": results[4],
+                "collectedAt": safe_collected_at,
+            },
+        }
+    
+    async def send_rank_alerts_bulk(self, recipients: List[dict]) -> List[dict]:
+        """
+        순위 알림 다건 발송 (rank_alert_v2)
+        
+        recipientList를 요청당 최대 MAX_RECIPIENTS_PER_REQUEST명씩 묶어 발송
+        요청들은 nhn_kakao_limiter(동시 호출 + 초당 요청 수) 안에서 동시 진행
+        
+        Args:
+            recipients: build_rank_alert_recipient()로 만든 항목 목록
+        
+        Returns:
+            recipients와 같은 순서의 수신자별 발송 결과 dict 목록
+        """
+        if not recipients:
+            return []
+        
+        if not self._is_configured():
+            logger.error("[NHN Kakao] API 설정이 완료되지 않았습니다")
+            return [
+                {"success": False, "message": "카카오 알림톡 설정이 완료되지 않았습니다"}
+                for _ in recipients
+            ]
+        
+        chunks = [
+            recipients[i:i + MAX_RECIPIENTS_PER_REQUEST]
+            for i in range(0, len(recipients), MAX_RECIPIENTS_PER_REQUEST)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._send_rank_alert_chunk(chunk) for chunk in chunks)
+        )
+        
+        results = []
+        for chunk_result in chunk_results:
+            results.extend(chunk_result)
+        return results
+    
+    async def _send_rank_alert_chunk(self, recipients: List[dict]) -> List[dict]:
+        """recipientList 1회 요청 발송 → 수신자별 결과 (sendResults의 recipientSeq 기준)"""
         payload = {
             "senderKey": self.sender_key,
             "templateCode": settings.KAKAO_TEMPLATE_RANK_ALERT_V2,
-            "recipientList": [
-                {
-                    "recipientNo": recipient_no,
-                    "templateParameter": {
-                        "storeName": safe_store_name,
-                        "result1": results[0],
-                        "result2": results[1],
-                        "result3": results[2],
-                        "result4": results[3],
-                        "result5": results[4],
-                        "collectedAt": safe_collected_at,
-                    },
-                }
-            ],
+            "recipientList": recipients,
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self._get_send_url(),
-                    headers=self._get_headers(),
-                    json=payload,
-                )
-                
-                result = response.json()
-                
-                logger.info(
-                    f"[NHN Kakao] 순위 알림 v2 발송 - "
-                    f"매장: {store_name} ({len(metrics_list)}개 키워드), "
-                    f"수신자: {recipient_no[-4:].rjust(len(recipient_no), '*')}, "
-                    f"status: {response.status_code}, "
-                    f"response: {result}"
+            response = await self._post(payload)
+            
+            result = response.json()
+            
+            logger.info(
+                f"[NHN Kakao] 순위 알림 v2 발송 - "
+                f"수신자 {len(recipients)}명, "
+                f"status: {response.status_code}, "
+                f"result: {result.get('header', {}).get('resultCode')}"
+            )
+            
+            header = result.get("header", {})
+            if not header.get("isSuccessful"):
+                error_msg = header.get("resultMessage", "알 수 없는 오류")
+                error_code = header.get("resultCode")
+                logger.error(
+                    f"[NHN Kakao] 순위 알림 v2 발송 실패: {error_msg} "
+                    f"(code={error_code}, full_response={result})"
                 )
-                
-                header = result.get("header", {})
-                if header.get("isSuccessful"):
-                    return {
+                return [
+                    {
+                        "success": False,
+                        "message": f"알림톡 발송 실패: {error_msg}",
+                        "error_code": error_code,
+                    }
+                    for _ in recipients
+                ]
+            
+            message = result.get("message") or {}
+            request_id = message.get("requestId")
+            send_results = {
+                item.get("recipientSeq"): item
+                for item in (message.get("sendResults") or [])
+            }
+            
+            results = []
+            for seq, recipient in enumerate(recipients, start=1):
+                item = send_results.get(seq)
+                if item is None or item.get("resultCode") == 0:
+                    results.append({
                         "success": True,
                         "message": "순위 알림이 발송되었습니다",
-                        "request_id": result.get("message", {}).get("requestId"),
-                    }
+                        "request_id": request_id,
+                    })
                 else:
-                    error_msg = header.get("resultMessage", "알 수 없는 오류")
-                    error_code = header.get("resultCode")
+                    recipient_no = recipient.get("recipientNo", "")
                     logger.error(
-                        f"[NHN Kakao] 순위 알림 v2 발송 실패: {error_msg} "
-                        f"(code={error_code}, full_response={result})"
+                        f"[NHN Kakao] 순위 알림 v2 수신자 발송 실패: "
+                        f"{recipient_no[-4:].rjust(len(recipient_no), '*')} - "
+                        f"{item.get('resultMessage')} (code={item.get('resultCode')})"
                     )
-                    return {
+                    results.append({
                         "success": False,
-                        "message": f"알림톡 발송 실패: {error_msg}",
-                        "error_code": error_code,
-                    }
-                    
+                        "message": f"알림톡 발송 실패: {item.get('resultMessage', '알 수 없는 오류')}",
+                        "error_code": item.get("resultCode"),
+                        "request_id": request_id,
+                    })
+            return results
+        
         except httpx.TimeoutException:
             logger.error("[NHN Kakao] 요청 타임아웃")
-            return {"success": False, "message": "요청 시간 초과"}
+            return [{"success": False, "message": "요청 시간 초과"} for _ in recipients]
         except Exception as e:
             logger.error(f"[NHN Kakao] 순위 알림 발송 오류: {str(e)}")
-            return {"success": False, "message": f"발송 오류: {str(e)}"}
+            return [{"success": False, "message": f"발송 오류: {str(e)}"} for _ in recipients]
     
     @staticmethod
     def format_results_for_v2(metrics_list: List[dict]) -> List[str]:
@@ -7,15 +7,18 @@
   - 매장 단위 합산 발송
   - 최대 5개 키워드 개별 순위 표시 (result1~result5)
   - 각 변수 값 최대 14자 제한
-이메일: 매장 단위로 합산하여 1건 발송
+  - 수신자를 recipientList로 묶어 다건 발송
+이메일: 매장 단위로 합산하여 1건 발송 (동시 발송)
+사용자/매장 정보는 발송 전에 in_() 쿼리로 일괄 조회
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Set
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from collections import defaultdict
 
-from app.core.database import get_supabase_client
+from app.core.database import get_supabase_client, chunked, IN_FILTER_CHUNK_SIZE
 from app.services.nhn_kakao_service import nhn_kakao_service, NHNKakaoService
 from app.services.nhn_email_service import nhn_email_service
 
@@ -73,151 +76,115 @@ class NotificationService:
             f"sms={len(sms_trackers)}, other={len(other_trackers)})"
         )
         
+        # 매장(store_id) + 사용자(user_id) 기준으로 그룹화
+        kakao_grouped = defaultdict(list)
+        for t in kakao_trackers:
+            kakao_grouped[(t["user_id"], t["store_id"])].append(t)
+        
+        email_grouped = defaultdict(list)
+        for t in email_trackers:
+            email_grouped[(t["user_id"], t["store_id"])].append(t)
+        
+        # 사용자/매장 정보 일괄 조회 (그룹마다 조회하지 않고 in_() 2회)
+        groups = list(kakao_grouped) + list(email_grouped)
+        users = self._get_users_info({user_id for user_id, _ in groups})
+        stores = self._get_stores_info({store_id for _, store_id in groups})
+        
+        collected_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M")
+        
         # ============================================
         # 1. 카카오 알림톡 (rank_alert_v2): 매장 단위 합산, 최대 5개 키워드 상세
+        #    수신자를 recipientList로 묶어 다건 발송
         # ============================================
-        if kakao_trackers:
-            # 매장(store_id) + 사용자(user_id) 기준으로 그룹화
-            kakao_grouped = defaultdict(list)
-            for t in kakao_trackers:
-                key = (t["user_id"], t["store_id"])
-                kakao_grouped[key].append(t)
+        if kakao_grouped:
+            collected_at_short = NHNKakaoService.format_collected_at_short(collected_at)
+            recipients = []
+            recipient_groups = []
             
             for (user_id, store_id), trackers in kakao_grouped.items():
-                try:
-                    first_tracker = trackers[0]
-                    user_info = self._get_user_info(user_id)
-                    if not user_info:
-                        logger.warning(f"[Notification] 사용자 정보 없음: {user_id}")
-                        stats["skipped"] += len(trackers)
-                        continue
-                    
-                    phone = (
-                        first_tracker.get("notification_phone")
-                        or user_info.get("phone_number")
+                user_info = users.get(str(user_id))
+                if not user_info:
+                    logger.warning(f"[Notification] 사용자 정보 없음: {user_id}")
+                    stats["skipped"] += len(trackers)
+                    continue
+                
+                phone = (
+                    trackers[0].get("notification_phone")
+                    or user_info.get("phone_number")
+                )
+                if not phone:
+                    logger.warning(
+                        f"[Notification] 전화번호 없음 (카카오): "
+                        f"user={user_id}, store={store_id}"
                     )
-                    if not phone:
-                        logger.warning(
-                            f"[Notification] 전화번호 없음 (카카오): "
-                            f"user={user_id}, store={store_id}"
-                        )
-                        stats["skipped"] += len(trackers)
-                        continue
-                    
-                    # 매장 정보
-                    store_info = self._get_store_info(store_id)
-                    store_name = store_info.get("store_name", "매장") if store_info else "매장"
-                    
-                    # 키워드별 순위 정보 목록
-                    metrics_list = []
-                    for t in trackers:
-                        metrics_list.append({
-                            "keyword": t.get("keyword", ""),
-                            "rank": t.get("rank"),
-                            "rank_change": t.get("rank_change"),
-                        })
-                    
-                    collected_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M")
-                    collected_at_short = NHNKakaoService.format_collected_at_short(collected_at)
-                    
-                    result = await nhn_kakao_service.send_rank_alert(
-                        phone_number=phone,
-                        store_name=store_name,
-                        metrics_list=metrics_list,
-                        collected_at=collected_at_short,
-                    )
-                    
-                    keywords_str = ", ".join(t.get("keyword", "") for t in trackers)
-                    if result["success"]:
-                        stats["sent"] += 1
-                        logger.info(
-                            f"[Notification] 카카오 알림 v2 발송 성공: "
-                            f"{store_name} ({len(trackers)}개 키워드: {keywords_str}) "
-                            f"→ {phone[-4:].rjust(11, '*')}"
-                        )
-                    else:
-                        stats["failed"] += 1
-                        logger.error(
-                            f"[Notification] 카카오 알림 v2 발송 실패: "
-                            f"{store_name} ({len(trackers)}개 키워드) - {result.get('message')}"
-                        )
-                        
-                except Exception as e:
+                    stats["skipped"] += len(trackers)
+                    continue
+                
+                store_info = stores.get(str(store_id))
+                store_name = store_info.get("store_name", "매장") if store_info else "매장"
+                
+                recipients.append(nhn_kakao_service.build_rank_alert_recipient(
+                    phone_number=phone,
+                    store_name=store_name,
+                    metrics_list=self._build_metrics_list(trackers),
+                    collected_at=collected_at_short,
+                ))
+                recipient_groups.append((store_name, trackers))
+            
+            try:
+                results = await nhn_kakao_service.send_rank_alerts_bulk(recipients)
+            except Exception as e:
+                logger.error(f"[Notification] 카카오 알림 일괄 발송 오류: {str(e)}")
+                results = [{"success": False, "message": str(e)} for _ in recipients]
+            
+            for (store_name, trackers), result in zip(recipient_groups, results):
+                if result["success"]:
+                    stats["sent"] += 1
+                else:
                     stats["failed"] += 1
                     logger.error(
-                        f"[Notification] 카카오 알림 발송 오류: "
-                        f"user={user_id}, store={store_id}, error={str(e)}"
+                        f"[Notification] 카카오 알림 v2 발송 실패: "
+                        f"{store_name} ({len(trackers)}개 키워드) - {result.get('message')}"
                     )
+            
+            logger.info(
+                f"[Notification] 카카오 알림 v2 발송: "
+                f"{len(recipients)}개 매장, 성공 {sum(1 for r in results if r['success'])}건"
+            )
         
         # ============================================
-        # 2. 이메일: 매장 단위로 합산하여 발송
+        # 2. 이메일: 매장 단위로 합산하여 발송 (nhn_email_limiter 안에서 동시 발송)
         # ============================================
-        if email_trackers:
-            # 매장(store_id) + 사용자(user_id) 기준으로 그룹화
-            email_grouped = defaultdict(list)
-            for t in email_trackers:
-                key = (t["user_id"], t["store_id"])
-                email_grouped[key].append(t)
-            
+        if email_grouped:
+            email_tasks = []
             for (user_id, store_id), trackers in email_grouped.items():
-                try:
-                    first_tracker = trackers[0]
-                    user_info = self._get_user_info(user_id)
-                    if not user_info:
-                        stats["skipped"] += 1
-                        continue
-                    
-                    email = (
-                        first_tracker.get("notification_email")
-                        or user_info.get("email")
-                    )
-                    if not email:
-                        logger.warning(
-                            f"[Notification] 이메일 없음: user={user_id}"
-                        )
-                        stats["skipped"] += 1
-                        continue
-                    
-                    store_info = self._get_store_info(store_id)
-                    store_name = store_info.get("store_name", "매장") if store_info else "매장"
-                    user_name = user_info.get("display_name", "고객")
-                    collected_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M")
-                    
-                    metrics_list = []
-                    for t in trackers:
-                        metrics_list.append({
-                            "keyword": t.get("keyword", ""),
-                            "rank": t.get("rank"),
-                            "rank_change": t.get("rank_change"),
-                        })
-                    
-                    result = await nhn_email_service.send_rank_alert_email(
-                        to_email=email,
-                        user_name=user_name,
-                        store_name=store_name,
-                        rank_results=metrics_list,
-                        collected_at=collected_at,
-                    )
-                    
-                    if result["success"]:
-                        stats["sent"] += 1
-                        logger.info(
-                            f"[Notification] 이메일 알림 발송 성공: "
-                            f"{store_name} ({len(trackers)}개 키워드) → {email}"
-                        )
-                    else:
-                        stats["failed"] += 1
-                        logger.error(
-                            f"[Notification] 이메일 알림 발송 실패: "
-                            f"{store_name} - {result.get('message')}"
-                        )
-                        
-                except Exception as e:
-                    stats["failed"] += 1
-                    logger.error(
-                        f"[Notification] 이메일 알림 발송 오류: "
-                        f"user={user_id}, store={store_id}, error={str(e)}"
+                user_info = users.get(str(user_id))
+                if not user_info:
+                    stats["skipped"] += 1
+                    continue
+                
+                email = (
+                    trackers[0].get("notification_email")
+                    or user_info.get("email")
+                )
+                if not email:
+                    logger.warning(
+                        f"[Notification] 이메일 없음: user={user_id}"
                     )
+                    stats["skipped"] += 1
+                    continue
+                
+                store_info = stores.get(str(store_id))
+                email_tasks.append(self._send_rank_alert_email(
+                    email=email,
+                    user_name=user_info.get("display_name", "고객"),
+                    store_name=store_info.get("store_name", "매장") if store_info else "매장",
+                    trackers=trackers,
+                    collected_at=collected_at,
+                ))
+            
+            for success in await asyncio.gather(*email_tasks):
+                stats["sent" if success else "failed"] += 1
         
         # ============================================
         # 3. SMS: 미구현 (스킵)
@@ -238,35 +205,84 @@ class NotificationService:
         )
         return stats
     
-    def _get_user_info(self, user_id: str) -> Optional[dict]:
-        """사용자 정보 조회"""
-        try:
-            result = self.supabase.table("profiles")\
-                .select("id, email, display_name, phone_number")\
-                .eq("id", str(user_id))\
-                .execute()
-            
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"[Notification] 사용자 조회 오류: {e}")
-            return None
+    @staticmethod
+    def _build_metrics_list(trackers: List[dict]) -> List[dict]:
+        """키워드별 순위 정보 목록"""
+        return [
+            {
+                "keyword": t.get("keyword", ""),
+                "rank": t.get("rank"),
+                "rank_change": t.get("rank_change"),
+            }
+            for t in trackers
+        ]
     
-    def _get_store_info(self, store_id: str) -> Optional[dict]:
-        """매장 정보 조회"""
+    async def _send_rank_alert_email(
+        self,
+        email: str,
+        user_name: str,
+        store_name: str,
+        trackers: List[dict],
+        collected_at: str,
+    ) -> bool:
+        """매장 단위 순위 알림 이메일 1건 발송"""
         try:
-            result = self.supabase.table("stores")\
-                .select("id, store_name, place_id")\
-                .eq("id", str(store_id))\
-                .execute()
+            result = await nhn_email_service.send_rank_alert_email(
+                to_email=email,
+                user_name=user_name,
+                store_name=store_name,
+                rank_results=self._build_metrics_list(trackers),
+                collected_at=collected_at,
+            )
+            
+            if result["success"]:
+                logger.info(
+                    f"[Notification] 이메일 알림 발송 성공: "
+                    f"{store_name} ({len(trackers)}개 키워드) → {email}"
+                )
+                return True
             
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            return None
+            logger.error(
+                f"[Notification] 이메일 알림 발송 실패: "
+                f"{store_name} - {result.get('message')}"
+            )
+            return False
         except Exception as e:
-            logger.error(f"[Notification] 매장 조회 오류: {e}")
-            return None
+            logger.error(
+                f"[Notification] 이메일 알림 발송 오류: "
+                f"store={store_name}, error={str(e)}"
+            )
+            return False
+    
+    def _get_users_info(self, user_ids: Set[str]) -> Dict[str, dict]:
+        """사용자 정보 일괄 조회 → {user_id: profile}"""
+        users: Dict[str, dict] = {}
+        for ids in chunked([str(user_id) for user_id in user_ids], IN_FILTER_CHUNK_SIZE):
+            try:
+                result = self.supabase.table("profiles")\
+                    .select("id, email, display_name, phone_number")\
+                    .in_("id", ids)\
+                    .execute()
+                for row in (result.data or []):
+                    users[str(row["id"])] = row
+            except Exception as e:
+                logger.error(f"[Notification] 사용자 조회 오류: {e}")
+        return users
+    
+    def _get_stores_info(self, store_ids: Set[str]) -> Dict[str, dict]:
+        """매장 정보 일괄 조회 → {store_id: store}"""
+        stores: Dict[str, dict] = {}
+        for ids in chunked([str(store_id) for store_id in store_ids], IN_FILTER_CHUNK_SIZE):
+            try:
+                result = self.supabase.table("stores")\
+                    .select("id, store_name, place_id")\
+                    .in_("id", ids)\
+                    .execute()
+                for row in (result.data or []):
+                    stores[str(row["id"])] = row
+            except Exception as e:
+                logger.error(f"[Notification] 매장 조회 오류: {e}")
+        return stores
 
 
 # 싱글톤 인스턴스
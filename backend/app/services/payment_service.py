@@ -11,6 +11,7 @@ import base64
 import httpx
 
 from app.core.database import get_supabase_client
+from app.services.credit_service import credit_service
 from app.core.config import (
     settings, 
     TIER_PRICES, TIER_ORDER,
@@ -529,6 +530,7 @@ class PaymentService:
                         "next_reset_at": (now + relativedelta(months=1)).isoformat()
                     })\
                     .execute()
+            credit_service.invalidate_balance(user_id)
             
             # 7. 쿠폰 사용 처리
             coupon_code = metadata.get("coupon_code")
@@ -785,6 +787,7 @@ class PaymentService:
                         "next_reset_at": (now + relativedelta(months=1)).isoformat()
                     })\
                     .execute()
+            credit_service.invalidate_balance(user_id)
             
             # 8. 쿠폰 사용 처리
             coupon_code = metadata.get("coupon_code")
@@ -11,7 +11,7 @@ import logging
 import asyncio
 import re
 from typing import Dict, Any, List, Optional
-from openai import AsyncOpenAI
+from app.core.metrics import observe_upstream_call
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ class ReviewSentimentService:
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다")
         
+        from openai import AsyncOpenAI  # 첫 사용 시 import (API 워커 시작 시간 절감)
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = "gpt-4o-mini"  # 빠르고 저렴한 모델
     
@@ -160,7 +161,7 @@ JSON 형태로 응답하라:
         
         for attempt in range(MAX_RETRIES):
             try:
-                response = await self.client.chat.completions.create(
+                response = await observe_upstream_call("openai", self.model, "direct", self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {"role": "system", "content": self._build_system_prompt()},
@@ -168,7 +169,7 @@ JSON 형태로 응답하라:
                     ],
                     temperature=0.3,  # 일관성을 위해 낮게 설정
                     response_format={"type": "json_object"}
-                )
+                ))
                 
                 content = response.choices[0].message.content
                 result = json.loads(content)
@@ -447,7 +448,7 @@ JSON 형태로 응답하라:
 이제 분석을 시작해주세요."""
         
         try:
-            response = await self.client.chat.completions.create(
+            response = await observe_upstream_call("openai", self.model, "direct", self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": """You are a professional data analyst and local business consultant specializing in Naver Place review analysis.
@@ -465,7 +466,7 @@ If something cannot be determined, clearly state that it cannot be inferred.
                 ],
                 temperature=0.5,
                 max_tokens=1000
-            )
+            ))
             
             summary = response.choices[0].message.content.strip()
             logger.info(f"일별 요약 생성 완료: {len(summary)}자")
@@ -0,0 +1,241 @@
+"""
+검색 결과(SERP) 컬럼 배열 표현
+
+순위 조회는 요청마다 최대 300개 매장을 들고 있고, 배치 지표 수집은 그룹별 결과를 저장 단계까지 유지하므로
+매장마다 dict(키 13개)를 만들면 정시 수집 때 수십 개의 300개짜리 dict 리스트가 동시에 살아 있습니다.
+
+- SerpResults: 필드별 리스트(struct-of-arrays) 11개 → 매장당 dict 대신 리스트 원소 참조만 보관
+- SerpItem: 기존 dict와 같은 키를 제공하는 지연 뷰 (store.get("place_id") 등 기존 코드 그대로 동작)
+- to_dicts / as_dicts: API 응답 경계에서만 dict 리스트로 변환
+- compact_rows: SERP 스냅샷 저장 배열(serp_snapshot_service.SNAPSHOT_COLUMNS 순서)을 컬럼에서 바로 생성
+- FIELD_PROFILES: 호출자별로 GraphQL에 요청할 검색 항목 필드 (요청하지 않은 필드는 빈 값 / 0 / None)
+
+메모리 벤치마크: python -m benchmarks.memory
+필드 프로필 벤치마크: python -m benchmarks.graphql_profiles
+"""
+import sys
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# SerpItem / to_dicts의 키 (기존 search_results dict와 동일한 키 / 순서)
+SERP_FIELDS = (
+    "place_id",
+    "name",
+    "category",
+    "address",
+    "road_address",
+    "phone",
+    "rating",
+    "review_count",
+    "blog_review_count",
+    "visitor_review_count",
+    "thumbnail",
+    "x",
+    "y",
+)
+
+
+# GraphQL 검색 항목 필드 프로필
+# - rank-only: 순위 / 전체 업체수만 쓰는 호출 (정기 순위 확인, 타겟 키워드 순위) → 대상 매장 리뷰수 보강 조회도 생략
+# - competitor: 경쟁매장 / 지표 수집 (SERP 스냅샷 컬럼, 좌표 제외)
+# - full: API 응답으로 search_results 전체를 내려주는 호출 (기본값)
+FIELD_PROFILES = {
+    "rank-only": ("id",),
+    "competitor": (
+        "id", "name", "category", "address", "roadAddress", "imageUrl",
+        "blogCafeReviewCount", "visitorReviewCount", "visitorReviewScore",
+    ),
+    "full": (
+        "id", "name", "category", "address", "roadAddress", "x", "y", "imageUrl",
+        "blogCafeReviewCount", "visitorReviewCount", "visitorReviewScore",
+    ),
+}
+
+DEFAULT_PROFILE = "full"
+
+
+def profile_fields(profile: str) -> tuple:
+    """프로필의 GraphQL 항목 필드 (알 수 없는 프로필이면 ValueError)"""
+    try:
+        return FIELD_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"알 수 없는 검색 필드 프로필: {profile} ({', '.join(FIELD_PROFILES)})")
+
+
+def parse_count(value) -> int:
+    """리뷰 수 ("1,234" / int / None) → int"""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace(',', ''))
+    except (ValueError, AttributeError):
+        return 0
+
+
+def parse_rating(value) -> Optional[float]:
+    """평점 (0 이하 / 빈 값이면 None)"""
+    if value is None or value == "" or value == "None":
+        return None
+    try:
+        rating = float(value)
+        return rating if rating > 0 else None
+    except (ValueError, TypeError):
+        return None
+
+
+class SerpResults:
+    """검색 결과 목록 (순서 = 순위, 인덱스로 접근하면 SerpItem 뷰)"""
+    
+    __slots__ = (
+        "place_ids", "names", "categories", "addresses", "road_addresses", "ratings",
+        "visitor_counts", "blog_counts", "thumbnails", "xs", "ys", "_positions",
+    )
+    
+    def __init__(self):
+        self.place_ids: List[str] = []
+        self.names: List[str] = []
+        self.categories: List[str] = []
+        self.addresses: List[str] = []
+        self.road_addresses: List[str] = []
+        self.ratings: List[Optional[float]] = []
+        self.visitor_counts: List[int] = []
+        self.blog_counts: List[int] = []
+        self.thumbnails: List[str] = []
+        self.xs: List[str] = []
+        self.ys: List[str] = []
+        self._positions: Optional[Dict[str, int]] = None
+    
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> "SerpResults":
+        results = cls()
+        results.extend_items(items)
+        return results
+    
+    def extend_items(self, items: Iterable[dict]) -> None:
+        """GraphQL 응답의 매장 항목 추가 (getPlacesList / getRestaurantList / getHospitals items)"""
+        for item in items:
+            self.place_ids.append(str(item.get("id") or ""))
+            self.names.append(item.get("name") or "")
+            # 카테고리는 같은 값이 반복되므로 intern
+            self.categories.append(sys.intern(item.get("category") or ""))
+            self.addresses.append(item.get("address") or "")
+            self.road_addresses.append(item.get("roadAddress") or "")
+            self.ratings.append(parse_rating(item.get("visitorReviewScore")))
+            self.visitor_counts.append(parse_count(item.get("visitorReviewCount")))
+            self.blog_counts.append(parse_count(item.get("blogCafeReviewCount")))
+            self.thumbnails.append(item.get("imageUrl") or "")
+            self.xs.append(str(item.get("x", "")))
+            self.ys.append(str(item.get("y", "")))
+        self._positions = None
+    
+    def __len__(self) -> int:
+        return len(self.place_ids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [SerpItem(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SerpResults index out of range")
+        return SerpItem(self, index)
+    
+    def __iter__(self) -> Iterator["SerpItem"]:
+        for index in range(len(self)):
+            yield SerpItem(self, index)
+    
+    def index_of(self, place_id: str) -> Optional[int]:
+        """place_id의 위치 (0부터, 없으면 None, 같은 매장이 여러 번이면 첫 위치)"""
+        if self._positions is None:
+            positions: Dict[str, int] = {}
+            for index, value in enumerate(self.place_ids):
+                positions.setdefault(value, index)
+            self._positions = positions
+        return self._positions.get(place_id)
+    
+    def to_dicts(self) -> List[Dict]:
+        """기존 search_results 형식 (API 응답용 dict 리스트)"""
+        return [
+            {
+                "place_id": place_id,
+                "name": name,
+                "category": category,
+                "address": address,
+                "road_address": road_address,
+                "phone": "",
+                "rating": rating,
+                "review_count": str(visitor_count),
+                "blog_review_count": str(blog_count),
+                "visitor_review_count": visitor_count,
+                "thumbnail": thumbnail,
+                "x": x,
+                "y": y,
+            }
+            for place_id, name, category, address, road_address, rating,
+                visitor_count, blog_count, thumbnail, x, y
+            in zip(
+                self.place_ids, self.names, self.categories, self.addresses, self.road_addresses,
+                self.ratings, self.visitor_counts, self.blog_counts, self.thumbnails, self.xs, self.ys,
+            )
+        ]
+    
+    def compact_rows(self) -> List[list]:
+        """SERP 스냅샷 저장 배열 (serp_snapshot_service.SNAPSHOT_COLUMNS 순서)"""
+        return [
+            list(row)
+            for row in zip(
+                self.place_ids, self.names, self.categories, self.addresses, self.road_addresses,
+                self.ratings, self.visitor_counts, self.blog_counts, self.thumbnails,
+            )
+        ]
+
+
+_GETTERS = {
+    "place_id": lambda r, i: r.place_ids[i],
+    "name": lambda r, i: r.names[i],
+    "category": lambda r, i: r.categories[i],
+    "address": lambda r, i: r.addresses[i],
+    "road_address": lambda r, i: r.road_addresses[i],
+    "phone": lambda r, i: "",
+    "rating": lambda r, i: r.ratings[i],
+    "review_count": lambda r, i: str(r.visitor_counts[i]),
+    "blog_review_count": lambda r, i: str(r.blog_counts[i]),
+    "visitor_review_count": lambda r, i: r.visitor_counts[i],
+    "thumbnail": lambda r, i: r.thumbnails[i],
+    "x": lambda r, i: r.xs[i],
+    "y": lambda r, i: r.ys[i],
+}
+
+
+class SerpItem(Mapping):
+    """SerpResults의 매장 1개 (읽기 전용 dict 뷰)"""
+    
+    __slots__ = ("_results", "_index")
+    
+    def __init__(self, results: SerpResults, index: int):
+        self._results = results
+        self._index = index
+    
+    def __getitem__(self, key):
+        getter = _GETTERS.get(key)
+        if getter is None:
+            raise KeyError(key)
+        return getter(self._results, self._index)
+    
+    def __iter__(self):
+        return iter(SERP_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(SERP_FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"SerpItem({dict(self)!r})"
+
+
+def as_dicts(search_results) -> List[Dict]:
+    """API 응답 경계: SerpResults → dict 리스트 (크롤링 폴백의 dict 리스트는 그대로)"""
+    if isinstance(search_results, SerpResults):
+        return search_results.to_dicts()
+    return list(search_results or [])
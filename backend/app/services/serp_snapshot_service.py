@@ -0,0 +1,351 @@
+"""
+SERP 스냅샷 서비스
+Deduplicated SERP snapshot storage for competitor_rankings
+
+같은 키워드를 같은 위치에서 같은 시간대에 수집한 검색 결과(최대 300개)는
+tracker가 달라도 동일하므로, serp_snapshots 테이블에 압축된 형태로 한 번만 저장하고
+competitor_rankings는 snapshot_id + 자기 순위(my_rank)만 저장합니다.
+
+- 스냅샷 키: (keyword, location_cell, collected_hour, content_hash)
+  → content_hash를 키에 포함하므로 내용이 다른 리스트가 합쳐지는 일은 없음
+- items: 매장 dict 대신 컬럼 순서가 고정된 배열의 배열 (SNAPSHOT_COLUMNS)
+- rank는 배열 인덱스, is_my_store는 조회 시 매장 place_id로 재계산
+"""
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.database import (
+    get_supabase_client,
+    chunked,
+    IN_FILTER_CHUNK_SIZE,
+    BULK_WRITE_CHUNK_SIZE,
+)
+from app.services.serp_results import SerpResults
+
+logger = logging.getLogger(__name__)
+
+# 압축 저장 컬럼 순서 (마이그레이션 SQL의 jsonb_build_array / SerpResults.compact_rows 순서와 동일해야 함)
+SNAPSHOT_COLUMNS = (
+    "place_id",
+    "name",
+    "category",
+    "address",
+    "road_address",
+    "rating",
+    "visitor_review_count",
+    "blog_review_count",
+    "thumbnail",
+)
+
+# 좌표 미설정 매장의 검색 기본 위치 (naver_rank_api_unofficial과 동일)
+DEFAULT_SEARCH_X = "127.0276"
+DEFAULT_SEARCH_Y = "37.4979"
+
+# 위치 셀 정밀도 (소수점 4자리 ≈ 10m)
+LOCATION_CELL_PRECISION = 4
+
+# 프로세스 내 최근 스냅샷 ID 캐시 (같은 수집 주기 내 중복 RPC 방지)
+SNAPSHOT_ID_CACHE_SIZE = 1024
+
+
+def _to_int(value) -> int:
+    """쉼표 포함 문자열/None을 정수로 변환"""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace(",", ""))
+    except (ValueError, TypeError):
+        return 0
+
+
+def make_location_cell(coord_x: Optional[str], coord_y: Optional[str]) -> str:
+    """검색 좌표를 위치 셀 문자열로 변환 (예: "127.0276,37.4979")"""
+    cells = []
+    for value, default in ((coord_x, DEFAULT_SEARCH_X), (coord_y, DEFAULT_SEARCH_Y)):
+        try:
+            cells.append(f"{float(value or default):.{LOCATION_CELL_PRECISION}f}")
+        except (ValueError, TypeError):
+            cells.append(f"{float(default):.{LOCATION_CELL_PRECISION}f}")
+    return ",".join(cells)
+
+
+def compact_search_results(search_results: List[Dict]) -> List[list]:
+    """check_rank의 search_results를 압축 배열 형태로 변환 (순서 = 순위)"""
+    if isinstance(search_results, SerpResults):
+        return search_results.compact_rows()
+    items = []
+    for s in search_results:
+        items.append([
+            str(s.get("place_id", "") or ""),
+            s.get("name", "") or "",
+            s.get("category", "") or "",
+            s.get("address", "") or "",
+            s.get("road_address", "") or "",
+            s.get("rating"),
+            _to_int(s.get("visitor_review_count", 0)),
+            _to_int(s.get("blog_review_count", 0)),
+            s.get("thumbnail", "") or "",
+        ])
+    return items
+
+
+def expand_snapshot_items(items: List[list], my_place_id: Optional[str]) -> List[Dict]:
+    """압축 배열을 기존 competitors_data 형식(dict 리스트)으로 복원"""
+    competitors = []
+    for idx, row in enumerate(items or [], start=1):
+        comp = dict(zip(SNAPSHOT_COLUMNS, row))
+        comp["rank"] = idx
+        comp["is_my_store"] = bool(my_place_id) and comp.get("place_id") == my_place_id
+        competitors.append(comp)
+    return competitors
+
+
+class SerpSnapshotService:
+    """SERP 스냅샷 저장/조회 서비스"""
+
+    def __init__(self):
+        self.supabase = get_supabase_client()
+        self._recent_ids: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+
+    def save_snapshot(
+        self,
+        keyword: str,
+        coord_x: Optional[str],
+        coord_y: Optional[str],
+        search_results: List[Dict],
+        total_count,
+        collected_at: datetime,
+    ) -> Optional[str]:
+        """
+        검색 결과를 스냅샷으로 저장 (이미 같은 스냅샷이 있으면 재사용)
+
+        Returns:
+            snapshot_id (저장할 결과가 없으면 None)
+        """
+        if not search_results:
+            return None
+
+        items = compact_search_results(search_results)
+        serialized = json.dumps(items, ensure_ascii=False, separators=(",", ":"))
+        content_hash = hashlib.md5(serialized.encode("utf-8")).hexdigest()
+        location_cell = make_location_cell(coord_x, coord_y)
+        collected_hour = collected_at.replace(minute=0, second=0, microsecond=0).isoformat()
+
+        cache_key = (keyword, location_cell, collected_hour, content_hash)
+        cached_id = self._recent_ids.get(cache_key)
+        if cached_id:
+            self._recent_ids.move_to_end(cache_key)
+            logger.info(f"[SERP Snapshot] 재사용 (캐시): {keyword} @ {location_cell}")
+            return cached_id
+
+        result = self.supabase.rpc('upsert_serp_snapshot', {
+            'p_keyword': keyword,
+            'p_location_cell': location_cell,
+            'p_collected_hour': collected_hour,
+            'p_content_hash': content_hash,
+            'p_total_count': _to_int(total_count),
+            'p_items': items,
+        }).execute()
+
+        snapshot_id = result.data if isinstance(result.data, str) else None
+        if isinstance(result.data, list) and result.data:
+            first = result.data[0]
+            snapshot_id = first.get('upsert_serp_snapshot') if isinstance(first, dict) else first
+
+        if snapshot_id:
+            self._recent_ids[cache_key] = snapshot_id
+            if len(self._recent_ids) > SNAPSHOT_ID_CACHE_SIZE:
+                self._recent_ids.popitem(last=False)
+            logger.info(f"[SERP Snapshot] 저장: {keyword} @ {location_cell} ({len(items)}개)")
+
+        return snapshot_id
+
+    def save_competitor_ranking(
+        self,
+        tracker_id: str,
+        keyword_id: str,
+        store_id: str,
+        keyword: str,
+        coord_x: Optional[str],
+        coord_y: Optional[str],
+        search_results: List[Dict],
+        my_rank: Optional[int],
+        total_count,
+        collected_at: datetime,
+    ) -> Optional[str]:
+        """
+        tracker의 경쟁매장 순위 저장 (스냅샷 참조 + 자기 순위만 저장)
+
+        오늘 데이터가 이미 있으면 업데이트, 없으면 삽입
+
+        Returns:
+            snapshot_id
+        """
+        snapshot_id = self.save_snapshot(
+            keyword, coord_x, coord_y, search_results, total_count, collected_at
+        )
+        if not snapshot_id:
+            return None
+
+        today = collected_at.date().isoformat()
+        competitor_record = {
+            'tracker_id': tracker_id,
+            'keyword_id': keyword_id,
+            'store_id': store_id,
+            'keyword': keyword,
+            'collection_date': today,
+            'my_rank': my_rank,
+            'total_count': _to_int(total_count),
+            'snapshot_id': snapshot_id,
+            'competitors_data': None,
+            'collected_at': collected_at.isoformat()
+        }
+
+        existing_comp = self.supabase.table('competitor_rankings')\
+            .select('id')\
+            .eq('tracker_id', tracker_id)\
+            .eq('collection_date', today)\
+            .execute()
+
+        if existing_comp.data and len(existing_comp.data) > 0:
+            self.supabase.table('competitor_rankings')\
+                .update(competitor_record)\
+                .eq('tracker_id', tracker_id)\
+                .eq('collection_date', today)\
+                .execute()
+        else:
+            self.supabase.table('competitor_rankings')\
+                .insert(competitor_record)\
+                .execute()
+
+        return snapshot_id
+
+    def save_competitor_rankings_bulk(
+        self,
+        entries: List[Dict],
+        collected_at: datetime,
+    ) -> int:
+        """
+        여러 tracker의 경쟁매장 순위 일괄 저장 (배치 지표 수집용)
+        
+        같은 검색을 공유하는 tracker들은 스냅샷 ID 캐시로 RPC 1회만 호출하고,
+        competitor_rankings는 기존 행 조회 1회 + upsert/insert 일괄 요청으로 저장
+        
+        Args:
+            entries: [{tracker_id, keyword_id, store_id, keyword, coord_x, coord_y,
+                       search_results, my_rank, total_count}, ...]
+        
+        Returns:
+            저장된 행 수
+        """
+        today = collected_at.date().isoformat()
+        records = []
+        for entry in entries:
+            try:
+                snapshot_id = self.save_snapshot(
+                    entry['keyword'], entry.get('coord_x'), entry.get('coord_y'),
+                    entry.get('search_results') or [], entry.get('total_count'), collected_at
+                )
+            except Exception as e:
+                logger.error(f"[SERP Snapshot] 스냅샷 저장 실패: {entry.get('tracker_id')} - {str(e)}")
+                continue
+            if not snapshot_id:
+                continue
+            records.append({
+                'tracker_id': entry['tracker_id'],
+                'keyword_id': entry['keyword_id'],
+                'store_id': entry['store_id'],
+                'keyword': entry['keyword'],
+                'collection_date': today,
+                'my_rank': entry.get('my_rank'),
+                'total_count': _to_int(entry.get('total_count')),
+                'snapshot_id': snapshot_id,
+                'competitors_data': None,
+                'collected_at': collected_at.isoformat()
+            })
+        
+        if not records:
+            return 0
+        
+        # 오늘 이미 저장된 행 조회 (tracker_id → id)
+        existing_ids: Dict[str, str] = {}
+        tracker_ids = [r['tracker_id'] for r in records]
+        for ids in chunked(tracker_ids, IN_FILTER_CHUNK_SIZE):
+            existing = self.supabase.table('competitor_rankings')\
+                .select('id, tracker_id')\
+                .in_('tracker_id', ids)\
+                .eq('collection_date', today)\
+                .execute()
+            for row in existing.data or []:
+                existing_ids[row['tracker_id']] = row['id']
+        
+        # 일괄 요청은 모든 행의 키가 같아야 하므로 업데이트(id 포함)/삽입을 분리
+        updates = [{**r, 'id': existing_ids[r['tracker_id']]} for r in records if r['tracker_id'] in existing_ids]
+        inserts = [r for r in records if r['tracker_id'] not in existing_ids]
+        
+        for rows in chunked(updates, BULK_WRITE_CHUNK_SIZE):
+            self.supabase.table('competitor_rankings').upsert(rows).execute()
+        for rows in chunked(inserts, BULK_WRITE_CHUNK_SIZE):
+            self.supabase.table('competitor_rankings').insert(rows).execute()
+        
+        logger.info(
+            f"[SERP Snapshot] 경쟁매장 순위 일괄 저장: {len(records)}개 "
+            f"(업데이트 {len(updates)}, 삽입 {len(inserts)})"
+        )
+        return len(records)
+    
+    def get_latest_competitors(
+        self,
+        keyword: str,
+        store_id: str,
+        my_place_id: Optional[str],
+    ) -> Optional[Dict]:
+        """
+        저장된 최신 경쟁매장 순위 조회 (기존 API 응답 형식으로 복원)
+
+        스냅샷 참조 행과 마이그레이션 이전의 competitors_data 행 모두 지원
+
+        Returns:
+            {collection_date, collected_at, my_rank, total_count, competitors} 또는 None
+        """
+        result = self.supabase.table("competitor_rankings")\
+            .select("*, serp_snapshots(items, total_count)")\
+            .eq("keyword", keyword)\
+            .eq("store_id", store_id)\
+            .order("collection_date", desc=True)\
+            .limit(1)\
+            .execute()
+
+        if not result.data:
+            return None
+
+        row = result.data[0]
+        snapshot = row.get('serp_snapshots')
+
+        if snapshot:
+            competitors = expand_snapshot_items(snapshot.get('items') or [], my_place_id)
+            total_count = row.get('total_count') or snapshot.get('total_count', 0)
+        else:
+            # 레거시 행: competitors_data JSON 그대로 사용
+            competitors = row.get('competitors_data') or []
+            if isinstance(competitors, str):
+                competitors = json.loads(competitors)
+            total_count = row.get('total_count', 0)
+
+        return {
+            'collection_date': row.get('collection_date'),
+            'collected_at': row.get('collected_at'),
+            'my_rank': row.get('my_rank'),
+            'total_count': total_count or 0,
+            'competitors': competitors,
+        }
+
+
+# 싱글톤 인스턴스
+serp_snapshot_service = SerpSnapshotService()
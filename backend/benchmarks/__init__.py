@@ -0,0 +1,23 @@
+"""
+오프라인 벤치마크 스위트
+
+네이버 GraphQL(api.place.naver.com / pcmap-api.place.naver.com), m.place.naver.com HTML,
+Supabase PostgREST를 로컬 ASGI 스탠드인으로 대체하고 저장소에 기록된 fixture
+(anana_graphql_response.json, search_api_response_*.json, debug_place_*.html)를 재생합니다.
+
+측정 대상:
+- check_rank: 신API 순위 조회 (300위 탐색, 타겟 150위)
+- reviews_7d: get_reviews_by_date_range (최근 7일)
+- diagnose_place: complete_diagnosis_service.diagnose_place
+- scheduler_rank_check / scheduler_metrics: 스케줄러 작업 (tracker N개)
+
+실행 방법은 benchmarks/__main__.py 참고 (python -m benchmarks --help)
+응답 직렬화 / 압축 벤치마크는 별도 실행: python -m benchmarks.serialization (benchmarks/serialization.py 참고)
+검색 결과 메모리 벤치마크는 별도 실행: python -m benchmarks.memory (benchmarks/memory.py 참고)
+HTML 파싱 백엔드 벤치마크 / 기존 구현과 결과 비교: python -m benchmarks.html_parsing (benchmarks/html_parsing.py 참고)
+날짜 문자열 파싱 벤치마크 / 기존 파서와 결과 비교: python -m benchmarks.date_parsing (benchmarks/date_parsing.py 참고)
+
+주의:
+- 스탠드인 Supabase는 조회 대상(tracker / keyword)만 반환하고 쓰기는 빈 응답 → 저장 왕복 비용만 측정
+- 오류 주입률이 높으면 크롤링 폴백(Selenium/Playwright) 경로로 빠질 수 있음 (스탠드인 대상 아님)
+"""
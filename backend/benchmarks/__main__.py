@@ -0,0 +1,186 @@
+"""
+오프라인 벤치마크 실행
+
+    cd backend
+    python -m benchmarks                                   # 전체 실행
+    python -m benchmarks --only check_rank reviews_7d      # 일부만
+    python -m benchmarks --latency-ms 120 --error-rate 0.02
+    python -m benchmarks --output bench.json --baseline bench_prev.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import StandInData, StandInResponder
+from benchmarks.runner import (
+    BenchmarkResult,
+    build_report,
+    format_results,
+    load_report,
+    regressions,
+    run_benchmark,
+    save_report,
+)
+from benchmarks.stand_in import FaultConfig, StandInApp, StandInServer, route_naver_to
+
+BENCHMARK_NAMES = [
+    "check_rank",
+    "reviews_7d",
+    "diagnose_place",
+    "scheduler_rank_check",
+    "scheduler_metrics",
+]
+
+# 같은 시간대 중복 실행을 막는 스케줄러 작업은 동시 실행하지 않음
+SERIAL_BENCHMARKS = {"scheduler_rank_check", "scheduler_metrics"}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="egurado 오프라인 벤치마크")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARK_NAMES, help="실행할 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="벤치마크당 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 실행 수 (스케줄러 작업은 1)")
+    parser.add_argument("--scheduler-iterations", type=int, default=3, help="스케줄러 작업 반복 횟수")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="스탠드인 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="지연 편차 (±)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trackers", type=int, default=60, help="스케줄러 벤치마크 tracker 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--fail-on-regression", action="store_true", help="baseline 대비 p95 회귀 시 exit 1")
+    parser.add_argument("--verbose", action="store_true", help="앱 로그 / print 출력 표시")
+    return parser.parse_args(argv)
+
+
+def configure_environment(base_url: str):
+    """app 모듈 import 전에 외부 의존성을 스탠드인으로 지정"""
+    os.environ["SUPABASE_URL"] = base_url
+    os.environ["SUPABASE_SERVICE_ROLE_KEY"] = "bench.bench.bench"
+    os.environ["PROXY_URLS"] = ""
+    os.environ["PROXY_URL"] = ""
+    os.environ["METRIC_SMOOTHING_WINDOW_MINUTES"] = "0"
+    os.environ["METRIC_BACKFILL_ON_STARTUP"] = "false"
+
+
+def build_benchmarks(responder: StandInResponder) -> Dict[str, Callable[[int], Awaitable[Optional[int]]]]:
+    """벤치마크 이름 → 비동기 실행 함수 (app 모듈은 환경 설정 후 import)"""
+    from app.core import scheduler
+    from app.services.naver_complete_diagnosis_service import complete_diagnosis_service
+    from app.services.naver_rank_api_unofficial import rank_service_new_api
+    from app.services.naver_review_service import naver_review_service
+    
+    target = responder.target
+    
+    async def check_rank(_: int) -> int:
+        result = await rank_service_new_api.check_rank(
+            keyword="성수 사진관",
+            target_place_id=target["id"],
+            store_name=target["name"],
+            category=target["category"],
+        )
+        if not result.get("found"):
+            raise RuntimeError("타겟 매장을 찾지 못함 (크롤링 폴백 경로)")
+        return result.get("total_results") or 0
+    
+    async def reviews_7d(_: int) -> int:
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=7)
+        reviews = await naver_review_service.get_reviews_by_date_range(target["id"], start_date, end_date)
+        return len(reviews)
+    
+    async def diagnose_place(_: int) -> int:
+        await complete_diagnosis_service.diagnose_place(target["id"], target["name"])
+        return 1
+    
+    async def scheduler_rank_check(_: int) -> int:
+        await scheduler.check_all_keywords_rank()
+        return responder.data.trackers
+    
+    async def scheduler_metrics(_: int) -> int:
+        await scheduler.collect_all_metrics()
+        return responder.data.trackers
+    
+    return {
+        "check_rank": check_rank,
+        "reviews_7d": reviews_7d,
+        "diagnose_place": diagnose_place,
+        "scheduler_rank_check": scheduler_rank_check,
+        "scheduler_metrics": scheduler_metrics,
+    }
+
+
+async def run_all(
+    args: argparse.Namespace, app: StandInApp, names: List[str], benchmarks: Dict[str, Callable]
+) -> List[BenchmarkResult]:
+    results = []
+    for name in names:
+        serial = name in SERIAL_BENCHMARKS
+        requests_before = (app.request_count, app.error_count)
+        result = await run_benchmark(
+            name,
+            benchmarks[name],
+            iterations=args.scheduler_iterations if serial else args.iterations,
+            concurrency=1 if serial else args.concurrency,
+        )
+        result.extra = {
+            "stand_in_requests": app.request_count - requests_before[0],
+            "stand_in_injected_errors": app.error_count - requests_before[1],
+        }
+        results.append(result)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    names = args.only or BENCHMARK_NAMES
+    
+    responder = StandInResponder(StandInData(trackers=args.trackers))
+    faults = FaultConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    app = StandInApp(responder, faults)
+    
+    with StandInServer(app) as server:
+        configure_environment(server.base_url)
+        if not args.verbose:
+            logging.disable(logging.CRITICAL)
+        benchmarks = build_benchmarks(responder)
+        
+        with route_naver_to(server.base_url), contextlib.ExitStack() as stack:
+            if not args.verbose:
+                # 서비스 코드의 print 출력이 결과 표를 가리지 않도록
+                stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            results = asyncio.run(run_all(args, app, names, benchmarks))
+    
+    logging.disable(logging.NOTSET)
+    
+    baseline = load_report(args.baseline) if args.baseline else None
+    print(format_results(results, baseline))
+    
+    if args.output:
+        options = {key: value for key, value in vars(args).items() if key not in ("output", "baseline")}
+        save_report(build_report(results, options), args.output)
+        print(f"\n결과 저장: {args.output}")
+    
+    if baseline and args.fail_on_regression:
+        regressed = regressions(results, baseline)
+        if regressed:
+            print(f"\np95 회귀: {', '.join(regressed)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
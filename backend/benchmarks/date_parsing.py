@@ -0,0 +1,482 @@
+"""
+날짜 문자열 파싱 벤치마크 / 기존 파서와 결과 비교 (app.services.naver_dates 기준)
+    
+    cd backend
+    python -m benchmarks.date_parsing
+    python -m benchmarks.date_parsing --pages 100 --iterations 20 --output date_parsing.json
+
+문자열 묶음 (네이버 응답 형식으로 생성, 기준 시각 고정, 최근 400일 분포):
+- visited: 방문자 리뷰 방문일 ("1.10.금", 작년이면 "25.12.31.수") → parse_naver_date / visit_date_strs
+- review_id: 방문자 리뷰 ID (ObjectId) → extract_date_from_id / object_id_date_str
+- created: 방문자 리뷰 작성일 (ISO "...Z" / "+09:00" / 밀리초, "1.27.전", "N일 전")
+  → 활성화 _parse_review_date, 경쟁분석 _parse_visitor_review_date / parse_dates(tz=UTC)
+- announcement: 공지 날짜 ("3일 전", "1주일 전", "2개월 전", "2026.10.01") → 경쟁분석 _parse_review_date
+- blog: 블로그 검색 / 블로그 리뷰 날짜 ("N분 전", "N시간 전", "N일 전", "N주 전", "2026.08.14.", "25.12.5.", "24.7.17.수", ISO)
+  → _parse_naver_search_date(KST), _parse_blog_review_date_from_text / 경쟁분석 _parse_blog_review_date(naive)
+
+비교: 기존 파서(legacy, 기준 시각을 인자로 받도록 옮긴 사본)와 같은 기준 시각으로 파싱 → 날짜(일 단위) / 시간대 유무 비교
+- agree: 같은 결과 (둘 다 실패 포함)
+- fixed: 기존 파서는 실패(None / datetime.min), 새 파서는 해석 ("24.12.31.화", "1주일 전", "25.12.5." 등)
+  또는 의도한 수정과 같은 결과 (naive ISO: 기존 "...Z" UTC 벽시계 → KST 벽시계)
+- differ: 기존 파서가 해석한 값과 다름 (있으면 종료 코드 1)
+
+측정 (묶음별, 페이지 = 문자열 50개):
+- legacy_ms: 기존 파서로 전체 파싱
+- cold_ms / warm_ms: 일괄 API, 캐시 비운 상태 / 같은 날 반복 (페이지네이션 재조회, 다른 매장 분석)
+"""
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.fixtures import WEEKDAYS_KO
+from benchmarks.runner import save_report
+
+PAGE_SIZE = 50
+
+# 기준 시각 (KST 15시 - "N시간 전"이 날짜를 넘지 않도록)
+KST = timezone(timedelta(hours=9), "KST")
+NOW_KST = datetime(2026, 10, 19, 15, 0, tzinfo=KST)
+NOW_UTC = NOW_KST.astimezone(timezone.utc)
+NOW_NAIVE = NOW_KST.replace(tzinfo=None)
+
+HISTORY_DAYS = 400
+
+
+# ==================== 기존 파서 (기준 시각 인자만 추가, pytz Asia/Seoul → 고정 +09:00) ====================
+
+def legacy_parse_naver_date(date_str: str, now: datetime) -> Optional[str]:
+    """NaverReviewService.parse_naver_date"""
+    try:
+        if not date_str:
+            return None
+        parts = date_str.split(".")
+        if len(parts) < 2:
+            return None
+        month = int(parts[0])
+        day = int(parts[1])
+        review_date = datetime(now.year, month, day)
+        if review_date.replace(tzinfo=None) > now.replace(tzinfo=None):
+            review_date = datetime(now.year - 1, month, day)
+        return review_date.strftime("%Y-%m-%d")
+    except Exception:
+        return None
+
+
+def legacy_extract_date_from_id(review_id: str, now: datetime) -> Optional[str]:
+    """NaverReviewService.extract_date_from_id"""
+    try:
+        timestamp = int(review_id[:8], 16)
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(KST).strftime("%Y-%m-%d")
+    except Exception:
+        return None
+
+
+def legacy_parse_visitor_review_date(date_str: str, now: datetime) -> Optional[datetime]:
+    """활성화 v3 _parse_review_date / 경쟁분석 _parse_visitor_review_date (같은 구현)"""
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except Exception:
+        pass
+    try:
+        match = re.match(r'(\d+)\.(\d+)\.', date_str)
+        if match:
+            month = int(match.group(1))
+            day = int(match.group(2))
+            try:
+                review_date = datetime(now.year, month, day, tzinfo=timezone.utc)
+                if review_date > now:
+                    review_date = datetime(now.year - 1, month, day, tzinfo=timezone.utc)
+                return review_date
+            except ValueError:
+                pass
+        if "일 전" in date_str:
+            return now - timedelta(days=int(date_str.split("일")[0].strip()))
+        elif "시간 전" in date_str:
+            return now - timedelta(hours=int(date_str.split("시간")[0].strip()))
+        elif "분 전" in date_str:
+            return now - timedelta(minutes=int(date_str.split("분")[0].strip()))
+    except Exception:
+        pass
+    return None
+
+
+def legacy_parse_announcement_date(date_str: str, now: datetime) -> datetime:
+    """경쟁분석 _parse_review_date"""
+    try:
+        if not date_str:
+            return datetime.min
+        if "일 전" in date_str:
+            return now - timedelta(days=int(date_str.split("일")[0].strip()))
+        elif "주일 전" in date_str:
+            return now - timedelta(weeks=int(date_str.split("주일")[0].strip()))
+        elif "개월 전" in date_str:
+            return now - timedelta(days=int(date_str.split("개월")[0].strip()) * 30)
+        else:
+            return datetime.strptime(date_str, "%Y.%m.%d")
+    except Exception:
+        return datetime.min
+
+
+def legacy_parse_competitor_blog_date(date_str: str, now: datetime) -> Optional[datetime]:
+    """경쟁분석 _parse_blog_review_date"""
+    if not date_str:
+        return None
+    try:
+        if "전" in date_str:
+            if "시간" in date_str or "분" in date_str:
+                return now
+            elif "일" in date_str:
+                return now - timedelta(days=int(re.search(r'\d+', date_str).group()))
+            elif "주" in date_str:
+                return now - timedelta(weeks=int(re.search(r'\d+', date_str).group()))
+        date_str_clean = date_str.replace(".", "").strip()
+        if len(date_str_clean) == 6:
+            return datetime.strptime(date_str_clean, "%y%m%d")
+        elif len(date_str_clean) == 8:
+            return datetime.strptime(date_str_clean, "%Y%m%d")
+        return None
+    except Exception:
+        return None
+
+
+def legacy_parse_naver_search_date(date_str: str, now: datetime) -> Optional[datetime]:
+    """NaverReviewService._parse_naver_search_date"""
+    if not date_str:
+        return None
+    try:
+        if "일 전" in date_str or "일전" in date_str:
+            match = re.search(r'(\d+)일\s*전', date_str)
+            if match:
+                return now - timedelta(days=int(match.group(1)))
+        if "주 전" in date_str or "주전" in date_str:
+            match = re.search(r'(\d+)주\s*전', date_str)
+            if match:
+                return now - timedelta(weeks=int(match.group(1)))
+        if "시간 전" in date_str or "시간전" in date_str:
+            match = re.search(r'(\d+)시간\s*전', date_str)
+            if match:
+                return now - timedelta(hours=int(match.group(1)))
+        if "분 전" in date_str or "분전" in date_str:
+            match = re.search(r'(\d+)분\s*전', date_str)
+            if match:
+                return now - timedelta(minutes=int(match.group(1)))
+        match = re.match(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?', date_str)
+        if match:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)), tzinfo=KST)
+        match = re.match(r'(\d{2})\.(\d{1,2})\.(\d{1,2})\.?', date_str)
+        if match:
+            year_short = int(match.group(1))
+            year = 2000 + year_short if year_short < 50 else 1900 + year_short
+            return datetime(year, int(match.group(2)), int(match.group(3)), tzinfo=KST)
+        return None
+    except Exception:
+        return None
+
+
+def _kst_wall_clock(date_str: str, legacy: Any) -> Any:
+    """의도한 수정: 오프셋 있는 ISO는 KST 벽시계 시각으로 (기존은 오프셋만 떼어 "...Z"가 9시간 이르게 됨)"""
+    if isinstance(legacy, datetime) and legacy.tzinfo is None and "-" in date_str:
+        try:
+            parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        except ValueError:
+            return legacy
+        if parsed.tzinfo is not None:
+            return parsed.astimezone(KST).replace(tzinfo=None)
+    return legacy
+
+
+def legacy_parse_blog_review_date_from_text(date_str: str, now: datetime) -> Optional[datetime]:
+    """NaverReviewService._parse_blog_review_date_from_text"""
+    try:
+        if 'T' in date_str or '-' in date_str:
+            try:
+                return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
+            except Exception:
+                pass
+        match = re.match(r'(\d{4})\.(\d{1,2})\.(\d{1,2})', date_str)
+        if match:
+            year, month, day = match.groups()
+            return datetime(int(year), int(month), int(day))
+        match = re.match(r'(\d{2})\.(\d{1,2})\.(\d{1,2})', date_str)
+        if match:
+            year_short, month, day = match.groups()
+            return datetime(2000 + int(year_short), int(month), int(day))
+        return None
+    except Exception:
+        return None
+
+
+# ==================== 문자열 생성 ====================
+
+def _recent_day(rng: random.Random) -> date:
+    """최근 날짜 (최근일수록 많음 - 리뷰 분포와 비슷하게)"""
+    return NOW_KST.date() - timedelta(days=int(rng.expovariate(1 / 60)) % HISTORY_DAYS)
+
+
+def _visited_label(day: date) -> str:
+    label = f"{day.month}.{day.day}.{WEEKDAYS_KO[day.weekday()]}"
+    if day.year != NOW_KST.year:
+        label = f"{day.year % 100}.{label}"
+    return label
+
+
+def _iso_label(rng: random.Random, day: date) -> str:
+    moment = datetime(day.year, day.month, day.day, tzinfo=KST) + timedelta(seconds=rng.randrange(86400))
+    moment = min(moment, NOW_KST)
+    style = rng.randrange(3)
+    if style == 0:
+        return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + f"{rng.randrange(1000):03d}Z"
+    if style == 1:
+        return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return moment.isoformat(timespec="seconds")
+
+
+def _relative_label(rng: random.Random, units: Sequence[str]) -> str:
+    unit = rng.choice(units)
+    amount = {
+        "분": rng.randint(1, 59),
+        "시간": rng.randint(1, 14),
+        "일": rng.randint(1, 6),
+        "주": rng.randint(1, 4),
+        "주일": rng.randint(1, 4),
+        "개월": rng.randint(1, 11),
+    }[unit]
+    return f"{amount}{unit} 전"
+
+
+def _blog_label(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.35:
+        return _relative_label(rng, ("분", "시간", "일", "주"))
+    day = _recent_day(rng)
+    if roll < 0.6:
+        return f"{day.year}.{day.month:02d}.{day.day:02d}."
+    if roll < 0.7:
+        return f"{day.year % 100}.{day.month}.{day.day}."
+    if roll < 0.85:
+        return f"{day.year % 100}.{day.month}.{day.day}.{WEEKDAYS_KO[day.weekday()]}"
+    return _iso_label(rng, day)
+
+
+def build_corpus(pages: int, seed: int = 7) -> Dict[str, List[str]]:
+    """묶음별 문자열 (pages × PAGE_SIZE개씩)"""
+    rng = random.Random(seed)
+    count = pages * PAGE_SIZE
+    
+    visited = [_visited_label(_recent_day(rng)) for _ in range(count)]
+    
+    review_ids = []
+    for _ in range(count):
+        day = _recent_day(rng)
+        moment = datetime(day.year, day.month, day.day, tzinfo=KST) + timedelta(seconds=rng.randrange(86400))
+        timestamp = int(min(moment, NOW_KST).timestamp())
+        review_ids.append(f"{timestamp:08x}{rng.getrandbits(64):016x}")
+    
+    created = []
+    for _ in range(count):
+        roll = rng.random()
+        day = _recent_day(rng)
+        if roll < 0.7:
+            created.append(_iso_label(rng, day))
+        elif roll < 0.85:
+            created.append(f"{day.month}.{day.day}.{rng.choice(WEEKDAYS_KO + ['전'])}")
+        else:
+            created.append(_relative_label(rng, ("분", "시간", "일")))
+    
+    announcements = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            announcements.append(_relative_label(rng, ("일", "주일", "개월")))
+        else:
+            day = _recent_day(rng)
+            announcements.append(f"{day.year}.{day.month:02d}.{day.day:02d}")
+    
+    return {
+        "visited": visited,
+        "review_id": review_ids,
+        "created": created,
+        "announcement": announcements,
+        "blog": [_blog_label(rng) for _ in range(count)],
+    }
+
+
+# ==================== 비교 ====================
+
+def _day_key(value: Any, legacy: Any) -> Any:
+    """비교 키: 문자열은 그대로, datetime은 (날짜, aware 여부) - aware끼리는 기존 결과 시간대로 변환"""
+    if value is None or value == datetime.min:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(legacy, datetime) and legacy.tzinfo is not None and value.tzinfo is not None:
+        value = value.astimezone(legacy.tzinfo)
+    return (value.date(), value.tzinfo is not None)
+
+
+def build_cases() -> List[Dict[str, Any]]:
+    """(이름, 묶음, 기존 파서, 새 파서 일괄 API, 의도한 수정을 반영한 기존 결과)"""
+    from app.services.naver_dates import KST as DATES_KST, object_id_date_str, parse_date, parse_dates, visit_date_strs
+    
+    return [
+        {
+            "name": "parse_naver_date",
+            "corpus": "visited",
+            "legacy": lambda text: legacy_parse_naver_date(text, NOW_KST),
+            "batch": lambda texts: visit_date_strs([{"visited": text} for text in texts], reference=NOW_KST),
+        },
+        {
+            "name": "extract_date_from_id",
+            "corpus": "review_id",
+            "legacy": lambda text: legacy_extract_date_from_id(text, NOW_KST),
+            "batch": lambda texts: [object_id_date_str(text) for text in texts],
+        },
+        {
+            "name": "visitor_review_date",
+            "corpus": "created",
+            "legacy": lambda text: legacy_parse_visitor_review_date(text, NOW_UTC),
+            "batch": lambda texts: parse_dates(texts, tz=timezone.utc, reference=NOW_UTC),
+        },
+        {
+            "name": "announcement_date",
+            "corpus": "announcement",
+            "legacy": lambda text: legacy_parse_announcement_date(text, NOW_NAIVE),
+            "batch": lambda texts: [parse_date(text, tz=None, reference=NOW_NAIVE) or datetime.min for text in texts],
+        },
+        {
+            "name": "competitor_blog_date",
+            "corpus": "blog",
+            "legacy": lambda text: legacy_parse_competitor_blog_date(text, NOW_NAIVE),
+            "batch": lambda texts: parse_dates(texts, tz=None, reference=NOW_NAIVE),
+        },
+        {
+            "name": "naver_search_date",
+            "corpus": "blog",
+            "legacy": lambda text: legacy_parse_naver_search_date(text, NOW_KST),
+            "batch": lambda texts: parse_dates(texts, tz=DATES_KST, reference=NOW_KST),
+        },
+        {
+            "name": "blog_review_date_text",
+            "corpus": "blog",
+            "legacy": lambda text: legacy_parse_blog_review_date_from_text(text, NOW_NAIVE),
+            "batch": lambda texts: parse_dates(texts, tz=None, reference=NOW_NAIVE),
+            "corrected": _kst_wall_clock,
+        },
+    ]
+
+
+def compare(case: Dict[str, Any], texts: List[str]) -> Dict[str, Any]:
+    legacy_results = [case["legacy"](text) for text in texts]
+    new_results = case["batch"](texts)
+    corrected = case.get("corrected")
+    counts = {"agree": 0, "fixed": 0, "differ": 0}
+    examples: Dict[str, Dict[str, str]] = {"fixed": {}, "differ": {}}
+    for text, legacy, new in zip(texts, legacy_results, new_results):
+        legacy_key = _day_key(legacy, legacy)
+        new_key = _day_key(new, legacy)
+        if legacy_key == new_key:
+            counts["agree"] += 1
+            continue
+        fixed = legacy_key is None or (corrected and _day_key(corrected(text, legacy), legacy) == new_key)
+        outcome = "fixed" if fixed else "differ"
+        counts[outcome] += 1
+        if len(examples[outcome]) < 5:
+            examples[outcome][text] = f"{legacy} → {new}"
+    return {**counts, "examples": examples}
+
+
+def _time_pages(func: Callable[[List[str]], Any], texts: List[str], iterations: int, before: Optional[Callable[[], Any]] = None) -> float:
+    """전체 문자열을 페이지 단위로 파싱하는 1회 평균 (ms)"""
+    pages = [texts[start:start + PAGE_SIZE] for start in range(0, len(texts), PAGE_SIZE)]
+    elapsed = 0.0
+    for _ in range(iterations):
+        if before:
+            before()
+        started = time.perf_counter()
+        for page in pages:
+            func(page)
+        elapsed += time.perf_counter() - started
+    return elapsed / iterations * 1000
+
+
+def measure(corpus: Dict[str, List[str]], iterations: int) -> List[Dict[str, Any]]:
+    from app.services import naver_dates
+    
+    results = []
+    for case in build_cases():
+        texts = corpus[case["corpus"]]
+        legacy = case["legacy"]
+        comparison = compare(case, texts)
+        
+        legacy_ms = _time_pages(lambda page: [legacy(text) for text in page], texts, iterations)
+        cold_ms = _time_pages(case["batch"], texts, iterations, before=naver_dates._interpret.cache_clear)
+        case["batch"](texts)
+        warm_ms = _time_pages(case["batch"], texts, iterations)
+        
+        results.append({
+            "case": case["name"],
+            "corpus": case["corpus"],
+            "strings": len(texts),
+            "unique": len(set(texts)),
+            "legacy_ms": round(legacy_ms, 2),
+            "cold_ms": round(cold_ms, 2),
+            "warm_ms": round(warm_ms, 2),
+            **comparison,
+        })
+    return results
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = (
+        f"{'case':<24}{'strings':>8}{'unique':>8}{'legacy ms':>11}{'cold ms':>9}{'warm ms':>9}"
+        f"{'agree':>7}{'fixed':>7}{'differ':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['case']:<24}{result['strings']:>8}{result['unique']:>8}"
+            f"{result['legacy_ms']:>11.2f}{result['cold_ms']:>9.2f}{result['warm_ms']:>9.2f}"
+            f"{result['agree']:>7}{result['fixed']:>7}{result['differ']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.date_parsing", description="날짜 문자열 파싱 벤치마크")
+    parser.add_argument("--pages", type=int, default=60, help=f"묶음별 페이지 수 (페이지당 {PAGE_SIZE}개)")
+    parser.add_argument("--iterations", type=int, default=10, help="묶음별 반복 횟수")
+    parser.add_argument("--seed", type=int, default=7, help="문자열 생성 시드")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    
+    logging.disable(logging.CRITICAL)
+    corpus = build_corpus(args.pages, args.seed)
+    results = measure(corpus, args.iterations)
+    
+    print(f"reference={NOW_KST.isoformat()}  pages={args.pages}  iterations={args.iterations}")
+    print(format_table(results))
+    
+    for result in results:
+        for outcome in ("fixed", "differ"):
+            if result["examples"][outcome]:
+                mark = "✗" if outcome == "differ" else "+"
+                print(f"\n{mark} {result['case']} {outcome} 예시 (legacy → new):")
+                for text, change in result["examples"][outcome].items():
+                    print(f"    {text!r}: {change}")
+    
+    if args.output:
+        save_report({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "options": vars(args),
+            "results": results,
+        }, args.output)
+        print(f"\n결과 저장: {args.output}")
+    return 1 if any(result["differ"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
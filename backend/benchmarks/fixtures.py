@@ -0,0 +1,289 @@
+"""
+스탠드인 응답 생성 (저장소에 기록된 네이버 응답 fixture 재생)
+
+- backend/search_api_response_*.json: GraphQL 검색(getPlacesList 등) 결과 목록
+- backend/anana_graphql_response.json: 벤치마크 대상 매장 (순위 검색의 타겟 / 상세 조회 응답)
+- backend/debug_place_*.html: m.place.naver.com 플레이스 HTML
+- 방문자 리뷰는 fixture가 없으므로 날짜가 하루 단위로 과거로 내려가는 리뷰를 결정적으로 생성
+"""
+import glob
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# GraphQL operationName → 응답 키
+SEARCH_RESPONSE_KEYS = {
+    "getRestaurantList": "restaurantList",
+    "getHospitals": "hospitals",
+    "getPlacesList": "places",
+}
+
+WEEKDAYS_KO = ["월", "화", "수", "목", "금", "토", "일"]
+
+_OPERATION_PATTERN = re.compile(r"query\s+(\w+)")
+_ITEMS_SELECTION_PATTERN = re.compile(r"items\s*\{([^{}]*)\}")
+
+
+@dataclass
+class StandInData:
+    """스탠드인 데이터 설정"""
+    search_total: int = 300     # 검색 결과 전체 업체 수
+    target_rank: int = 150      # 타겟 매장(anana) 순위
+    review_total: int = 1000    # 매장당 방문자 리뷰 수
+    reviews_per_day: int = 8    # 하루 리뷰 수 (기간 조회 페이지 수 결정)
+    trackers: int = 60          # 스케줄러 벤치마크용 tracker / keyword 수
+    keyword_groups: int = 12    # tracker가 공유하는 검색(키워드) 수
+
+
+def _load_json(filename: str) -> Any:
+    with open(os.path.join(BACKEND_DIR, filename), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=1)
+def load_target_place() -> Dict[str, Any]:
+    """anana_graphql_response.json → GraphQL 검색 항목 형식"""
+    place = _load_json("anana_graphql_response.json")
+    return {
+        "id": place["place_id"],
+        "name": place["name"],
+        "category": place["category"],
+        "address": place["address"],
+        "roadAddress": place["roadAddress"],
+        "x": "127.0557",
+        "y": "37.5447",
+        "imageUrl": "",
+        "blogCafeReviewCount": str(place.get("blog_review_count") or 0),
+        "visitorReviewCount": str(place.get("visitor_review_count") or 0),
+        "visitorReviewScore": place.get("visitorReviewScore"),
+        "bookingReviewCount": "0",
+        "imageCount": 0,
+    }
+
+
+@lru_cache(maxsize=1)
+def load_search_items() -> List[Dict[str, Any]]:
+    """search_api_response_*.json의 검색 항목 (중복 id 제거)"""
+    items: List[Dict[str, Any]] = []
+    seen = set()
+    for path in sorted(glob.glob(os.path.join(BACKEND_DIR, "search_api_response_*.json"))):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for item in data.get("data", {}).get("places", {}).get("items", []):
+            if item.get("id") in seen:
+                continue
+            seen.add(item.get("id"))
+            items.append(item)
+    return items
+
+
+@lru_cache(maxsize=1)
+def load_place_html() -> bytes:
+    """debug_place_*.html (m.place.naver.com 플레이스 페이지)"""
+    paths = sorted(glob.glob(os.path.join(BACKEND_DIR, "debug_place_*.html")))
+    if not paths:
+        return b"<html><body></body></html>"
+    with open(paths[0], "rb") as f:
+        return f.read()
+
+
+def graphql_operation_name(operation: Dict[str, Any]) -> str:
+    """operationName이 없는 요청(getVisitorReviews 등)은 쿼리 본문에서 추출"""
+    name = operation.get("operationName")
+    if name:
+        return name
+    match = _OPERATION_PATTERN.search(operation.get("query") or "")
+    return match.group(1) if match else "unknown"
+
+
+def selected_item_fields(operation: Dict[str, Any]) -> Optional[List[str]]:
+    """검색 쿼리의 items { ... } 선택 필드 (실제 GraphQL처럼 요청한 필드만 응답, 없으면 None)"""
+    match = _ITEMS_SELECTION_PATTERN.search(operation.get("query") or "")
+    return match.group(1).split() if match else None
+
+
+def project_items(items: List[Dict[str, Any]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    if not fields:
+        return items
+    return [{field: item.get(field) for field in fields} for item in items]
+
+
+class StandInResponder:
+    """GraphQL / HTML / PostgREST 스탠드인 응답 생성기"""
+    
+    def __init__(self, data: Optional[StandInData] = None):
+        self.data = data or StandInData()
+        self.target = load_target_place()
+        self.search_items = load_search_items()
+    
+    # ============================================
+    # GraphQL (api.place.naver.com / pcmap-api.place.naver.com)
+    # ============================================
+    
+    def graphql(self, body: Any) -> Any:
+        if isinstance(body, list):
+            return [self._graphql_operation(operation) for operation in body]
+        return self._graphql_operation(body or {})
+    
+    def _graphql_operation(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        name = graphql_operation_name(operation)
+        variables = operation.get("variables") or {}
+        graphql_input = variables.get("input") or {}
+        
+        if name in SEARCH_RESPONSE_KEYS:
+            key = SEARCH_RESPONSE_KEYS[name]
+            fields = selected_item_fields(operation)
+            if graphql_input.get("businessId"):
+                item = dict(self.target, id=str(graphql_input["businessId"]))
+                return {"data": {key: {"total": 1, "items": project_items([item], fields)}}}
+            start = int(graphql_input.get("start") or 1)
+            display = int(graphql_input.get("display") or 50)
+            return {"data": {key: {
+                "total": self.data.search_total,
+                "items": project_items(self.search_page(start, display), fields),
+            }}}
+        
+        if name == "getVisitorReviews":
+            return {"data": {"visitorReviews": self.visitor_reviews(
+                str(graphql_input.get("businessId") or self.target["id"]),
+                int(graphql_input.get("size") or 20),
+                graphql_input.get("after"),
+            )}}
+        
+        if name == "getFsasReviews":
+            return {"data": {"fsasReviews": {"total": 0, "items": []}}}
+        
+        return {"data": {}}
+    
+    def search_item(self, position: int) -> Dict[str, Any]:
+        """검색 결과 position(1부터)의 항목 (fixture 순환 + 타겟 매장 삽입)"""
+        if position == self.data.target_rank:
+            return self.target
+        base = self.search_items[(position - 1) % len(self.search_items)]
+        if position <= len(self.search_items):
+            return base
+        return dict(base, id=str(9000000000 + position))
+    
+    def search_page(self, start: int, display: int) -> List[Dict[str, Any]]:
+        end = min(self.data.search_total, start + display - 1)
+        return [self.search_item(position) for position in range(start, end + 1)]
+    
+    def visitor_reviews(self, place_id: str, size: int, after: Optional[str]) -> Dict[str, Any]:
+        """최신순 방문자 리뷰 (cursor = 리뷰 순번)"""
+        offset = int(after) + 1 if after and str(after).isdigit() else 0
+        today = date.today()
+        items = []
+        for index in range(offset, min(self.data.review_total, offset + size)):
+            visited = today - timedelta(days=index // max(1, self.data.reviews_per_day))
+            label = f"{visited.month}.{visited.day}.{WEEKDAYS_KO[visited.weekday()]}"
+            if visited.year != today.year:
+                label = f"{visited.year % 100}.{label}"
+            items.append({
+                "id": f"{place_id}-{index:06d}",
+                "cursor": str(index),
+                "reviewId": f"{place_id}-{index:06d}",
+                "rating": 5,
+                "author": {"id": f"user{index % 97}", "nickname": f"리뷰어{index % 97}", "imageUrl": ""},
+                "body": "분위기가 좋고 사진이 잘 나왔어요. 다음에 또 방문할게요!",
+                "thumbnail": None,
+                "media": [],
+                "tags": [],
+                "status": "",
+                "visited": label,
+                "created": label,
+                "reply": None,
+                "businessName": self.target["name"],
+            })
+        return {"total": self.data.review_total, "items": items}
+    
+    # ============================================
+    # HTML (m.place.naver.com / m.map.naver.com / search.naver.com)
+    # ============================================
+    
+    def html(self, host: str, path: str) -> Optional[bytes]:
+        if host in ("m.place.naver.com", "pcmap.place.naver.com", "m.map.naver.com"):
+            return load_place_html()
+        if host.endswith("naver.com"):
+            return b"<html><body></body></html>"
+        return None
+    
+    # ============================================
+    # PostgREST (Supabase) - 스케줄러 작업용
+    # ============================================
+    
+    def _store(self, index: int) -> Dict[str, Any]:
+        item = self.search_item(index % self.data.search_total + 1)
+        return {
+            "store_name": item["name"],
+            "place_id": item["id"],
+            "platform": "naver",
+            "place_x": "127.0557",
+            "place_y": "37.5447",
+            "category": item.get("category"),
+        }
+    
+    def _keyword(self, index: int) -> str:
+        return f"벤치마크 키워드 {index % max(1, self.data.keyword_groups)}"
+    
+    def due_metric_trackers(self) -> List[Dict[str, Any]]:
+        """get_due_metric_trackers RPC 응답 형식의 tracker 목록"""
+        trackers = []
+        for index in range(self.data.trackers):
+            trackers.append({
+                "id": f"00000000-0000-4000-8000-{index:012d}",
+                "user_id": "00000000-0000-4000-8000-000000000000",
+                "store_id": f"00000000-0000-4000-9000-{index:012d}",
+                "keyword_id": f"00000000-0000-4000-a000-{index:012d}",
+                "update_frequency": "daily_once",
+                "update_times": list(range(24)),
+                "notification_enabled": False,
+                "notification_type": None,
+                "notification_consent": False,
+                "notification_phone": None,
+                "notification_email": None,
+                "is_active": True,
+                "last_collected_at": None,
+                "next_collection_at": None,
+                "created_at": None,
+                "updated_at": None,
+                "stores": self._store(index),
+                "keywords": {"keyword": self._keyword(index)},
+            })
+        return trackers
+    
+    def keywords_with_stores(self) -> List[Dict[str, Any]]:
+        """check_all_keywords_rank가 조회하는 keywords + stores 임베드"""
+        return [
+            {
+                "id": f"00000000-0000-4000-a000-{index:012d}",
+                "keyword": self._keyword(index),
+                "store_id": f"00000000-0000-4000-9000-{index:012d}",
+                "current_rank": None,
+                "stores": self._store(index),
+            }
+            for index in range(self.data.trackers)
+        ]
+    
+    def postgrest(self, method: str, path: str, select: str) -> Any:
+        """
+        /rest/v1/... 요청 응답
+        
+        - 스케줄러 작업의 읽기 대상(get_due_metric_trackers, keywords)만 데이터 반환
+        - 나머지 조회는 빈 목록, 쓰기는 빈 representation (저장 왕복 비용만 측정)
+        """
+        parts = [part for part in path.split("/") if part]
+        if "rpc" in parts:
+            function = parts[-1]
+            if function == "get_due_metric_trackers":
+                return self.due_metric_trackers()
+            return []
+        table = parts[-1] if parts else ""
+        if method == "GET" and table == "keywords" and "stores(" in select:
+            return self.keywords_with_stores()
+        return []
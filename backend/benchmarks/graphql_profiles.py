@@ -0,0 +1,132 @@
+"""
+순위 검색 GraphQL 필드 프로필 벤치마크 (rank-only / competitor / full)
+    
+    cd backend
+    python -m benchmarks.graphql_profiles
+    python -m benchmarks.graphql_profiles --results 300 --iterations 50 --output profiles.json
+
+측정 (프로필별, 검색 1회 = 100개씩 페이지 요청):
+- query_bytes: 요청 쿼리 본문 크기 (페이지당)
+- response_bytes / gzip_bytes: 응답 JSON 크기 합계 (스탠드인이 실제 GraphQL처럼 선택 필드만 응답)
+- decode_us: 응답 JSON 파싱 시간 (json.loads, httpx response.json()과 같은 단계)
+- extend_us: SerpResults.extend_items 시간
+- retained_bytes: 검색 결과 1세트(SerpResults) 보관 크기
+"""
+import argparse
+import gzip
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fixtures import SEARCH_RESPONSE_KEYS, StandInData, StandInResponder
+from benchmarks.runner import save_report
+
+PAGE_SIZE = 100
+
+
+def build_pages(responder: StandInResponder, operation_name: str, query: str, total: int) -> List[bytes]:
+    """스탠드인 GraphQL 응답 (페이지별 JSON bytes)"""
+    pages = []
+    for start in range(1, total + 1, PAGE_SIZE):
+        response = responder.graphql({
+            "operationName": operation_name,
+            "variables": {"input": {"query": "성수 사진관", "start": start, "display": min(PAGE_SIZE, total - start + 1)}},
+            "query": query,
+        })
+        pages.append(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+    return pages
+
+
+def _time_per_call(func, iterations: int) -> float:
+    """1회 평균 (µs)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def measure(profile: str, query_type: str, total: int, iterations: int) -> Dict[str, Any]:
+    from app.services.naver_rank_api_unofficial import NaverRankNewAPIService
+    from app.services.serp_results import SerpResults
+    
+    responder = StandInResponder(StandInData(search_total=total))
+    operation_name, query = NaverRankNewAPIService._build_search_query(query_type, profile)
+    response_key = SEARCH_RESPONSE_KEYS[operation_name]
+    pages = build_pages(responder, operation_name, query, total)
+    decoded = [json.loads(page) for page in pages]
+    
+    def decode():
+        return [json.loads(page) for page in pages]
+    
+    def extend():
+        results = SerpResults()
+        for page in decoded:
+            results.extend_items(page["data"][response_key]["items"])
+        return results
+    
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    results = extend()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    
+    return {
+        "profile": profile,
+        "query_type": query_type,
+        "results": total,
+        "query_bytes": len(query.encode("utf-8")),
+        "response_bytes": sum(len(page) for page in pages),
+        "gzip_bytes": sum(len(gzip.compress(page, mtime=0)) for page in pages),
+        "decode_us": round(_time_per_call(decode, iterations), 1),
+        "extend_us": round(_time_per_call(extend, iterations), 1),
+        "retained_bytes": after - before,
+    }
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = (
+        f"{'profile':<12}{'query B':>9}{'resp KB':>10}{'gzip KB':>10}"
+        f"{'decode µs':>11}{'extend µs':>11}{'retained KB':>13}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['profile']:<12}{result['query_bytes']:>9}"
+            f"{result['response_bytes'] / 1024:>10.1f}{result['gzip_bytes'] / 1024:>10.1f}"
+            f"{result['decode_us']:>11.1f}{result['extend_us']:>11.1f}{result['retained_bytes'] / 1024:>13.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from app.services.serp_results import FIELD_PROFILES
+    
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.graphql_profiles", description="순위 검색 필드 프로필 벤치마크")
+    parser.add_argument("--results", type=int, default=300, help="검색 결과 수 (100개씩 페이지 요청)")
+    parser.add_argument("--query-type", choices=("restaurant", "hospital", "place"), default="place")
+    parser.add_argument("--iterations", type=int, default=50, help="프로필별 파싱 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    
+    results = [measure(profile, args.query_type, args.results, args.iterations) for profile in FIELD_PROFILES]
+    
+    print(f"results={args.results}  query_type={args.query_type}  (페이지 {PAGE_SIZE}개씩)")
+    print(format_table(results))
+    
+    if args.output:
+        save_report({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "options": vars(args),
+            "results": results,
+        }, args.output)
+        print(f"\n결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
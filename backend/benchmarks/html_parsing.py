@@ -0,0 +1,390 @@
+"""
+HTML 파싱 백엔드 벤치마크 / 결과 비교 (selectolax / lxml / bs4, 기존 BeautifulSoup 구현 기준)
+    
+    cd backend
+    python -m benchmarks.html_parsing
+    python -m benchmarks.html_parsing --iterations 50 --output html_parsing.json
+
+페이지 (저장소 fixture + 생성 페이지):
+- place_home: debug_place_*.html → NaverHtmlParserService._parse_html_content
+- place_order: place_home + 주문 버튼 ("주문" 텍스트에서 부모 링크 역방향 탐색 경로)
+- place_info: debug_place_*.html → _parse_description_from_info_page
+- blog_search: 생성한 블로그 검색 결과 페이지 (30개, 매장명 일치 / 불일치, 상대 / 절대 날짜)
+  → NaverReviewService._parse_blog_search_page
+- blog_post: blog_main_frame.html (저장소 루트, PostView 본문) → _extract_blog_post_place_ids
+
+측정 (페이지 × 백엔드):
+- ms: 파싱 + 추출 1회 평균
+- equal: 기존 구현(legacy, BeautifulSoup html.parser) 결과와 같은지 (다르면 종료 코드 1)
+- 이벤트 루프 최대 정지 시간: 플레이스 홈 파싱을 루프에서 직접 실행 / run_parser(스레드)로 실행
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import BACKEND_DIR, load_place_html
+from benchmarks.runner import save_report
+
+BLOG_FRAME_PATH = os.path.join(os.path.dirname(BACKEND_DIR), "blog_main_frame.html")
+
+STORE_NAME = "아나나 스튜디오"
+
+# place_order: 플레이스 홈에 추가하는 주문 버튼 (링크 안쪽 span 텍스트 "주문")
+ORDER_BUTTON_HTML = (
+    '<a class="order_btn" href="https://m.place.naver.com/order/bizes/1938980634">'
+    '<div class="btn_inner"><span class="ico"></span><span>주문</span></div></a>'
+)
+
+# 루프 정지 측정 간격 (초)
+TICK_SECONDS = 0.001
+
+
+def load_blog_frame_html() -> str:
+    if not os.path.exists(BLOG_FRAME_PATH):
+        return "<html><body></body></html>"
+    with open(BLOG_FRAME_PATH, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def build_blog_search_html(count: int = 30, script_kb: int = 200) -> str:
+    """네이버 통합 검색 블로그 탭 형태의 결과 페이지 (홀수 번째는 다른 매장 글)"""
+    date_labels = ["3시간 전", "1일 전", "5일 전", "2주 전", "2026.08.14.", "25.12.5."]
+    items = []
+    for index in range(count):
+        blog_id = f"user{index % 7}"
+        url = f"https://blog.naver.com/{blog_id}/2241536{index:05d}"
+        store = STORE_NAME if index % 2 == 0 else "다른 사진관"
+        items.append(
+            f'<li class="bx"><div class="view_wrap">'
+            f'<div class="user_box"><div class="user_info">'
+            f'<a class="name" href="https://blog.naver.com/{blog_id}">{blog_id}</a>'
+            f'<span class="sub">{date_labels[index % len(date_labels)]}</span></div></div>'
+            f'<div class="title_area"><a class="title_link" href="{url}">{store} 방문 후기 #{index} &amp; 촬영</a></div>'
+            f'<div class="dsc_area"><a class="dsc_link" href="{url}">성수동 {store}에서 프로필 사진을 찍었어요. '
+            f'보정도 꼼꼼하게 해주셔서 만족스러웠습니다.</a></div>'
+            f'</div></li>'
+        )
+    padding = "var data = " + json.dumps(["x" * 1000] * script_kb) + ";"
+    return (
+        "<!doctype html><html><head><title>블로그 검색</title>"
+        f"<script>{padding}</script><style>.bx {{ margin: 0 }}</style></head>"
+        f'<body><div id="main_pack"><ul class="lst_view">{"".join(items)}</ul></div></body></html>'
+    )
+
+
+# ============================================
+# 기존 구현 (BeautifulSoup html.parser, 로그 제외)
+# ============================================
+
+def legacy_place_home(html: str) -> Dict[str, Any]:
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, "html.parser")
+    result: Dict[str, Any] = {}
+    
+    elem = soup.find("span", class_="xlx7Q")
+    if elem:
+        result["phone_number"] = elem.get_text(strip=True)
+    elem = soup.find("div", class_="A_cdD")
+    if elem:
+        result["business_status_text"] = elem.get_text(strip=True)
+        result["is_open"] = "영업 중" in result["business_status_text"]
+    elem = soup.find("a", class_="CHmqa")
+    if elem and elem.get("href"):
+        result["homepage"] = elem.get("href")
+    for link in soup.find_all("a", class_="iBUwB"):
+        href = link.get("href", "")
+        text = link.get_text(strip=True)
+        if "블로그" in text and href:
+            result["blog"] = href
+        elif "인스타그램" in text and href:
+            result["instagram"] = href
+    elem = soup.find("div", class_="UFXr9")
+    if elem:
+        result["tv_program"] = elem.get_text(strip=True)
+    elem = soup.find("div", class_="xPvPE")
+    if elem:
+        text = elem.get_text(strip=True)
+        conveniences = [item.strip() for item in text.split(",")]
+        result["conveniences_text"] = text
+        result["conveniences"] = conveniences
+        result["has_reservation"] = any("예약" in c for c in conveniences)
+        result["group_seating"] = any("단체" in c for c in conveniences)
+        result["has_takeout"] = any("포장" in c for c in conveniences)
+        result["has_wifi"] = any("무선 인터넷" in c or "와이파이" in c for c in conveniences)
+        result["has_delivery"] = any("배달" in c for c in conveniences)
+    elem = soup.find("div", class_="AX_W3")
+    if elem:
+        result["description"] = elem.get_text(strip=True)
+    result["is_place_plus"] = soup.find("span", class_="jpqsT") is not None
+    
+    result["is_new_business"] = False
+    badges = soup.find("div", class_="dAsGb")
+    if badges:
+        for span in badges.find_all("span", class_="PXMot"):
+            text = span.get_text(strip=True)
+            if "새로오픈" in text or "새로 오픈" in text:
+                result["is_new_business"] = True
+                break
+    
+    all_links = soup.find_all("a", href=True)
+    result["has_naver_talk"] = any("talk.naver.com" in link.get("href", "") for link in all_links)
+    
+    has_order = any(
+        "booking.naver.com/order" in link.get("href", "") or "order.store.naver.com" in link.get("href", "")
+        for link in all_links
+    )
+    if not has_order:
+        for text_elem in soup.find_all(["span", "button"], string=re.compile(r"^주문$")):
+            parent = text_elem.parent
+            for _ in range(5):
+                if not parent:
+                    break
+                href = parent.get("href", "") if parent.name == "a" else ""
+                if href and "naver.com" in href and ("/order" in href or "order.store" in href or "order/bizes" in href):
+                    has_order = True
+                    break
+                parent = parent.parent
+            if has_order:
+                break
+    if not has_order:
+        has_order = any(
+            "smartstore.naver.com" in link.get("href", "")
+            and any(keyword in link.get_text(strip=True) for keyword in ["주문", "구매", "장바구니"])
+            for link in all_links
+        )
+    result["has_naver_order"] = has_order
+    return result
+
+
+def legacy_place_info(html: str) -> Optional[str]:
+    from bs4 import BeautifulSoup
+    
+    elem = BeautifulSoup(html, "html.parser").find("div", class_="AX_W3")
+    return elem.get_text(strip=True) if elem else None
+
+
+def legacy_blog_post_place_ids(html: str) -> List[str]:
+    from bs4 import BeautifulSoup
+    from app.services.naver_review_service import _PLACE_IFRAME_ID_PATTERN, _PLACE_LINK_PATTERN
+    
+    soup = BeautifulSoup(html, "html.parser")
+    found = []
+    for link in soup.find_all("a", attrs={"data-linkdata": True}):
+        try:
+            place_id = str(json.loads(link["data-linkdata"].replace("&quot;", '"')).get("placeId", "") or "")
+            if place_id:
+                found.append(place_id)
+        except (json.JSONDecodeError, KeyError, AttributeError):
+            continue
+    for iframe in soup.find_all("iframe", src=re.compile(r"place\.naver\.com")):
+        found.extend(_PLACE_IFRAME_ID_PATTERN.findall(iframe.get("src", "")))
+    for link in soup.find_all("a", href=_PLACE_LINK_PATTERN):
+        found.extend(_PLACE_LINK_PATTERN.findall(link.get("href", "")))
+    return list(dict.fromkeys(found))
+
+
+# ============================================
+# 측정
+# ============================================
+
+def _normalize_blog_page(page: Dict[str, Any]) -> Dict[str, Any]:
+    """상대 날짜("N일 전")는 호출 시각 기준이라 날짜(일) 단위로 비교"""
+    oldest = page["oldest_date"]
+    return {
+        "link_count": page["link_count"],
+        "oldest_date": oldest.date().isoformat() if oldest else None,
+        "checked_dates": page["checked_dates"],
+        "reviews": [
+            {**review, "date": review["date"][:10] if review["date"] else None}
+            for review in page["reviews"]
+        ],
+    }
+
+
+def run_with_backend(backend: str, func: Callable[..., Any], *args: Any) -> Any:
+    """백엔드를 고정하고 서비스 파싱 함수 실행 (parse_html은 html_parsing.backend_name()으로 기본 백엔드 결정)"""
+    from app.core import html_parsing
+    
+    default = html_parsing.backend_name
+    html_parsing.backend_name = lambda: backend
+    try:
+        return func(*args)
+    finally:
+        html_parsing.backend_name = default
+
+
+def build_cases() -> Dict[str, Dict[str, Any]]:
+    """페이지별 {html, run(backend), legacy()} (backend=None은 기존 구현)"""
+    from app.services.naver_html_parser_service import NaverHtmlParserService
+    from app.services.naver_review_service import NaverReviewService
+    
+    parser_service = NaverHtmlParserService()
+    review_service = NaverReviewService()
+    place_html = load_place_html().decode("utf-8", errors="replace")
+    # "주문" 버튼 역방향 탐색 경로 (fixture에는 주문 링크가 없음)
+    place_order_html = place_html.replace("</body>", ORDER_BUTTON_HTML + "</body>", 1)
+    blog_search_html = build_blog_search_html()
+    blog_frame_html = load_blog_frame_html()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=60)
+    
+    return {
+        "place_home": {
+            "bytes": len(place_html.encode("utf-8")),
+            "run": lambda backend: run_with_backend(backend, parser_service._parse_html_content, place_html),
+            "legacy": lambda: legacy_place_home(place_html),
+        },
+        "place_order": {
+            "bytes": len(place_order_html.encode("utf-8")),
+            "run": lambda backend: run_with_backend(backend, parser_service._parse_html_content, place_order_html),
+            "legacy": lambda: legacy_place_home(place_order_html),
+        },
+        "place_info": {
+            "bytes": len(place_html.encode("utf-8")),
+            "run": lambda backend: run_with_backend(backend, parser_service._parse_description_from_info_page, place_html),
+            "legacy": lambda: legacy_place_info(place_html),
+        },
+        "blog_search": {
+            "bytes": len(blog_search_html.encode("utf-8")),
+            "run": lambda backend: _normalize_blog_page(
+                run_with_backend(backend, review_service._parse_blog_search_page, blog_search_html, STORE_NAME, cutoff)
+            ),
+            # 기존 구현과 같은 BeautifulSoup(html.parser) 호출 순서 (find_all / get_text)를 그대로 쓰는 bs4 백엔드 기준
+            "legacy": lambda: _normalize_blog_page(
+                run_with_backend("bs4", review_service._parse_blog_search_page, blog_search_html, STORE_NAME, cutoff)
+            ),
+        },
+        "blog_post": {
+            "bytes": len(blog_frame_html.encode("utf-8")),
+            "run": lambda backend: run_with_backend(backend, review_service._extract_blog_post_place_ids, blog_frame_html),
+            "legacy": lambda: legacy_blog_post_place_ids(blog_frame_html),
+        },
+    }
+
+
+def _time_per_call(func: Callable[[], Any], iterations: int) -> float:
+    """1회 평균 (ms)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+async def _max_loop_stall(work: Callable[[], Any], offload: bool, repeat: int) -> float:
+    """work를 repeat번 실행하는 동안 이벤트 루프가 멈춘 최대 시간 (ms)"""
+    from app.core.html_parsing import run_parser
+    
+    stall = 0.0
+    done = asyncio.Event()
+    
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(TICK_SECONDS)
+            now = time.perf_counter()
+            stall = max(stall, (now - last - TICK_SECONDS) * 1000)
+            last = now
+    
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SECONDS * 5)
+    for _ in range(repeat):
+        if offload:
+            await run_parser(work)
+        else:
+            work()
+        await asyncio.sleep(0)
+    done.set()
+    await task
+    return round(stall, 1)
+
+
+def measure(cases: Dict[str, Dict[str, Any]], backends: List[str], iterations: int) -> List[Dict[str, Any]]:
+    results = []
+    for name, case in cases.items():
+        expected = case["legacy"]()
+        legacy_ms = _time_per_call(case["legacy"], iterations)
+        results.append({"page": name, "backend": "legacy", "bytes": case["bytes"], "ms": round(legacy_ms, 2), "speedup": 1.0, "equal": True})
+        for backend in backends:
+            run = lambda backend=backend: case["run"](backend)
+            actual = run()
+            ms = _time_per_call(run, iterations)
+            results.append({
+                "page": name,
+                "backend": backend,
+                "bytes": case["bytes"],
+                "ms": round(ms, 2),
+                "speedup": round(legacy_ms / ms, 2) if ms else None,
+                "equal": actual == expected,
+                "mismatch": None if actual == expected else {"expected": expected, "actual": actual},
+            })
+    return results
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = f"{'page':<14}{'backend':<12}{'KB':>8}{'ms':>10}{'speedup':>10}{'equal':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['page']:<14}{result['backend']:<12}{result['bytes'] / 1024:>8.1f}"
+            f"{result['ms']:>10.2f}{result['speedup'] or 0:>9.2f}x{str(result['equal']):>8}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.html_parsing", description="HTML 파싱 백엔드 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="페이지 / 백엔드별 반복 횟수")
+    parser.add_argument("--backend", action="append", help="비교할 백엔드 (기본: 설치된 전체)")
+    parser.add_argument("--stall-repeat", type=int, default=10, help="루프 정지 측정 시 플레이스 홈 파싱 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    
+    from app.core import html_parsing
+    
+    logging.disable(logging.CRITICAL)
+    backends = args.backend or html_parsing.available_backends()
+    cases = build_cases()
+    results = measure(cases, backends, args.iterations)
+    
+    place_home = cases["place_home"]["run"]
+    default_backend = html_parsing.backend_name()
+    stall = {
+        "backend": default_backend,
+        "inline_ms": asyncio.run(_max_loop_stall(lambda: place_home(default_backend), False, args.stall_repeat)),
+        "run_parser_ms": asyncio.run(_max_loop_stall(lambda: place_home(default_backend), True, args.stall_repeat)),
+    }
+    
+    print(f"backends={','.join(backends)}  default={default_backend}  iterations={args.iterations}")
+    print(format_table(results))
+    print(
+        f"\n이벤트 루프 최대 정지 (place_home × {args.stall_repeat}, {default_backend}): "
+        f"루프에서 직접 {stall['inline_ms']} ms / run_parser {stall['run_parser_ms']} ms"
+    )
+    
+    mismatches = [result for result in results if not result["equal"]]
+    for result in mismatches:
+        print(f"\n✗ {result['page']} / {result['backend']} 결과 불일치:")
+        print(json.dumps(result["mismatch"], ensure_ascii=False, default=str, indent=2)[:2000])
+    
+    if args.output:
+        save_report({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "options": vars(args),
+            "results": results,
+            "loop_stall": stall,
+        }, args.output)
+        print(f"\n결과 저장: {args.output}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
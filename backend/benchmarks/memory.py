@@ -0,0 +1,207 @@
+"""
+검색 결과(SERP) 메모리 벤치마크
+    
+    cd backend
+    python -m benchmarks.memory                          # columnar / dicts 비교 (모드별 별도 프로세스)
+    python -m benchmarks.memory --trackers 240 --groups 60
+    python -m benchmarks.memory --mode columnar --json   # 한 모드만 (결과 JSON 1줄)
+
+측정:
+- retained: 300개 검색 결과 1세트를 보관하는 데 드는 메모리 (tracemalloc, GraphQL 응답 항목은 양쪽 모두 보관)
+  columnar = SerpResults / dicts = 기존 매장별 dict 리스트 (SerpResults.to_dicts)
+- collection: 스탠드인 네이버 / Supabase에 대해 collect_all_metrics(배치 지표 수집)를 1회 실행하는 동안의
+  최대 RSS (/proc/self/statm 샘플링, 없으면 ru_maxrss)와 tracemalloc 최대치
+  dicts 모드는 순위 결과의 search_results를 dict 리스트로 바꿔 보관해 변경 전 보관 형태를 재현
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fixtures import StandInData, StandInResponder
+from benchmarks.stand_in import FaultConfig, StandInApp, StandInServer, route_naver_to
+
+MODES = ("columnar", "dicts")
+
+# RSS 샘플링 간격 (초)
+RSS_SAMPLE_SECONDS = 0.01
+
+
+def current_rss_bytes() -> Optional[int]:
+    """현재 RSS (Linux /proc, 없으면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def max_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def measure_retained(mode: str, responder: StandInResponder, total: int) -> int:
+    """검색 결과 1세트 보관 크기 (byte)"""
+    from app.services.serp_results import SerpResults
+    
+    items = [responder.search_item(position) for position in range(1, total + 1)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    results = SerpResults.from_items(items)
+    if mode == "dicts":
+        results = results.to_dicts()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return after - before
+
+
+def keep_dict_results():
+    """dicts 모드: 순위 결과의 search_results를 dict 리스트로 보관 (같은 검색을 공유하는 결과는 같은 리스트)"""
+    from app.services.naver_rank_api_unofficial import NaverRankNewAPIService
+    
+    original = NaverRankNewAPIService._build_rank_result
+    converted: Dict[int, list] = {}
+    
+    async def build_rank_result(self, search_results, *args, **kwargs):
+        result = await original(self, search_results, *args, **kwargs)
+        key = id(search_results)
+        if key not in converted:
+            converted.clear()
+            converted[key] = search_results.to_dicts()
+        result["search_results"] = converted[key]
+        return result
+    
+    NaverRankNewAPIService._build_rank_result = build_rank_result
+
+
+async def run_collection(trace: bool) -> Dict[str, Any]:
+    """collect_all_metrics 1회 + 실행 중 최대 RSS"""
+    from app.core import scheduler
+    
+    peak_rss = current_rss_bytes() or 0
+    done = asyncio.Event()
+    
+    async def sample():
+        nonlocal peak_rss
+        while not done.is_set():
+            peak_rss = max(peak_rss, current_rss_bytes() or 0)
+            await asyncio.sleep(RSS_SAMPLE_SECONDS)
+    
+    if trace:
+        tracemalloc.start()
+    sampler = asyncio.create_task(sample())
+    started = time.perf_counter()
+    try:
+        await scheduler.collect_all_metrics()
+    finally:
+        elapsed = time.perf_counter() - started
+        done.set()
+        await sampler
+    traced_peak = None
+    if trace:
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 2),
+        "peak_rss_bytes": peak_rss or max_rss_bytes(),
+        "traced_peak_bytes": traced_peak,
+    }
+
+
+def run_mode(args: argparse.Namespace) -> Dict[str, Any]:
+    from benchmarks.__main__ import configure_environment
+    
+    data = StandInData(trackers=args.trackers, keyword_groups=args.groups)
+    responder = StandInResponder(data)
+    app = StandInApp(responder, FaultConfig(latency_ms=args.latency_ms, jitter_ms=0.0, seed=42))
+    
+    with StandInServer(app) as server:
+        configure_environment(server.base_url)
+        logging.disable(logging.CRITICAL)
+        retained = measure_retained(args.mode, responder, data.search_total)
+        if args.mode == "dicts":
+            keep_dict_results()
+        with route_naver_to(server.base_url), contextlib.redirect_stdout(io.StringIO()):
+            start_rss = current_rss_bytes() or max_rss_bytes()
+            collection = asyncio.run(run_collection(trace=args.trace))
+    
+    return {
+        "mode": args.mode,
+        "trackers": args.trackers,
+        "groups": args.groups,
+        "retained_bytes_per_serp": retained,
+        "start_rss_bytes": start_rss,
+        **collection,
+    }
+
+
+def _mb(value: Optional[int]) -> str:
+    return f"{value / (1024 * 1024):.1f}" if value else "-"
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = f"{'mode':<10}{'KB/SERP':>9}{'start MB':>10}{'peak MB':>9}{'Δ MB':>8}{'traced MB':>11}{'sec':>7}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        delta = (result["peak_rss_bytes"] or 0) - (result["start_rss_bytes"] or 0)
+        lines.append(
+            f"{result['mode']:<10}{result['retained_bytes_per_serp'] / 1024:>9.1f}"
+            f"{_mb(result['start_rss_bytes']):>10}{_mb(result['peak_rss_bytes']):>9}{_mb(delta):>8}"
+            f"{_mb(result['traced_peak_bytes']):>11}{result['seconds']:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description="검색 결과 메모리 벤치마크")
+    parser.add_argument("--mode", choices=MODES, help="한 모드만 실행 (기본: 모드별 별도 프로세스로 비교)")
+    parser.add_argument("--trackers", type=int, default=240, help="수집 대상 tracker 수")
+    parser.add_argument("--groups", type=int, default=60, help="tracker가 공유하는 검색(키워드) 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="스탠드인 응답 지연")
+    parser.add_argument("--trace", action="store_true", help="tracemalloc 최대치도 측정 (느려짐)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 1줄로 출력")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    
+    if args.mode:
+        result = run_mode(args)
+        print(json.dumps(result) if args.json else format_table([result]))
+        return 0
+    
+    # RSS는 프로세스 단위라서 모드별로 새 프로세스에서 측정
+    results = []
+    for mode in MODES:
+        command = [
+            sys.executable, "-m", "benchmarks.memory", "--mode", mode, "--json",
+            "--trackers", str(args.trackers), "--groups", str(args.groups),
+            "--latency-ms", str(args.latency_ms),
+        ] + (["--trace"] if args.trace else [])
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    
+    print(f"trackers={args.trackers}  groups={args.groups}  (search_results 300개 / 검색)")
+    print(format_table(results))
+    
+    if args.output:
+        from benchmarks.runner import save_report
+        save_report({"options": vars(args), "results": results}, args.output)
+        print(f"\n결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
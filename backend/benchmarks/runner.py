@@ -0,0 +1,175 @@
+"""
+벤치마크 실행 / 결과 집계 / 이전 결과와 비교
+"""
+import asyncio
+import json
+import math
+import platform
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# 이전 결과 대비 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 0.10
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """선형 보간 백분위수 (sorted_values는 오름차순)"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 1종의 결과 (시간 단위: ms)"""
+    name: str
+    iterations: int
+    concurrency: int
+    errors: int
+    duration_s: float
+    throughput_per_s: float
+    units_per_s: float
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    min_ms: float
+    max_ms: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+async def run_benchmark(
+    name: str,
+    func: Callable[[int], Awaitable[Optional[int]]],
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """
+    func(i)를 iterations회 실행 (동시 concurrency개)
+    
+    func의 반환값은 처리 단위 수(리뷰 수, tracker 수 등)로 units_per_s 계산에 사용
+    예외는 오류로 집계하고 계속 진행
+    """
+    for index in range(warmup):
+        try:
+            await func(-1 - index)
+        except Exception:
+            pass
+    
+    latencies: List[float] = []
+    errors = 0
+    units = 0
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def one(index: int):
+        nonlocal errors, units
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await func(index)
+                units += result or 0
+            except Exception:
+                errors += 1
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(iterations)))
+    duration = time.perf_counter() - started
+    
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        concurrency=concurrency,
+        errors=errors,
+        duration_s=round(duration, 3),
+        throughput_per_s=round(iterations / duration, 2) if duration else 0.0,
+        units_per_s=round(units / duration, 2) if duration else 0.0,
+        p50_ms=round(percentile(latencies, 50), 1),
+        p90_ms=round(percentile(latencies, 90), 1),
+        p95_ms=round(percentile(latencies, 95), 1),
+        p99_ms=round(percentile(latencies, 99), 1),
+        min_ms=round(latencies[0], 1) if latencies else 0.0,
+        max_ms=round(latencies[-1], 1) if latencies else 0.0,
+    )
+
+
+def build_report(results: List[BenchmarkResult], options: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "options": options,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def save_report(report: Dict[str, Any], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_results(results: List[BenchmarkResult], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """결과 표 (baseline이 있으면 p50/p95/처리량 변화율 표시)"""
+    previous = {item["name"]: item for item in (baseline or {}).get("results", [])}
+    header = f"{'benchmark':<28}{'iter':>6}{'err':>5}{'ops/s':>9}{'units/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<28}{result.iterations:>6}{result.errors:>5}"
+            f"{result.throughput_per_s:>9.2f}{result.units_per_s:>10.1f}"
+            f"{result.p50_ms:>9.1f}{result.p95_ms:>9.1f}{result.p99_ms:>9.1f}{result.max_ms:>9.1f}"
+        )
+        before = previous.get(result.name)
+        if before:
+            lines.append("    vs baseline: " + "  ".join(_compare(result, before)))
+    return "\n".join(lines)
+
+
+def _change(current: float, before: float) -> Optional[float]:
+    if not before:
+        return None
+    return (current - before) / before
+
+
+def _compare(result: BenchmarkResult, before: Dict[str, Any]) -> List[str]:
+    parts = []
+    for key, label, lower_is_better in (
+        ("p50_ms", "p50", True),
+        ("p95_ms", "p95", True),
+        ("throughput_per_s", "ops/s", False),
+    ):
+        change = _change(getattr(result, key), before.get(key, 0))
+        if change is None:
+            continue
+        regressed = change > REGRESSION_THRESHOLD if lower_is_better else change < -REGRESSION_THRESHOLD
+        flag = " ⚠️" if regressed else ""
+        parts.append(f"{label} {change:+.1%}{flag}")
+    return parts
+
+
+def regressions(results: List[BenchmarkResult], baseline: Dict[str, Any]) -> List[str]:
+    """baseline 대비 p95가 REGRESSION_THRESHOLD 이상 느려진 벤치마크 이름"""
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    names = []
+    for result in results:
+        before = previous.get(result.name)
+        if not before:
+            continue
+        change = _change(result.p95_ms, before.get("p95_ms", 0))
+        if change is not None and change > REGRESSION_THRESHOLD:
+            names.append(result.name)
+    return names
@@ -0,0 +1,184 @@
+"""
+응답 직렬화 / 압축 벤치마크 (저장소에 기록된 응답 fixture 기준)
+    
+    cd backend
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --iterations 500 --output serialization.json
+
+페이로드:
+- check_rank_unofficial: /check-rank-unofficial 응답 (search_results 300개, search_api_response_*.json 재생)
+- competitors: /metrics/competitors 응답 (경쟁매장 300개)
+- place_details: anana_full_diagnosis.json (플레이스 상세)
+- diagnosis: diagnosis_result.json (플레이스 진단 결과)
+- review_sse: 리뷰 분석 SSE 이벤트 50개 (이벤트마다 직렬화)
+
+측정: 표준 json(JSONResponse.render) / orjson 직렬화 시간, 본문 크기, gzip / br 압축 크기와 시간
+(jsonable_encoder 이후 단계만 측정 - 두 경로 모두 같은 jsonable_encoder 결과를 직렬화)
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import BACKEND_DIR, StandInData, StandInResponder, _load_json
+from benchmarks.runner import save_report
+
+
+def build_payloads() -> Dict[str, Any]:
+    """엔드포인트별 응답 본문 (jsonable_encoder 이후 형태)"""
+    from app.services.serp_results import SerpResults
+    
+    responder = StandInResponder(StandInData(search_total=300))
+    search_results = SerpResults.from_items(
+        responder.search_item(position) for position in range(1, 301)
+    ).to_dicts()
+    target = responder.target
+    checked_at = datetime(2026, 10, 19, 9, 0, 0).isoformat()
+    
+    check_rank = {
+        "status": "success",
+        "keyword": "성수 사진관",
+        "place_id": target["id"],
+        "store_name": target["name"],
+        "rank": responder.data.target_rank,
+        "found": True,
+        "total_results": len(search_results),
+        "total_count": "1,011",
+        "previous_rank": responder.data.target_rank + 3,
+        "rank_change": 3,
+        "last_checked_at": checked_at,
+        "search_results": search_results,
+    }
+    
+    competitors = {
+        "keyword": "성수 사진관",
+        "my_rank": responder.data.target_rank,
+        "total_count": 1011,
+        "competitors": [
+            {
+                "rank": rank,
+                "place_id": store["place_id"],
+                "name": store["name"],
+                "category": store["category"],
+                "address": store["address"],
+                "road_address": store["road_address"],
+                "rating": store["rating"],
+                "visitor_review_count": store["visitor_review_count"],
+                "blog_review_count": int(store["blog_review_count"]),
+                "thumbnail": store["thumbnail"],
+                "is_my_store": store["place_id"] == target["id"],
+            }
+            for rank, store in enumerate(search_results, start=1)
+        ],
+    }
+    
+    reviews = responder.visitor_reviews(target["id"], 50, None)["items"]
+    review_events = [
+        {"type": "review", "review": review, "sentiment": "positive", "temperature": 72.5}
+        for review in reviews
+    ]
+    
+    return {
+        "check_rank_unofficial": check_rank,
+        "competitors": competitors,
+        "place_details": _load_json("anana_full_diagnosis.json"),
+        "diagnosis": _load_json("diagnosis_result.json"),
+        "review_sse": review_events,
+    }
+
+
+def _time_per_call(func: Callable[[], Any], iterations: int) -> float:
+    """1회 평균 (µs)"""
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def measure(name: str, payload: Any, iterations: int) -> Dict[str, Any]:
+    from app.core import compression, serialization
+    from app.core.config import settings
+    
+    levels = (settings.RESPONSE_COMPRESSION_GZIP_LEVEL, settings.RESPONSE_COMPRESSION_BROTLI_QUALITY)
+    if name == "review_sse":
+        # 기존: f"data: {json.dumps(event)}\n\n" / 변경: sse_event(event)
+        std = lambda: [f"data: {json.dumps(event)}\n\n" for event in payload]
+        fast = lambda: [serialization.sse_event(event) for event in payload]
+        body = "".join(fast()).encode("utf-8")
+        std_bytes = len("".join(std()).encode("utf-8"))
+    else:
+        std = lambda: serialization.dumps_std(payload)
+        fast = lambda: serialization.dumps(payload)
+        body = fast()
+        std_bytes = len(std())
+    
+    std_us = _time_per_call(std, iterations)
+    fast_us = _time_per_call(fast, iterations)
+    
+    result = {
+        "payload": name,
+        "json_bytes": std_bytes,
+        "orjson_bytes": len(body),
+        "json_us": round(std_us, 1),
+        "orjson_us": round(fast_us, 1),
+        "speedup": round(std_us / fast_us, 2) if fast_us else None,
+    }
+    
+    compress_iterations = max(1, iterations // 10)
+    for encoding in compression.available_encodings():
+        compressed = compression.compress_body(body, encoding, *levels)
+        result[f"{encoding}_bytes"] = len(compressed)
+        result[f"{encoding}_us"] = round(
+            _time_per_call(lambda: compression.compress_body(body, encoding, *levels), compress_iterations), 1
+        )
+        result[f"{encoding}_ratio"] = round(len(compressed) / len(body), 3)
+    return result
+
+
+def format_table(results: List[Dict[str, Any]], encodings: List[str]) -> str:
+    header = f"{'payload':<24}{'bytes':>9}{'json µs':>10}{'orjson µs':>11}{'speedup':>9}"
+    for encoding in encodings:
+        header += f"{encoding + ' bytes':>12}{encoding + ' µs':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        line = (
+            f"{result['payload']:<24}{result['orjson_bytes']:>9}{result['json_us']:>10.1f}"
+            f"{result['orjson_us']:>11.1f}{result['speedup'] or 0:>8.2f}x"
+        )
+        for encoding in encodings:
+            line += f"{result[f'{encoding}_bytes']:>12}{result[f'{encoding}_us']:>10.1f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serialization", description="응답 직렬화 / 압축 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="페이로드별 직렬화 반복 횟수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+    
+    from app.core import compression, serialization
+    
+    payloads = build_payloads()
+    results = [measure(name, payload, args.iterations) for name, payload in payloads.items()]
+    encodings = compression.available_encodings()
+    
+    print(f"serializer={serialization.backend_name()}  encodings={','.join(encodings)}  fixtures={BACKEND_DIR}")
+    print(format_table(results, encodings))
+    
+    if args.output:
+        save_report({
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "serializer": serialization.backend_name(),
+            "options": {"iterations": args.iterations},
+            "results": results,
+        }, args.output)
+        print(f"\n결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+로컬 네이버 / Supabase 스탠드인 서버 (ASGI)
+
+- api.place.naver.com/graphql, pcmap-api.place.naver.com/graphql → fixture 기반 GraphQL 응답
+- m.place.naver.com 등 HTML 페이지 → debug_place_*.html
+- /rest/v1/... → 최소 PostgREST (스케줄러 작업 벤치마크용)
+- 지연(latency + jitter) / 오류(error_rate, error_status) 주입
+
+앱 코드는 수정하지 않고 httpx.AsyncClient 생성 시 StandInTransport를 주입해
+*.naver.com 요청을 로컬 서버로 보냅니다 (Supabase는 SUPABASE_URL을 로컬 서버로 지정).
+"""
+import asyncio
+import contextlib
+import json
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import parse_qs
+
+import httpx
+import uvicorn
+
+from benchmarks.fixtures import StandInResponder
+
+# 원래 호스트를 전달하는 헤더 (StandInTransport → 스탠드인 서버)
+ORIGINAL_HOST_HEADER = "x-stand-in-host"
+
+
+@dataclass
+class FaultConfig:
+    """지연 / 오류 주입 설정"""
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: int = 42
+
+
+class StandInApp:
+    """스탠드인 ASGI 앱 (외부 프레임워크 없이 요청 1건 = JSON/HTML 응답 1건)"""
+    
+    def __init__(self, responder: StandInResponder, faults: FaultConfig):
+        self.responder = responder
+        self.faults = faults
+        self._random = random.Random(faults.seed)
+        self.request_count = 0
+        self.error_count = 0
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        
+        self.request_count += 1
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        host = headers.get(ORIGINAL_HOST_HEADER, "")
+        method = scope["method"]
+        path = scope["path"]
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        
+        delay = self.faults.latency_ms + self._random.uniform(-1, 1) * self.faults.jitter_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        
+        if self.faults.error_rate > 0 and self._random.random() < self.faults.error_rate:
+            self.error_count += 1
+            await self._send(send, self.faults.error_status, b'{"error":"injected"}', "application/json")
+            return
+        
+        if host.endswith("naver.com"):
+            if path.endswith("/graphql") and method == "POST":
+                payload = self.responder.graphql(json.loads(body or b"{}"))
+                await self._send_json(send, payload)
+                return
+            html = self.responder.html(host, path)
+            if html is not None:
+                await self._send(send, 200, html, "text/html; charset=utf-8")
+                return
+        elif path.startswith("/rest/v1"):
+            select = (query.get("select") or [""])[0]
+            await self._send_json(send, self.responder.postgrest(method, path, select))
+            return
+        
+        await self._send(send, 404, b'{"error":"not found"}', "application/json")
+    
+    async def _send_json(self, send, payload):
+        await self._send(send, 200, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json")
+    
+    @staticmethod
+    async def _send(send, status: int, body: bytes, content_type: str):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type.encode("latin-1")),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StandInServer:
+    """스탠드인 앱을 별도 스레드의 uvicorn으로 실행"""
+    
+    def __init__(self, app: StandInApp, port: Optional[int] = None):
+        self.app = app
+        self.port = port or find_free_port()
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def start(self, timeout: float = 10.0):
+        config = uvicorn.Config(
+            self.app, host="127.0.0.1", port=self.port,
+            log_level="warning", lifespan="off", access_log=False,
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="naver-stand-in", daemon=True)
+        self._thread.start()
+        
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("스탠드인 서버 시작 시간 초과")
+            time.sleep(0.02)
+    
+    def stop(self):
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+    
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class StandInTransport(httpx.AsyncBaseTransport):
+    """*.naver.com 요청을 스탠드인 서버로 보내는 transport (그 외 호스트는 그대로)"""
+    
+    def __init__(self, base_url: str):
+        self._target = httpx.URL(base_url)
+        self._transport = httpx.AsyncHTTPTransport()
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host.endswith("naver.com"):
+            request.headers[ORIGINAL_HOST_HEADER] = request.url.host
+            request.url = request.url.copy_with(
+                scheme=self._target.scheme, host=self._target.host, port=self._target.port
+            )
+        return await self._transport.handle_async_request(request)
+    
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+@contextlib.contextmanager
+def route_naver_to(base_url: str) -> Iterator[None]:
+    """
+    이 블록 안에서 생성되는 httpx.AsyncClient의 네이버 요청을 스탠드인으로 라우팅
+    
+    서비스들이 요청마다 AsyncClient를 새로 만들기 때문에 생성자에 transport를 주입합니다.
+    (프록시 설정 시 httpx가 proxy transport를 우선하므로 벤치마크는 프록시 없이 실행)
+    """
+    original_init = httpx.AsyncClient.__init__
+    
+    def patched_init(self, *args, **kwargs):
+        kwargs.setdefault("transport", StandInTransport(base_url))
+        original_init(self, *args, **kwargs)
+    
+    httpx.AsyncClient.__init__ = patched_init
+    try:
+        yield
+    finally:
+        httpx.AsyncClient.__init__ = original_init
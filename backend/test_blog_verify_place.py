@@ -0,0 +1,77 @@
+"""블로그 첨부 지도 확인 (BLOG_VERIFY_PLACE_ATTACHMENT) 테스트
+
+- 설정값이 활성화 / 경쟁분석 블로그 추이 호출에 그대로 전달되는지
+- filter_blog_reviews_by_place가 다른 매장 지도만 첨부된 포스트만 제외하는지
+
+네트워크 / DB 없이 실행 (네이버 요청 메서드는 기록용 함수로 교체)
+"""
+import asyncio
+
+from app.core.config import settings
+from app.services.naver_activation_service_v3 import activation_service_v3
+from app.services.naver_competitor_analysis_service import competitor_analysis_service
+from app.services.naver_review_service import naver_review_service
+
+PLACE_ID = "1234567"
+
+
+async def test_flag_passthrough():
+    """설정값 → get_blog_reviews_html(verify_place=...) 전달 확인"""
+    calls = []
+    
+    async def fake_get_blog_reviews_html(**kwargs):
+        calls.append(kwargs.get("verify_place"))
+        return []
+    
+    original_activation = naver_review_service.get_blog_reviews_html
+    original_competitor = competitor_analysis_service.review_service.get_blog_reviews_html
+    naver_review_service.get_blog_reviews_html = fake_get_blog_reviews_html
+    competitor_analysis_service.review_service.get_blog_reviews_html = fake_get_blog_reviews_html
+    original_flag = settings.BLOG_VERIFY_PLACE_ATTACHMENT
+    try:
+        for flag in (False, True):
+            settings.BLOG_VERIFY_PLACE_ATTACHMENT = flag
+            calls.clear()
+            await activation_service_v3._calculate_blog_review_trends_realtime(PLACE_ID, "테스트매장", "서울 강남구", 0)
+            await competitor_analysis_service._calculate_blog_reviews_accurate(PLACE_ID, "테스트매장", "서울 강남구", 0)
+            assert calls == [flag, flag], f"flag={flag}, calls={calls}"
+            print(f"[OK] BLOG_VERIFY_PLACE_ATTACHMENT={flag} → verify_place={calls}")
+    finally:
+        settings.BLOG_VERIFY_PLACE_ATTACHMENT = original_flag
+        naver_review_service.get_blog_reviews_html = original_activation
+        competitor_analysis_service.review_service.get_blog_reviews_html = original_competitor
+
+
+async def test_filter_by_place():
+    """첨부 지도 없음 / 확인 실패 / 같은 매장 첨부는 유지, 다른 매장만 첨부는 제외"""
+    attached = {
+        "https://blog.naver.com/a/1": [],  # 지도 첨부 없음
+        "https://blog.naver.com/b/2": None,  # 확인 실패
+        "https://blog.naver.com/c/3": [PLACE_ID, "999"],  # 같은 매장 포함
+        "https://blog.naver.com/d/4": ["999"],  # 다른 매장만
+    }
+    
+    async def fake_get_blog_post_place_ids(blog_urls):
+        return {blog_url: attached[blog_url] for blog_url in blog_urls}
+    
+    original = naver_review_service.get_blog_post_place_ids
+    naver_review_service.get_blog_post_place_ids = fake_get_blog_post_place_ids
+    try:
+        reviews = [{"url": blog_url} for blog_url in attached]
+        kept = await naver_review_service.filter_blog_reviews_by_place(reviews, PLACE_ID)
+    finally:
+        naver_review_service.get_blog_post_place_ids = original
+    
+    kept_urls = [review["url"] for review in kept]
+    assert kept_urls == list(attached)[:3], kept_urls
+    print(f"[OK] 첨부 지도 필터링: {len(reviews)}개 → {len(kept)}개")
+
+
+async def main():
+    await test_flag_passthrough()
+    await test_filter_by_place()
+    print("\n모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,271 @@
+"""크레딧 예약 (reserve → commit / release) 테스트
+
+credit_service가 예약 RPC 결과를 어떻게 다루는지 확인합니다.
+Supabase 대신 RPC 규칙(20261019060000_add_credit_reservations.sql)을 메모리로 옮긴 클라이언트를 사용합니다.
+- 진행 중인 예약만큼 잔액에서 제외 (같은 잔액을 두 번 통과하지 못함)
+- 확정 시 차감 + 잔액 캐시 갱신, 확정 / 해제는 예약당 1회
+- CREDIT_AUTO_DEDUCT=false면 확정 대신 해제
+- 예약 RPC 실패 시 STRICT 모드면 부족, 아니면 예약 없이 통과 → 확정 시 일반 차감
+    
+    cd backend
+    python test_credit_reservations.py
+"""
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import app.core.database as database
+from app.core.config import settings
+
+
+class FakeSupabase:
+    """reserve_user_credits / commit_credit_reservation / release_credit_reservation / deduct_user_credits"""
+    
+    def __init__(self):
+        self.credits = {}
+        self.reservations = {}
+        self.transactions = []
+        self.table_reads = 0
+        self.rpc_calls = []
+        self.fail_rpc = set()
+    
+    def add_user(self, user_id, total: int, tier: str = "basic"):
+        self.credits[str(user_id)] = {
+            "user_id": str(user_id),
+            "tier": tier,
+            "monthly_credits": total,
+            "monthly_used": 0,
+            "monthly_remaining": total,
+            "manual_credits": 0,
+            "total_remaining": total,
+            "next_reset_at": None,
+        }
+    
+    def rpc(self, name, params):
+        self.rpc_calls.append(name)
+        if name in self.fail_rpc:
+            raise RuntimeError(f"{name} 실패")
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=getattr(self, f"_{name}")(**params)))
+    
+    def table(self, name):
+        assert name == "user_credits"
+        query = SimpleNamespace()
+        query.select = lambda *args: query
+        query.single = lambda: query
+        
+        def eq(column, value):
+            query.user_id = value
+            return query
+        
+        def execute():
+            self.table_reads += 1
+            return SimpleNamespace(data=dict(self.credits[query.user_id]))
+        
+        query.eq = eq
+        query.execute = execute
+        return query
+    
+    def _deduct(self, user_id, amount):
+        row = self.credits[user_id]
+        if row["total_remaining"] < amount:
+            raise RuntimeError("Insufficient credits")
+        from_monthly = min(amount, row["monthly_remaining"])
+        row["monthly_used"] += from_monthly
+        row["monthly_remaining"] -= from_monthly
+        row["manual_credits"] -= amount - from_monthly
+        row["total_remaining"] -= amount
+        transaction_id = str(uuid.uuid4())
+        self.transactions.append((user_id, amount, transaction_id))
+        return transaction_id
+    
+    def _reserve_user_credits(self, p_user_id, p_feature, p_credits_amount, p_ttl_seconds, p_metadata):
+        row = self.credits.get(p_user_id)
+        if row is None:
+            return None
+        now = datetime.now(timezone.utc)
+        held = sum(
+            reservation["credits_amount"] for reservation in self.reservations.values()
+            if reservation["user_id"] == p_user_id and reservation["status"] == "reserved" and reservation["expires_at"] > now
+        )
+        available = row["total_remaining"] - held
+        sufficient = available >= p_credits_amount
+        reservation_id = None
+        if sufficient:
+            reservation_id = str(uuid.uuid4())
+            self.reservations[reservation_id] = {
+                "user_id": p_user_id,
+                "feature": p_feature,
+                "credits_amount": p_credits_amount,
+                "status": "reserved",
+                "expires_at": now + timedelta(seconds=p_ttl_seconds),
+            }
+        return {
+            "sufficient": sufficient,
+            "current_credits": available,
+            "monthly_remaining": row["monthly_remaining"],
+            "manual_credits": row["manual_credits"],
+            "required_credits": p_credits_amount,
+            "shortage": 0 if sufficient else p_credits_amount - available,
+            "tier": row["tier"],
+            "next_reset": None,
+            "is_god_tier": False,
+            "reservation_id": reservation_id,
+            "credits": dict(row),
+        }
+    
+    def _commit_credit_reservation(self, p_reservation_id, p_credits_amount, p_metadata):
+        reservation = self.reservations[p_reservation_id]
+        if reservation["status"] != "reserved":
+            raise RuntimeError(f"Credit reservation already {reservation['status']}")
+        amount = reservation["credits_amount"] if p_credits_amount is None else p_credits_amount
+        transaction_id = self._deduct(reservation["user_id"], amount)
+        reservation["status"] = "committed"
+        return {"transaction_id": transaction_id, "credits": dict(self.credits[reservation["user_id"]])}
+    
+    def _release_credit_reservation(self, p_reservation_id):
+        reservation = self.reservations.get(p_reservation_id)
+        if reservation is None or reservation["status"] != "reserved":
+            return False
+        reservation["status"] = "released"
+        return True
+    
+    def _deduct_user_credits(self, p_user_id, p_feature, p_credits_amount, p_metadata):
+        return self._deduct(p_user_id, p_credits_amount)
+
+
+# credit_service 싱글톤이 생성 시 가져가는 클라이언트
+fake = FakeSupabase()
+database._supabase_client = fake
+
+from app.services.credit_service import credit_service  # noqa: E402
+
+
+def _configure(**overrides):
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+
+async def test_reserve_holds_balance():
+    """진행 중인 예약만큼 잔액 제외 → 동시 요청이 같은 잔액을 두 번 통과하지 못함"""
+    user_id = uuid.uuid4()
+    fake.add_user(user_id, 100)
+    
+    first, second = await asyncio.gather(
+        credit_service.reserve_credits(user_id, "analysis", credits_amount=60),
+        credit_service.reserve_credits(user_id, "analysis", credits_amount=60),
+    )
+    assert [first.sufficient, second.sufficient].count(True) == 1
+    winner, loser = (first, second) if first.sufficient else (second, first)
+    assert winner.reservation_id and loser.reservation_id is None
+    assert loser.current_credits == 40 and loser.shortage == 20
+    
+    # 부족한 예약은 해제할 것이 없음
+    await credit_service.release_reservation(loser)
+    assert loser.settled
+    
+    rest = await credit_service.reserve_credits(user_id, "analysis", credits_amount=40)
+    assert rest.sufficient and rest.current_credits == 100 - 60
+    
+    # 확정: 차감 + 반환된 잔액으로 캐시 갱신 (user_credits 재조회 없음)
+    reads = fake.table_reads
+    transaction_id = await credit_service.commit_reservation(winner)
+    assert transaction_id is not None and winner.settled
+    balance = await credit_service.get_user_credits(user_id)
+    assert balance.total_remaining == 40 and fake.table_reads == reads
+    
+    # 확정 / 해제는 예약당 1회
+    assert await credit_service.commit_reservation(winner) is None
+    await credit_service.release_reservation(winner)
+    assert fake.reservations[str(winner.reservation_id)]["status"] == "committed"
+    
+    # 해제한 예약은 잔액에 다시 포함
+    await credit_service.release_reservation(rest)
+    assert fake.reservations[str(rest.reservation_id)]["status"] == "released"
+    again = await credit_service.reserve_credits(user_id, "analysis", credits_amount=40)
+    assert again.sufficient
+    await credit_service.release_reservation(again)
+    print("[OK] 예약 잔액 제외 / 확정 / 해제")
+
+
+async def test_commit_actual_amount():
+    """확정 시 실제 사용량으로 차감 (예약보다 적게 쓴 경우)"""
+    user_id = uuid.uuid4()
+    fake.add_user(user_id, 50)
+    reservation = await credit_service.reserve_credits(user_id, "analysis", credits_amount=30)
+    await credit_service.commit_reservation(reservation, credits_amount=12)
+    assert fake.credits[str(user_id)]["total_remaining"] == 38
+    print("[OK] 실제 사용량 확정")
+
+
+async def test_auto_deduct_disabled():
+    """CREDIT_AUTO_DEDUCT=false → 확정 대신 해제 (차감 없음)"""
+    user_id = uuid.uuid4()
+    fake.add_user(user_id, 50)
+    reservation = await credit_service.reserve_credits(user_id, "analysis", credits_amount=30)
+    _configure(CREDIT_AUTO_DEDUCT=False)
+    try:
+        assert await credit_service.commit_reservation(reservation) is None
+    finally:
+        _configure(CREDIT_AUTO_DEDUCT=True)
+    assert fake.reservations[str(reservation.reservation_id)]["status"] == "released"
+    assert fake.credits[str(user_id)]["total_remaining"] == 50
+    print("[OK] 자동 차감 꺼짐 → 해제")
+
+
+async def test_reserve_rpc_failure():
+    """예약 RPC 실패: 느슨한 모드는 예약 없이 통과 → 확정 시 일반 차감, STRICT 모드는 부족"""
+    user_id = uuid.uuid4()
+    fake.add_user(user_id, 50)
+    fake.fail_rpc.add("reserve_user_credits")
+    try:
+        _configure(CREDIT_CHECK_STRICT=False)
+        lenient = await credit_service.reserve_credits(user_id, "analysis", credits_amount=10)
+        _configure(CREDIT_CHECK_STRICT=True)
+        strict = await credit_service.reserve_credits(user_id, "analysis", credits_amount=10)
+    finally:
+        fake.fail_rpc.discard("reserve_user_credits")
+        _configure(CREDIT_CHECK_STRICT=False)
+    assert lenient.sufficient and lenient.reservation_id is None
+    assert not strict.sufficient and strict.shortage == 10
+    
+    fake.rpc_calls.clear()
+    assert await credit_service.commit_reservation(lenient) is not None
+    assert fake.rpc_calls == ["deduct_user_credits"]
+    assert fake.credits[str(user_id)]["total_remaining"] == 40
+    print("[OK] 예약 RPC 실패 시 STRICT / 느슨한 모드")
+
+
+async def test_credit_system_disabled():
+    """CREDIT_SYSTEM_ENABLED=false → RPC 없이 통과, 확정 / 해제할 것 없음"""
+    _configure(CREDIT_SYSTEM_ENABLED=False)
+    fake.rpc_calls.clear()
+    try:
+        reservation = await credit_service.reserve_credits(uuid.uuid4(), "analysis", credits_amount=10)
+        assert reservation.sufficient and reservation.settled
+        assert await credit_service.commit_reservation(reservation) is None
+    finally:
+        _configure(CREDIT_SYSTEM_ENABLED=True)
+    assert fake.rpc_calls == []
+    print("[OK] 크레딧 시스템 꺼짐")
+
+
+async def main():
+    logging.disable(logging.CRITICAL)
+    _configure(
+        CREDIT_SYSTEM_ENABLED=True,
+        CREDIT_AUTO_DEDUCT=True,
+        CREDIT_CHECK_STRICT=False,
+        CREDIT_BALANCE_CACHE_TTL_SECONDS=10,
+    )
+    await test_reserve_holds_balance()
+    await test_commit_actual_amount()
+    await test_auto_deduct_disabled()
+    await test_reserve_rpc_failure()
+    await test_credit_system_disabled()
+    print("\n모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""다중 패턴 키워드 매처 (app.core.keyword_matcher) 테스트
+
+카운트 규칙이 기존 str.count() / `in`과 같은지 확인합니다.
+- 고정 예시: 겹치는 패턴, 접두/접미 공유, 대소문자, 빈 패턴
+- 무작위 텍스트: 작은 알파벳(겹침이 많음) + 한글 키워드 변형으로 str.count()와 비교
+    
+    cd backend
+    python test_keyword_matcher.py
+"""
+import random
+
+from app.core.keyword_matcher import KeywordMatcher
+
+
+def _expected(text: str, pattern: str, case_sensitive: bool) -> int:
+    """기존 방식 (키워드마다 str.count)"""
+    if not pattern:
+        return 0
+    if not case_sensitive:
+        text, pattern = text.lower(), pattern.lower()
+    return text.count(pattern)
+
+
+def _check(patterns, text: str, case_sensitive: bool = False):
+    counts = KeywordMatcher(patterns, case_sensitive=case_sensitive).count(text)
+    for pattern in patterns:
+        expected = _expected(text, pattern, case_sensitive)
+        assert counts.count(pattern) == expected, (
+            f"{pattern!r} in {text!r} (case_sensitive={case_sensitive}): {counts.count(pattern)} != {expected}"
+        )
+        assert counts.contains(pattern) == (pattern in text if case_sensitive else pattern.lower() in text.lower())
+
+
+def test_examples():
+    """고정 예시"""
+    _check(["aa"], "aaaa")  # non-overlapping → 2
+    _check(["aa", "aaa", "a"], "aaaaaaa")
+    _check(["he", "she", "his", "hers"], "ushershishe")
+    _check(["abcd", "bc", "c"], "abcabcdbc")
+    _check(["종로맛집", "종로 맛집", "맛집", "종로"], "종로맛집 추천! 종로 맛집 BEST, 종로맛집종로맛집")
+    _check(["Cafe", "CAFE"], "cafe Cafe CAFE")
+    _check(["Cafe", "CAFE"], "cafe Cafe CAFE", case_sensitive=True)
+    _check(["", "x"], "xxx")
+    _check(["x"], "")
+    
+    matcher = KeywordMatcher(["종로맛집", "종로맛집", "", "맛집"])
+    assert len(matcher) == 2  # 빈 패턴 / 중복 제외
+    counts = matcher.count("종로맛집 맛집")
+    assert counts.total() == 3
+    assert counts.contains("") and counts.count("") == 0
+    
+    fields = matcher.count_fields({"description": "종로맛집", "road": None, "menu": "맛집 맛집"})
+    assert fields["description"].count("종로맛집") == 1
+    assert fields["road"].total() == 0
+    assert fields["menu"].count("맛집") == 2
+    print("[OK] 고정 예시")
+
+
+def test_random_parity(rounds: int = 300, seed: int = 11):
+    """무작위 패턴 / 텍스트로 str.count()와 비교"""
+    rng = random.Random(seed)
+    alphabets = ["ab", "abc", "종로맛집 ", "aAbB"]
+    for _ in range(rounds):
+        alphabet = rng.choice(alphabets)
+        patterns = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        text = "".join(rng.choice(alphabet + "xyz") for _ in range(rng.randint(0, 200)))
+        case_sensitive = rng.random() < 0.3
+        _check(patterns, text, case_sensitive=case_sensitive)
+    print(f"[OK] 무작위 비교 {rounds}회")
+
+
+def test_reuse():
+    """같은 매처로 여러 텍스트를 세도 결과가 섞이지 않음 (전이 캐시 공유)"""
+    matcher = KeywordMatcher(["ab", "bab"])
+    first = matcher.count("babab")
+    second = matcher.count("ab")
+    assert (first.count("ab"), first.count("bab")) == ("babab".count("ab"), "babab".count("bab"))
+    assert (second.count("ab"), second.count("bab")) == (1, 0)
+    print("[OK] 매처 재사용")
+
+
+def main():
+    test_examples()
+    test_random_parity()
+    test_reuse()
+    print("\n모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()
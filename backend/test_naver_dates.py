@@ -0,0 +1,78 @@
+"""날짜 파싱 (app.services.naver_dates) 테스트
+
+- 기존 파서와 결과 비교: benchmarks.date_parsing의 문자열 묶음 / 비교 규칙 그대로 사용
+  (differ가 하나라도 있으면 실패, fixed는 의도한 수정)
+- 대표 형식별 기대값 (기준 시각 고정)
+    
+    cd backend
+    python test_naver_dates.py
+"""
+import logging
+from datetime import datetime, timezone
+
+from app.services.naver_dates import KST, object_id_date_str, parse_date, parse_dates, visit_date_str
+from benchmarks.date_parsing import NOW_KST, NOW_NAIVE, NOW_UTC, build_cases, build_corpus, compare
+
+
+def test_legacy_parity():
+    """기존 파서가 해석한 값은 새 파서도 같은 날짜로 해석"""
+    corpus = build_corpus(pages=20)
+    for case in build_cases():
+        result = compare(case, corpus[case["corpus"]])
+        assert result["differ"] == 0, f"{case['name']}: {result['examples']['differ']}"
+        print(f"[OK] {case['name']}: agree={result['agree']}, fixed={result['fixed']}")
+
+
+def test_formats():
+    """형식별 기대값 (기준: 2026-10-19 15:00 KST)"""
+    expected = [
+        # (문자열, 시간대, 기준 시각, 기대값)
+        ("3일 전", KST, NOW_KST, datetime(2026, 10, 16, 15, 0, tzinfo=KST)),
+        ("1주일 전", KST, NOW_KST, datetime(2026, 10, 12, 15, 0, tzinfo=KST)),
+        ("2개월 전", None, NOW_NAIVE, datetime(2026, 8, 20, 15, 0)),
+        ("2026.08.14.", KST, NOW_KST, datetime(2026, 8, 14, tzinfo=KST)),
+        ("25.12.5.", None, NOW_NAIVE, datetime(2025, 12, 5)),
+        ("24.12.31.화", KST, NOW_KST, datetime(2024, 12, 31, tzinfo=KST)),
+        # 연도 없는 날짜가 기준일보다 미래면 작년
+        ("12.31.수", KST, NOW_KST, datetime(2025, 12, 31, tzinfo=KST)),
+        ("10.19.월", KST, NOW_KST, datetime(2026, 10, 19, tzinfo=KST)),
+        # ISO: 시간대 지정 시 변환, naive면 KST 벽시계 ("...Z"와 "+09:00"이 같은 시각)
+        ("2026-10-18T15:00:00Z", timezone.utc, NOW_UTC, datetime(2026, 10, 18, 15, 0, tzinfo=timezone.utc)),
+        ("2026-10-18T15:00:00Z", None, NOW_NAIVE, datetime(2026, 10, 19, 0, 0)),
+        ("2026-10-19T00:00:00+09:00", None, NOW_NAIVE, datetime(2026, 10, 19, 0, 0)),
+        ("2026-10-18T15:00:00.123", KST, NOW_KST, datetime(2026, 10, 18, 15, 0, 0, 123000, tzinfo=KST)),
+        # 해석 불가
+        ("", KST, NOW_KST, None),
+        ("어제", KST, NOW_KST, None),
+        ("13.45.", KST, NOW_KST, None),
+    ]
+    for text, tz, reference, value in expected:
+        parsed = parse_date(text, tz=tz, reference=reference)
+        assert parsed == value, f"{text!r} (tz={tz}): {parsed} != {value}"
+    assert parse_dates(["3일 전", None, "1.10.금"], reference=NOW_KST) == [
+        datetime(2026, 10, 16, 15, 0, tzinfo=KST), None, datetime(2026, 1, 10, tzinfo=KST)
+    ]
+    print(f"[OK] 형식별 기대값 {len(expected)}개")
+
+
+def test_visit_dates():
+    """방문일 "YYYY-MM-DD": visited → 리뷰 ID(ObjectId) 순"""
+    review_id = f"{int(datetime(2026, 10, 18, 23, 30, tzinfo=KST).timestamp()):08x}" + "0" * 16
+    assert object_id_date_str(review_id) == "2026-10-18"
+    assert object_id_date_str("not-hex") is None
+    assert visit_date_str("1.10.금", review_id, reference=NOW_KST) == "2026-01-10"
+    assert visit_date_str(None, review_id, reference=NOW_KST) == "2026-10-18"
+    assert visit_date_str("알 수 없음", None, reference=NOW_KST) is None
+    print("[OK] 방문일 / 리뷰 ID 날짜")
+
+
+def main():
+    logging.disable(logging.CRITICAL)
+    test_legacy_parity()
+    test_formats()
+    test_visit_dates()
+    print("\n모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    main()
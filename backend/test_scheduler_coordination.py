@@ -0,0 +1,174 @@
+"""스케줄러 조정 (app.core.coordination) 테스트
+
+LocalCoordinationBackend 하나를 여러 SchedulerCoordinator가 공유해서 다중 워커를 재현합니다.
+- run_exclusive: 리더만 실행, 같은 기간은 1회 (실행 중 / 완료 / 실패 모두 재claim 안 됨)
+- claim_run: heartbeat가 끊긴 실행만 인수 (attempts 증가)
+- run_sharded: 워커끼리 샤드가 겹치지 않고, claim_all로 남은 샤드 정리
+- 리더 교체 후 놓친 단독 작업 기간 실행 (catchup) / 끊긴 실행 재실행 (recovery)
+    
+    cd backend
+    python test_scheduler_coordination.py
+"""
+import asyncio
+import logging
+from datetime import timedelta
+
+from app.core.coordination import LEADER_LEASE_NAME, LocalCoordinationBackend, SchedulerCoordinator
+
+
+class JobRecorder:
+    """작업 함수 호출 기록 (샤드, 기간, 모드)"""
+    
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+    
+    async def __call__(self, shards, period, mode):
+        self.calls.append((shards, period, mode))
+        if self.fail:
+            raise RuntimeError("작업 실패")
+
+
+def _workers(backend, *worker_ids, **kwargs):
+    return [SchedulerCoordinator(backend, worker_id=worker_id, **kwargs) for worker_id in worker_ids]
+
+
+async def _settle():
+    """tick이 띄운 백그라운드 실행(catchup / recovery) 완료 대기"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_run_exclusive():
+    backend = LocalCoordinationBackend()
+    leader, follower = _workers(backend, "a", "b")
+    await leader.tick()
+    await follower.tick()
+    assert leader.is_leader and not follower.is_leader
+    
+    job = JobRecorder()
+    assert not await follower.run_exclusive("billing", "2026-10-19", job)
+    assert await leader.run_exclusive("billing", "2026-10-19", job)
+    # 같은 기간은 완료 후에도 다시 실행하지 않음
+    assert not await leader.run_exclusive("billing", "2026-10-19", job)
+    assert await leader.run_exclusive("billing", "2026-10-20", job)
+    assert [(period, mode) for _, period, mode in job.calls] == [("2026-10-19", "scheduled"), ("2026-10-20", "scheduled")]
+    
+    # 실패한 기간도 자동 재실행하지 않음 (claim은 실행 기록 기준)
+    failing = JobRecorder(fail=True)
+    assert await leader.run_exclusive("report", "2026-10-19", failing)
+    assert not await leader.run_exclusive("report", "2026-10-19", failing)
+    assert backend._runs["report:2026-10-19"]["status"] == "failed"
+    print("[OK] run_exclusive: 리더만 / 기간당 1회")
+
+
+async def test_claim_run_takeover():
+    backend = LocalCoordinationBackend()
+    assert backend.claim_run("job:p", "job", "a", 60, {})
+    # 살아있는 실행은 다른 워커가 claim할 수 없음
+    assert not backend.claim_run("job:p", "job", "b", 60, {})
+    # heartbeat가 끊긴 실행은 인수
+    backend._runs["job:p"]["heartbeat_at"] -= timedelta(seconds=120)
+    assert backend.claim_run("job:p", "job", "b", 60, {"mode": "recovery"})
+    run = backend._runs["job:p"]
+    assert run["holder"] == "b" and run["attempts"] == 2 and run["meta"]["mode"] == "recovery"
+    # 인수당한 워커의 heartbeat / 종료 기록은 반영되지 않음
+    assert backend.heartbeat_runs(["job:p"], "a") == []
+    backend.finish_runs(["job:p"], "a", "completed", None)
+    assert run["status"] == "running"
+    backend.finish_runs(["job:p"], "b", "completed", None)
+    assert run["status"] == "completed"
+    # 완료된 실행은 오래되어도 다시 claim되지 않음
+    run["heartbeat_at"] -= timedelta(seconds=120)
+    assert not backend.claim_run("job:p", "job", "c", 60, {})
+    print("[OK] claim_run: 끊긴 실행만 인수")
+
+
+async def test_run_sharded():
+    backend = LocalCoordinationBackend()
+    workers = _workers(backend, "a", "b", "c", shard_count=8, claim_grace_seconds=0)
+    # 두 번째 tick에서 서로의 생존 신호를 봄
+    for _ in range(2):
+        for worker in workers:
+            await worker.tick()
+    assert all(worker.active_workers == 3 for worker in workers)
+    
+    job = JobRecorder()
+    claimed = []
+    for worker in workers[1:]:
+        shards = await worker.run_sharded("rank", "2026-10-19T10", job)
+        assert shards is not None and len(shards.indices) <= 3  # ceil(8 / 3)
+        claimed.extend(shards.indices)
+    assert len(claimed) == len(set(claimed)), claimed
+    
+    # 리더(a)의 cron이 늦게 울려도 남은 샤드만 처리 → 합쳐서 8개 모두, 중복 없음
+    leader_shards = await workers[0].run_sharded("rank", "2026-10-19T10", job, claim_all=True)
+    claimed.extend(leader_shards.indices)
+    assert sorted(claimed) == list(range(8)), claimed
+    assert await workers[1].run_sharded("rank", "2026-10-19T10", job, claim_all=True) is None
+    print(f"[OK] run_sharded: 샤드 8개를 워커 3개가 중복 없이 처리 ({len(job.calls)}회 실행)")
+
+
+async def test_catch_up_after_failover():
+    backend = LocalCoordinationBackend()
+    old_leader, new_leader = _workers(backend, "a", "b", lease_ttl_seconds=3)
+    period = {"value": None}
+    for worker in (old_leader, new_leader):
+        worker.register("billing", JobRecorder(), due_period=lambda: period["value"])
+    await old_leader.tick()
+    await new_leader.tick()
+    
+    # cron 시각 전 (None) → 실행 안 함
+    await old_leader.tick()
+    await _settle()
+    assert not old_leader._jobs["billing"].calls
+    
+    # 리더가 cron 직전에 죽음 (리스 만료) → cron은 리더가 아닌 b에서만 울려서 건너뜀
+    period["value"] = "2026-10-19"
+    backend._leases[LEADER_LEASE_NAME]["expires_at"] -= timedelta(seconds=10)
+    assert not await new_leader.run_exclusive("billing", "2026-10-19", new_leader._jobs["billing"])
+    
+    # 다음 tick에서 b가 리더가 되고 실행 기록이 없는 기간을 실행
+    await new_leader.tick()
+    await _settle()
+    assert new_leader.is_leader
+    assert [(p, mode) for _, p, mode in new_leader._jobs["billing"].calls] == [("2026-10-19", "catchup")]
+    
+    # 같은 기간은 다시 확인하지 않고, 이미 실행된 기간은 claim이 거절
+    await new_leader.tick()
+    new_leader._checked_periods.clear()
+    await new_leader.tick()
+    await _settle()
+    assert len(new_leader._jobs["billing"].calls) == 1
+    print("[OK] 리더 교체 후 놓친 단독 작업 1회 실행 (catchup)")
+
+
+async def test_recover_stale_run():
+    backend = LocalCoordinationBackend()
+    crashed, leader = _workers(backend, "a", "b", lease_ttl_seconds=3, run_stale_seconds=3)
+    job = JobRecorder()
+    leader.register("billing", job)
+    
+    # a가 실행을 claim한 뒤 heartbeat 없이 죽음
+    assert backend.claim_run("billing:2026-10-19", "billing", crashed.worker_id, 3, {"period": "2026-10-19"})
+    backend._runs["billing:2026-10-19"]["heartbeat_at"] -= timedelta(seconds=10)
+    
+    await leader.tick()
+    await _settle()
+    assert [(p, mode) for _, p, mode in job.calls] == [("2026-10-19", "recovery")]
+    assert backend._runs["billing:2026-10-19"]["status"] == "completed"
+    print("[OK] 끊긴 실행을 리더가 인수해서 재실행 (recovery)")
+
+
+async def main():
+    logging.disable(logging.CRITICAL)
+    await test_run_exclusive()
+    await test_claim_run_takeover()
+    await test_run_sharded()
+    await test_catch_up_after_failover()
+    await test_recover_stale_run()
+    print("\n모든 테스트 통과")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
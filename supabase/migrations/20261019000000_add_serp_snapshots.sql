@@ -0,0 +1,154 @@
+-- ========================================
+-- SERP 스냅샷 테이블 (competitor_rankings 중복 제거)
+-- ========================================
+-- 목적: 같은 키워드 × 같은 위치 × 같은 수집 시간대의 검색 결과(최대 300개)를
+--       tracker마다 competitors_data JSON으로 반복 저장하던 것을 1회만 저장
+-- - serp_snapshots: 압축된 검색 결과 (배열의 배열, 순서 = 순위)
+-- - competitor_rankings: snapshot_id + my_rank + total_count만 저장
+--
+-- items 컬럼 순서 (backend/app/services/serp_snapshot_service.py SNAPSHOT_COLUMNS):
+--   [place_id, name, category, address, road_address, rating,
+--    visitor_review_count, blog_review_count, thumbnail]
+-- ========================================
+
+-- 1단계: 스냅샷 테이블 생성
+CREATE TABLE IF NOT EXISTS serp_snapshots (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  keyword TEXT NOT NULL,
+  location_cell TEXT NOT NULL, -- 검색 좌표 (소수점 4자리, 예: '127.0276,37.4979')
+  collected_hour TIMESTAMP WITH TIME ZONE NOT NULL, -- 수집 시각 (시간 단위 절사)
+  content_hash TEXT, -- items 내용 해시 (다른 결과가 합쳐지지 않도록 키에 포함, 기존 competitor_rankings에서 옮긴 행은 NULL)
+  total_count INTEGER DEFAULT 0,
+  item_count INTEGER DEFAULT 0,
+  items JSONB NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  UNIQUE(keyword, location_cell, collected_hour, content_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_serp_snapshots_collected_hour ON serp_snapshots(collected_hour DESC);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE serp_snapshots ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: competitor_rankings에 스냅샷 참조 컬럼 추가
+ALTER TABLE competitor_rankings
+  ADD COLUMN IF NOT EXISTS snapshot_id UUID REFERENCES serp_snapshots(id) ON DELETE SET NULL;
+
+ALTER TABLE competitor_rankings ALTER COLUMN competitors_data DROP NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_competitor_rankings_snapshot_id ON competitor_rankings(snapshot_id);
+CREATE INDEX IF NOT EXISTS idx_competitor_rankings_store_keyword
+  ON competitor_rankings(store_id, keyword, collection_date DESC);
+
+-- 3단계: 스냅샷 저장 함수 (이미 있으면 기존 ID 반환, 1 round trip)
+CREATE OR REPLACE FUNCTION upsert_serp_snapshot(
+    p_keyword TEXT,
+    p_location_cell TEXT,
+    p_collected_hour TIMESTAMPTZ,
+    p_content_hash TEXT,
+    p_total_count INTEGER,
+    p_items JSONB
+)
+RETURNS UUID
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_id UUID;
+BEGIN
+    INSERT INTO serp_snapshots (
+        keyword, location_cell, collected_hour, content_hash,
+        total_count, item_count, items
+    )
+    VALUES (
+        p_keyword, p_location_cell, p_collected_hour, p_content_hash,
+        p_total_count, jsonb_array_length(p_items), p_items
+    )
+    ON CONFLICT (keyword, location_cell, collected_hour, content_hash)
+    DO UPDATE SET total_count = EXCLUDED.total_count
+    RETURNING id INTO v_id;
+
+    RETURN v_id;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION upsert_serp_snapshot(TEXT, TEXT, TIMESTAMPTZ, TEXT, INTEGER, JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION upsert_serp_snapshot(TEXT, TEXT, TIMESTAMPTZ, TEXT, INTEGER, JSONB) TO service_role;
+
+COMMENT ON FUNCTION upsert_serp_snapshot(TEXT, TEXT, TIMESTAMPTZ, TEXT, INTEGER, JSONB) IS
+'SERP 스냅샷 저장 (동일 키워드/위치/시간대/내용이면 기존 스냅샷 ID 반환)';
+
+-- 4단계: 기존 competitor_rankings 행 마이그레이션
+-- competitors_data는 TEXT(JSON 문자열) 또는 JSONB(문자열 스칼라 포함)로 저장되어 있을 수 있음
+CREATE TEMP TABLE legacy_competitor_rankings AS
+SELECT
+    cr.id AS ranking_id,
+    cr.keyword,
+    to_char(COALESCE(NULLIF(s.place_x, '')::numeric, 127.0276), 'FM999990.0000') || ',' ||
+    to_char(COALESCE(NULLIF(s.place_y, '')::numeric, 37.4979), 'FM999990.0000') AS location_cell,
+    date_trunc('hour', cr.collected_at) AS collected_hour,
+    COALESCE(cr.total_count, 0) AS total_count,
+    (
+        SELECT COALESCE(jsonb_agg(
+            jsonb_build_array(
+                COALESCE(c->>'place_id', ''),
+                COALESCE(c->>'name', ''),
+                COALESCE(c->>'category', ''),
+                COALESCE(c->>'address', ''),
+                COALESCE(c->>'road_address', ''),
+                c->'rating',
+                COALESCE((c->>'visitor_review_count')::int, 0),
+                COALESCE((c->>'blog_review_count')::int, 0),
+                COALESCE(c->>'thumbnail', '')
+            ) ORDER BY (c->>'rank')::int
+        ), '[]'::jsonb)
+        FROM jsonb_array_elements(
+            CASE
+                WHEN jsonb_typeof(cr.competitors_data::jsonb) = 'string'
+                THEN (cr.competitors_data::jsonb #>> '{}')::jsonb
+                ELSE cr.competitors_data::jsonb
+            END
+        ) AS c
+    ) AS items
+FROM competitor_rankings cr
+LEFT JOIN stores s ON s.id = cr.store_id
+WHERE cr.snapshot_id IS NULL
+  AND cr.competitors_data IS NOT NULL;
+
+-- content_hash는 백엔드(json.dumps 압축 직렬화 md5)와 같은 값을 SQL에서 만들 수 없으므로 NULL로 둠
+-- (jsonb 텍스트는 공백 / 숫자 표기가 달라 해시가 맞지 않음 → NULL = 백엔드 upsert와 매칭되지 않는 이관 행)
+-- 같은 키워드/위치/시간대/내용의 기존 행은 items_hash로 묶어 스냅샷 1개로 저장
+ALTER TABLE legacy_competitor_rankings ADD COLUMN items_hash TEXT, ADD COLUMN snapshot_id UUID;
+UPDATE legacy_competitor_rankings SET items_hash = md5(items::text);
+
+UPDATE legacy_competitor_rankings l
+SET snapshot_id = g.snapshot_id
+FROM (
+    SELECT keyword, location_cell, collected_hour, items_hash, gen_random_uuid() AS snapshot_id
+    FROM legacy_competitor_rankings
+    WHERE jsonb_array_length(items) > 0
+    GROUP BY keyword, location_cell, collected_hour, items_hash
+) g
+WHERE l.keyword = g.keyword
+  AND l.location_cell = g.location_cell
+  AND l.collected_hour = g.collected_hour
+  AND l.items_hash = g.items_hash;
+
+INSERT INTO serp_snapshots (id, keyword, location_cell, collected_hour, content_hash, total_count, item_count, items)
+SELECT DISTINCT ON (snapshot_id)
+    snapshot_id, keyword, location_cell, collected_hour, NULL, total_count, jsonb_array_length(items), items
+FROM legacy_competitor_rankings
+WHERE snapshot_id IS NOT NULL;
+
+UPDATE competitor_rankings cr
+SET snapshot_id = l.snapshot_id,
+    competitors_data = NULL
+FROM legacy_competitor_rankings l
+WHERE cr.id = l.ranking_id
+  AND l.snapshot_id IS NOT NULL;
+
+DROP TABLE legacy_competitor_rankings;
+
+COMMENT ON TABLE serp_snapshots IS '키워드/위치/시간대별 검색 결과 스냅샷 (competitor_rankings에서 공유 참조)';
+COMMENT ON COLUMN competitor_rankings.snapshot_id IS '공유 SERP 스냅샷 참조 (NULL이면 레거시 competitors_data 사용)';
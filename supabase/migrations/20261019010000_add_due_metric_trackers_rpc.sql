@@ -0,0 +1,127 @@
+-- ========================================
+-- 시간대별 수집 대상 tracker 조회 (서버 측 필터링)
+-- ========================================
+-- 목적: 스케줄러가 매 시간 모든 활성 tracker를 가져와 Python에서
+--       update_times를 필터링하던 것을 Postgres로 이동
+-- - update_times 정규화: NULL/빈 배열을 update_frequency 기본값으로 채움
+--   (daily_once: [16], daily_twice: [6, 16])
+-- - GIN 인덱스로 update_times @> ARRAY[hour] 조회
+-- - get_due_metric_trackers(hour): stores / keywords를 PostgREST 임베드와
+--   같은 형태(JSONB)로 함께 반환
+-- ========================================
+
+-- 1단계: update_frequency 기본 수집 시간 함수
+CREATE OR REPLACE FUNCTION metric_tracker_default_update_times(p_update_frequency TEXT)
+RETURNS INTEGER[]
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT CASE p_update_frequency
+        WHEN 'daily_twice' THEN ARRAY[6, 16]
+        ELSE ARRAY[16]
+    END;
+$$;
+
+-- 2단계: 기존 데이터 정규화
+UPDATE metric_trackers
+SET update_times = metric_tracker_default_update_times(update_frequency)
+WHERE update_times IS NULL
+   OR cardinality(update_times) = 0;
+
+-- 3단계: 이후 저장되는 행도 정규화 (인덱스 조회만으로 기본값 처리)
+CREATE OR REPLACE FUNCTION normalize_metric_tracker_update_times()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NEW.update_times IS NULL OR cardinality(NEW.update_times) = 0 THEN
+        NEW.update_times := metric_tracker_default_update_times(NEW.update_frequency);
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_normalize_metric_tracker_update_times ON metric_trackers;
+CREATE TRIGGER trg_normalize_metric_tracker_update_times
+    BEFORE INSERT OR UPDATE OF update_times, update_frequency ON metric_trackers
+    FOR EACH ROW
+    EXECUTE FUNCTION normalize_metric_tracker_update_times();
+
+-- 4단계: 활성 tracker의 수집 시간 GIN 인덱스
+CREATE INDEX IF NOT EXISTS idx_metric_trackers_active_update_times
+    ON metric_trackers USING GIN (update_times)
+    WHERE is_active = true;
+
+-- 5단계: 수집 대상 조회 함수
+DROP FUNCTION IF EXISTS get_due_metric_trackers(INTEGER);
+
+CREATE OR REPLACE FUNCTION get_due_metric_trackers(p_hour INTEGER)
+RETURNS TABLE (
+    id UUID,
+    user_id UUID,
+    store_id UUID,
+    keyword_id UUID,
+    update_frequency TEXT,
+    update_times INTEGER[],
+    notification_enabled BOOLEAN,
+    notification_type TEXT,
+    notification_consent BOOLEAN,
+    notification_phone TEXT,
+    notification_email TEXT,
+    is_active BOOLEAN,
+    last_collected_at TIMESTAMPTZ,
+    next_collection_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    stores JSONB,
+    keywords JSONB
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        mt.id,
+        mt.user_id,
+        mt.store_id,
+        mt.keyword_id,
+        mt.update_frequency,
+        mt.update_times,
+        mt.notification_enabled,
+        mt.notification_type,
+        mt.notification_consent,
+        mt.notification_phone,
+        mt.notification_email,
+        mt.is_active,
+        mt.last_collected_at,
+        mt.next_collection_at,
+        mt.created_at,
+        mt.updated_at,
+        CASE WHEN s.id IS NULL THEN NULL ELSE jsonb_build_object(
+            'store_name', s.store_name,
+            'place_id', s.place_id,
+            'platform', s.platform,
+            'place_x', s.place_x,
+            'place_y', s.place_y,
+            'category', s.category
+        ) END,
+        CASE WHEN k.id IS NULL THEN NULL ELSE jsonb_build_object(
+            'keyword', k.keyword
+        ) END
+    FROM metric_trackers mt
+    LEFT JOIN stores s ON mt.store_id = s.id
+    LEFT JOIN keywords k ON mt.keyword_id = k.id
+    WHERE mt.is_active = true
+      AND mt.update_times @> ARRAY[p_hour];
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION get_due_metric_trackers(INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_due_metric_trackers(INTEGER) TO service_role;
+
+COMMENT ON FUNCTION get_due_metric_trackers(INTEGER) IS
+'p_hour(KST)에 수집해야 할 활성 metric_trackers 조회 (stores/keywords 포함, 스케줄러 전용)';
+COMMENT ON INDEX idx_metric_trackers_active_update_times IS
+'get_due_metric_trackers의 update_times @> ARRAY[hour] 조회용';
@@ -0,0 +1,120 @@
+-- ========================================
+-- tracker 목록 + 최신 지표 2개 조회 (대시보드 목록용)
+-- ========================================
+-- 목적: get_all_trackers가 사용자의 모든 tracker에 대해 최근 30일 daily_metrics를
+--       select('*')로 전부 가져와 Python에서 그룹화/정렬하던 것을 1회 RPC로 대체
+-- - tracker별 최신 2개만 LATERAL + LIMIT 2로 조회
+--   (UNIQUE(tracker_id, collection_date) 인덱스를 역순 스캔 → 이력 길이와 무관)
+-- - 목록 화면에 필요한 컬럼만 반환 (최신 순위/리뷰 수 + 전일 대비 변동)
+-- ========================================
+
+DROP FUNCTION IF EXISTS get_metric_trackers_with_latest_metrics(UUID, DATE);
+
+CREATE OR REPLACE FUNCTION get_metric_trackers_with_latest_metrics(
+    p_user_id UUID,
+    p_cutoff_date DATE DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    user_id UUID,
+    store_id UUID,
+    keyword_id UUID,
+    update_frequency TEXT,
+    update_times INTEGER[],
+    notification_enabled BOOLEAN,
+    notification_type TEXT,
+    notification_consent BOOLEAN,
+    notification_phone TEXT,
+    notification_email TEXT,
+    is_active BOOLEAN,
+    last_collected_at TIMESTAMPTZ,
+    next_collection_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    store_name TEXT,
+    platform TEXT,
+    keyword TEXT,
+    latest_rank INTEGER,
+    rank_change INTEGER,
+    visitor_review_count INTEGER,
+    blog_review_count INTEGER,
+    visitor_review_change INTEGER,
+    blog_review_change INTEGER
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        mt.id,
+        mt.user_id,
+        mt.store_id,
+        mt.keyword_id,
+        mt.update_frequency,
+        mt.update_times,
+        mt.notification_enabled,
+        mt.notification_type,
+        mt.notification_consent,
+        mt.notification_phone,
+        mt.notification_email,
+        mt.is_active,
+        mt.last_collected_at,
+        mt.next_collection_at,
+        mt.created_at,
+        mt.updated_at,
+        s.store_name,
+        s.platform,
+        k.keyword,
+        lm.latest_rank,
+        lm.rank_change,
+        lm.visitor_review_count,
+        lm.blog_review_count,
+        lm.visitor_review_change,
+        lm.blog_review_change
+    FROM metric_trackers mt
+    LEFT JOIN stores s ON mt.store_id = s.id
+    LEFT JOIN keywords k ON mt.keyword_id = k.id
+    LEFT JOIN LATERAL (
+        SELECT
+            MAX(dm.rank) FILTER (WHERE dm.rn = 1) AS latest_rank,
+            MAX(dm.rank_change) FILTER (WHERE dm.rn = 1) AS rank_change,
+            MAX(dm.visitor_review_count) FILTER (WHERE dm.rn = 1) AS visitor_review_count,
+            MAX(dm.blog_review_count) FILTER (WHERE dm.rn = 1) AS blog_review_count,
+            CASE WHEN COUNT(*) > 1 THEN
+                COALESCE(MAX(dm.visitor_review_count) FILTER (WHERE dm.rn = 1), 0) -
+                COALESCE(MAX(dm.visitor_review_count) FILTER (WHERE dm.rn = 2), 0)
+            END AS visitor_review_change,
+            CASE WHEN COUNT(*) > 1 THEN
+                COALESCE(MAX(dm.blog_review_count) FILTER (WHERE dm.rn = 1), 0) -
+                COALESCE(MAX(dm.blog_review_count) FILTER (WHERE dm.rn = 2), 0)
+            END AS blog_review_change
+        FROM (
+            SELECT
+                d.rank,
+                d.rank_change,
+                d.visitor_review_count,
+                d.blog_review_count,
+                ROW_NUMBER() OVER (ORDER BY d.collection_date DESC, d.collected_at DESC) AS rn
+            FROM (
+                SELECT *
+                FROM daily_metrics
+                WHERE daily_metrics.tracker_id = mt.id
+                  AND (p_cutoff_date IS NULL OR daily_metrics.collection_date >= p_cutoff_date)
+                ORDER BY daily_metrics.collection_date DESC, daily_metrics.collected_at DESC
+                LIMIT 2
+            ) d
+        ) dm
+        HAVING COUNT(*) > 0
+    ) lm ON true
+    WHERE mt.user_id = p_user_id
+    ORDER BY mt.created_at DESC;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION get_metric_trackers_with_latest_metrics(UUID, DATE) TO service_role;
+GRANT EXECUTE ON FUNCTION get_metric_trackers_with_latest_metrics(UUID, DATE) TO authenticated;
+
+COMMENT ON FUNCTION get_metric_trackers_with_latest_metrics(UUID, DATE) IS
+'사용자의 metric_trackers + tracker별 최신 지표/전일 대비 변동 (최신 2개 daily_metrics만 조회, RLS 우회)';
@@ -0,0 +1,157 @@
+-- ========================================
+-- 주요지표 주간/월간 롤업 테이블
+-- ========================================
+-- 목적: 6~12개월 차트가 daily_metrics 원본 행 수천 개를 전송/렌더링하지 않도록
+--       주(월요일 시작)/월 단위 요약을 미리 저장
+-- - collect_metrics가 저장할 때마다 해당 날짜가 속한 주/월만 재계산 (증분 갱신)
+-- - 순위: min / avg / max / 마지막 값
+-- - 리뷰 수: 기간 첫 값 / 마지막 값 / 증감
+-- ========================================
+
+-- 1단계: 롤업 테이블
+CREATE TABLE IF NOT EXISTS daily_metric_rollups (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  tracker_id UUID NOT NULL REFERENCES metric_trackers(id) ON DELETE CASCADE,
+  keyword_id UUID NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+  store_id UUID NOT NULL REFERENCES stores(id) ON DELETE CASCADE,
+
+  resolution TEXT NOT NULL CHECK (resolution IN ('weekly', 'monthly')),
+  period_start DATE NOT NULL,
+  period_end DATE NOT NULL,
+  sample_count INTEGER NOT NULL DEFAULT 0, -- 기간 내 수집 일수
+
+  -- 순위 (순위권 밖(NULL)은 제외하고 계산)
+  min_rank INTEGER,
+  max_rank INTEGER,
+  avg_rank NUMERIC(8, 2),
+  last_rank INTEGER,
+
+  -- 리뷰 수
+  first_visitor_review_count INTEGER,
+  last_visitor_review_count INTEGER,
+  visitor_review_delta INTEGER,
+  first_blog_review_count INTEGER,
+  last_blog_review_count INTEGER,
+  blog_review_delta INTEGER,
+
+  last_collection_date DATE,
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  UNIQUE(tracker_id, resolution, period_start)
+);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE daily_metric_rollups ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 롤업 재계산 함수 (지정 tracker들의 p_date가 속한 주/월)
+CREATE OR REPLACE FUNCTION refresh_daily_metric_rollups(
+    p_tracker_ids UUID[],
+    p_date DATE
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_count INTEGER := 0;
+    v_rows INTEGER;
+    v_resolution TEXT;
+    v_period_start DATE;
+    v_period_end DATE;
+BEGIN
+    FOREACH v_resolution IN ARRAY ARRAY['weekly', 'monthly'] LOOP
+        IF v_resolution = 'weekly' THEN
+            v_period_start := date_trunc('week', p_date)::date;
+            v_period_end := v_period_start + 6;
+        ELSE
+            v_period_start := date_trunc('month', p_date)::date;
+            v_period_end := (v_period_start + INTERVAL '1 month')::date - 1;
+        END IF;
+
+        INSERT INTO daily_metric_rollups (
+            tracker_id, keyword_id, store_id, resolution, period_start, period_end,
+            sample_count, min_rank, max_rank, avg_rank, last_rank,
+            first_visitor_review_count, last_visitor_review_count, visitor_review_delta,
+            first_blog_review_count, last_blog_review_count, blog_review_delta,
+            last_collection_date, updated_at
+        )
+        SELECT
+            dm.tracker_id,
+            (array_agg(dm.keyword_id ORDER BY dm.collection_date DESC))[1],
+            (array_agg(dm.store_id ORDER BY dm.collection_date DESC))[1],
+            v_resolution,
+            v_period_start,
+            v_period_end,
+            COUNT(*),
+            MIN(dm.rank),
+            MAX(dm.rank),
+            ROUND(AVG(dm.rank), 2),
+            (array_agg(dm.rank ORDER BY dm.collection_date DESC))[1],
+            (array_agg(dm.visitor_review_count ORDER BY dm.collection_date ASC))[1],
+            (array_agg(dm.visitor_review_count ORDER BY dm.collection_date DESC))[1],
+            COALESCE((array_agg(dm.visitor_review_count ORDER BY dm.collection_date DESC))[1], 0) -
+            COALESCE((array_agg(dm.visitor_review_count ORDER BY dm.collection_date ASC))[1], 0),
+            (array_agg(dm.blog_review_count ORDER BY dm.collection_date ASC))[1],
+            (array_agg(dm.blog_review_count ORDER BY dm.collection_date DESC))[1],
+            COALESCE((array_agg(dm.blog_review_count ORDER BY dm.collection_date DESC))[1], 0) -
+            COALESCE((array_agg(dm.blog_review_count ORDER BY dm.collection_date ASC))[1], 0),
+            MAX(dm.collection_date),
+            NOW()
+        FROM daily_metrics dm
+        WHERE dm.tracker_id = ANY(p_tracker_ids)
+          AND dm.collection_date BETWEEN v_period_start AND v_period_end
+        GROUP BY dm.tracker_id
+        ON CONFLICT (tracker_id, resolution, period_start) DO UPDATE SET
+            keyword_id = EXCLUDED.keyword_id,
+            store_id = EXCLUDED.store_id,
+            period_end = EXCLUDED.period_end,
+            sample_count = EXCLUDED.sample_count,
+            min_rank = EXCLUDED.min_rank,
+            max_rank = EXCLUDED.max_rank,
+            avg_rank = EXCLUDED.avg_rank,
+            last_rank = EXCLUDED.last_rank,
+            first_visitor_review_count = EXCLUDED.first_visitor_review_count,
+            last_visitor_review_count = EXCLUDED.last_visitor_review_count,
+            visitor_review_delta = EXCLUDED.visitor_review_delta,
+            first_blog_review_count = EXCLUDED.first_blog_review_count,
+            last_blog_review_count = EXCLUDED.last_blog_review_count,
+            blog_review_delta = EXCLUDED.blog_review_delta,
+            last_collection_date = EXCLUDED.last_collection_date,
+            updated_at = EXCLUDED.updated_at;
+
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+        v_count := v_count + v_rows;
+    END LOOP;
+
+    RETURN v_count;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_daily_metric_rollups(UUID[], DATE) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_daily_metric_rollups(UUID[], DATE) TO service_role;
+
+COMMENT ON FUNCTION refresh_daily_metric_rollups(UUID[], DATE) IS
+'지정 tracker들의 p_date가 속한 주/월 롤업 재계산 (collect_metrics 저장 후 호출)';
+
+-- 3단계: 기존 이력 백필 (tracker × 수집된 모든 주/월)
+DO $$
+DECLARE
+    v_date DATE;
+BEGIN
+    FOR v_date IN
+        SELECT DISTINCT date_trunc('week', collection_date)::date FROM daily_metrics
+        UNION
+        SELECT DISTINCT date_trunc('month', collection_date)::date FROM daily_metrics
+    LOOP
+        PERFORM refresh_daily_metric_rollups(
+            ARRAY(
+                SELECT DISTINCT tracker_id FROM daily_metrics
+                WHERE collection_date BETWEEN v_date AND v_date + 31
+            ),
+            v_date
+        );
+    END LOOP;
+END;
+$$;
+
+COMMENT ON TABLE daily_metric_rollups IS 'daily_metrics 주간/월간 요약 (장기 차트용, collect_metrics가 증분 갱신)';
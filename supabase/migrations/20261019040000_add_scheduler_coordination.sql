@@ -0,0 +1,251 @@
+-- ========================================
+-- 스케줄러 조정 (리더 선출 리스 + 작업 실행 기록)
+-- ========================================
+-- 목적: API 워커를 여러 개 띄워도 cron 작업(정기결제, 순위 확인, 리뷰 수집, 주요지표 수집)이
+--       중복 실행되지 않도록 Postgres에서 조정
+-- - scheduler_leases: 리더 리스 (만료 시각이 지나면 다른 워커가 가져감, 가져갈 때마다 fencing_token 증가)
+--   ※ PostgREST는 요청마다 커넥션이 바뀌어 세션 단위 advisory lock을 유지할 수 없으므로 리스 테이블 사용
+-- - scheduler_workers: 워커 생존 신호 (샤드 분배 시 살아있는 워커 수 계산)
+-- - scheduler_job_runs: 작업(샤드) 단위 실행 기록 (run_key 유일)
+--   → 같은 run_key는 한 워커만 claim 가능
+--   → 실행 중 워커가 죽어 heartbeat가 끊기면 리더가 다시 claim해서 재실행 (failover)
+-- ========================================
+
+-- 1단계: 테이블
+CREATE TABLE IF NOT EXISTS scheduler_leases (
+  name TEXT PRIMARY KEY,
+  holder TEXT NOT NULL,
+  fencing_token BIGINT NOT NULL DEFAULT 1,
+  acquired_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  renewed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS scheduler_workers (
+  worker_id TEXT PRIMARY KEY,
+  role TEXT,
+  started_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  last_seen_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+  run_key TEXT PRIMARY KEY,            -- 예: check_ranks:2026-10-19:3/16
+  job_id TEXT NOT NULL,
+  holder TEXT NOT NULL,
+  status TEXT NOT NULL DEFAULT 'running' CHECK (status IN ('running', 'completed', 'failed')),
+  attempts INTEGER NOT NULL DEFAULT 1,
+  meta JSONB NOT NULL DEFAULT '{}'::jsonb,   -- period, shard, shard_count, mode
+  detail JSONB,
+  started_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  heartbeat_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  finished_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_job_runs_running
+  ON scheduler_job_runs(heartbeat_at)
+  WHERE status = 'running';
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_job_runs_started
+  ON scheduler_job_runs(started_at DESC);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE scheduler_leases ENABLE ROW LEVEL SECURITY;
+ALTER TABLE scheduler_workers ENABLE ROW LEVEL SECURITY;
+ALTER TABLE scheduler_job_runs ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 리스 획득/갱신 (만료되었거나 내가 보유 중일 때만 성공, 현재 보유자 반환)
+CREATE OR REPLACE FUNCTION acquire_scheduler_lease(
+    p_name TEXT,
+    p_holder TEXT,
+    p_ttl_seconds INTEGER
+)
+RETURNS TABLE (holder TEXT, fencing_token BIGINT, expires_at TIMESTAMP WITH TIME ZONE)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    INSERT INTO scheduler_leases AS l (name, holder, fencing_token, acquired_at, renewed_at, expires_at)
+    VALUES (p_name, p_holder, 1, NOW(), NOW(), NOW() + make_interval(secs => p_ttl_seconds))
+    ON CONFLICT (name) DO UPDATE SET
+        holder = EXCLUDED.holder,
+        fencing_token = CASE WHEN l.holder = EXCLUDED.holder THEN l.fencing_token ELSE l.fencing_token + 1 END,
+        acquired_at = CASE WHEN l.holder = EXCLUDED.holder THEN l.acquired_at ELSE NOW() END,
+        renewed_at = NOW(),
+        expires_at = EXCLUDED.expires_at
+    WHERE l.holder = EXCLUDED.holder OR l.expires_at < NOW();
+
+    RETURN QUERY
+    SELECT l.holder, l.fencing_token, l.expires_at
+    FROM scheduler_leases l
+    WHERE l.name = p_name;
+END;
+$$;
+
+-- 3단계: 리스 반납 (정상 종료 시 다음 워커가 TTL을 기다리지 않고 바로 리더가 되도록)
+CREATE OR REPLACE FUNCTION release_scheduler_lease(
+    p_name TEXT,
+    p_holder TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    UPDATE scheduler_leases
+    SET expires_at = NOW()
+    WHERE name = p_name AND holder = p_holder;
+    RETURN FOUND;
+END;
+$$;
+
+-- 4단계: 워커 생존 신호 + 살아있는 워커 수 반환 (오래된 워커 행은 정리)
+CREATE OR REPLACE FUNCTION heartbeat_scheduler_worker(
+    p_worker_id TEXT,
+    p_role TEXT,
+    p_ttl_seconds INTEGER
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    INSERT INTO scheduler_workers (worker_id, role, started_at, last_seen_at)
+    VALUES (p_worker_id, p_role, NOW(), NOW())
+    ON CONFLICT (worker_id) DO UPDATE SET last_seen_at = NOW(), role = EXCLUDED.role;
+
+    DELETE FROM scheduler_workers
+    WHERE last_seen_at < NOW() - INTERVAL '1 day';
+
+    SELECT COUNT(*) INTO v_count
+    FROM scheduler_workers
+    WHERE last_seen_at >= NOW() - make_interval(secs => p_ttl_seconds);
+
+    RETURN v_count;
+END;
+$$;
+
+-- 5단계: 작업 실행 claim
+-- 새 run_key면 생성, 이미 있으면 running 상태이면서 heartbeat가 p_stale_seconds 이상 끊긴 경우에만 인수
+-- (completed / failed는 다시 claim하지 않음)
+CREATE OR REPLACE FUNCTION claim_scheduler_run(
+    p_run_key TEXT,
+    p_job_id TEXT,
+    p_holder TEXT,
+    p_stale_seconds INTEGER,
+    p_meta JSONB DEFAULT '{}'::jsonb
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_claimed BOOLEAN;
+BEGIN
+    INSERT INTO scheduler_job_runs AS r (run_key, job_id, holder, status, meta, started_at, heartbeat_at)
+    VALUES (p_run_key, p_job_id, p_holder, 'running', COALESCE(p_meta, '{}'::jsonb), NOW(), NOW())
+    ON CONFLICT (run_key) DO UPDATE SET
+        holder = EXCLUDED.holder,
+        attempts = r.attempts + 1,
+        meta = r.meta || EXCLUDED.meta,
+        started_at = NOW(),
+        heartbeat_at = NOW()
+    WHERE r.status = 'running'
+      AND r.heartbeat_at < NOW() - make_interval(secs => p_stale_seconds)
+    RETURNING TRUE INTO v_claimed;
+
+    RETURN COALESCE(v_claimed, FALSE);
+END;
+$$;
+
+-- 6단계: 실행 중 heartbeat (다른 워커가 인수했으면 FALSE)
+CREATE OR REPLACE FUNCTION heartbeat_scheduler_runs(
+    p_run_keys TEXT[],
+    p_holder TEXT
+)
+RETURNS TEXT[]
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_kept TEXT[];
+BEGIN
+    WITH updated AS (
+        UPDATE scheduler_job_runs
+        SET heartbeat_at = NOW()
+        WHERE run_key = ANY(p_run_keys)
+          AND holder = p_holder
+          AND status = 'running'
+        RETURNING run_key
+    )
+    SELECT COALESCE(array_agg(run_key), ARRAY[]::TEXT[]) INTO v_kept FROM updated;
+    RETURN v_kept;
+END;
+$$;
+
+-- 7단계: 실행 종료 기록
+CREATE OR REPLACE FUNCTION finish_scheduler_runs(
+    p_run_keys TEXT[],
+    p_holder TEXT,
+    p_status TEXT,
+    p_detail JSONB DEFAULT NULL
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    UPDATE scheduler_job_runs
+    SET status = p_status,
+        detail = p_detail,
+        finished_at = NOW(),
+        heartbeat_at = NOW()
+    WHERE run_key = ANY(p_run_keys)
+      AND holder = p_holder;
+    GET DIAGNOSTICS v_count = ROW_COUNT;
+
+    -- 오래된 실행 기록 정리
+    DELETE FROM scheduler_job_runs
+    WHERE started_at < NOW() - INTERVAL '14 days';
+
+    RETURN v_count;
+END;
+$$;
+
+-- 8단계: heartbeat가 끊긴 실행 목록 (리더가 인수 대상 확인)
+CREATE OR REPLACE FUNCTION get_stale_scheduler_runs(
+    p_stale_seconds INTEGER
+)
+RETURNS SETOF scheduler_job_runs
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    SELECT *
+    FROM scheduler_job_runs
+    WHERE status = 'running'
+      AND heartbeat_at < NOW() - make_interval(secs => p_stale_seconds)
+    ORDER BY started_at;
+$$;
+
+-- 실행 권한 (SECURITY DEFINER → 기본 PUBLIC 실행 권한 회수, 백엔드 Service Role만 호출)
+REVOKE EXECUTE ON FUNCTION acquire_scheduler_lease(TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION release_scheduler_lease(TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION heartbeat_scheduler_worker(TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION claim_scheduler_run(TEXT, TEXT, TEXT, INTEGER, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION heartbeat_scheduler_runs(TEXT[], TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION finish_scheduler_runs(TEXT[], TEXT, TEXT, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION get_stale_scheduler_runs(INTEGER) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION acquire_scheduler_lease(TEXT, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION release_scheduler_lease(TEXT, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION heartbeat_scheduler_worker(TEXT, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION claim_scheduler_run(TEXT, TEXT, TEXT, INTEGER, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION heartbeat_scheduler_runs(TEXT[], TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION finish_scheduler_runs(TEXT[], TEXT, TEXT, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION get_stale_scheduler_runs(INTEGER) TO service_role;
+
+COMMENT ON TABLE scheduler_leases IS '스케줄러 리더 리스 (만료 시 다른 워커가 인수, fencing_token은 리더가 바뀔 때마다 증가)';
+COMMENT ON TABLE scheduler_job_runs IS '스케줄러 작업/샤드 실행 기록 (run_key 단위 claim, heartbeat 끊기면 리더가 재실행)';
@@ -0,0 +1,235 @@
+-- ========================================
+-- 백그라운드 작업 큐 (긴 분석 작업의 비동기 실행)
+-- ========================================
+-- 목적: 타겟 키워드 분석 / 경쟁매장 전체 분석 / 완전 진단 / 플레이스 활성화처럼
+--       20~90초 걸리는 분석을 HTTP 요청 밖에서 실행
+-- - API는 작업을 등록하고 202 + job_id를 즉시 반환 (?async=true)
+-- - 워커(WORKER_ROLE=all / worker)가 claim → 실행 → 진행률 / 결과 저장
+-- - 클라이언트는 GET /api/v1/jobs/{job_id} (또는 /events SSE)로 진행률 / 결과 조회 (재접속 가능)
+-- - 같은 (user_id, kind, idempotency_key)는 기존 작업을 반환 (Idempotency-Key 헤더)
+-- - 워커가 죽으면 lease 만료 후 다른 워커가 재실행 (max_attempts까지)
+-- ========================================
+
+-- 1단계: 작업 테이블
+CREATE TABLE IF NOT EXISTS background_jobs (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id UUID REFERENCES profiles(id) ON DELETE CASCADE,
+  kind TEXT NOT NULL,                 -- target_keyword_analysis / competitor_analysis / place_diagnosis / place_activation
+  idempotency_key TEXT,
+  status TEXT NOT NULL DEFAULT 'queued'
+    CHECK (status IN ('queued', 'running', 'succeeded', 'failed', 'cancelled')),
+  params JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+  progress INTEGER NOT NULL DEFAULT 0 CHECK (progress BETWEEN 0 AND 100),
+  progress_message TEXT,
+  result JSONB,
+  error JSONB,                        -- {status_code, detail}
+
+  attempts INTEGER NOT NULL DEFAULT 0,
+  max_attempts INTEGER NOT NULL DEFAULT 2,
+  worker_id TEXT,
+  lease_expires_at TIMESTAMP WITH TIME ZONE,
+  cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  started_at TIMESTAMP WITH TIME ZONE,
+  finished_at TIMESTAMP WITH TIME ZONE,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_background_jobs_idempotency
+  ON background_jobs(user_id, kind, idempotency_key)
+  WHERE idempotency_key IS NOT NULL;
+
+-- 워커 claim용 (대기 / 실행 중인 작업만)
+CREATE INDEX IF NOT EXISTS idx_background_jobs_pending
+  ON background_jobs(created_at)
+  WHERE status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_background_jobs_user
+  ON background_jobs(user_id, created_at DESC);
+
+-- 백엔드(Service Role) 전용 테이블 (사용자 조회는 API에서 소유자 확인 후 반환)
+ALTER TABLE background_jobs ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 작업 등록 (멱등 키가 같으면 기존 작업 반환)
+CREATE OR REPLACE FUNCTION enqueue_background_job(
+    p_user_id UUID,
+    p_kind TEXT,
+    p_params JSONB,
+    p_idempotency_key TEXT DEFAULT NULL,
+    p_max_attempts INTEGER DEFAULT 2
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_job background_jobs;
+BEGIN
+    INSERT INTO background_jobs (user_id, kind, idempotency_key, params, max_attempts)
+    VALUES (p_user_id, p_kind, p_idempotency_key, COALESCE(p_params, '{}'::jsonb), p_max_attempts)
+    ON CONFLICT (user_id, kind, idempotency_key) WHERE idempotency_key IS NOT NULL DO NOTHING
+    RETURNING * INTO v_job;
+
+    IF v_job.id IS NOT NULL THEN
+        RETURN jsonb_build_object('job', to_jsonb(v_job), 'created', TRUE);
+    END IF;
+
+    SELECT * INTO v_job
+    FROM background_jobs
+    WHERE user_id = p_user_id
+      AND kind = p_kind
+      AND idempotency_key = p_idempotency_key;
+
+    RETURN jsonb_build_object('job', to_jsonb(v_job), 'created', FALSE);
+END;
+$$;
+
+-- 3단계: 작업 claim (대기 중이거나 lease가 만료된 실행 중 작업, 여러 워커가 동시에 호출해도 1개씩)
+CREATE OR REPLACE FUNCTION claim_background_job(
+    p_worker_id TEXT,
+    p_kinds TEXT[],
+    p_lease_seconds INTEGER
+)
+RETURNS SETOF background_jobs
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    -- 재시도 횟수를 다 쓴 채 워커가 사라진 작업은 실패 처리
+    UPDATE background_jobs
+    SET status = 'failed',
+        error = jsonb_build_object('status_code', 500, 'detail', '작업을 처리하던 워커가 중단되었습니다'),
+        finished_at = NOW(),
+        updated_at = NOW()
+    WHERE status = 'running'
+      AND lease_expires_at < NOW()
+      AND attempts >= max_attempts;
+
+    RETURN QUERY
+    UPDATE background_jobs j
+    SET status = 'running',
+        worker_id = p_worker_id,
+        attempts = j.attempts + 1,
+        started_at = COALESCE(j.started_at, NOW()),
+        lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        updated_at = NOW()
+    WHERE j.id = (
+        SELECT id
+        FROM background_jobs
+        WHERE kind = ANY(p_kinds)
+          AND NOT cancel_requested
+          AND (
+            status = 'queued'
+            OR (status = 'running' AND lease_expires_at < NOW() AND attempts < max_attempts)
+          )
+        ORDER BY created_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING j.*;
+END;
+$$;
+
+-- 4단계: lease 연장 + 진행률 (FALSE: 다른 워커가 인수했거나 취소 요청됨 → 실행 중단)
+CREATE OR REPLACE FUNCTION heartbeat_background_job(
+    p_job_id UUID,
+    p_worker_id TEXT,
+    p_lease_seconds INTEGER,
+    p_progress INTEGER DEFAULT NULL,
+    p_message TEXT DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_cancel BOOLEAN;
+BEGIN
+    UPDATE background_jobs
+    SET lease_expires_at = NOW() + make_interval(secs => p_lease_seconds),
+        progress = COALESCE(p_progress, progress),
+        progress_message = COALESCE(p_message, progress_message),
+        updated_at = NOW()
+    WHERE id = p_job_id
+      AND worker_id = p_worker_id
+      AND status = 'running'
+    RETURNING cancel_requested INTO v_cancel;
+
+    RETURN FOUND AND NOT v_cancel;
+END;
+$$;
+
+-- 5단계: 작업 종료 (결과 / 오류 저장) + 오래된 작업 정리
+CREATE OR REPLACE FUNCTION finish_background_job(
+    p_job_id UUID,
+    p_worker_id TEXT,
+    p_status TEXT,
+    p_result JSONB DEFAULT NULL,
+    p_error JSONB DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_found BOOLEAN;
+BEGIN
+    UPDATE background_jobs
+    SET status = p_status,
+        result = p_result,
+        error = p_error,
+        progress = CASE WHEN p_status = 'succeeded' THEN 100 ELSE progress END,
+        lease_expires_at = NULL,
+        finished_at = NOW(),
+        updated_at = NOW()
+    WHERE id = p_job_id
+      AND worker_id = p_worker_id
+      AND status = 'running';
+    v_found := FOUND;
+
+    DELETE FROM background_jobs
+    WHERE finished_at < NOW() - INTERVAL '7 days';
+
+    RETURN v_found;
+END;
+$$;
+
+-- 6단계: 취소 (대기 중이면 즉시 취소, 실행 중이면 취소 요청 → 워커가 다음 heartbeat에서 중단)
+CREATE OR REPLACE FUNCTION cancel_background_job(
+    p_job_id UUID,
+    p_user_id UUID
+)
+RETURNS SETOF background_jobs
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    RETURN QUERY
+    UPDATE background_jobs
+    SET cancel_requested = TRUE,
+        status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE status END,
+        finished_at = CASE WHEN status = 'queued' THEN NOW() ELSE finished_at END,
+        updated_at = NOW()
+    WHERE id = p_job_id
+      AND user_id = p_user_id
+      AND status IN ('queued', 'running')
+    RETURNING *;
+END;
+$$;
+
+-- 실행 권한 (SECURITY DEFINER → 기본 PUBLIC 실행 권한 회수, 백엔드 Service Role만 호출)
+REVOKE EXECUTE ON FUNCTION enqueue_background_job(UUID, TEXT, JSONB, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION claim_background_job(TEXT, TEXT[], INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION heartbeat_background_job(UUID, TEXT, INTEGER, INTEGER, TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION finish_background_job(UUID, TEXT, TEXT, JSONB, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION cancel_background_job(UUID, UUID) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION enqueue_background_job(UUID, TEXT, JSONB, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION claim_background_job(TEXT, TEXT[], INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION heartbeat_background_job(UUID, TEXT, INTEGER, INTEGER, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION finish_background_job(UUID, TEXT, TEXT, JSONB, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION cancel_background_job(UUID, UUID) TO service_role;
+
+COMMENT ON TABLE background_jobs IS '긴 분석 작업 큐 (202 비동기 모드, 진행률 / 결과 저장, 멱등 키, lease 기반 재실행)';
@@ -0,0 +1,216 @@
+-- ========================================
+-- 크레딧 예약 (reserve → commit / release)
+-- ========================================
+-- 목적: 유료 기능이 check_sufficient_credits(작업 전) + deduct_user_credits(작업 후) 두 번 호출하던 것을
+--       예약 → 확정 / 해제 프로토콜로 교체
+-- - reserve_user_credits: user_credits 행을 잠그고 (잔액 - 진행 중인 예약) >= 필요 크레딧이면 예약 생성
+--   → 같은 사용자의 동시 요청이 같은 잔액을 두 번 통과하지 못함 (race-free)
+-- - commit_credit_reservation: 작업 성공 시 실제 차감 (deduct_user_credits 재사용) + 차감 후 잔액 반환
+--   → 백엔드는 반환된 잔액으로 잔액 캐시를 갱신 (UI 배지용 user_credits 재조회 불필요)
+-- - release_credit_reservation: 작업 실패 시 예약 해제
+-- - 해제되지 않은 예약은 expires_at이 지나면 잔액 계산에서 제외 (워커가 죽어도 크레딧이 묶이지 않음)
+-- ========================================
+
+-- 1단계: 예약 테이블
+CREATE TABLE IF NOT EXISTS credit_reservations (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id UUID NOT NULL REFERENCES auth.users(id) ON DELETE CASCADE,
+  feature TEXT NOT NULL,
+  credits_amount INTEGER NOT NULL CHECK (credits_amount >= 0),
+  status TEXT NOT NULL DEFAULT 'reserved'
+    CHECK (status IN ('reserved', 'committed', 'released')),
+  metadata JSONB NOT NULL DEFAULT '{}'::jsonb,
+  transaction_id UUID REFERENCES credit_transactions(id) ON DELETE SET NULL,
+  expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  finished_at TIMESTAMP WITH TIME ZONE
+);
+
+-- 잔액 계산용 (진행 중인 예약만)
+CREATE INDEX IF NOT EXISTS idx_credit_reservations_active
+  ON credit_reservations(user_id, expires_at)
+  WHERE status = 'reserved';
+
+CREATE INDEX IF NOT EXISTS idx_credit_reservations_user_created
+  ON credit_reservations(user_id, created_at);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE credit_reservations ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 예약 (check_sufficient_credits와 같은 형식 + reservation_id / credits)
+-- 잔액 부족이면 예약하지 않고 reservation_id = NULL 반환, user_credits 레코드가 없으면 NULL 반환
+CREATE OR REPLACE FUNCTION reserve_user_credits(
+    p_user_id UUID,
+    p_feature TEXT,
+    p_credits_amount INTEGER,
+    p_ttl_seconds INTEGER DEFAULT 600,
+    p_metadata JSONB DEFAULT '{}'
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_credits user_credits;
+    v_held INTEGER;
+    v_available INTEGER;
+    v_sufficient BOOLEAN;
+    v_reservation_id UUID;
+BEGIN
+    -- 같은 사용자의 예약 / 확정을 직렬화
+    SELECT * INTO v_credits
+    FROM user_credits
+    WHERE user_id = p_user_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    -- 오래된 예약 정리 (확정 / 해제 / 만료 후 하루)
+    DELETE FROM credit_reservations
+    WHERE user_id = p_user_id
+      AND created_at < NOW() - INTERVAL '1 day';
+
+    -- God tier는 무제한 (확정 시 0 크레딧 트랜잭션만 기록)
+    IF v_credits.tier = 'god' THEN
+        INSERT INTO credit_reservations (user_id, feature, credits_amount, metadata, expires_at)
+        VALUES (p_user_id, p_feature, 0, COALESCE(p_metadata, '{}'::jsonb), NOW() + make_interval(secs => p_ttl_seconds))
+        RETURNING id INTO v_reservation_id;
+
+        RETURN jsonb_build_object(
+            'sufficient', true,
+            'current_credits', -1,
+            'required_credits', p_credits_amount,
+            'shortage', 0,
+            'is_god_tier', true,
+            'reservation_id', v_reservation_id,
+            'credits', to_jsonb(v_credits)
+        );
+    END IF;
+
+    -- 진행 중인 예약만큼 잔액에서 제외
+    SELECT COALESCE(SUM(credits_amount), 0) INTO v_held
+    FROM credit_reservations
+    WHERE user_id = p_user_id
+      AND status = 'reserved'
+      AND expires_at > NOW();
+
+    v_available := v_credits.total_remaining - v_held;
+    v_sufficient := v_available >= p_credits_amount;
+
+    IF v_sufficient THEN
+        INSERT INTO credit_reservations (user_id, feature, credits_amount, metadata, expires_at)
+        VALUES (p_user_id, p_feature, p_credits_amount, COALESCE(p_metadata, '{}'::jsonb), NOW() + make_interval(secs => p_ttl_seconds))
+        RETURNING id INTO v_reservation_id;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'sufficient', v_sufficient,
+        'current_credits', v_available,
+        'monthly_remaining', v_credits.monthly_remaining,
+        'manual_credits', v_credits.manual_credits,
+        'required_credits', p_credits_amount,
+        'shortage', CASE WHEN v_sufficient THEN 0 ELSE p_credits_amount - v_available END,
+        'tier', v_credits.tier,
+        'next_reset', v_credits.next_reset_at,
+        'is_god_tier', false,
+        'reservation_id', v_reservation_id,
+        'credits', to_jsonb(v_credits)
+    );
+END;
+$$;
+
+-- 3단계: 확정 (실제 차감, p_credits_amount가 NULL이면 예약한 크레딧만큼)
+-- 예약 시간이 지나 만료된 예약도 확정 가능 (작업이 오래 걸린 경우, 잔액 부족이면 deduct_user_credits가 예외)
+CREATE OR REPLACE FUNCTION commit_credit_reservation(
+    p_reservation_id UUID,
+    p_credits_amount INTEGER DEFAULT NULL,
+    p_metadata JSONB DEFAULT '{}'
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_user_id UUID;
+    v_reservation credit_reservations;
+    v_transaction_id UUID;
+    v_credits user_credits;
+BEGIN
+    SELECT user_id INTO v_user_id
+    FROM credit_reservations
+    WHERE id = p_reservation_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Credit reservation not found: %', p_reservation_id;
+    END IF;
+
+    -- reserve_user_credits와 같은 순서로 잠금 (user_credits → credit_reservations)
+    PERFORM 1 FROM user_credits WHERE user_id = v_user_id FOR UPDATE;
+
+    SELECT * INTO v_reservation
+    FROM credit_reservations
+    WHERE id = p_reservation_id
+    FOR UPDATE;
+
+    IF v_reservation.status <> 'reserved' THEN
+        RAISE EXCEPTION 'Credit reservation already %: %', v_reservation.status, p_reservation_id;
+    END IF;
+
+    v_transaction_id := deduct_user_credits(
+        v_reservation.user_id,
+        v_reservation.feature,
+        COALESCE(p_credits_amount, v_reservation.credits_amount),
+        v_reservation.metadata || COALESCE(p_metadata, '{}'::jsonb) || jsonb_build_object('reservation_id', p_reservation_id)
+    );
+
+    UPDATE credit_reservations
+    SET status = 'committed',
+        transaction_id = v_transaction_id,
+        finished_at = NOW()
+    WHERE id = p_reservation_id;
+
+    SELECT * INTO v_credits
+    FROM user_credits
+    WHERE user_id = v_reservation.user_id;
+
+    RETURN jsonb_build_object(
+        'transaction_id', v_transaction_id,
+        'credits', to_jsonb(v_credits)
+    );
+END;
+$$;
+
+-- 4단계: 해제 (작업 실패 / 취소, 이미 확정 / 해제된 예약이면 FALSE)
+CREATE OR REPLACE FUNCTION release_credit_reservation(
+    p_reservation_id UUID
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    UPDATE credit_reservations
+    SET status = 'released',
+        finished_at = NOW()
+    WHERE id = p_reservation_id
+      AND status = 'reserved';
+
+    RETURN FOUND;
+END;
+$$;
+
+-- 실행 권한 (SECURITY DEFINER → 기본 PUBLIC 실행 권한 회수, 백엔드 Service Role만 호출)
+REVOKE EXECUTE ON FUNCTION reserve_user_credits(UUID, TEXT, INTEGER, INTEGER, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION commit_credit_reservation(UUID, INTEGER, JSONB) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION release_credit_reservation(UUID) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION reserve_user_credits(UUID, TEXT, INTEGER, INTEGER, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION commit_credit_reservation(UUID, INTEGER, JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION release_credit_reservation(UUID) TO service_role;
+
+COMMENT ON TABLE credit_reservations IS '크레딧 예약 (작업 전 확보 → 성공 시 확정 / 실패 시 해제, 만료된 예약은 잔액 계산에서 제외)';
+COMMENT ON FUNCTION reserve_user_credits IS '크레딧 예약 (잔액 확인 + 확보를 원자적으로)';
+COMMENT ON FUNCTION commit_credit_reservation IS '크레딧 예약 확정 (실제 차감, 차감 후 잔액 반환)';
+COMMENT ON FUNCTION release_credit_reservation IS '크레딧 예약 해제';
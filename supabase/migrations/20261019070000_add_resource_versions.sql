@@ -0,0 +1,112 @@
+-- ========================================
+-- 리소스 버전 카운터 (대시보드 조회 API의 ETag / 304 Not Modified)
+-- ========================================
+-- 목적: 대시보드가 주기적으로 호출하는 조회 API(매장 목록, 주요지표 추적 목록, 리뷰 통계,
+--       읽지 않은 알림 수, 진단 히스토리)가 데이터가 그대로여도 매번 전체 조회 + 직렬화하던 것을
+--       버전 확인(PK 조회 1회)으로 대체
+-- - resource_versions: scope별 버전 (예: stores:{user_id}, review_stats:{store_id}, notifications:global)
+-- - 원본 테이블의 INSERT / UPDATE / DELETE 트리거가 버전을 올림
+--   → 스케줄러 / 다른 워커 / 관리자 화면 등 어디서 쓰든 버전이 바뀜
+-- - 백엔드는 get_resource_versions로 버전을 조회해 ETag를 만들고,
+--   If-None-Match가 같으면 본문을 만들지 않고 304 반환
+-- ========================================
+
+-- 1단계: 버전 테이블
+CREATE TABLE IF NOT EXISTS resource_versions (
+  scope TEXT PRIMARY KEY,
+  version BIGINT NOT NULL DEFAULT 1,
+  updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE resource_versions ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 버전 증가
+CREATE OR REPLACE FUNCTION bump_resource_version(p_scope TEXT)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    INSERT INTO resource_versions (scope)
+    VALUES (p_scope)
+    ON CONFLICT (scope) DO UPDATE
+    SET version = resource_versions.version + 1,
+        updated_at = NOW();
+END;
+$$;
+
+-- 3단계: 버전 조회 (없는 scope는 결과에서 빠짐 → 백엔드에서 0으로 취급)
+CREATE OR REPLACE FUNCTION get_resource_versions(p_scopes TEXT[])
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+AS $$
+    SELECT COALESCE(jsonb_object_agg(scope, version), '{}'::jsonb)
+    FROM resource_versions
+    WHERE scope = ANY(p_scopes);
+$$;
+
+-- 4단계: 트리거 함수 (TG_ARGV[0]: scope 접두어, TG_ARGV[1]: scope 컬럼, 컬럼이 NULL이면 global)
+CREATE OR REPLACE FUNCTION bump_resource_version_trigger()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_new TEXT;
+    v_old TEXT;
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        v_new := COALESCE(to_jsonb(NEW) ->> TG_ARGV[1], 'global');
+        PERFORM bump_resource_version(TG_ARGV[0] || ':' || v_new);
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        v_old := COALESCE(to_jsonb(OLD) ->> TG_ARGV[1], 'global');
+        IF v_old IS DISTINCT FROM v_new THEN
+            PERFORM bump_resource_version(TG_ARGV[0] || ':' || v_old);
+        END IF;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+-- 5단계: 대시보드 조회 API가 읽는 테이블에 트리거 연결
+DROP TRIGGER IF EXISTS bump_stores_version ON stores;
+CREATE TRIGGER bump_stores_version
+    AFTER INSERT OR UPDATE OR DELETE ON stores
+    FOR EACH ROW EXECUTE FUNCTION bump_resource_version_trigger('stores', 'user_id');
+
+DROP TRIGGER IF EXISTS bump_metric_trackers_version ON metric_trackers;
+CREATE TRIGGER bump_metric_trackers_version
+    AFTER INSERT OR UPDATE OR DELETE ON metric_trackers
+    FOR EACH ROW EXECUTE FUNCTION bump_resource_version_trigger('metric_trackers', 'user_id');
+
+DROP TRIGGER IF EXISTS bump_review_stats_version ON review_stats;
+CREATE TRIGGER bump_review_stats_version
+    AFTER INSERT OR UPDATE OR DELETE ON review_stats
+    FOR EACH ROW EXECUTE FUNCTION bump_resource_version_trigger('review_stats', 'store_id');
+
+DROP TRIGGER IF EXISTS bump_diagnosis_history_version ON diagnosis_history;
+CREATE TRIGGER bump_diagnosis_history_version
+    AFTER INSERT OR UPDATE OR DELETE ON diagnosis_history
+    FOR EACH ROW EXECUTE FUNCTION bump_resource_version_trigger('diagnosis_history', 'store_id');
+
+DROP TRIGGER IF EXISTS bump_notifications_version ON notifications;
+CREATE TRIGGER bump_notifications_version
+    AFTER INSERT OR UPDATE OR DELETE ON notifications
+    FOR EACH ROW EXECUTE FUNCTION bump_resource_version_trigger('notifications', 'user_id');
+
+-- 실행 권한 (SECURITY DEFINER → 기본 PUBLIC 실행 권한 회수, 버전 증가는 트리거만 / 조회는 백엔드 Service Role만)
+REVOKE EXECUTE ON FUNCTION bump_resource_version(TEXT) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION bump_resource_version_trigger() FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION get_resource_versions(TEXT[]) FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION bump_resource_version(TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION get_resource_versions(TEXT[]) TO service_role;
+
+COMMENT ON TABLE resource_versions IS '조회 API ETag용 리소스 버전 (원본 테이블 트리거가 증가)';
+COMMENT ON FUNCTION get_resource_versions IS 'scope 목록의 현재 버전 조회 (없는 scope는 제외)';
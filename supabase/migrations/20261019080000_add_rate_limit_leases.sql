@@ -0,0 +1,137 @@
+-- ========================================
+-- 워커 간 레이트 리밋 슬롯 리스
+-- ========================================
+-- 목적: 유저별 동시 수집 제한(user_collect)과 네이버 API 동시 호출 제한(naver_api)을
+--       워커별이 아니라 전체 워커 합계로 적용
+-- - rate_limit_leases: 사용 중인 슬롯 1개 = 행 1개 (limiter + slot_key 단위로 개수 제한)
+--   slot_key: user_collect는 유저 ID, naver_api는 'global'
+-- - 워커가 TTL/3 간격으로 보유 리스를 갱신, 워커가 죽으면 expires_at이 지나 슬롯이 자동 반환
+-- - 획득은 (limiter, slot_key) 단위 트랜잭션 advisory lock으로 직렬화 → 동시에 획득해도 제한 초과 없음
+-- - TTL은 함수 안에서 3~300초로 제한, 실행 권한은 service_role만 (anon / authenticated 호출 불가)
+-- ========================================
+
+-- 1단계: 테이블
+CREATE TABLE IF NOT EXISTS rate_limit_leases (
+  lease_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  limiter TEXT NOT NULL,
+  slot_key TEXT NOT NULL,
+  holder TEXT NOT NULL,                -- 워커 ID (hostname:pid:random)
+  acquired_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+  expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_leases_slot
+  ON rate_limit_leases(limiter, slot_key, expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_leases_expires
+  ON rate_limit_leases(expires_at);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE rate_limit_leases ENABLE ROW LEVEL SECURITY;
+
+-- 2단계: 슬롯 획득 (만료 리스 정리 후 p_limit 미만이면 리스 생성, 부족하면 NULL)
+CREATE OR REPLACE FUNCTION acquire_rate_limit_lease(
+    p_limiter TEXT,
+    p_key TEXT,
+    p_limit INTEGER,
+    p_holder TEXT,
+    p_ttl_seconds INTEGER
+)
+RETURNS UUID
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_count INTEGER;
+    v_lease_id UUID;
+    v_ttl_seconds INTEGER := LEAST(GREATEST(COALESCE(p_ttl_seconds, 30), 3), 300);
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtextextended(p_limiter || ':' || p_key, 0));
+
+    DELETE FROM rate_limit_leases
+    WHERE limiter = p_limiter AND slot_key = p_key AND expires_at < NOW();
+
+    SELECT COUNT(*) INTO v_count
+    FROM rate_limit_leases
+    WHERE limiter = p_limiter AND slot_key = p_key;
+
+    IF v_count >= p_limit THEN
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO rate_limit_leases (limiter, slot_key, holder, expires_at)
+    VALUES (p_limiter, p_key, p_holder, NOW() + make_interval(secs => v_ttl_seconds))
+    RETURNING lease_id INTO v_lease_id;
+
+    RETURN v_lease_id;
+END;
+$$;
+
+-- 3단계: 보유 리스 갱신 (이미 만료된 리스는 다른 워커가 슬롯을 가져갔을 수 있으므로 갱신하지 않음)
+-- 갱신된 lease_id 목록 반환
+CREATE OR REPLACE FUNCTION renew_rate_limit_leases(
+    p_holder TEXT,
+    p_lease_ids UUID[],
+    p_ttl_seconds INTEGER
+)
+RETURNS SETOF UUID
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    v_ttl_seconds INTEGER := LEAST(GREATEST(COALESCE(p_ttl_seconds, 30), 3), 300);
+BEGIN
+    -- 죽은 워커가 남긴 리스 정리
+    DELETE FROM rate_limit_leases
+    WHERE expires_at < NOW() - INTERVAL '1 hour';
+
+    RETURN QUERY
+    UPDATE rate_limit_leases
+    SET expires_at = NOW() + make_interval(secs => v_ttl_seconds)
+    WHERE lease_id = ANY(p_lease_ids)
+      AND holder = p_holder
+      AND expires_at >= NOW()
+    RETURNING lease_id;
+END;
+$$;
+
+-- 4단계: 슬롯 반납
+CREATE OR REPLACE FUNCTION release_rate_limit_lease(
+    p_lease_id UUID
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    DELETE FROM rate_limit_leases WHERE lease_id = p_lease_id;
+    RETURN FOUND;
+END;
+$$;
+
+-- 5단계: 사용 현황 (limiter / slot_key / 워커별 유효 리스 수, 모니터링용)
+CREATE OR REPLACE FUNCTION get_rate_limit_usage()
+RETURNS TABLE (limiter TEXT, slot_key TEXT, holder TEXT, active BIGINT)
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    SELECT l.limiter, l.slot_key, l.holder, COUNT(*)
+    FROM rate_limit_leases l
+    WHERE l.expires_at >= NOW()
+    GROUP BY l.limiter, l.slot_key, l.holder
+    ORDER BY l.limiter, l.slot_key, l.holder;
+$$;
+
+-- 6단계: 실행 권한 (SECURITY DEFINER → 기본 PUBLIC 실행 권한 회수, 백엔드 Service Role만 호출)
+REVOKE EXECUTE ON FUNCTION acquire_rate_limit_lease(TEXT, TEXT, INTEGER, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION renew_rate_limit_leases(TEXT, UUID[], INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION release_rate_limit_lease(UUID) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION get_rate_limit_usage() FROM PUBLIC, anon, authenticated;
+
+GRANT EXECUTE ON FUNCTION acquire_rate_limit_lease(TEXT, TEXT, INTEGER, TEXT, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION renew_rate_limit_leases(TEXT, UUID[], INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION release_rate_limit_lease(UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION get_rate_limit_usage() TO service_role;
+
+COMMENT ON TABLE rate_limit_leases IS '워커 간 레이트 리밋 슬롯 리스 (limiter + slot_key 단위 개수 제한, 만료 시 자동 반환)';
+COMMENT ON FUNCTION acquire_rate_limit_lease IS '슬롯 획득 (advisory lock으로 직렬화, 제한 초과 시 NULL)';
@@ -0,0 +1,20 @@
+-- ========================================
+-- 블로그 포스트 첨부 플레이스 캐시
+-- ========================================
+-- 목적: 활성화 / 경쟁분석의 블로그 추이 계산에서 포스트마다 PostView를 다시 요청하지 않도록
+--       포스트에 첨부된 플레이스 지도(placeId) 확인 결과를 저장
+-- - 포스트의 지도 첨부는 게시 후 바뀌지 않으므로 만료 없이 보관 (처음 보는 포스트만 요청)
+-- - place_ids: 첨부된 placeId 목록 (첨부가 없으면 빈 배열)
+-- - 요청 실패한 포스트는 저장하지 않음 (다음 조회에서 재시도)
+-- ========================================
+
+CREATE TABLE IF NOT EXISTS blog_post_places (
+  blog_url TEXT PRIMARY KEY,             -- https://blog.naver.com/{blogId}/{logNo}
+  place_ids TEXT[] NOT NULL DEFAULT '{}',
+  checked_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- 백엔드(Service Role) 전용 테이블
+ALTER TABLE blog_post_places ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE blog_post_places IS '블로그 포스트 → 첨부 플레이스 지도 placeId 캐시 (PostView 확인 결과, 만료 없음)';